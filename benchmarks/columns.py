@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compares getting the scores, creation dates and tag ids of `--pages` search pages of 50 images each:
+- `models`: building the `Image`s, then reading those fields back into lists.
+- `columns`: `decode_image_columns(...)`, straight into NumPy arrays.
+Both are measured starting from the undecoded response bodies, using the same json decoder,
+and from the already decoded json (`_raw=True`), as decoding the json takes most of the time.
+
+    $ python benchmarks/columns.py --pages 200
+"""
+import sys
+import timeit
+import argparse
+import os.path
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from derpi.decoding import decode_json, get_json_decoder
+from derpi.columns import decode_image_columns
+from derpi.syncrounous.models import Image
+from benchmarks.fixtures import TAGGED_BODY
+
+__author__ = 'luckydonald'
+
+
+def models(pages):
+    images = [Image.from_dict(data) for page in pages for data in (decode_json(page) if isinstance(page, bytes) else page)['images']]
+    return [image.score for image in images], [image.created_at for image in images], [image.tag_ids for image in images]
+# end def
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=200, help='Amount of pages to decode, per measurement.')
+    args = parser.parse_args()
+
+    print(f'json decoder: {get_json_decoder()}')
+    for source, pages in [('bytes', [TAGGED_BODY] * args.pages), ('decoded', [decode_json(TAGGED_BODY) for _ in range(args.pages)])]:
+        for name, decode in [('models', models), ('columns', decode_image_columns)]:
+            seconds = min(timeit.repeat(lambda: decode(pages), number=1, repeat=5))
+            print(f'{source:<8} {name:<8} {seconds / args.pages * 1000:>6.3f} ms per page')
+        # end for
+    # end for
+# end def
+
+
+if __name__ == '__main__':
+    main()
+# end if
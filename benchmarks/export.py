@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compares storing `--images` images, like from a crawl, every one with its own tags, score and timestamps:
+- `json`: one `image.to_json()` per line.
+- `pickle`: the list of images.
+- `parquet`: `write_parquet(images, path)`, zstd compressed.
+- `arrow`: `write_arrow(images, path)`, uncompressed.
+Loading means getting the models back for json and pickle, and a `pyarrow.Table` for the columnar files.
+
+    $ python benchmarks/export.py --images 100000
+"""
+import os
+import sys
+import json
+import time
+import pickle
+import random
+import argparse
+import tempfile
+import os.path
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from derpi.syncrounous.models import Image
+from derpi.export import write_parquet, write_arrow
+from benchmarks.fixtures import image_dict
+
+__author__ = 'luckydonald'
+
+
+def crawled_images(count):
+    randomness = random.Random(4)
+    start = datetime(2012, 1, 2, tzinfo=timezone.utc)
+    for image_id in range(count):
+        tag_ids = sorted(randomness.sample(range(2000), 40))
+        created_at = (start + timedelta(seconds=image_id * 3000 + randomness.randrange(3000))).isoformat()
+        yield Image.from_dict(dict(
+            image_dict(image_id), tag_count=40, tag_ids=tag_ids, tags=[f'tag {tag_id}' for tag_id in tag_ids],
+            score=randomness.randrange(1000), faves=randomness.randrange(500), wilson_score=randomness.random(),
+            created_at=created_at, first_seen_at=created_at, updated_at=created_at,
+        ))
+    # end for
+# end def
+
+
+def write_json(images, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        for image in images:
+            f.write(image.to_json() + '\n')
+        # end for
+    # end with
+# end def
+
+
+def read_json(path):
+    with open(path, encoding='utf-8') as f:
+        return [Image.from_dict(json.loads(line)) for line in f]
+    # end with
+# end def
+
+
+def write_pickle(images, path):
+    with open(path, 'wb') as f:
+        pickle.dump(images, f, pickle.HIGHEST_PROTOCOL)
+    # end with
+# end def
+
+
+def read_pickle(path):
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+    # end with
+# end def
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--images', type=int, default=100000, help='Amount of images to store.')
+    args = parser.parse_args()
+
+    import pyarrow.ipc
+    import pyarrow.parquet
+
+    images = list(crawled_images(args.images))
+    for image in images:
+        image.created_at, image.first_seen_at, image.updated_at  # parse them, like a crawler would.
+    # end for
+    with tempfile.TemporaryDirectory() as folder:
+        for name, write, read in [
+            ('json', write_json, read_json),
+            ('pickle', write_pickle, read_pickle),
+            ('parquet', write_parquet, pyarrow.parquet.read_table),
+            ('arrow', write_arrow, lambda path: pyarrow.ipc.open_file(path).read_all()),
+        ]:
+            path = os.path.join(folder, name)
+            started = time.perf_counter()
+            write(images, path)
+            written = time.perf_counter()
+            read(path)
+            done = time.perf_counter()
+            size = os.path.getsize(path)
+            print(f'{name:<8} {size / 2**20:>8.1f} MiB  write {written - started:>6.2f} s  load {done - written:>6.2f} s')
+        # end for
+    # end with
+# end def
+
+
+if __name__ == '__main__':
+    main()
+# end if
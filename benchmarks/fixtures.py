@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+The payloads the benchmarks run on, shaped like the responses of the api:
+- `BODY`: a search page of 50 images with a single tag each.
+- `TAGGED_BODY`: a search page of 50 images with 40 tags each, out of the 2000 most common ones, like real images.
+"""
+import json
+import random
+
+__author__ = 'luckydonald'
+
+
+def image_dict(image_id):
+    """
+    :return: The json of an image, as the api returns it.
+    """
+    return {
+        "animated": False, "aspect_ratio": 1.0, "comment_count": 0, "created_at": "2019-05-02T05:33:36",
+        "deletion_reason": None, "description": "", "downvotes": 0, "duplicate_of": None, "duration": 0.04,
+        "faves": 0, "first_seen_at": "2019-05-02T05:33:36", "format": "png", "height": 100,
+        "hidden_from_users": False, "id": image_id, "intensities": None, "mime_type": "image/png",
+        "name": "image.png", "orig_sha512_hash": f"orig{image_id}", "processed": True, "representations": {
+            key: f"https://derpicdn.net/img/2019/5/2/{image_id}/{key}.png"
+            for key in ["full", "large", "medium", "small", "tall", "thumb", "thumb_small", "thumb_tiny"]
+        }, "score": 0, "sha512_hash": f"sha{image_id}", "size": 1234, "source_url": "", "spoilered": False,
+        "tag_count": 1, "tag_ids": [40482], "tags": ["safe"], "thumbnails_generated": True,
+        "updated_at": "2020-04-10T00:14:35", "uploader": "Kam3E433", "uploader_id": 459261, "upvotes": 0,
+        "view_url": f"https://derpicdn.net/img/view/2019/5/2/{image_id}.png", "width": 100, "wilson_score": 0.0,
+    }
+# end def
+
+
+def page_body(images):
+    """
+    :return: The undecoded response body of a search page with those images.
+    """
+    return json.dumps({"images": images, "interactions": [], "total": len(images)}).encode('utf-8')
+# end def
+
+
+def tagged_page_body():
+    """
+    :return: The undecoded response body of a search page of 50 images, with 40 random tags each.
+    """
+    randomness = random.Random(4)
+    images = []
+    for image_id in range(50):
+        tag_ids = randomness.sample(range(2000), 40)
+        images.append(image_dict(image_id))
+        images[-1].update(tag_count=40, tag_ids=tag_ids, tags=[f'tag {tag_id}' for tag_id in tag_ids])
+        images[-1]['representations']['full'] = f'https://derpicdn.net/img/view/2019/5/2/{image_id}.png'
+    # end for
+    return page_body(images)
+# end def
+
+
+BODY = page_body([image_dict(i) for i in range(50)])
+TAGGED_BODY = tagged_page_body()
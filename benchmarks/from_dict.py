@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compares building the models of a search page of 50 images with `Image.from_dict(...)`
+against how the models used to be built: copying every field, then deleting them one by one from a copy
+of the payload (the original would be destroyed), and checking the leftovers.
+As parsing the three timestamps of an image took most of the time, it is measured without them as well.
+Timestamps are now only parsed when they are read, which `+dates` does for all of them.
+`lazy` builds `LazyImage`s instead, reading just the `id`, `tags` and a representation, like a typical consumer.
+
+    $ python benchmarks/from_dict.py --repeat 500
+"""
+import sys
+import json
+import timeit
+import argparse
+import os.path
+
+import iso8601
+from luckydonaldUtils.exceptions import assert_type_or_raise
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from derpi.syncrounous.models import Image, LazyImage, Intensities, Representations, logger
+from benchmarks.fixtures import BODY
+
+__author__ = 'luckydonald'
+
+
+def legacy_from_dict(data):
+    """
+    The previous `Image.from_dict(...)`, as it was generated. Nested models are built with the current code.
+    """
+    data = dict(data)  # it deletes the keys of the caller's dict.
+    assert_type_or_raise(data, dict, parameter_name="data")
+
+    arguments = {}
+    arguments['animated'] = data['animated']
+    arguments['aspect_ratio'] = data['aspect_ratio']
+    arguments['comment_count'] = data['comment_count']
+    arguments['created_at'] = iso8601.parse_date(data['created_at'])
+    arguments['deletion_reason'] = data['deletion_reason'] if data.get('deletion_reason', None) is not None else None
+    arguments['description'] = data['description']
+    arguments['downvotes'] = data['downvotes']
+    arguments['duplicate_of'] = data['duplicate_of'] if data.get('duplicate_of', None) is not None else None
+    arguments['duration'] = data['duration']
+    arguments['faves'] = data['faves']
+    arguments['first_seen_at'] = iso8601.parse_date(data['first_seen_at'])
+    arguments['format'] = data['format']
+    arguments['height'] = data['height']
+    arguments['hidden_from_users'] = data['hidden_from_users']
+    arguments['id'] = data['id']
+    arguments['intensities'] = Intensities.from_dict(data['intensities']) if data.get('intensities', None) is not None else None
+    arguments['mime_type'] = data['mime_type']
+    arguments['name'] = data['name']
+    arguments['orig_sha512_hash'] = data['orig_sha512_hash']
+    arguments['processed'] = data['processed']
+    arguments['representations'] = Representations.from_dict(data['representations'])
+    arguments['score'] = data['score']
+    arguments['sha512_hash'] = data['sha512_hash']
+    arguments['size'] = data['size']
+    arguments['source_url'] = data['source_url']
+    arguments['spoilered'] = data['spoilered']
+    arguments['tag_count'] = data['tag_count']
+    arguments['tag_ids'] = data['tag_ids']
+    arguments['tags'] = data['tags']
+    arguments['thumbnails_generated'] = data['thumbnails_generated']
+    arguments['updated_at'] = iso8601.parse_date(data['updated_at'])
+    arguments['uploader'] = data['uploader']
+    arguments['uploader_id'] = data['uploader_id'] if data.get('uploader_id', None) is not None else None
+    arguments['upvotes'] = data['upvotes']
+    arguments['view_url'] = data['view_url']
+    arguments['width'] = data['width']
+    arguments['wilson_score'] = data['wilson_score']
+
+    del data['animated']
+    del data['aspect_ratio']
+    del data['comment_count']
+    del data['created_at']
+    if 'deletion_reason' in data:
+        del data['deletion_reason']
+    # end if
+    del data['description']
+    del data['downvotes']
+    if 'duplicate_of' in data:
+        del data['duplicate_of']
+    # end if
+    del data['duration']
+    del data['faves']
+    del data['first_seen_at']
+    del data['format']
+    del data['height']
+    del data['hidden_from_users']
+    del data['id']
+    if 'intensities' in data:
+        del data['intensities']
+    # end if
+    del data['mime_type']
+    del data['name']
+    del data['orig_sha512_hash']
+    del data['processed']
+    del data['representations']
+    del data['score']
+    del data['sha512_hash']
+    del data['size']
+    del data['source_url']
+    del data['spoilered']
+    del data['tag_count']
+    del data['tag_ids']
+    del data['tags']
+    del data['thumbnails_generated']
+    del data['updated_at']
+    del data['uploader']
+    if 'uploader_id' in data:
+        del data['uploader_id']
+    # end if
+    del data['upvotes']
+    del data['view_url']
+    del data['width']
+    del data['wilson_score']
+
+    if data:
+        logger.warning(f'still got leftover data: {data!r}')
+        if Image._assert_consuming_all_params:
+            raise ValueError(
+                f'the dict should be consumed completely, but still has the following elements left: {list(data.keys())!r}'
+            )
+        # end if
+    # end if
+    instance = Image(**arguments)
+    instance._raw = arguments
+    return instance
+# end def
+
+
+def from_dict_reading_timestamps(data):
+    image = Image.from_dict(data)
+    image.created_at, image.first_seen_at, image.updated_at
+    return image
+# end def
+
+
+def lazy_reading_fields(data):
+    image = LazyImage.from_dict(data)
+    image.id, image.tags, image.representations.thumb
+    return image
+# end def
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=500, help='How often to build the page.')
+    args = parser.parse_args()
+
+    images = json.loads(BODY)['images']
+    assert [legacy_from_dict(image) for image in images] == [Image.from_dict(image) for image in images]
+    print(f'{len(images)} images per page')
+    parse_date = iso8601.parse_date
+    for title, parser, functions in [
+        ('with timestamps', parse_date, [
+            ('legacy', legacy_from_dict), ('from_dict', Image.from_dict), ('+dates', from_dict_reading_timestamps),
+            ('lazy', lazy_reading_fields),
+        ]),
+        ('without timestamps', lambda value: value, [('legacy', legacy_from_dict), ('from_dict', Image.from_dict)]),
+    ]:
+        iso8601.parse_date = parser
+        results = {}
+        for name, function in functions:
+            seconds = min(timeit.repeat(lambda: [function(image) for image in images], number=args.repeat, repeat=5))
+            results[name] = seconds
+            print(f'{title:<20} {name:<10} {seconds / args.repeat * 1e6:>8.1f} µs per page')
+        # end for
+        print(f'{title:<20} {results["legacy"] / results["from_dict"]:.2f}x faster')
+    # end for
+    iso8601.parse_date = parse_date
+# end def
+
+
+if __name__ == '__main__':
+    main()
+# end if
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compares HTTP/1.1 connection pooling with a single multiplexed HTTP/2 connection,
+by running a lot of concurrent `search_images(...)` requests of the async client against a local stand-in server.
+
+The server answers every request with the same page of images, after an artificial `--latency`.
+As it is plain http, HTTP/2 is spoken with prior knowledge (h2c) instead of being negotiated via TLS.
+
+    $ pip install derpi[async,http2]
+    $ python benchmarks/http2.py --requests 500 --concurrency 50 --latency 0.02
+"""
+import sys
+import time
+import asyncio
+import argparse
+import os.path
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from derpi.asyncrounous.client import DerpiClient
+from derpi.retry import NO_RETRY
+from benchmarks.fixtures import BODY
+
+__author__ = 'luckydonald'
+
+
+class Http1Protocol(asyncio.Protocol):
+    """
+    Minimal HTTP/1.1 keep-alive server, answering every (body-less) request with `BODY`.
+    """
+    def __init__(self, server):
+        self.server = server
+        self.buffer = b''
+        self.transport = None
+    # end def
+
+    def connection_made(self, transport):
+        self.server.connections += 1
+        self.transport = transport
+    # end def
+
+    def data_received(self, data):
+        self.buffer += data
+        while b'\r\n\r\n' in self.buffer:
+            _, self.buffer = self.buffer.split(b'\r\n\r\n', 1)
+            asyncio.ensure_future(self.respond())
+        # end while
+    # end def
+
+    async def respond(self):
+        await asyncio.sleep(self.server.latency)
+        self.transport.write(
+            b'HTTP/1.1 200 OK\r\n'
+            b'content-type: application/json; charset=utf-8\r\n'
+            b'content-length: ' + str(len(BODY)).encode() + b'\r\n'
+            b'\r\n' + BODY
+        )
+    # end def
+# end class
+
+
+class Http2Protocol(asyncio.Protocol):
+    """
+    Minimal HTTP/2 (h2c, prior knowledge) server, answering every request with `BODY`.
+    """
+    def __init__(self, server):
+        import h2.config
+        import h2.connection
+        self.server = server
+        self.connection = h2.connection.H2Connection(config=h2.config.H2Configuration(client_side=False))
+        self.window_updated = asyncio.Event()
+        self.transport = None
+    # end def
+
+    def connection_made(self, transport):
+        self.server.connections += 1
+        self.transport = transport
+        self.connection.initiate_connection()
+        self.transport.write(self.connection.data_to_send())
+    # end def
+
+    def data_received(self, data):
+        import h2.events
+        for event in self.connection.receive_data(data):
+            if isinstance(event, h2.events.RequestReceived):
+                asyncio.ensure_future(self.respond(event.stream_id))
+            elif isinstance(event, h2.events.WindowUpdated):
+                self.window_updated.set()
+            elif isinstance(event, h2.events.ConnectionTerminated):
+                self.transport.close()
+            # end if
+        # end for
+        self.transport.write(self.connection.data_to_send())
+    # end def
+
+    async def respond(self, stream_id):
+        await asyncio.sleep(self.server.latency)
+        self.connection.send_headers(stream_id, [
+            (':status', '200'),
+            ('content-type', 'application/json; charset=utf-8'),
+            ('content-length', str(len(BODY))),
+        ])
+        body = BODY
+        while body:
+            window = min(self.connection.local_flow_control_window(stream_id), self.connection.max_outbound_frame_size)
+            if window < 1:  # the client has to acknowledge what we sent so far.
+                self.window_updated.clear()
+                await self.window_updated.wait()
+                continue
+            # end if
+            chunk, body = body[:window], body[window:]
+            self.connection.send_data(stream_id, chunk, end_stream=not body)
+            self.transport.write(self.connection.data_to_send())
+        # end while
+        self.transport.write(self.connection.data_to_send())
+    # end def
+# end class
+
+
+class Server(object):
+    def __init__(self, protocol, latency):
+        self.protocol = protocol
+        self.latency = latency
+        self.connections = 0  # how many connections were opened.
+        self.server = None
+    # end def
+
+    async def start(self) -> str:
+        self.server = await asyncio.get_running_loop().create_server(lambda: self.protocol(self), '127.0.0.1', 0)
+        host, port = self.server.sockets[0].getsockname()[:2]
+        return f'http://{host}:{port}'
+    # end def
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+    # end def
+# end class
+
+
+async def run(name, protocol, client, requests, concurrency, latency):
+    server = Server(protocol, latency)
+    base_url = await server.start()
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def search(page):
+        async with semaphore:
+            started = time.perf_counter()
+            result = await derpi.search_images('safe', page=page, per_page=50)
+            latencies.append(time.perf_counter() - started)
+            assert len(result) == 50
+        # end with
+    # end def
+
+    async with client:
+        derpi = DerpiClient(key=None, client=client, base_url=base_url, retry=NO_RETRY)
+        started = time.perf_counter()
+        await asyncio.gather(*[search(page) for page in range(1, requests + 1)])
+        elapsed = time.perf_counter() - started
+    # end with
+    await server.stop()
+    latencies.sort()
+    print(
+        f'{name:<10} {requests / elapsed:>10.1f} req/s {elapsed:>8.3f} s total'
+        f' {latencies[len(latencies) // 2] * 1000:>8.1f} ms p50 {latencies[int(len(latencies) * 0.99)] * 1000:>8.1f} ms p99'
+        f' {server.connections:>5} connections'
+    )
+# end def
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=500, help='Amount of search requests to send.')
+    parser.add_argument('--concurrency', type=int, default=50, help='Requests running at the same time.')
+    parser.add_argument('--latency', type=float, default=0.02, help='Seconds the server takes per request.')
+    args = parser.parse_args()
+
+    await run('HTTP/1.1', Http1Protocol, DerpiClient.create_client(http2=False), args.requests, args.concurrency, args.latency)
+    try:
+        import h2
+    except ImportError:
+        print('HTTP/2     skipped, as the "h2" package is missing. Install it with `pip install derpi[http2]`.')
+        return
+    # end try
+    # as the stand-in server is plain http, the client has to speak HTTP/2 right away instead of negotiating it.
+    client = httpx.AsyncClient(http1=False, http2=True, limits=httpx.Limits(
+        max_connections=DerpiClient.POOL_CONNECTIONS, keepalive_expiry=DerpiClient.POOL_KEEPALIVE_EXPIRY,
+    ))
+    await run('HTTP/2', Http2Protocol, client, args.requests, args.concurrency, args.latency)
+# end def
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
+# end if
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compares the json libraries available to `derpi.decoding`, parsing a search page of 50 images from bytes.
+For comparison, `response.json()` of requests (bytes -> str -> stdlib json) is measured as well.
+
+    $ python benchmarks/json_decoding.py --repeat 2000
+"""
+import sys
+import json
+import timeit
+import argparse
+import os.path
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from derpi.decoding import JSON_DECODERS, set_json_decoder, decode_json
+from benchmarks.fixtures import BODY
+
+__author__ = 'luckydonald'
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=2000, help='How often to parse the page.')
+    args = parser.parse_args()
+
+    response = requests.Response()
+    response._content = BODY
+    response.encoding = 'utf-8'
+    print(f'{len(BODY)} bytes per page')
+    seconds = timeit.timeit(response.json, number=args.repeat)
+    print(f'{"response.json()":<16} {seconds / args.repeat * 1e6:>8.1f} µs per page')
+    for name in JSON_DECODERS:
+        try:
+            set_json_decoder(name)
+        except ImportError:
+            print(f'{name:<16} not installed')
+            continue
+        # end try
+        assert decode_json(BODY) == json.loads(BODY)
+        seconds = timeit.timeit(lambda: decode_json(BODY), number=args.repeat)
+        print(f'{name:<16} {seconds / args.repeat * 1e6:>8.1f} µs per page')
+    # end for
+# end def
+
+
+if __name__ == '__main__':
+    main()
+# end if
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Measures the memory held by a list of `--images` images, built from search pages of 50 images each.
+Like real images, every one of them has 40 tags, out of the 2000 most common ones, and 8 representation urls:
+- `dict`: how the models used to be stored, with a `__dict__` per instance, parsed timestamps
+  and the constructor arguments as `_raw`.
+- `slots`: the current models using `__slots__`, without `_raw` (the default).
+- `slots+raw`: the current models, keeping the original payload as `_raw` (`DerpiModel._keep_raw = True`).
+- `compact`: the current models, with the tags interned and the tag ids in an array (`Image._compact_tags = True`).
+
+    $ python benchmarks/memory.py --images 100000
+"""
+import gc
+import sys
+import json
+import argparse
+import tracemalloc
+import os.path
+
+import iso8601
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from derpi.syncrounous.models import DerpiModel, Image, Intensities, Representations
+from benchmarks.fixtures import TAGGED_BODY
+
+__author__ = 'luckydonald'
+
+
+def dict_model(cls):
+    """
+    A class storing the same attributes as `cls` as they are, in a `__dict__`.
+    """
+    def __init__(self, **arguments):
+        self.__dict__.update(arguments)
+    # end def
+    return type(cls.__name__, (object,), {'__init__': __init__})
+# end def
+
+
+DictImage = dict_model(Image)
+DictIntensities = dict_model(Intensities)
+DictRepresentations = dict_model(Representations)
+
+
+def dict_from_dict(data):
+    arguments = Image.prepare_dict(data)
+    for key in ('created_at', 'first_seen_at', 'updated_at'):
+        arguments[key] = iso8601.parse_date(arguments[key])
+    # end for
+    arguments['representations'] = DictRepresentations(**Representations.prepare_dict(data['representations']))
+    if arguments['intensities'] is not None:
+        arguments['intensities'] = DictIntensities(**Intensities.prepare_dict(data['intensities']))
+    # end if
+    image = DictImage(**arguments)
+    image._raw = arguments
+    return image
+# end def
+
+
+def measure(from_dict, count):
+    """
+    :return: bytes held by `count` images.
+    """
+    gc.collect()
+    tracemalloc.start()
+    images = []
+    while len(images) < count:
+        # every page is parsed on its own, so the strings aren't shared between pages like with a real crawl.
+        images.extend(from_dict(data) for data in json.loads(TAGGED_BODY)['images'])
+    # end while
+    del images[count:]
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del images
+    return size
+# end def
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--images', type=int, default=100000, help='Amount of images to hold in memory.')
+    args = parser.parse_args()
+
+    baseline = None
+    for name, from_dict, keep_raw, compact_tags in [
+        ('dict', dict_from_dict, False, False),
+        ('slots', Image.from_dict, False, False),
+        ('slots+raw', Image.from_dict, True, False),
+        ('compact', Image.from_dict, False, True),
+    ]:
+        DerpiModel._keep_raw = keep_raw
+        Image._compact_tags = compact_tags
+        size = measure(from_dict, args.images)
+        baseline = baseline or size
+        print(f'{name:<10} {size / 2**20:>8.1f} MiB {size / args.images:>8.0f} bytes per image {size / baseline:>6.0%}')
+    # end for
+    DerpiModel._keep_raw = False
+    Image._compact_tags = False
+# end def
+
+
+if __name__ == '__main__':
+    main()
+# end if
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compares the size and speed of storing the models of a search page of 50 images:
+- `pickle default`: pickling like python does for classes with `__slots__`, a dict of slot names to values per model.
+- `pickle`: pickling with the generated `__reduce__`, a tuple of the values per model.
+- `json`: `image.to_json()`, and back with `Image.from_dict(json.loads(...))`.
+- `msgpack`: `image.to_msgpack()` and `Image.from_msgpack(...)`, if msgpack is installed.
+
+    $ python benchmarks/serialization.py --repeat 200
+"""
+import sys
+import json
+import pickle
+import timeit
+import argparse
+import os.path
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from derpi.syncrounous.models import DerpiModel, Image
+from benchmarks.fixtures import BODY
+
+__author__ = 'luckydonald'
+
+
+def pickle_default():
+    """
+    Pickling, as it would be without the generated `__reduce__` methods.
+    """
+    def dump(images):
+        reducers = {cls: cls.__dict__['__reduce__'] for cls in DerpiModel.__subclasses__()}
+        for cls in reducers:
+            cls.__reduce__ = object.__reduce__
+        # end for
+        try:
+            return pickle.dumps(images, pickle.HIGHEST_PROTOCOL)
+        finally:
+            for cls, reducer in reducers.items():
+                cls.__reduce__ = reducer
+            # end for
+        # end try
+    # end def
+    return dump, pickle.loads
+# end def
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=200, help='How often to serialize the page, per measurement.')
+    args = parser.parse_args()
+
+    images = [Image.from_dict(data) for data in json.loads(BODY)['images']]
+    candidates = [
+        ('pickle default', *pickle_default()),
+        ('pickle', lambda images: pickle.dumps(images, pickle.HIGHEST_PROTOCOL), pickle.loads),
+        ('json', lambda images: [image.to_json() for image in images], lambda dumped: [Image.from_dict(json.loads(image)) for image in dumped]),
+    ]
+    try:
+        import msgpack
+    except ImportError:
+        print('msgpack is not installed, skipping it.')
+    else:
+        candidates.append(('msgpack', lambda images: [image.to_msgpack() for image in images], lambda dumped: [Image.from_msgpack(image) for image in dumped]))
+    # end try
+
+    for name, dump, load in candidates:
+        dumped = dump(images)
+        size = len(dumped) if isinstance(dumped, bytes) else sum(len(image) for image in dumped)
+        dump_time = min(timeit.repeat(lambda: dump(images), number=args.repeat, repeat=5)) / args.repeat
+        load_time = min(timeit.repeat(lambda: load(dumped), number=args.repeat, repeat=5)) / args.repeat
+        print(f'{name:<15} {size:>7} bytes  dump {dump_time * 1000:>6.3f} ms  load {load_time * 1000:>6.3f} ms  per page')
+    # end for
+# end def
+
+
+if __name__ == '__main__':
+    main()
+# end if
@@ -51,6 +51,18 @@ class Route(object):
         # end if
     # end def
 
+    @property
+    def is_paginated(self) -> bool:
+        """
+        If the route returns a list which can be paged through with the `page` parameter.
+        """
+        return self.response_format.is_list and self.has_query_parameter('page')
+    # end def
+
+    def has_query_parameter(self, name: str) -> bool:
+        return any(param.name == name for param in self.allowed_query_parameters)
+    # end def
+
     __repr__ = __str__
 # end class
 
@@ -137,15 +149,15 @@ class ResponseType(object):
     # end def
 
     def python_typing_representation(self, json_mode: bool, include_dict=True):
+        if self.has_total and not json_mode:
+            return f'SearchResult[{self.class_name}]'
+        # end if
         string = 'Dict' if json_mode else self.class_name
         if self.is_list:
             string = f'List[{string}]'
         # end if
         if json_mode and include_dict and self.key:
-            string = f'Dict[str, {string}]'
-        # end if
-        if self.has_total:
-            string = f'SearchResult[{string}]'
+            string = f'Dict[str, Union[{string}, int]]' if self.has_total else f'Dict[str, {string}]'
         # end if
         return string
 # end class
@@ -12,12 +12,12 @@ routes = [
 	Route(name='system_filters', method='GET', path=UrlPath(original='/api/v1/json/filters/system', template='/api/v1/json/filters/system', params=[]), allowed_query_parameters=[Parameter(name='page', type='Integer', description='Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.', optional=True, api_name='page')], description='Fetches a list of **filter responses** that are flagged as being **system** filters (and thus usable by anyone).', response_format=ResponseType(schema='{"filters":[Filter]}', is_list=True, key='filters', class_name='Filter', has_total=False), example_url='/api/v1/json/filters/system'),
 	Route(name='user_filters', method='GET', path=UrlPath(original='/api/v1/json/filters/user', template='/api/v1/json/filters/user', params=[]), allowed_query_parameters=[Parameter(name='key', type='String', description='An optional authentication token. If omitted, no user will be authenticated.\n\nYou can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).', optional=False, api_name='key'), Parameter(name='page', type='Integer', description='Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.', optional=True, api_name='page')], description='Fetches a list of **filter responses** that belong to the user given by **key**. If no **key** is given or it is invalid, will return a **403 Forbidden** error.', response_format=ResponseType(schema='{"filters":[Filter]}', is_list=True, key='filters', class_name='Filter', has_total=False), example_url='/api/v1/json/filters/user'),
 	Route(name='oembed', method='GET', path=UrlPath(original='/api/v1/json/oembed', template='/api/v1/json/oembed', params=[]), allowed_query_parameters=[Parameter(name='url', type='String', description='Link a deviantART page, a Tumblr post, or the image directly.', optional=False, api_name='url')], description='Fetches an **oEmbed response** for the given app link or CDN URL.', response_format=ResponseType(schema='Oembed', is_list=False, key=None, class_name='Oembed', has_total=False), example_url='/api/v1/json/oembed?url=https://derpicdn.net/img/2012/1/2/3/full.png'),
-	Route(name='search_comments', method='GET', path=UrlPath(original='/api/v1/json/search/comments', template='/api/v1/json/search/comments', params=[]), allowed_query_parameters=[Parameter(name='key', type='String', description='An optional authentication token. If omitted, no user will be authenticated.\n\nYou can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).', optional=True, api_name='key'), Parameter(name='page', type='Integer', description='Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.', optional=True, api_name='page'), Parameter(name='query', type='String', description='The current search query, if the request is a search request.', optional=False, api_name='q')], description='Executes the search given by the `q` query parameter (case insensitive and stemming is applied. If you search for **best pony** results like **Best Ponies** are also be returned), and returns **comment responses** sorted by descending creation time.', response_format=ResponseType(schema='{"comments":[Comment]}', is_list=True, key='comments', class_name='Comment', has_total=False), example_url='/api/v1/json/search/comments?q=image_id:1000000'),
-	Route(name='search_galleries', method='GET', path=UrlPath(original='/api/v1/json/search/galleries', template='/api/v1/json/search/galleries', params=[]), allowed_query_parameters=[Parameter(name='key', type='String', description='An optional authentication token. If omitted, no user will be authenticated.\n\nYou can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).', optional=True, api_name='key'), Parameter(name='page', type='Integer', description='Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.', optional=True, api_name='page'), Parameter(name='query', type='String', description='The current search query, if the request is a search request.', optional=False, api_name='q')], description='Executes the search given by the `q` query parameter, and returns **gallery responses** sorted by descending creation time.', response_format=ResponseType(schema='{"galleries":[Gallery]}', is_list=True, key='galleries', class_name='Gallery', has_total=False), example_url='/api/v1/json/search/galleries?q=title:mean*'),
-	Route(name='search_posts', method='GET', path=UrlPath(original='/api/v1/json/search/posts', template='/api/v1/json/search/posts', params=[]), allowed_query_parameters=[Parameter(name='key', type='String', description='An optional authentication token. If omitted, no user will be authenticated.\n\nYou can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).', optional=True, api_name='key'), Parameter(name='page', type='Integer', description='Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.', optional=True, api_name='page'), Parameter(name='query', type='String', description='The current search query, if the request is a search request.', optional=False, api_name='q')], description='Executes the search given by the `q` query parameter, and returns **post responses** sorted by descending creation time.', response_format=ResponseType(schema='{"posts":[Post]}', is_list=True, key='posts', class_name='Post', has_total=False), example_url='/api/v1/json/search/posts?q=subject:time wasting thread'),
-	Route(name='search_images', method='GET', path=UrlPath(original='/api/v1/json/search/images', template='/api/v1/json/search/images', params=[]), allowed_query_parameters=[Parameter(name='key', type='String', description='An optional authentication token. If omitted, no user will be authenticated.\n\nYou can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).', optional=True, api_name='key'), Parameter(name='filter_id', type='Integer', description='Assuming the user can access the filter ID given by the parameter, overrides the current filter for this request. This is primarily useful for unauthenticated API access.', optional=True, api_name='filter_id'), Parameter(name='page', type='Integer', description='Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.', optional=True, api_name='page'), Parameter(name='per_page', type='Integer', description='Controls the number of results per page, up to a limit of 50, if the response is paginated. The default is 25.', optional=True, api_name='per_page'), Parameter(name='query', type='String', description='The current search query, if the request is a search request.', optional=False, api_name='q'), Parameter(name='sort_direction', type='String', description='The current sort direction, if the request is a search request.', optional=True, api_name='sd'), Parameter(name='sort_field', type='String', description='The current sort field, if the request is a search request.', optional=True, api_name='sf')], description='Executes the search given by the `q` query parameter, and returns **image responses**.', response_format=ResponseType(schema='{"images":[Image]}', is_list=True, key='images', class_name='Image', has_total=False), example_url='/api/v1/json/search/images?q=safe'),
-	Route(name='search_tags', method='GET', path=UrlPath(original='/api/v1/json/search/tags', template='/api/v1/json/search/tags', params=[]), allowed_query_parameters=[Parameter(name='page', type='Integer', description='Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.', optional=True, api_name='page'), Parameter(name='query', type='String', description='The current search query, if the request is a search request.', optional=False, api_name='q')], description='Executes the search given by the `q` query parameter, and returns **tag responses** sorted by descending image count.', response_format=ResponseType(schema='{"tags":[Tag]}', is_list=True, key='tags', class_name='Tag', has_total=False), example_url='/api/v1/json/search/tags?q=analyzed_name:wing'),
-	Route(name='search_reverse', method='POST', path=UrlPath(original='/api/v1/json/search/reverse', template='/api/v1/json/search/reverse', params=[]), allowed_query_parameters=[Parameter(name='key', type='String', description='An optional authentication token. If omitted, no user will be authenticated.\n\nYou can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).', optional=True, api_name='key'), Parameter(name='url', type='String', description='Link a deviantART page, a Tumblr post, or the image directly.', optional=False, api_name='url'), Parameter(name='distance', type='Float', description='Match distance (suggested values: between 0.2 and 0.5).', optional=True, api_name='distance')], description='Returns **image responses** based on the results of reverse-searching the image given by the `url` query parameter.', response_format=ResponseType(schema='{"images":[Image]}', is_list=True, key='images', class_name='Image', has_total=False), example_url='/api/v1/json/search/reverse?url=https://derpicdn.net/img/2019/12/24/2228439/full.jpg'),
+	Route(name='search_comments', method='GET', path=UrlPath(original='/api/v1/json/search/comments', template='/api/v1/json/search/comments', params=[]), allowed_query_parameters=[Parameter(name='key', type='String', description='An optional authentication token. If omitted, no user will be authenticated.\n\nYou can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).', optional=True, api_name='key'), Parameter(name='page', type='Integer', description='Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.', optional=True, api_name='page'), Parameter(name='query', type='String', description='The current search query, if the request is a search request.', optional=False, api_name='q')], description='Executes the search given by the `q` query parameter (case insensitive and stemming is applied. If you search for **best pony** results like **Best Ponies** are also be returned), and returns **comment responses** sorted by descending creation time.', response_format=ResponseType(schema='{"comments":[Comment]}', is_list=True, key='comments', class_name='Comment', has_total=True), example_url='/api/v1/json/search/comments?q=image_id:1000000'),
+	Route(name='search_galleries', method='GET', path=UrlPath(original='/api/v1/json/search/galleries', template='/api/v1/json/search/galleries', params=[]), allowed_query_parameters=[Parameter(name='key', type='String', description='An optional authentication token. If omitted, no user will be authenticated.\n\nYou can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).', optional=True, api_name='key'), Parameter(name='page', type='Integer', description='Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.', optional=True, api_name='page'), Parameter(name='query', type='String', description='The current search query, if the request is a search request.', optional=False, api_name='q')], description='Executes the search given by the `q` query parameter, and returns **gallery responses** sorted by descending creation time.', response_format=ResponseType(schema='{"galleries":[Gallery]}', is_list=True, key='galleries', class_name='Gallery', has_total=True), example_url='/api/v1/json/search/galleries?q=title:mean*'),
+	Route(name='search_posts', method='GET', path=UrlPath(original='/api/v1/json/search/posts', template='/api/v1/json/search/posts', params=[]), allowed_query_parameters=[Parameter(name='key', type='String', description='An optional authentication token. If omitted, no user will be authenticated.\n\nYou can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).', optional=True, api_name='key'), Parameter(name='page', type='Integer', description='Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.', optional=True, api_name='page'), Parameter(name='query', type='String', description='The current search query, if the request is a search request.', optional=False, api_name='q')], description='Executes the search given by the `q` query parameter, and returns **post responses** sorted by descending creation time.', response_format=ResponseType(schema='{"posts":[Post]}', is_list=True, key='posts', class_name='Post', has_total=True), example_url='/api/v1/json/search/posts?q=subject:time wasting thread'),
+	Route(name='search_images', method='GET', path=UrlPath(original='/api/v1/json/search/images', template='/api/v1/json/search/images', params=[]), allowed_query_parameters=[Parameter(name='key', type='String', description='An optional authentication token. If omitted, no user will be authenticated.\n\nYou can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).', optional=True, api_name='key'), Parameter(name='filter_id', type='Integer', description='Assuming the user can access the filter ID given by the parameter, overrides the current filter for this request. This is primarily useful for unauthenticated API access.', optional=True, api_name='filter_id'), Parameter(name='page', type='Integer', description='Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.', optional=True, api_name='page'), Parameter(name='per_page', type='Integer', description='Controls the number of results per page, up to a limit of 50, if the response is paginated. The default is 25.', optional=True, api_name='per_page'), Parameter(name='query', type='String', description='The current search query, if the request is a search request.', optional=False, api_name='q'), Parameter(name='sort_direction', type='String', description='The current sort direction, if the request is a search request.', optional=True, api_name='sd'), Parameter(name='sort_field', type='String', description='The current sort field, if the request is a search request.', optional=True, api_name='sf')], description='Executes the search given by the `q` query parameter, and returns **image responses**.', response_format=ResponseType(schema='{"images":[Image]}', is_list=True, key='images', class_name='Image', has_total=True), example_url='/api/v1/json/search/images?q=safe'),
+	Route(name='search_tags', method='GET', path=UrlPath(original='/api/v1/json/search/tags', template='/api/v1/json/search/tags', params=[]), allowed_query_parameters=[Parameter(name='page', type='Integer', description='Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.', optional=True, api_name='page'), Parameter(name='query', type='String', description='The current search query, if the request is a search request.', optional=False, api_name='q')], description='Executes the search given by the `q` query parameter, and returns **tag responses** sorted by descending image count.', response_format=ResponseType(schema='{"tags":[Tag]}', is_list=True, key='tags', class_name='Tag', has_total=True), example_url='/api/v1/json/search/tags?q=analyzed_name:wing'),
+	Route(name='search_reverse', method='POST', path=UrlPath(original='/api/v1/json/search/reverse', template='/api/v1/json/search/reverse', params=[]), allowed_query_parameters=[Parameter(name='key', type='String', description='An optional authentication token. If omitted, no user will be authenticated.\n\nYou can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).', optional=True, api_name='key'), Parameter(name='url', type='String', description='Link a deviantART page, a Tumblr post, or the image directly.', optional=False, api_name='url'), Parameter(name='distance', type='Float', description='Match distance (suggested values: between 0.2 and 0.5).', optional=True, api_name='distance')], description='Returns **image responses** based on the results of reverse-searching the image given by the `url` query parameter.', response_format=ResponseType(schema='{"images":[Image]}', is_list=True, key='images', class_name='Image', has_total=True), example_url='/api/v1/json/search/reverse?url=https://derpicdn.net/img/2019/12/24/2228439/full.jpg'),
 	Route(name='forums', method='GET', path=UrlPath(original='/api/v1/json/forums', template='/api/v1/json/forums', params=[]), allowed_query_parameters=[], description='Fetches a list of **forum responses**.', response_format=ResponseType(schema='{"forums":[Forum]}', is_list=True, key='forums', class_name='Forum', has_total=False), example_url='/api/v1/json/forums'),
 	Route(name='forum', method='GET', path=UrlPath(original='/api/v1/json/forums/:short_name', template='/api/v1/json/forums/{short_name}', params=[Parameter(name='short_name', type='String', description='the variable short_name part of the url.', optional=False, api_name='short_name')]), allowed_query_parameters=[], description='Fetches a **forum response** for the abbreviated name given by the `short_name` URL parameter.', response_format=ResponseType(schema='{"forum":Forum}', is_list=False, key='forum', class_name='Forum', has_total=False), example_url='/api/v1/json/forums/dis'),
 	Route(name='forum_topics', method='GET', path=UrlPath(original='/api/v1/json/forums/:short_name/topics', template='/api/v1/json/forums/{short_name}/topics', params=[Parameter(name='short_name', type='String', description='the variable short_name part of the url.', optional=False, api_name='short_name')]), allowed_query_parameters=[Parameter(name='page', type='Integer', description='Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.', optional=True, api_name='page')], description='Fetches a list of **topic responses** for the abbreviated forum name given by the `short_name` URL parameter.', response_format=ResponseType(schema='{"topics":[Topic]}', is_list=True, key='topics', class_name='Topic', has_total=False), example_url='/api/v1/json/forums/dis/topics'),
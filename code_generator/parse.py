@@ -347,6 +347,10 @@ for row in rows:
             # end if
         # end for
     # end if
+    if r.name.startswith('search_'):
+        # The documentation doesn't list it, but the search responses all contain the `total` amount of results as well.
+        r.response_format.has_total = True
+    # end if
     routes.append(r)
 # end def
 
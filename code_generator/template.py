@@ -43,6 +43,7 @@ def get_template(file_name):
 init_template = get_template("init.template")
 classes_template = get_template("classes.template")
 functions_template = get_template("functions.template")
+schemas_template = get_template("schemas.template")
 
 mkdir_p('../derpi/syncrounous/')
 mkdir_p('../derpi/asyncrounous/')
@@ -68,7 +69,6 @@ with open('../derpi/asyncrounous/models.py', 'w') as f:
     f.write(classes_template.render(classes=classes, is_asyncio=True))
 # end with
 
-
-
-
-
+with open('../derpi/schemas.py', 'w') as f:
+    f.write(schemas_template.render(classes=classes))
+# end with
@@ -6,11 +6,26 @@ __author__ = 'luckydonald'
 from luckydonaldUtils.logger import logging
 from luckydonaldUtils.exceptions import assert_type_or_raise
 
-from typing import Union, List, Dict, Type, Any
+from typing import Union, List, Dict, Type, Any, Tuple, Callable, AsyncIterator, Awaitable
 from .models import *
+from ..cache import BaseCache, MemoryCache, SQLiteCache, make_cache_key
+from ..exceptions import *
+from ..retry import RetryPolicy, NO_RETRY
+from ..ratelimit import RateLimiter, TokenBucket, FileTokenBucket
+from ..decoding import set_json_decoder, get_json_decoder, decode_json
+from ..streaming import JsonArrayStream
+from ..concurrency import AdaptiveConcurrencyLimiter
+
+import json
+import math
+import time
+import base64
+import asyncio
+import weakref
 
 # import httpx, an async http client
 import httpx as internet
+TRANSPORT_ERRORS = (internet.TransportError,)
 
 
 logger = logging.getLogger(__name__)
@@ -19,9 +34,220 @@ if __name__ == '__main__':
 # end if
 
 
+MAX_PER_PAGE = 50  # the api returns at most that many items per page, even if more were requested.
+
+
+def _pin_query(query: Union[str, None], condition: str) -> str:
+    """
+    Narrows a search query down with another condition, like `id.lte:1234`.
+
+    :param query: The search query.
+    :param condition: The condition the results have to match as well.
+    :return: Both combined. For an empty query (which `() && ...` would be a syntax error for) only the condition.
+    """
+    if not query or not query.strip():
+        return condition
+    # end if
+    return f'({query}) && {condition}'
+# end def
+
+
+async def _paginate(
+    fetch_page: Callable[[int], Awaitable[List[Any]]],
+    per_page: Union[int, None] = None,
+    limit: Union[int, None] = None,
+) -> AsyncIterator[Any]:
+    """
+    Walks through all the pages, starting at page `1`, yielding every single item.
+    While the items of a page are consumed, the next page is already requested in the background.
+
+    :param fetch_page: Coroutine function loading a single page.
+    :param per_page: The page size we requested, if known. A shorter page is the last one.
+                     Capped at `MAX_PER_PAGE`, as the api doesn't return more.
+    :param limit: Stop after that many items. `None` to get all of them.
+    """
+    page = 1
+    count = 0
+    if per_page is not None:
+        per_page = min(per_page, MAX_PER_PAGE)
+    # end if
+    next_page: Union[asyncio.Future, None] = asyncio.ensure_future(fetch_page(page))
+    try:
+        while next_page is not None:
+            items = await next_page
+            next_page = None
+            if not items:
+                return
+            # end if
+            if per_page is None:  # the first page tells us how big they are.
+                per_page = len(items)
+            # end if
+            if len(items) >= per_page and (limit is None or count + len(items) < limit):
+                page += 1
+                next_page = asyncio.ensure_future(fetch_page(page))
+            # end if
+            for item in items:
+                yield item
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+                # end if
+            # end for
+        # end while
+    finally:
+        if next_page is not None:  # we have been stopped early, so we don't need it any longer.
+            next_page.cancel()
+        # end if
+    # end try
+# end def
+
+
+async def _fan_out(
+    fetch_page: Callable[[int], Awaitable[SearchResult]],
+    first_page: SearchResult,
+    per_page: Union[int, None] = None,
+    limit: Union[int, None] = None,
+    max_concurrency: int = 4,
+) -> SearchResult:
+    """
+    Loads all the pages after `first_page` concurrently, with at most `max_concurrency` requests at the same time.
+
+    :param fetch_page: Coroutine function loading a single page.
+    :param first_page: The already loaded first page, telling us the `total` amount of results.
+    :param per_page: The page size we requested, if known. Otherwise the size of the first page is used.
+                     Capped at `MAX_PER_PAGE`, as the api doesn't return more.
+    :param limit: Stop after that many items. `None` to get all of them.
+    :param max_concurrency: How many pages may be requested at the same time.
+    """
+    hits = list(first_page.hits)
+    wanted = first_page.total if limit is None else min(first_page.total, limit)
+    if per_page is None:
+        per_page = len(hits)
+    # end if
+    per_page = min(per_page, MAX_PER_PAGE)
+    if per_page and len(hits) < wanted:
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch_page_limited(page: int) -> SearchResult:
+            async with semaphore:
+                return await fetch_page(page)
+            # end with
+        # end def
+
+        pages = await asyncio.gather(*[
+            fetch_page_limited(page) for page in range(2, math.ceil(wanted / per_page) + 1)
+        ])
+        for page in pages:
+            hits.extend(page.hits)
+        # end for
+    # end if
+    return SearchResult(hits=hits[:wanted], total=first_page.total)
+# end def
+
+class SearchCursor(object):
+    """
+    Walks through the results of a search with keyset pagination:
+    Instead of requesting page after page, the results are sorted by `id` (descending),
+    and every next page is requested as the first page of everything older than the last item we've seen (`id.lt:<id>`).
+    That way every page costs the same, no matter how deep we are, and new items arriving while crawling don't shift the pages.
+
+    To be able to resume later, store the `token`. It always points after the last item yielded so far,
+    and can be handed in as `cursor=token` to continue from there.
+    >>> cursor = cursor_search_images('safe')
+    >>> async for image in cursor:
+    ...     store(image, resume_token=cursor.token)
+    """
+
+    def __init__(
+        self,
+        fetch_page: Callable[[str], Awaitable[SearchResult]],
+        query: str,
+        token: Union[str, None] = None,
+        limit: Union[int, None] = None,
+        raw: bool = False,
+    ):
+        """
+        :param fetch_page: Coroutine function loading the first page for a given query.
+        :param query: The search query to walk through.
+        :param token: A `token` of an earlier cursor with the same `query`, to continue where that one stopped.
+        :param limit: Stop after that many items. `None` to get all of them.
+        :param raw: Yield the json of the items (see their `to_dict()`) instead of the models.
+        """
+        self._fetch_page = fetch_page
+        self._raw = raw
+        self.query = query
+        self.last_id: Union[int, None] = None
+        if token is not None:
+            token_query, self.last_id = self.decode_token(token)
+            if token_query != query:
+                raise ValueError(f'The cursor token belongs to the query {token_query!r}, not {query!r}.')
+            # end if
+        # end if
+        self.limit = limit
+        self.count = 0
+        self._items: List[Any] = []
+        self._is_last_page = False
+    # end def
+
+    @property
+    def token(self) -> str:
+        """
+        A string representing the current position, to continue after the last yielded item.
+        """
+        return self.encode_token(self.query, self.last_id)
+    # end def
+
+    @staticmethod
+    def encode_token(query: str, last_id: Union[int, None]) -> str:
+        data = json.dumps({'q': query, 'lt': last_id}, separators=(',', ':')).encode('utf-8')
+        return base64.urlsafe_b64encode(data).decode('ascii')
+    # end def
+
+    @staticmethod
+    def decode_token(token: str) -> Tuple[str, Union[int, None]]:
+        data = json.loads(base64.urlsafe_b64decode(token.encode('ascii')).decode('utf-8'))
+        return data['q'], data['lt']
+    # end def
+
+    def page_query(self) -> str:
+        """
+        The query to request the next page with.
+        """
+        if self.last_id is None:
+            return self.query
+        # end if
+        return _pin_query(self.query, f'id.lt:{self.last_id}')
+    # end def
+
+    def __aiter__(self) -> 'SearchCursor':
+        return self
+    # end def
+
+    async def __anext__(self) -> Any:
+        if self.limit is not None and self.count >= self.limit:
+            raise StopAsyncIteration
+        # end if
+        if not self._items and not self._is_last_page:
+            page: SearchResult = await self._fetch_page(self.page_query())
+            self._items = list(page.hits)
+            # `total` counts everything older than `last_id`, so if we got all of that, there's nothing left.
+            self._is_last_page = len(self._items) >= page.total
+        # end if
+        if not self._items:
+            raise StopAsyncIteration
+        # end if
+        item = self._items.pop(0)
+        self.last_id = item.id
+        self.count += 1
+        return item.to_dict() if self._raw else item
+    # end def
+# end class
+
+
 async def comment(
     comment_id: int,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: Union[None, bool, str] = None,
 ) -> Comment:
     """
     Fetches a **comment response** for the comment ID referenced by the `comment_id` URL parameter.
@@ -53,15 +279,34 @@ async def comment(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
     :rtype:  Comment
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/comments/{comment_id}')
-    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client)
-    result: Dict[str, Dict] = response.json()
+    response: internet.Response = await DerpiClient.static_request('GET', url=_url, route='comment', client=_client)
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, Dict] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Comment] = LazyComment
+    elif _raw:
+        return result
+    else:
+        model: Type[Comment] = Comment
+    # end if
     result: Dict = result['comment']
     assert_type_or_raise(result, dict, parameter_name='result')
-    result: Comment = Comment.from_dict(result)
+    result: Comment = model.from_dict(result)
     return result
 # end def comment
 
@@ -71,6 +316,7 @@ async def image(
     filter_id: Union[int, None] = None,
     key: Union[str, None] = None,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: Union[None, bool, str] = None,
 ) -> Image:
     """
     Fetches an **image response** for the image ID referenced by the `image_id` URL parameter.
@@ -110,18 +356,37 @@ async def image(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
     :rtype:  Image
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/images/{image_id}')
-    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params={
+    response: internet.Response = await DerpiClient.static_request('GET', url=_url, route='image', client=_client, params={
         'filter_id': filter_id,
         'key': key,
     })
-    result: Dict[str, Dict] = response.json()
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, Dict] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Image] = LazyImage
+    elif _raw:
+        return result
+    else:
+        model: Type[Image] = Image
+    # end if
     result: Dict = result['image']
     assert_type_or_raise(result, dict, parameter_name='result')
-    result: Image = Image.from_dict(result)
+    result: Image = model.from_dict(result)
     return result
 # end def image
 
@@ -130,6 +395,7 @@ async def image_upload(
     url: str,
     key: Union[str, None] = None,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: Union[None, bool, str] = None,
 ) -> Image:
     """
     Submits a new image. Both `key` and `url` are required. Errors will result in an `{"errors":image-errors-response}`.
@@ -166,24 +432,44 @@ async def image_upload(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
     :rtype:  Image
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/images')
-    response: internet.Response = await DerpiClient.static_request('POST', url=_url, client=_client, params={
+    response: internet.Response = await DerpiClient.static_request('POST', url=_url, route='image_upload', client=_client, params={
         'url': url,
         'key': key,
     })
-    result: Dict[str, Dict] = response.json()
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, Dict] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Image] = LazyImage
+    elif _raw:
+        return result
+    else:
+        model: Type[Image] = Image
+    # end if
     result: Dict = result['image']
     assert_type_or_raise(result, dict, parameter_name='result')
-    result: Image = Image.from_dict(result)
+    result: Image = model.from_dict(result)
     return result
 # end def image_upload
 
 
 async def featured_image(
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: Union[None, bool, str] = None,
 ) -> Image:
     """
     Fetches an **image response** for the for the current featured image.
@@ -212,15 +498,34 @@ async def featured_image(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
     :rtype:  Image
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/images/featured')
-    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client)
-    result: Dict[str, Dict] = response.json()
+    response: internet.Response = await DerpiClient.static_request('GET', url=_url, route='featured_image', client=_client)
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, Dict] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Image] = LazyImage
+    elif _raw:
+        return result
+    else:
+        model: Type[Image] = Image
+    # end if
     result: Dict = result['image']
     assert_type_or_raise(result, dict, parameter_name='result')
-    result: Image = Image.from_dict(result)
+    result: Image = model.from_dict(result)
     return result
 # end def featured_image
 
@@ -228,6 +533,7 @@ async def featured_image(
 async def tag(
     tag_id: str,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: Union[None, bool, str] = None,
 ) -> Tag:
     """
     Fetches a **tag response** for the **tag slug** given by the `tag_id` URL parameter. The tag's ID is **not** used. For getting a tag by ID the search endpoint can be used like `search/tags?q=id:4458`.
@@ -259,15 +565,34 @@ async def tag(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
     :rtype:  Tag
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/tags/{tag_id}')
-    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client)
-    result: Dict[str, Dict] = response.json()
+    response: internet.Response = await DerpiClient.static_request('GET', url=_url, route='tag', client=_client)
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, Dict] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Tag] = LazyTag
+    elif _raw:
+        return result
+    else:
+        model: Type[Tag] = Tag
+    # end if
     result: Dict = result['tag']
     assert_type_or_raise(result, dict, parameter_name='result')
-    result: Tag = Tag.from_dict(result)
+    result: Tag = model.from_dict(result)
     return result
 # end def tag
 
@@ -275,6 +600,7 @@ async def tag(
 async def post(
     post_id: int,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: Union[None, bool, str] = None,
 ) -> Post:
     """
     Fetches a **post response** for the post ID given by the `post_id` URL parameter.
@@ -306,15 +632,34 @@ async def post(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
     :rtype:  Post
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/posts/{post_id}')
-    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client)
-    result: Dict[str, Dict] = response.json()
+    response: internet.Response = await DerpiClient.static_request('GET', url=_url, route='post', client=_client)
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, Dict] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Post] = LazyPost
+    elif _raw:
+        return result
+    else:
+        model: Type[Post] = Post
+    # end if
     result: Dict = result['post']
     assert_type_or_raise(result, dict, parameter_name='result')
-    result: Post = Post.from_dict(result)
+    result: Post = model.from_dict(result)
     return result
 # end def post
 
@@ -322,6 +667,7 @@ async def post(
 async def user(
     user_id: int,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: Union[None, bool, str] = None,
 ) -> User:
     """
     Fetches a **profile response** for the user ID given by the `user_id` URL parameter.
@@ -353,15 +699,34 @@ async def user(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
     :rtype:  User
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/profiles/{user_id}')
-    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client)
-    result: Dict[str, Dict] = response.json()
+    response: internet.Response = await DerpiClient.static_request('GET', url=_url, route='user', client=_client)
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, Dict] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[User] = LazyUser
+    elif _raw:
+        return result
+    else:
+        model: Type[User] = User
+    # end if
     result: Dict = result['user']
     assert_type_or_raise(result, dict, parameter_name='result')
-    result: User = User.from_dict(result)
+    result: User = model.from_dict(result)
     return result
 # end def user
 
@@ -370,6 +735,7 @@ async def filter(
     filter_id: int,
     key: Union[str, None] = None,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: Union[None, bool, str] = None,
 ) -> Filter:
     """
     Fetches a **filter response** for the filter ID given by the `filter_id` URL parameter.
@@ -406,17 +772,36 @@ async def filter(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
     :rtype:  Filter
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/filters/{filter_id}')
-    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params={
+    response: internet.Response = await DerpiClient.static_request('GET', url=_url, route='filter', client=_client, params={
         'key': key,
     })
-    result: Dict[str, Dict] = response.json()
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, Dict] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Filter] = LazyFilter
+    elif _raw:
+        return result
+    else:
+        model: Type[Filter] = Filter
+    # end if
     result: Dict = result['filter']
     assert_type_or_raise(result, dict, parameter_name='result')
-    result: Filter = Filter.from_dict(result)
+    result: Filter = model.from_dict(result)
     return result
 # end def filter
 
@@ -424,6 +809,7 @@ async def filter(
 async def system_filters(
     page: Union[int, None] = None,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: Union[None, bool, str] = None,
 ) -> List[Filter]:
     """
     Fetches a list of **filter responses** that are flagged as being **system** filters (and thus usable by anyone).
@@ -455,28 +841,96 @@ async def system_filters(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
     :rtype:  List[Filter]
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/filters/system')
-    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params={
+    response: internet.Response = await DerpiClient.static_request('GET', url=_url, route='system_filters', client=_client, params={
         'page': page,
     })
-    result: Dict[str, List[Dict]] = response.json()
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, List[Dict]] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Filter] = LazyFilter
+    elif _raw:
+        return result
+    else:
+        model: Type[Filter] = Filter
+    # end if
     result: List[Dict] = result['filters']
     assert_type_or_raise(result, list, parameter_name='result')
     result: List[Filter] = [
-        Filter.from_dict(item)
+        model.from_dict(item)
         for item in result
     ]
     return result
 # end def system_filters
 
 
+def iter_system_filters(
+    limit: Union[int, None] = None,
+    _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: Union[None, bool, str] = None,
+) -> AsyncIterator[Filter]:
+    """
+    Walks through all the pages of `system_filters(...)`, yielding every single `Filter`.
+    While the items of a page are consumed, the next page is already requested in the background.
+
+    >>> async for item in iter_system_filters(...):
+    ...     print(item)
+    
+    :param limit: Stop after that many items. `None` to get all of them.
+    :type  limit: int|None
+
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `httpx.AsyncClient`, see `system_filters(...)`.
+    :type  _client: httpx.AsyncClient|DerpiClient|None
+
+    :param _raw: Skip building the models: `True` (or `'bytes'`) yields the decoded json of every item.
+                 `'lazy'` yields lazy models (like `LazyImage`). `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: Async iterator over the parsed results from the API.
+    :rtype:  AsyncIterator[Filter]
+    """
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        _raw = True  # a single item has no undecoded body of its own.
+    # end if
+
+    async def fetch_page(page: int) -> Union[List[Filter], List[Dict]]:
+        result = await system_filters(
+            page=page,
+            _client=_client,
+            _raw=_raw,
+        )
+        if _raw is True:
+            return result['filters']
+        # end if
+        return result
+    # end def
+
+    return _paginate(fetch_page, per_page=None, limit=limit)
+# end def iter_system_filters
+
+
 async def user_filters(
     key: str,
     page: Union[int, None] = None,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: Union[None, bool, str] = None,
 ) -> List[Filter]:
     """
     Fetches a list of **filter responses** that belong to the user given by **key**. If no **key** is given or it is invalid, will return a **403 Forbidden** error.
@@ -513,28 +967,103 @@ async def user_filters(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
     :rtype:  List[Filter]
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/filters/user')
-    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params={
+    response: internet.Response = await DerpiClient.static_request('GET', url=_url, route='user_filters', client=_client, params={
         'key': key,
         'page': page,
     })
-    result: Dict[str, List[Dict]] = response.json()
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, List[Dict]] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Filter] = LazyFilter
+    elif _raw:
+        return result
+    else:
+        model: Type[Filter] = Filter
+    # end if
     result: List[Dict] = result['filters']
     assert_type_or_raise(result, list, parameter_name='result')
     result: List[Filter] = [
-        Filter.from_dict(item)
+        model.from_dict(item)
         for item in result
     ]
     return result
 # end def user_filters
 
 
+def iter_user_filters(
+    key: str,
+    limit: Union[int, None] = None,
+    _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: Union[None, bool, str] = None,
+) -> AsyncIterator[Filter]:
+    """
+    Walks through all the pages of `user_filters(...)`, yielding every single `Filter`.
+    While the items of a page are consumed, the next page is already requested in the background.
+
+    >>> async for item in iter_user_filters(...):
+    ...     print(item)
+    
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+    :type  key: str
+    
+    :param limit: Stop after that many items. `None` to get all of them.
+    :type  limit: int|None
+
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `httpx.AsyncClient`, see `user_filters(...)`.
+    :type  _client: httpx.AsyncClient|DerpiClient|None
+
+    :param _raw: Skip building the models: `True` (or `'bytes'`) yields the decoded json of every item.
+                 `'lazy'` yields lazy models (like `LazyImage`). `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: Async iterator over the parsed results from the API.
+    :rtype:  AsyncIterator[Filter]
+    """
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        _raw = True  # a single item has no undecoded body of its own.
+    # end if
+
+    async def fetch_page(page: int) -> Union[List[Filter], List[Dict]]:
+        result = await user_filters(
+            key=key,
+            page=page,
+            _client=_client,
+            _raw=_raw,
+        )
+        if _raw is True:
+            return result['filters']
+        # end if
+        return result
+    # end def
+
+    return _paginate(fetch_page, per_page=None, limit=limit)
+# end def iter_user_filters
+
+
 async def oembed(
     url: str,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: Union[None, bool, str] = None,
 ) -> Oembed:
     """
     Fetches an **oEmbed response** for the given app link or CDN URL.
@@ -566,16 +1095,35 @@ async def oembed(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
     :rtype:  Oembed
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/oembed')
-    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params={
+    response: internet.Response = await DerpiClient.static_request('GET', url=_url, route='oembed', client=_client, params={
         'url': url,
     })
-    result: Dict = response.json()
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Oembed] = LazyOembed
+    elif _raw:
+        return result
+    else:
+        model: Type[Oembed] = Oembed
+    # end if
     assert_type_or_raise(result, dict, parameter_name='result')
-    result: Oembed = Oembed.from_dict(result)
+    result: Oembed = model.from_dict(result)
     return result
 # end def oembed
 
@@ -585,7 +1133,8 @@ async def search_comments(
     page: Union[int, None] = None,
     key: Union[str, None] = None,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
-) -> List[Comment]:
+    _raw: Union[None, bool, str] = None,
+) -> SearchResult[Comment]:
     """
     Executes the search given by the `q` query parameter (case insensitive and stemming is applied. If you search for **best pony** results like **Best Ponies** are also be returned), and returns **comment responses** sorted by descending creation time.
 
@@ -593,7 +1142,7 @@ async def search_comments(
     It will take in account `self._base_url` and fill in all url variables and append the data parameters as needed,
     which would for example look like this: https://derpibooru.org/api/v1/json/search/comments?q=image_id:1000000
 
-    The API should return json looking like `{"comments":[Comment]}` which will then be parsed to the python result `List[Comment]`.
+    The API should return json looking like `{"comments":[Comment]}` which will then be parsed to the python result `SearchResult[Comment]`.
     
     :param query: The current search query, if the request is a search request.
                   Note, on derpibooru's side this parameter is called `q`.
@@ -625,32 +1174,249 @@ async def search_comments(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
-    :rtype:  List[Comment]
+    :rtype:  SearchResult[Comment]
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/search/comments')
-    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params={
+    response: internet.Response = await DerpiClient.static_request('GET', url=_url, route='search_comments', client=_client, params={
         'q': query,
         'page': page,
         'key': key,
     })
-    result: Dict[str, List[Dict]] = response.json()
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, Union[List[Dict], int]] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Comment] = LazyComment
+    elif _raw:
+        return result
+    else:
+        model: Type[Comment] = Comment
+    # end if
+    total: int = result['total']
     result: List[Dict] = result['comments']
     assert_type_or_raise(result, list, parameter_name='result')
-    result: List[Comment] = [
-        Comment.from_dict(item)
-        for item in result
-    ]
+    result: SearchResult[Comment] = SearchResult(
+        hits=[
+            model.from_dict(item)
+            for item in result
+        ],
+        total=total,
+    )
     return result
 # end def search_comments
 
 
+def iter_search_comments(
+    query: str,
+    key: Union[str, None] = None,
+    limit: Union[int, None] = None,
+    _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: Union[None, bool, str] = None,
+) -> AsyncIterator[Comment]:
+    """
+    Walks through all the pages of `search_comments(...)`, yielding every single `Comment`.
+    While the items of a page are consumed, the next page is already requested in the background.
+
+    >>> async for item in iter_search_comments(...):
+    ...     print(item)
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+    :type  key: str|None
+    
+    :param limit: Stop after that many items. `None` to get all of them.
+    :type  limit: int|None
+
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `httpx.AsyncClient`, see `search_comments(...)`.
+    :type  _client: httpx.AsyncClient|DerpiClient|None
+
+    :param _raw: Skip building the models: `True` (or `'bytes'`) yields the decoded json of every item.
+                 `'lazy'` yields lazy models (like `LazyImage`). `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: Async iterator over the parsed results from the API.
+    :rtype:  AsyncIterator[Comment]
+    """
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        _raw = True  # a single item has no undecoded body of its own.
+    # end if
+
+    async def fetch_page(page: int) -> Union[SearchResult[Comment], List[Dict]]:
+        result = await search_comments(
+            query=query,
+            page=page,
+            key=key,
+            _client=_client,
+            _raw=_raw,
+        )
+        if _raw is True:
+            return result['comments']
+        # end if
+        return result
+    # end def
+
+    return _paginate(fetch_page, per_page=None, limit=limit)
+# end def iter_search_comments
+
+
+async def fan_out_search_comments(
+    query: str,
+    key: Union[str, None] = None,
+    limit: Union[int, None] = None,
+    max_concurrency: int = 4,
+    _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: Union[None, bool, str] = None,
+) -> SearchResult[Comment]:
+    """
+    Loads all the results of `search_comments(...)` at once:
+    After the first page told us the `total` amount of results, all the remaining pages are requested concurrently,
+    with at most `max_concurrency` requests at the same time.
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+    :type  key: str|None
+    
+    :param limit: Stop after that many items. `None` to get all of them.
+    :type  limit: int|None
+
+    :param max_concurrency: How many pages may be requested at the same time.
+    :type  max_concurrency: int
+
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `httpx.AsyncClient`, see `search_comments(...)`.
+    :type  _client: httpx.AsyncClient|DerpiClient|None
+
+    :param _raw: Skip building the models: `True` (or `'bytes'`) returns json like a single page, with all the items.
+                 `'lazy'` returns lazy models (like `LazyImage`). `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: All the parsed results from the API.
+    :rtype:  SearchResult[Comment]
+    """
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    model_mode = 'lazy' if _raw else False  # the ids and the total are needed, the lazy models just wrap the json.
+
+    async def fetch_page(page: int) -> SearchResult[Comment]:
+        return await search_comments(
+            query=query,
+            page=page,
+            key=key,
+            _client=_client,
+            _raw=model_mode,
+        )
+    # end def
+
+    result = await _fan_out(
+        fetch_page, await fetch_page(1),
+        per_page=None, limit=limit, max_concurrency=max_concurrency,
+    )
+    if _raw and _raw != 'lazy':
+        return {'comments': [item.to_dict() for item in result.hits], 'total': result.total}
+    # end if
+    return result
+# end def fan_out_search_comments
+
+
+async def stream_search_comments(
+    query: str,
+    page: Union[int, None] = None,
+    key: Union[str, None] = None,
+    _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: Union[None, bool, str] = None,
+) -> AsyncIterator[Comment]:
+    """
+    Like `search_comments(...)`, but parses the page while it is still being downloaded,
+    yielding every single `Comment` as soon as it arrived completely.
+    That gets you the first results earlier, and never keeps the whole page in memory.
+    Note, those requests are neither cached nor retried, see `DerpiClient.static_stream(...)`.
+
+    >>> async for item in stream_search_comments(...):
+    ...     print(item)
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+    :type  page: int|None
+    
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+    :type  key: str|None
+    
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `httpx.AsyncClient`, see `search_comments(...)`.
+    :type  _client: httpx.AsyncClient|DerpiClient|None
+
+    :param _raw: Skip building the models: `True` (or `'bytes'`) yields the decoded json of every item.
+                 `'lazy'` yields lazy models (like `LazyImage`). `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: Async iterator over the parsed results from the API.
+    :rtype:  AsyncIterator[Comment]
+    """
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'lazy':
+        model: Union[Type[Comment], None] = LazyComment
+    elif _raw:
+        model: Union[Type[Comment], None] = None
+    else:
+        model: Union[Type[Comment], None] = Comment
+    # end if
+    _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/search/comments')
+    items = JsonArrayStream('comments')
+    chunks = DerpiClient.static_stream('GET', url=_url, client=_client, params={
+        'q': query,
+        'page': page,
+        'key': key,
+    })
+    try:
+        async for chunk in chunks:
+            for item in items.feed(chunk):
+                yield item if model is None else model.from_dict(item)
+            # end for
+        # end for
+    finally:
+        await chunks.aclose()
+    # end try
+    items.close()
+# end def stream_search_comments
+
+
 async def search_galleries(
     query: str,
     page: Union[int, None] = None,
     key: Union[str, None] = None,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
-) -> List[Gallery]:
+    _raw: Union[None, bool, str] = None,
+) -> SearchResult[Gallery]:
     """
     Executes the search given by the `q` query parameter, and returns **gallery responses** sorted by descending creation time.
 
@@ -658,7 +1424,7 @@ async def search_galleries(
     It will take in account `self._base_url` and fill in all url variables and append the data parameters as needed,
     which would for example look like this: https://derpibooru.org/api/v1/json/search/galleries?q=title:mean*
 
-    The API should return json looking like `{"galleries":[Gallery]}` which will then be parsed to the python result `List[Gallery]`.
+    The API should return json looking like `{"galleries":[Gallery]}` which will then be parsed to the python result `SearchResult[Gallery]`.
     
     :param query: The current search query, if the request is a search request.
                   Note, on derpibooru's side this parameter is called `q`.
@@ -690,92 +1456,894 @@ async def search_galleries(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
-    :rtype:  List[Gallery]
+    :rtype:  SearchResult[Gallery]
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/search/galleries')
-    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params={
+    response: internet.Response = await DerpiClient.static_request('GET', url=_url, route='search_galleries', client=_client, params={
         'q': query,
         'page': page,
         'key': key,
     })
-    result: Dict[str, List[Dict]] = response.json()
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, Union[List[Dict], int]] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Gallery] = LazyGallery
+    elif _raw:
+        return result
+    else:
+        model: Type[Gallery] = Gallery
+    # end if
+    total: int = result['total']
     result: List[Dict] = result['galleries']
     assert_type_or_raise(result, list, parameter_name='result')
-    result: List[Gallery] = [
-        Gallery.from_dict(item)
-        for item in result
-    ]
+    result: SearchResult[Gallery] = SearchResult(
+        hits=[
+            model.from_dict(item)
+            for item in result
+        ],
+        total=total,
+    )
     return result
 # end def search_galleries
 
 
-async def search_posts(
+def iter_search_galleries(
     query: str,
-    page: Union[int, None] = None,
     key: Union[str, None] = None,
+    limit: Union[int, None] = None,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
-) -> List[Post]:
+    _raw: Union[None, bool, str] = None,
+) -> AsyncIterator[Gallery]:
     """
-    Executes the search given by the `q` query parameter, and returns **post responses** sorted by descending creation time.
+    Walks through all the pages of `search_galleries(...)`, yielding every single `Gallery`.
+    While the items of a page are consumed, the next page is already requested in the background.
 
-    A request will be sent to the following endpoint: `/api/v1/json/search/posts`
+    >>> async for item in iter_search_galleries(...):
+    ...     print(item)
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+    :type  key: str|None
+    
+    :param limit: Stop after that many items. `None` to get all of them.
+    :type  limit: int|None
+
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `httpx.AsyncClient`, see `search_galleries(...)`.
+    :type  _client: httpx.AsyncClient|DerpiClient|None
+
+    :param _raw: Skip building the models: `True` (or `'bytes'`) yields the decoded json of every item.
+                 `'lazy'` yields lazy models (like `LazyImage`). `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: Async iterator over the parsed results from the API.
+    :rtype:  AsyncIterator[Gallery]
+    """
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        _raw = True  # a single item has no undecoded body of its own.
+    # end if
+
+    async def fetch_page(page: int) -> Union[SearchResult[Gallery], List[Dict]]:
+        result = await search_galleries(
+            query=query,
+            page=page,
+            key=key,
+            _client=_client,
+            _raw=_raw,
+        )
+        if _raw is True:
+            return result['galleries']
+        # end if
+        return result
+    # end def
+
+    return _paginate(fetch_page, per_page=None, limit=limit)
+# end def iter_search_galleries
+
+
+async def fan_out_search_galleries(
+    query: str,
+    key: Union[str, None] = None,
+    limit: Union[int, None] = None,
+    max_concurrency: int = 4,
+    _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: Union[None, bool, str] = None,
+) -> SearchResult[Gallery]:
+    """
+    Loads all the results of `search_galleries(...)` at once:
+    After the first page told us the `total` amount of results, all the remaining pages are requested concurrently,
+    with at most `max_concurrency` requests at the same time.
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+    :type  key: str|None
+    
+    :param limit: Stop after that many items. `None` to get all of them.
+    :type  limit: int|None
+
+    :param max_concurrency: How many pages may be requested at the same time.
+    :type  max_concurrency: int
+
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `httpx.AsyncClient`, see `search_galleries(...)`.
+    :type  _client: httpx.AsyncClient|DerpiClient|None
+
+    :param _raw: Skip building the models: `True` (or `'bytes'`) returns json like a single page, with all the items.
+                 `'lazy'` returns lazy models (like `LazyImage`). `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: All the parsed results from the API.
+    :rtype:  SearchResult[Gallery]
+    """
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    model_mode = 'lazy' if _raw else False  # the ids and the total are needed, the lazy models just wrap the json.
+
+    async def fetch_page(page: int) -> SearchResult[Gallery]:
+        return await search_galleries(
+            query=query,
+            page=page,
+            key=key,
+            _client=_client,
+            _raw=model_mode,
+        )
+    # end def
+
+    result = await _fan_out(
+        fetch_page, await fetch_page(1),
+        per_page=None, limit=limit, max_concurrency=max_concurrency,
+    )
+    if _raw and _raw != 'lazy':
+        return {'galleries': [item.to_dict() for item in result.hits], 'total': result.total}
+    # end if
+    return result
+# end def fan_out_search_galleries
+
+
+async def stream_search_galleries(
+    query: str,
+    page: Union[int, None] = None,
+    key: Union[str, None] = None,
+    _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: Union[None, bool, str] = None,
+) -> AsyncIterator[Gallery]:
+    """
+    Like `search_galleries(...)`, but parses the page while it is still being downloaded,
+    yielding every single `Gallery` as soon as it arrived completely.
+    That gets you the first results earlier, and never keeps the whole page in memory.
+    Note, those requests are neither cached nor retried, see `DerpiClient.static_stream(...)`.
+
+    >>> async for item in stream_search_galleries(...):
+    ...     print(item)
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+    :type  page: int|None
+    
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+    :type  key: str|None
+    
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `httpx.AsyncClient`, see `search_galleries(...)`.
+    :type  _client: httpx.AsyncClient|DerpiClient|None
+
+    :param _raw: Skip building the models: `True` (or `'bytes'`) yields the decoded json of every item.
+                 `'lazy'` yields lazy models (like `LazyImage`). `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: Async iterator over the parsed results from the API.
+    :rtype:  AsyncIterator[Gallery]
+    """
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'lazy':
+        model: Union[Type[Gallery], None] = LazyGallery
+    elif _raw:
+        model: Union[Type[Gallery], None] = None
+    else:
+        model: Union[Type[Gallery], None] = Gallery
+    # end if
+    _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/search/galleries')
+    items = JsonArrayStream('galleries')
+    chunks = DerpiClient.static_stream('GET', url=_url, client=_client, params={
+        'q': query,
+        'page': page,
+        'key': key,
+    })
+    try:
+        async for chunk in chunks:
+            for item in items.feed(chunk):
+                yield item if model is None else model.from_dict(item)
+            # end for
+        # end for
+    finally:
+        await chunks.aclose()
+    # end try
+    items.close()
+# end def stream_search_galleries
+
+
+async def search_posts(
+    query: str,
+    page: Union[int, None] = None,
+    key: Union[str, None] = None,
+    _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: Union[None, bool, str] = None,
+) -> SearchResult[Post]:
+    """
+    Executes the search given by the `q` query parameter, and returns **post responses** sorted by descending creation time.
+
+    A request will be sent to the following endpoint: `/api/v1/json/search/posts`
     It will take in account `self._base_url` and fill in all url variables and append the data parameters as needed,
     which would for example look like this: https://derpibooru.org/api/v1/json/search/posts?q=subject:time wasting thread
 
-    The API should return json looking like `{"posts":[Post]}` which will then be parsed to the python result `List[Post]`.
+    The API should return json looking like `{"posts":[Post]}` which will then be parsed to the python result `SearchResult[Post]`.
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+    :type  page: int|None
+    
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+    :type  key: str|None
+    
+    :param _client: If you wanna to provide your custom `DerpiClient`, or just an already opened `httpx.AsyncClient`.
+                    Example with `httpx.AsyncClient`:
+                    >>> async with httpx.AsyncClient() as client:
+                    ...    result = await search_posts(..., _client=client)
+
+                    You can provide a DerpiClient instance as well, to that same variable:
+                    >>> client = DerpiClient(key='...')
+                    >>> client._base_url = 'https://furbooru.org'
+                    >>> result = await search_posts(..., _client=client)
+                    In this example we wanted to modify the base url to go to a different booru.
+
+                    Combined example:
+                    >>> async with httpx.AsyncClient() as web_client:
+                    >>>    derpi_client = DerpiClient(key='...', client=web_client)
+                    ...    result = await search_posts(..., _client=derpi_client)
+
+    :type  _client: httpx.AsyncClient|DerpiClient|None
+    
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: The parsed result from the API.
+    :rtype:  SearchResult[Post]
+    """
+    _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/search/posts')
+    response: internet.Response = await DerpiClient.static_request('GET', url=_url, route='search_posts', client=_client, params={
+        'q': query,
+        'page': page,
+        'key': key,
+    })
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, Union[List[Dict], int]] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Post] = LazyPost
+    elif _raw:
+        return result
+    else:
+        model: Type[Post] = Post
+    # end if
+    total: int = result['total']
+    result: List[Dict] = result['posts']
+    assert_type_or_raise(result, list, parameter_name='result')
+    result: SearchResult[Post] = SearchResult(
+        hits=[
+            model.from_dict(item)
+            for item in result
+        ],
+        total=total,
+    )
+    return result
+# end def search_posts
+
+
+def iter_search_posts(
+    query: str,
+    key: Union[str, None] = None,
+    limit: Union[int, None] = None,
+    _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: Union[None, bool, str] = None,
+) -> AsyncIterator[Post]:
+    """
+    Walks through all the pages of `search_posts(...)`, yielding every single `Post`.
+    While the items of a page are consumed, the next page is already requested in the background.
+
+    >>> async for item in iter_search_posts(...):
+    ...     print(item)
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+    :type  key: str|None
+    
+    :param limit: Stop after that many items. `None` to get all of them.
+    :type  limit: int|None
+
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `httpx.AsyncClient`, see `search_posts(...)`.
+    :type  _client: httpx.AsyncClient|DerpiClient|None
+
+    :param _raw: Skip building the models: `True` (or `'bytes'`) yields the decoded json of every item.
+                 `'lazy'` yields lazy models (like `LazyImage`). `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: Async iterator over the parsed results from the API.
+    :rtype:  AsyncIterator[Post]
+    """
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        _raw = True  # a single item has no undecoded body of its own.
+    # end if
+
+    async def fetch_page(page: int) -> Union[SearchResult[Post], List[Dict]]:
+        result = await search_posts(
+            query=query,
+            page=page,
+            key=key,
+            _client=_client,
+            _raw=_raw,
+        )
+        if _raw is True:
+            return result['posts']
+        # end if
+        return result
+    # end def
+
+    return _paginate(fetch_page, per_page=None, limit=limit)
+# end def iter_search_posts
+
+
+async def fan_out_search_posts(
+    query: str,
+    key: Union[str, None] = None,
+    limit: Union[int, None] = None,
+    max_concurrency: int = 4,
+    _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: Union[None, bool, str] = None,
+) -> SearchResult[Post]:
+    """
+    Loads all the results of `search_posts(...)` at once:
+    After the first page told us the `total` amount of results, all the remaining pages are requested concurrently,
+    with at most `max_concurrency` requests at the same time.
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+    :type  key: str|None
+    
+    :param limit: Stop after that many items. `None` to get all of them.
+    :type  limit: int|None
+
+    :param max_concurrency: How many pages may be requested at the same time.
+    :type  max_concurrency: int
+
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `httpx.AsyncClient`, see `search_posts(...)`.
+    :type  _client: httpx.AsyncClient|DerpiClient|None
+
+    :param _raw: Skip building the models: `True` (or `'bytes'`) returns json like a single page, with all the items.
+                 `'lazy'` returns lazy models (like `LazyImage`). `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: All the parsed results from the API.
+    :rtype:  SearchResult[Post]
+    """
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    model_mode = 'lazy' if _raw else False  # the ids and the total are needed, the lazy models just wrap the json.
+
+    async def fetch_page(page: int) -> SearchResult[Post]:
+        return await search_posts(
+            query=query,
+            page=page,
+            key=key,
+            _client=_client,
+            _raw=model_mode,
+        )
+    # end def
+
+    result = await _fan_out(
+        fetch_page, await fetch_page(1),
+        per_page=None, limit=limit, max_concurrency=max_concurrency,
+    )
+    if _raw and _raw != 'lazy':
+        return {'posts': [item.to_dict() for item in result.hits], 'total': result.total}
+    # end if
+    return result
+# end def fan_out_search_posts
+
+
+async def stream_search_posts(
+    query: str,
+    page: Union[int, None] = None,
+    key: Union[str, None] = None,
+    _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: Union[None, bool, str] = None,
+) -> AsyncIterator[Post]:
+    """
+    Like `search_posts(...)`, but parses the page while it is still being downloaded,
+    yielding every single `Post` as soon as it arrived completely.
+    That gets you the first results earlier, and never keeps the whole page in memory.
+    Note, those requests are neither cached nor retried, see `DerpiClient.static_stream(...)`.
+
+    >>> async for item in stream_search_posts(...):
+    ...     print(item)
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+    :type  page: int|None
+    
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+    :type  key: str|None
+    
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `httpx.AsyncClient`, see `search_posts(...)`.
+    :type  _client: httpx.AsyncClient|DerpiClient|None
+
+    :param _raw: Skip building the models: `True` (or `'bytes'`) yields the decoded json of every item.
+                 `'lazy'` yields lazy models (like `LazyImage`). `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: Async iterator over the parsed results from the API.
+    :rtype:  AsyncIterator[Post]
+    """
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'lazy':
+        model: Union[Type[Post], None] = LazyPost
+    elif _raw:
+        model: Union[Type[Post], None] = None
+    else:
+        model: Union[Type[Post], None] = Post
+    # end if
+    _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/search/posts')
+    items = JsonArrayStream('posts')
+    chunks = DerpiClient.static_stream('GET', url=_url, client=_client, params={
+        'q': query,
+        'page': page,
+        'key': key,
+    })
+    try:
+        async for chunk in chunks:
+            for item in items.feed(chunk):
+                yield item if model is None else model.from_dict(item)
+            # end for
+        # end for
+    finally:
+        await chunks.aclose()
+    # end try
+    items.close()
+# end def stream_search_posts
+
+
+async def search_images(
+    query: str,
+    filter_id: Union[int, None] = None,
+    page: Union[int, None] = None,
+    per_page: Union[int, None] = None,
+    sort_direction: Union[str, None] = None,
+    sort_field: Union[str, None] = None,
+    key: Union[str, None] = None,
+    _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: Union[None, bool, str] = None,
+) -> SearchResult[Image]:
+    """
+    Executes the search given by the `q` query parameter, and returns **image responses**.
+
+    A request will be sent to the following endpoint: `/api/v1/json/search/images`
+    It will take in account `self._base_url` and fill in all url variables and append the data parameters as needed,
+    which would for example look like this: https://derpibooru.org/api/v1/json/search/images?q=safe
+
+    The API should return json looking like `{"images":[Image]}` which will then be parsed to the python result `SearchResult[Image]`.
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param filter_id: Assuming the user can access the filter ID given by the parameter, overrides the current filter for this request. This is primarily useful for unauthenticated API access.
+    :type  filter_id: int|None
+    
+    :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+    :type  page: int|None
+    
+    :param per_page: Controls the number of results per page, up to a limit of 50, if the response is paginated. The default is 25.
+    :type  per_page: int|None
+    
+    :param sort_direction: The current sort direction, if the request is a search request.
+                           Note, on derpibooru's side this parameter is called `sd`.
+    :type  sort_direction: str|None
+    
+    :param sort_field: The current sort field, if the request is a search request.
+                       Note, on derpibooru's side this parameter is called `sf`.
+    :type  sort_field: str|None
+    
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+    :type  key: str|None
+    
+    :param _client: If you wanna to provide your custom `DerpiClient`, or just an already opened `httpx.AsyncClient`.
+                    Example with `httpx.AsyncClient`:
+                    >>> async with httpx.AsyncClient() as client:
+                    ...    result = await search_images(..., _client=client)
+
+                    You can provide a DerpiClient instance as well, to that same variable:
+                    >>> client = DerpiClient(key='...')
+                    >>> client._base_url = 'https://furbooru.org'
+                    >>> result = await search_images(..., _client=client)
+                    In this example we wanted to modify the base url to go to a different booru.
+
+                    Combined example:
+                    >>> async with httpx.AsyncClient() as web_client:
+                    >>>    derpi_client = DerpiClient(key='...', client=web_client)
+                    ...    result = await search_images(..., _client=derpi_client)
+
+    :type  _client: httpx.AsyncClient|DerpiClient|None
+    
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: The parsed result from the API.
+    :rtype:  SearchResult[Image]
+    """
+    _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/search/images')
+    response: internet.Response = await DerpiClient.static_request('GET', url=_url, route='search_images', client=_client, params={
+        'q': query,
+        'filter_id': filter_id,
+        'page': page,
+        'per_page': per_page,
+        'sd': sort_direction,
+        'sf': sort_field,
+        'key': key,
+    })
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, Union[List[Dict], int]] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Image] = LazyImage
+    elif _raw:
+        return result
+    else:
+        model: Type[Image] = Image
+    # end if
+    total: int = result['total']
+    result: List[Dict] = result['images']
+    assert_type_or_raise(result, list, parameter_name='result')
+    result: SearchResult[Image] = SearchResult(
+        hits=[
+            model.from_dict(item)
+            for item in result
+        ],
+        total=total,
+    )
+    return result
+# end def search_images
+
+
+def iter_search_images(
+    query: str,
+    filter_id: Union[int, None] = None,
+    per_page: Union[int, None] = 50,
+    sort_direction: Union[str, None] = None,
+    sort_field: Union[str, None] = None,
+    key: Union[str, None] = None,
+    limit: Union[int, None] = None,
+    _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: Union[None, bool, str] = None,
+) -> AsyncIterator[Image]:
+    """
+    Walks through all the pages of `search_images(...)`, yielding every single `Image`.
+    While the items of a page are consumed, the next page is already requested in the background.
+
+    >>> async for item in iter_search_images(...):
+    ...     print(item)
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param filter_id: Assuming the user can access the filter ID given by the parameter, overrides the current filter for this request. This is primarily useful for unauthenticated API access.
+    :type  filter_id: int|None
+    
+    :param per_page: Controls the number of results per page, up to a limit of 50, if the response is paginated. The default is 25.
+                     Here we default to the maximum of 50, to need as few requests as possible.
+    :type  per_page: int|None
+    
+    :param sort_direction: The current sort direction, if the request is a search request.
+                           Note, on derpibooru's side this parameter is called `sd`.
+    :type  sort_direction: str|None
+    
+    :param sort_field: The current sort field, if the request is a search request.
+                       Note, on derpibooru's side this parameter is called `sf`.
+    :type  sort_field: str|None
+    
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+    :type  key: str|None
+    
+    :param limit: Stop after that many items. `None` to get all of them.
+    :type  limit: int|None
+
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `httpx.AsyncClient`, see `search_images(...)`.
+    :type  _client: httpx.AsyncClient|DerpiClient|None
+
+    :param _raw: Skip building the models: `True` (or `'bytes'`) yields the decoded json of every item.
+                 `'lazy'` yields lazy models (like `LazyImage`). `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: Async iterator over the parsed results from the API.
+    :rtype:  AsyncIterator[Image]
+    """
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        _raw = True  # a single item has no undecoded body of its own.
+    # end if
+
+    async def fetch_page(page: int) -> Union[SearchResult[Image], List[Dict]]:
+        result = await search_images(
+            query=query,
+            filter_id=filter_id,
+            page=page,
+            per_page=per_page,
+            sort_direction=sort_direction,
+            sort_field=sort_field,
+            key=key,
+            _client=_client,
+            _raw=_raw,
+        )
+        if _raw is True:
+            return result['images']
+        # end if
+        return result
+    # end def
+
+    return _paginate(fetch_page, per_page=per_page, limit=limit)
+# end def iter_search_images
+
+
+async def fan_out_search_images(
+    query: str,
+    filter_id: Union[int, None] = None,
+    per_page: Union[int, None] = 50,
+    sort_direction: Union[str, None] = None,
+    sort_field: Union[str, None] = None,
+    key: Union[str, None] = None,
+    limit: Union[int, None] = None,
+    max_concurrency: int = 4,
+    _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: Union[None, bool, str] = None,
+) -> SearchResult[Image]:
+    """
+    Loads all the results of `search_images(...)` at once:
+    After the first page told us the `total` amount of results, all the remaining pages are requested concurrently,
+    with at most `max_concurrency` requests at the same time.
+    To keep the pages from shifting while new items are added, the query gets pinned to the newest item existing beforehand,
+    by adding `id.lte:<newest id>` to it.
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param filter_id: Assuming the user can access the filter ID given by the parameter, overrides the current filter for this request. This is primarily useful for unauthenticated API access.
+    :type  filter_id: int|None
+    
+    :param per_page: Controls the number of results per page, up to a limit of 50, if the response is paginated. The default is 25.
+                     Here we default to the maximum of 50, to need as few requests as possible.
+    :type  per_page: int|None
+    
+    :param sort_direction: The current sort direction, if the request is a search request.
+                           Note, on derpibooru's side this parameter is called `sd`.
+    :type  sort_direction: str|None
+    
+    :param sort_field: The current sort field, if the request is a search request.
+                       Note, on derpibooru's side this parameter is called `sf`.
+    :type  sort_field: str|None
+    
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+    :type  key: str|None
+    
+    :param limit: Stop after that many items. `None` to get all of them.
+    :type  limit: int|None
+
+    :param max_concurrency: How many pages may be requested at the same time.
+    :type  max_concurrency: int
+
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `httpx.AsyncClient`, see `search_images(...)`.
+    :type  _client: httpx.AsyncClient|DerpiClient|None
+
+    :param _raw: Skip building the models: `True` (or `'bytes'`) returns json like a single page, with all the items.
+                 `'lazy'` returns lazy models (like `LazyImage`). `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: All the parsed results from the API.
+    :rtype:  SearchResult[Image]
+    """
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    model_mode = 'lazy' if _raw else False  # the ids and the total are needed, the lazy models just wrap the json.
+    newest: SearchResult[Image] = await search_images(
+        query=query,
+        filter_id=filter_id,
+        page=1,
+        per_page=1,
+        sort_direction='desc',
+        sort_field='id',
+        key=key,
+        _client=_client,
+        _raw=model_mode,
+    )
+    if not newest.hits:
+        return newest if not _raw or _raw == 'lazy' else {'images': [], 'total': newest.total}
+    # end if
+    query = _pin_query(query, f'id.lte:{newest[0].id}')
+
+    async def fetch_page(page: int) -> SearchResult[Image]:
+        return await search_images(
+            query=query,
+            filter_id=filter_id,
+            page=page,
+            per_page=per_page,
+            sort_direction=sort_direction,
+            sort_field=sort_field,
+            key=key,
+            _client=_client,
+            _raw=model_mode,
+        )
+    # end def
+
+    result = await _fan_out(
+        fetch_page, await fetch_page(1),
+        per_page=per_page, limit=limit, max_concurrency=max_concurrency,
+    )
+    if _raw and _raw != 'lazy':
+        return {'images': [item.to_dict() for item in result.hits], 'total': result.total}
+    # end if
+    return result
+# end def fan_out_search_images
+
+
+def cursor_search_images(
+    query: str,
+    filter_id: Union[int, None] = None,
+    per_page: Union[int, None] = 50,
+    key: Union[str, None] = None,
+    cursor: Union[str, None] = None,
+    limit: Union[int, None] = None,
+    _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: Union[None, bool, str] = None,
+) -> SearchCursor:
+    """
+    Walks through all the results of `search_images(...)` with keyset pagination, newest first.
+    Every page is requested as `({query}) && id.lt:<last seen id>`, so deep crawls stay fast and don't skip or repeat items.
+    Use the `token` of the returned `SearchCursor` to resume a crawl later.
     
     :param query: The current search query, if the request is a search request.
                   Note, on derpibooru's side this parameter is called `q`.
     :type  query: str
     
-    :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
-    :type  page: int|None
+    :param filter_id: Assuming the user can access the filter ID given by the parameter, overrides the current filter for this request. This is primarily useful for unauthenticated API access.
+    :type  filter_id: int|None
+    
+    :param per_page: Controls the number of results per page, up to a limit of 50, if the response is paginated. The default is 25.
+                     Here we default to the maximum of 50, to need as few requests as possible.
+    :type  per_page: int|None
     
     :param key: An optional authentication token. If omitted, no user will be authenticated.
 
                     You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
     :type  key: str|None
     
-    :param _client: If you wanna to provide your custom `DerpiClient`, or just an already opened `httpx.AsyncClient`.
-                    Example with `httpx.AsyncClient`:
-                    >>> async with httpx.AsyncClient() as client:
-                    ...    result = await search_posts(..., _client=client)
-
-                    You can provide a DerpiClient instance as well, to that same variable:
-                    >>> client = DerpiClient(key='...')
-                    >>> client._base_url = 'https://furbooru.org'
-                    >>> result = await search_posts(..., _client=client)
-                    In this example we wanted to modify the base url to go to a different booru.
+    :param cursor: The `token` of an earlier `SearchCursor` for the same query, to continue after its last item.
+    :type  cursor: str|None
 
-                    Combined example:
-                    >>> async with httpx.AsyncClient() as web_client:
-                    >>>    derpi_client = DerpiClient(key='...', client=web_client)
-                    ...    result = await search_posts(..., _client=derpi_client)
+    :param limit: Stop after that many items. `None` to get all of them.
+    :type  limit: int|None
 
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `httpx.AsyncClient`, see `search_images(...)`.
     :type  _client: httpx.AsyncClient|DerpiClient|None
-    
-    :return: The parsed result from the API.
-    :rtype:  List[Post]
+
+    :param _raw: Skip building the models: `True` (or `'bytes'`) yields the decoded json of every item.
+                 `'lazy'` yields lazy models (like `LazyImage`). `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: Async iterator over the parsed results from the API, with a resumable `token`.
+    :rtype:  SearchCursor
     """
-    _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/search/posts')
-    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params={
-        'q': query,
-        'page': page,
-        'key': key,
-    })
-    result: Dict[str, List[Dict]] = response.json()
-    result: List[Dict] = result['posts']
-    assert_type_or_raise(result, list, parameter_name='result')
-    result: List[Post] = [
-        Post.from_dict(item)
-        for item in result
-    ]
-    return result
-# end def search_posts
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    model_mode = 'lazy' if _raw else False  # the ids are needed, the lazy models just wrap the json.
 
+    async def fetch_page(page_query: str) -> SearchResult[Image]:
+        return await search_images(
+            query=page_query,
+            filter_id=filter_id,
+            page=1,
+            per_page=per_page,
+            sort_direction='desc',
+            sort_field='id',
+            key=key,
+            _client=_client,
+            _raw=model_mode,
+        )
+    # end def
 
-async def search_images(
+    return SearchCursor(fetch_page, query=query, token=cursor, limit=limit, raw=bool(_raw) and _raw != 'lazy')
+# end def cursor_search_images
+
+
+async def stream_search_images(
     query: str,
     filter_id: Union[int, None] = None,
     page: Union[int, None] = None,
@@ -784,15 +2352,16 @@ async def search_images(
     sort_field: Union[str, None] = None,
     key: Union[str, None] = None,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
-) -> List[Image]:
+    _raw: Union[None, bool, str] = None,
+) -> AsyncIterator[Image]:
     """
-    Executes the search given by the `q` query parameter, and returns **image responses**.
-
-    A request will be sent to the following endpoint: `/api/v1/json/search/images`
-    It will take in account `self._base_url` and fill in all url variables and append the data parameters as needed,
-    which would for example look like this: https://derpibooru.org/api/v1/json/search/images?q=safe
+    Like `search_images(...)`, but parses the page while it is still being downloaded,
+    yielding every single `Image` as soon as it arrived completely.
+    That gets you the first results earlier, and never keeps the whole page in memory.
+    Note, those requests are neither cached nor retried, see `DerpiClient.static_stream(...)`.
 
-    The API should return json looking like `{"images":[Image]}` which will then be parsed to the python result `List[Image]`.
+    >>> async for item in stream_search_images(...):
+    ...     print(item)
     
     :param query: The current search query, if the request is a search request.
                   Note, on derpibooru's side this parameter is called `q`.
@@ -820,29 +2389,29 @@ async def search_images(
                     You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
     :type  key: str|None
     
-    :param _client: If you wanna to provide your custom `DerpiClient`, or just an already opened `httpx.AsyncClient`.
-                    Example with `httpx.AsyncClient`:
-                    >>> async with httpx.AsyncClient() as client:
-                    ...    result = await search_images(..., _client=client)
-
-                    You can provide a DerpiClient instance as well, to that same variable:
-                    >>> client = DerpiClient(key='...')
-                    >>> client._base_url = 'https://furbooru.org'
-                    >>> result = await search_images(..., _client=client)
-                    In this example we wanted to modify the base url to go to a different booru.
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `httpx.AsyncClient`, see `search_images(...)`.
+    :type  _client: httpx.AsyncClient|DerpiClient|None
 
-                    Combined example:
-                    >>> async with httpx.AsyncClient() as web_client:
-                    >>>    derpi_client = DerpiClient(key='...', client=web_client)
-                    ...    result = await search_images(..., _client=derpi_client)
+    :param _raw: Skip building the models: `True` (or `'bytes'`) yields the decoded json of every item.
+                 `'lazy'` yields lazy models (like `LazyImage`). `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
 
-    :type  _client: httpx.AsyncClient|DerpiClient|None
-    
-    :return: The parsed result from the API.
-    :rtype:  List[Image]
+    :return: Async iterator over the parsed results from the API.
+    :rtype:  AsyncIterator[Image]
     """
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'lazy':
+        model: Union[Type[Image], None] = LazyImage
+    elif _raw:
+        model: Union[Type[Image], None] = None
+    else:
+        model: Union[Type[Image], None] = Image
+    # end if
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/search/images')
-    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params={
+    items = JsonArrayStream('images')
+    chunks = DerpiClient.static_stream('GET', url=_url, client=_client, params={
         'q': query,
         'filter_id': filter_id,
         'page': page,
@@ -851,22 +2420,25 @@ async def search_images(
         'sf': sort_field,
         'key': key,
     })
-    result: Dict[str, List[Dict]] = response.json()
-    result: List[Dict] = result['images']
-    assert_type_or_raise(result, list, parameter_name='result')
-    result: List[Image] = [
-        Image.from_dict(item)
-        for item in result
-    ]
-    return result
-# end def search_images
+    try:
+        async for chunk in chunks:
+            for item in items.feed(chunk):
+                yield item if model is None else model.from_dict(item)
+            # end for
+        # end for
+    finally:
+        await chunks.aclose()
+    # end try
+    items.close()
+# end def stream_search_images
 
 
 async def search_tags(
     query: str,
     page: Union[int, None] = None,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
-) -> List[Tag]:
+    _raw: Union[None, bool, str] = None,
+) -> SearchResult[Tag]:
     """
     Executes the search given by the `q` query parameter, and returns **tag responses** sorted by descending image count.
 
@@ -874,7 +2446,7 @@ async def search_tags(
     It will take in account `self._base_url` and fill in all url variables and append the data parameters as needed,
     which would for example look like this: https://derpibooru.org/api/v1/json/search/tags?q=analyzed_name:wing
 
-    The API should return json looking like `{"tags":[Tag]}` which will then be parsed to the python result `List[Tag]`.
+    The API should return json looking like `{"tags":[Tag]}` which will then be parsed to the python result `SearchResult[Tag]`.
     
     :param query: The current search query, if the request is a search request.
                   Note, on derpibooru's side this parameter is called `q`.
@@ -901,31 +2473,227 @@ async def search_tags(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
-    :rtype:  List[Tag]
+    :rtype:  SearchResult[Tag]
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/search/tags')
-    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params={
+    response: internet.Response = await DerpiClient.static_request('GET', url=_url, route='search_tags', client=_client, params={
         'q': query,
         'page': page,
     })
-    result: Dict[str, List[Dict]] = response.json()
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, Union[List[Dict], int]] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Tag] = LazyTag
+    elif _raw:
+        return result
+    else:
+        model: Type[Tag] = Tag
+    # end if
+    total: int = result['total']
     result: List[Dict] = result['tags']
     assert_type_or_raise(result, list, parameter_name='result')
-    result: List[Tag] = [
-        Tag.from_dict(item)
-        for item in result
-    ]
+    result: SearchResult[Tag] = SearchResult(
+        hits=[
+            model.from_dict(item)
+            for item in result
+        ],
+        total=total,
+    )
     return result
 # end def search_tags
 
 
+def iter_search_tags(
+    query: str,
+    limit: Union[int, None] = None,
+    _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: Union[None, bool, str] = None,
+) -> AsyncIterator[Tag]:
+    """
+    Walks through all the pages of `search_tags(...)`, yielding every single `Tag`.
+    While the items of a page are consumed, the next page is already requested in the background.
+
+    >>> async for item in iter_search_tags(...):
+    ...     print(item)
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param limit: Stop after that many items. `None` to get all of them.
+    :type  limit: int|None
+
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `httpx.AsyncClient`, see `search_tags(...)`.
+    :type  _client: httpx.AsyncClient|DerpiClient|None
+
+    :param _raw: Skip building the models: `True` (or `'bytes'`) yields the decoded json of every item.
+                 `'lazy'` yields lazy models (like `LazyImage`). `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: Async iterator over the parsed results from the API.
+    :rtype:  AsyncIterator[Tag]
+    """
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        _raw = True  # a single item has no undecoded body of its own.
+    # end if
+
+    async def fetch_page(page: int) -> Union[SearchResult[Tag], List[Dict]]:
+        result = await search_tags(
+            query=query,
+            page=page,
+            _client=_client,
+            _raw=_raw,
+        )
+        if _raw is True:
+            return result['tags']
+        # end if
+        return result
+    # end def
+
+    return _paginate(fetch_page, per_page=None, limit=limit)
+# end def iter_search_tags
+
+
+async def fan_out_search_tags(
+    query: str,
+    limit: Union[int, None] = None,
+    max_concurrency: int = 4,
+    _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: Union[None, bool, str] = None,
+) -> SearchResult[Tag]:
+    """
+    Loads all the results of `search_tags(...)` at once:
+    After the first page told us the `total` amount of results, all the remaining pages are requested concurrently,
+    with at most `max_concurrency` requests at the same time.
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param limit: Stop after that many items. `None` to get all of them.
+    :type  limit: int|None
+
+    :param max_concurrency: How many pages may be requested at the same time.
+    :type  max_concurrency: int
+
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `httpx.AsyncClient`, see `search_tags(...)`.
+    :type  _client: httpx.AsyncClient|DerpiClient|None
+
+    :param _raw: Skip building the models: `True` (or `'bytes'`) returns json like a single page, with all the items.
+                 `'lazy'` returns lazy models (like `LazyImage`). `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: All the parsed results from the API.
+    :rtype:  SearchResult[Tag]
+    """
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    model_mode = 'lazy' if _raw else False  # the ids and the total are needed, the lazy models just wrap the json.
+
+    async def fetch_page(page: int) -> SearchResult[Tag]:
+        return await search_tags(
+            query=query,
+            page=page,
+            _client=_client,
+            _raw=model_mode,
+        )
+    # end def
+
+    result = await _fan_out(
+        fetch_page, await fetch_page(1),
+        per_page=None, limit=limit, max_concurrency=max_concurrency,
+    )
+    if _raw and _raw != 'lazy':
+        return {'tags': [item.to_dict() for item in result.hits], 'total': result.total}
+    # end if
+    return result
+# end def fan_out_search_tags
+
+
+async def stream_search_tags(
+    query: str,
+    page: Union[int, None] = None,
+    _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: Union[None, bool, str] = None,
+) -> AsyncIterator[Tag]:
+    """
+    Like `search_tags(...)`, but parses the page while it is still being downloaded,
+    yielding every single `Tag` as soon as it arrived completely.
+    That gets you the first results earlier, and never keeps the whole page in memory.
+    Note, those requests are neither cached nor retried, see `DerpiClient.static_stream(...)`.
+
+    >>> async for item in stream_search_tags(...):
+    ...     print(item)
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+    :type  page: int|None
+    
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `httpx.AsyncClient`, see `search_tags(...)`.
+    :type  _client: httpx.AsyncClient|DerpiClient|None
+
+    :param _raw: Skip building the models: `True` (or `'bytes'`) yields the decoded json of every item.
+                 `'lazy'` yields lazy models (like `LazyImage`). `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: Async iterator over the parsed results from the API.
+    :rtype:  AsyncIterator[Tag]
+    """
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'lazy':
+        model: Union[Type[Tag], None] = LazyTag
+    elif _raw:
+        model: Union[Type[Tag], None] = None
+    else:
+        model: Union[Type[Tag], None] = Tag
+    # end if
+    _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/search/tags')
+    items = JsonArrayStream('tags')
+    chunks = DerpiClient.static_stream('GET', url=_url, client=_client, params={
+        'q': query,
+        'page': page,
+    })
+    try:
+        async for chunk in chunks:
+            for item in items.feed(chunk):
+                yield item if model is None else model.from_dict(item)
+            # end for
+        # end for
+    finally:
+        await chunks.aclose()
+    # end try
+    items.close()
+# end def stream_search_tags
+
+
 async def search_reverse(
     url: str,
     distance: Union[float, None] = None,
     key: Union[str, None] = None,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
-) -> List[Image]:
+    _raw: Union[None, bool, str] = None,
+) -> SearchResult[Image]:
     """
     Returns **image responses** based on the results of reverse-searching the image given by the `url` query parameter.
 
@@ -933,7 +2701,7 @@ async def search_reverse(
     It will take in account `self._base_url` and fill in all url variables and append the data parameters as needed,
     which would for example look like this: https://derpibooru.org/api/v1/json/search/reverse?url=https://derpicdn.net/img/2019/12/24/2228439/full.jpg
 
-    The API should return json looking like `{"images":[Image]}` which will then be parsed to the python result `List[Image]`.
+    The API should return json looking like `{"images":[Image]}` which will then be parsed to the python result `SearchResult[Image]`.
     
     :param url: Link a deviantART page, a Tumblr post, or the image directly.
     :type  url: str
@@ -964,28 +2732,52 @@ async def search_reverse(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
-    :rtype:  List[Image]
+    :rtype:  SearchResult[Image]
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/search/reverse')
-    response: internet.Response = await DerpiClient.static_request('POST', url=_url, client=_client, params={
+    response: internet.Response = await DerpiClient.static_request('POST', url=_url, route='search_reverse', client=_client, params={
         'url': url,
         'distance': distance,
         'key': key,
     })
-    result: Dict[str, List[Dict]] = response.json()
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, Union[List[Dict], int]] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Image] = LazyImage
+    elif _raw:
+        return result
+    else:
+        model: Type[Image] = Image
+    # end if
+    total: int = result['total']
     result: List[Dict] = result['images']
     assert_type_or_raise(result, list, parameter_name='result')
-    result: List[Image] = [
-        Image.from_dict(item)
-        for item in result
-    ]
+    result: SearchResult[Image] = SearchResult(
+        hits=[
+            model.from_dict(item)
+            for item in result
+        ],
+        total=total,
+    )
     return result
 # end def search_reverse
 
 
 async def forums(
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: Union[None, bool, str] = None,
 ) -> List[Forum]:
     """
     Fetches a list of **forum responses**.
@@ -1014,16 +2806,35 @@ async def forums(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
     :rtype:  List[Forum]
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/forums')
-    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client)
-    result: Dict[str, List[Dict]] = response.json()
+    response: internet.Response = await DerpiClient.static_request('GET', url=_url, route='forums', client=_client)
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, List[Dict]] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Forum] = LazyForum
+    elif _raw:
+        return result
+    else:
+        model: Type[Forum] = Forum
+    # end if
     result: List[Dict] = result['forums']
     assert_type_or_raise(result, list, parameter_name='result')
     result: List[Forum] = [
-        Forum.from_dict(item)
+        model.from_dict(item)
         for item in result
     ]
     return result
@@ -1033,6 +2844,7 @@ async def forums(
 async def forum(
     short_name: str,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: Union[None, bool, str] = None,
 ) -> Forum:
     """
     Fetches a **forum response** for the abbreviated name given by the `short_name` URL parameter.
@@ -1064,15 +2876,34 @@ async def forum(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
     :rtype:  Forum
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/forums/{short_name}')
-    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client)
-    result: Dict[str, Dict] = response.json()
+    response: internet.Response = await DerpiClient.static_request('GET', url=_url, route='forum', client=_client)
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, Dict] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Forum] = LazyForum
+    elif _raw:
+        return result
+    else:
+        model: Type[Forum] = Forum
+    # end if
     result: Dict = result['forum']
     assert_type_or_raise(result, dict, parameter_name='result')
-    result: Forum = Forum.from_dict(result)
+    result: Forum = model.from_dict(result)
     return result
 # end def forum
 
@@ -1081,6 +2912,7 @@ async def forum_topics(
     short_name: str,
     page: Union[int, None] = None,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: Union[None, bool, str] = None,
 ) -> List[Topic]:
     """
     Fetches a list of **topic responses** for the abbreviated forum name given by the `short_name` URL parameter.
@@ -1115,28 +2947,101 @@ async def forum_topics(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
     :rtype:  List[Topic]
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/forums/{short_name}/topics')
-    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params={
+    response: internet.Response = await DerpiClient.static_request('GET', url=_url, route='forum_topics', client=_client, params={
         'page': page,
     })
-    result: Dict[str, List[Dict]] = response.json()
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, List[Dict]] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Topic] = LazyTopic
+    elif _raw:
+        return result
+    else:
+        model: Type[Topic] = Topic
+    # end if
     result: List[Dict] = result['topics']
     assert_type_or_raise(result, list, parameter_name='result')
     result: List[Topic] = [
-        Topic.from_dict(item)
+        model.from_dict(item)
         for item in result
     ]
     return result
 # end def forum_topics
 
 
+def iter_forum_topics(
+    short_name: str,
+    limit: Union[int, None] = None,
+    _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: Union[None, bool, str] = None,
+) -> AsyncIterator[Topic]:
+    """
+    Walks through all the pages of `forum_topics(...)`, yielding every single `Topic`.
+    While the items of a page are consumed, the next page is already requested in the background.
+
+    >>> async for item in iter_forum_topics(...):
+    ...     print(item)
+    
+    :param short_name: the variable short_name part of the url.
+    :type  short_name: str
+    
+    :param limit: Stop after that many items. `None` to get all of them.
+    :type  limit: int|None
+
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `httpx.AsyncClient`, see `forum_topics(...)`.
+    :type  _client: httpx.AsyncClient|DerpiClient|None
+
+    :param _raw: Skip building the models: `True` (or `'bytes'`) yields the decoded json of every item.
+                 `'lazy'` yields lazy models (like `LazyImage`). `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: Async iterator over the parsed results from the API.
+    :rtype:  AsyncIterator[Topic]
+    """
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        _raw = True  # a single item has no undecoded body of its own.
+    # end if
+
+    async def fetch_page(page: int) -> Union[List[Topic], List[Dict]]:
+        result = await forum_topics(
+            short_name=short_name,
+            page=page,
+            _client=_client,
+            _raw=_raw,
+        )
+        if _raw is True:
+            return result['topics']
+        # end if
+        return result
+    # end def
+
+    return _paginate(fetch_page, per_page=None, limit=limit)
+# end def iter_forum_topics
+
+
 async def forum_topic(
     short_name: str,
     topic_slug: str,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: Union[None, bool, str] = None,
 ) -> Topic:
     """
     Fetches a **topic response** for the abbreviated forum name given by the `short_name` and topic given by `topic_slug` URL parameters.
@@ -1171,15 +3076,34 @@ async def forum_topic(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
     :rtype:  Topic
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/forums/{short_name}/topics/{topic_slug}')
-    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client)
-    result: Dict[str, Dict] = response.json()
+    response: internet.Response = await DerpiClient.static_request('GET', url=_url, route='forum_topic', client=_client)
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, Dict] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Topic] = LazyTopic
+    elif _raw:
+        return result
+    else:
+        model: Type[Topic] = Topic
+    # end if
     result: Dict = result['topic']
     assert_type_or_raise(result, dict, parameter_name='result')
-    result: Topic = Topic.from_dict(result)
+    result: Topic = model.from_dict(result)
     return result
 # end def forum_topic
 
@@ -1189,6 +3113,7 @@ async def forum_posts(
     topic_slug: str,
     page: Union[int, None] = None,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: Union[None, bool, str] = None,
 ) -> List[Post]:
     """
     Fetches a list of **post responses** for the abbreviated forum name given by the `short_name` and topic given by `topic_slug` URL parameters.
@@ -1224,24 +3149,101 @@ async def forum_posts(
                     >>>    derpi_client = DerpiClient(key='...', client=web_client)
                     ...    result = await forum_posts(..., _client=derpi_client)
 
-    :type  _client: httpx.AsyncClient|DerpiClient|None
-    
-    :return: The parsed result from the API.
-    :rtype:  List[Post]
-    """
-    _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/forums/{short_name}/topics/{topic_slug}/posts')
-    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params={
-        'page': page,
-    })
-    result: Dict[str, List[Dict]] = response.json()
-    result: List[Dict] = result['posts']
-    assert_type_or_raise(result, list, parameter_name='result')
-    result: List[Post] = [
-        Post.from_dict(item)
-        for item in result
-    ]
-    return result
-# end def forum_posts
+    :type  _client: httpx.AsyncClient|DerpiClient|None
+    
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: The parsed result from the API.
+    :rtype:  List[Post]
+    """
+    _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/forums/{short_name}/topics/{topic_slug}/posts')
+    response: internet.Response = await DerpiClient.static_request('GET', url=_url, route='forum_posts', client=_client, params={
+        'page': page,
+    })
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, List[Dict]] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Post] = LazyPost
+    elif _raw:
+        return result
+    else:
+        model: Type[Post] = Post
+    # end if
+    result: List[Dict] = result['posts']
+    assert_type_or_raise(result, list, parameter_name='result')
+    result: List[Post] = [
+        model.from_dict(item)
+        for item in result
+    ]
+    return result
+# end def forum_posts
+
+
+def iter_forum_posts(
+    short_name: str,
+    topic_slug: str,
+    limit: Union[int, None] = None,
+    _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: Union[None, bool, str] = None,
+) -> AsyncIterator[Post]:
+    """
+    Walks through all the pages of `forum_posts(...)`, yielding every single `Post`.
+    While the items of a page are consumed, the next page is already requested in the background.
+
+    >>> async for item in iter_forum_posts(...):
+    ...     print(item)
+    
+    :param short_name: the variable short_name part of the url.
+    :type  short_name: str
+    
+    :param topic_slug: the variable topic_slug part of the url.
+    :type  topic_slug: str
+    
+    :param limit: Stop after that many items. `None` to get all of them.
+    :type  limit: int|None
+
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `httpx.AsyncClient`, see `forum_posts(...)`.
+    :type  _client: httpx.AsyncClient|DerpiClient|None
+
+    :param _raw: Skip building the models: `True` (or `'bytes'`) yields the decoded json of every item.
+                 `'lazy'` yields lazy models (like `LazyImage`). `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: Async iterator over the parsed results from the API.
+    :rtype:  AsyncIterator[Post]
+    """
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        _raw = True  # a single item has no undecoded body of its own.
+    # end if
+
+    async def fetch_page(page: int) -> Union[List[Post], List[Dict]]:
+        result = await forum_posts(
+            short_name=short_name,
+            topic_slug=topic_slug,
+            page=page,
+            _client=_client,
+            _raw=_raw,
+        )
+        if _raw is True:
+            return result['posts']
+        # end if
+        return result
+    # end def
+
+    return _paginate(fetch_page, per_page=None, limit=limit)
+# end def iter_forum_posts
 
 
 async def forum_post(
@@ -1249,6 +3251,7 @@ async def forum_post(
     topic_slug: str,
     post_id: int,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: Union[None, bool, str] = None,
 ) -> Post:
     """
     Fetches a **post response** for the abbreviated forum name given by the `short_name`, topic given by `topic_slug` and post given by `post_id` URL parameters.
@@ -1286,35 +3289,337 @@ async def forum_post(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
     :rtype:  Post
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/forums/{short_name}/topics/{topic_slug}/posts/{post_id}')
-    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client)
-    result: Dict[str, Dict] = response.json()
+    response: internet.Response = await DerpiClient.static_request('GET', url=_url, route='forum_post', client=_client)
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, Dict] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Post] = LazyPost
+    elif _raw:
+        return result
+    else:
+        model: Type[Post] = Post
+    # end if
     result: Dict = result['post']
     assert_type_or_raise(result, dict, parameter_name='result')
-    result: Post = Post.from_dict(result)
+    result: Post = model.from_dict(result)
     return result
 # end def forum_post
 
 
+BULK_BATCH_SIZE = 50  # amount of images looked up with a single search request, which is the maximum of `per_page`.
+
+
+async def _search_images_batched(
+    terms: List[str],
+    filter_id: Union[int, None] = None,
+    key: Union[str, None] = None,
+    max_concurrency: int = 4,
+    _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+) -> List[Image]:
+    """
+    Searches for all images matching any of the given search terms,
+    combining up to `BULK_BATCH_SIZE` of them with `||` into a single query.
+    Those batches are requested concurrently, with at most `max_concurrency` requests at the same time.
+    """
+    queries = [
+        ' || '.join(terms[i:i + BULK_BATCH_SIZE])
+        for i in range(0, len(terms), BULK_BATCH_SIZE)
+    ]
+
+    async def fetch_batch(query: str) -> SearchResult[Image]:
+        return await search_images(
+            query=query, filter_id=filter_id, page=1, per_page=BULK_BATCH_SIZE, key=key, _client=_client, _raw=False,
+        )
+    # end def
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch_batch_limited(query: str) -> SearchResult[Image]:
+        async with semaphore:
+            return await fetch_batch(query)
+        # end with
+    # end def
+
+    batches = await asyncio.gather(*[fetch_batch_limited(query) for query in queries])
+    return [image for batch in batches for image in batch]
+# end def
+
+
+async def images(
+    image_ids: List[int],
+    filter_id: Union[int, None] = None,
+    key: Union[str, None] = None,
+    max_concurrency: int = 4,
+    _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+) -> Tuple[List[Image], List[int]]:
+    """
+    Fetches a lot of images by their ID at once.
+    Instead of calling `image(...)` for every single one, up to `BULK_BATCH_SIZE` IDs are looked up per search request,
+    like `id:1 || id:2 || ...`, and those requests are run concurrently.
+
+    Note, this uses the search, so images hidden by the filter will be missing.
+    You probably want to use a `filter_id` of a filter hiding nothing, like the `Everything` filter (`56027`).
+
+    :param image_ids: The IDs of the images to get.
+    :type  image_ids: List[int]
+
+    :param filter_id: Assuming the user can access the filter ID given by the parameter, overrides the current filter for this request. This is primarily useful for unauthenticated API access.
+    :type  filter_id: int|None
+
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+    :type  key: str|None
+
+    :param max_concurrency: How many search requests may be run at the same time.
+    :type  max_concurrency: int
+
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `httpx.AsyncClient`, see `search_images(...)`.
+    :type  _client: httpx.AsyncClient|DerpiClient|None
+
+    :return: The found images in the order of `image_ids`, and the IDs which could not be found.
+    :rtype:  Tuple[List[Image], List[int]]
+    """
+    image_ids = list(dict.fromkeys(image_ids))  # removes duplicates, keeping the order.
+    found: Dict[int, Image] = {
+        image.id: image
+        for image in await _search_images_batched(
+            [f'id:{image_id}' for image_id in image_ids],
+            filter_id=filter_id, key=key, max_concurrency=max_concurrency, _client=_client,
+        )
+    }
+    return (
+        [found[image_id] for image_id in image_ids if image_id in found],
+        [image_id for image_id in image_ids if image_id not in found],
+    )
+# end def images
+
+
+async def images_by_hash(
+    hashes: List[str],
+    original: bool = False,
+    filter_id: Union[int, None] = None,
+    key: Union[str, None] = None,
+    max_concurrency: int = 4,
+    _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+) -> Tuple[List[Image], List[str]]:
+    """
+    Fetches a lot of images by their SHA512 hash at once.
+    Up to `BULK_BATCH_SIZE` hashes are looked up per search request,
+    like `sha512_hash:... || sha512_hash:...`, and those requests are run concurrently.
+
+    Note, this uses the search, so images hidden by the filter will be missing.
+    You probably want to use a `filter_id` of a filter hiding nothing, like the `Everything` filter (`56027`).
+
+    :param hashes: The SHA512 hashes of the images to get.
+    :type  hashes: List[str]
+
+    :param original: If the hashes are of the originally uploaded file (`orig_sha512_hash`), instead of the processed one (`sha512_hash`).
+    :type  original: bool
+
+    :param filter_id: Assuming the user can access the filter ID given by the parameter, overrides the current filter for this request. This is primarily useful for unauthenticated API access.
+    :type  filter_id: int|None
+
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+    :type  key: str|None
+
+    :param max_concurrency: How many search requests may be run at the same time.
+    :type  max_concurrency: int
+
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `httpx.AsyncClient`, see `search_images(...)`.
+    :type  _client: httpx.AsyncClient|DerpiClient|None
+
+    :return: The found images in the order of `hashes`, and the hashes which could not be found.
+    :rtype:  Tuple[List[Image], List[str]]
+    """
+    field = 'orig_sha512_hash' if original else 'sha512_hash'
+    hashes = list(dict.fromkeys(sha512.lower() for sha512 in hashes))  # removes duplicates, keeping the order.
+    found: Dict[str, Image] = {}
+    for image in await _search_images_batched(
+        [f'{field}:{sha512}' for sha512 in hashes],
+        filter_id=filter_id, key=key, max_concurrency=max_concurrency, _client=_client,
+    ):
+        sha512 = getattr(image, field)
+        if sha512 is None:  # e.g. still being processed.
+            continue
+        # end if
+        found.setdefault(sha512.lower(), image)
+    # end for
+    return (
+        [found[sha512] for sha512 in hashes if sha512 in found],
+        [sha512 for sha512 in hashes if sha512 not in found],
+    )
+# end def images_by_hash
+
+
 class DerpiClient(object):
     """
-    Synchronous client for Derpibooru.org
+    Asynchronous client for Derpibooru.org
+
+    Without a `client` given, all requests go through a shared, process-wide connection pool (see `get_shared_client()`),
+    so connections - and with them the TLS sessions - are kept alive and reused between calls.
+    If you want a dedicated pool instead, use the client as context manager:
+    >>> async with DerpiClient(key='...') as derpi:
+    ...     result = await derpi.image(1)
+    That pool will be closed when leaving the `async with` block.
     """
     DEFAULT_BASE_URL = 'https://derpibooru.org'  # default base url.
-
-    def __init__(self, key, client: Union[None, internet.AsyncClient] = None, base_url = None):
+    POOL_CONNECTIONS = 10  # amount of hosts to keep connection pools for.
+    POOL_MAXSIZE = 10  # amount of connections to keep alive per host.
+    POOL_KEEPALIVE_EXPIRY = 60.0  # seconds an idle connection is kept open, before it gets closed.
+    DEFAULT_RETRY = RetryPolicy()  # used if no `retry` policy is given.
+    STREAM_CHUNK_SIZE = 16 * 1024  # bytes to read at once, when streaming a response.
+    DEFAULT_RATE_LIMITER: Union[RateLimiter, None] = None  # used if no `rate_limiter` is given. `None` to not limit.
+    DEFAULT_CONCURRENCY_LIMITER: Union[AdaptiveConcurrencyLimiter, None] = None  # used if no `concurrency_limiter` is given.
+    COALESCE_REQUESTS = True  # if identical GET requests running at the same time should share a single request.
+    HTTP2 = False  # if new connection pools should use HTTP/2, see `create_client(...)`.
+
+    _shared_clients: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[bool, internet.AsyncClient]]' = weakref.WeakKeyDictionary()  # one pool per event loop and HTTP version.
+    _in_flight: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[int, str], asyncio.Future]]' = weakref.WeakKeyDictionary()  # running GET requests, per event loop and client.
+
+    def __init__(
+        self, key, client: Union[None, internet.AsyncClient] = None, base_url = None,
+        cache: Union[BaseCache, None] = None, retry: Union[RetryPolicy, None] = None,
+        rate_limiter: Union[RateLimiter, None] = None, raw: Union[bool, str] = False, concurrency_limiter: Union[AdaptiveConcurrencyLimiter, None] = None,
+        http2: Union[bool, None] = None,
+    ):
         """
         :param key: API key
+
+        :param client: An already opened `httpx.AsyncClient` to use.
+                       If `None`, the shared connection pool is used, or a dedicated one if used as context manager.
+
+        :param cache: Optional cache to answer `GET` requests from, e.g. `MemoryCache()`. `None` to always ask the server.
+
+        :param retry: How failed `GET` requests are retried. `None` for `DEFAULT_RETRY`, `NO_RETRY` to never retry.
+
+        :param rate_limiter: Limits how many requests are sent per second. `None` for `DEFAULT_RATE_LIMITER`.
+
+        :param raw: Make the routes return the decoded json (`True`) or the undecoded response body (`'bytes'`),
+                    instead of building the models. `'lazy'` builds lazy models (like `LazyImage`) instead,
+                    converting the fields only when accessed. Can be overridden per call with `_raw`.
+
+        :param concurrency_limiter: Adapts how many requests run at the same time, e.g. `AdaptiveConcurrencyLimiter()`.
+                                    `None` for `DEFAULT_CONCURRENCY_LIMITER`.
+
+        :param http2: If HTTP/2 should be used. `None` for `HTTP2`. That is the dedicated pool created when used as context manager,
+                      or otherwise the shared pool for HTTP/2, see `get_shared_client(...)`.
         """
         if base_url is None:
             base_url = self.DEFAULT_BASE_URL
         # end if
         self._key = key
         self._client = client
+        self._owns_client = False  # if we created `self._client` ourself, and thus have to close it again.
         self._base_url = base_url
+        self._cache = cache
+        self._retry = retry
+        self._rate_limiter = rate_limiter
+        self._raw = raw
+        self._concurrency_limiter = concurrency_limiter
+        self._http2 = http2
+    # end def
+
+    async def __aenter__(self) -> 'DerpiClient':
+        if self._client is None:
+            self._client = self.create_client(http2=self._http2)
+            self._owns_client = True
+        # end if
+        return self
+    # end def
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+    # end def
+
+    async def close(self) -> None:
+        """
+        Closes the connection pool of this client, if it was created by us.
+        A `client` given to the constructor as well as the shared pool are left open.
+        """
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._owns_client = False
+        # end if
+    # end def
+
+    @classmethod
+    def create_client(cls, http2: Union[bool, None] = None) -> internet.AsyncClient:
+        """
+        Creates a new http client with a keep-alive connection pool.
+        Note, httpx only supports a total limit, so we allow `POOL_CONNECTIONS * POOL_MAXSIZE` connections overall.
+        With HTTP/2 all the requests to a host are multiplexed over a single connection,
+        so we only allow `POOL_CONNECTIONS` connections then.
+
+        :param http2: If HTTP/2 should be used, for servers supporting it. `None` for `HTTP2`.
+                      That needs the `h2` package, e.g. via `pip install derpi[http2]`.
+
+        :return: A new, pooled httpx.AsyncClient.
+        """
+        if http2 is None:
+            http2 = cls.HTTP2
+        # end if
+        if http2:
+            return internet.AsyncClient(http2=True, limits=internet.Limits(
+                max_connections=cls.POOL_CONNECTIONS,
+                max_keepalive_connections=cls.POOL_CONNECTIONS,
+                keepalive_expiry=cls.POOL_KEEPALIVE_EXPIRY,
+            ))
+        # end if
+        return internet.AsyncClient(limits=internet.Limits(
+            max_connections=cls.POOL_CONNECTIONS * cls.POOL_MAXSIZE,
+            max_keepalive_connections=cls.POOL_CONNECTIONS * cls.POOL_MAXSIZE,
+            keepalive_expiry=cls.POOL_KEEPALIVE_EXPIRY,
+        ))
+    # end def
+
+    @classmethod
+    def get_shared_client(cls, http2: Union[bool, None] = None) -> internet.AsyncClient:
+        """
+        Returns the shared connection pool, creating it on first use.
+        As connections can't be used across event loops, there is one pool per running event loop.
+        Clients using HTTP/2 share a separate pool.
+
+        :param http2: If the pool should use HTTP/2. `None` for `HTTP2`.
+
+        :return: The shared, pooled httpx.AsyncClient.
+        """
+        if http2 is None:
+            http2 = cls.HTTP2
+        # end if
+        clients = cls._shared_clients.setdefault(asyncio.get_running_loop(), {})
+        client = clients.get(bool(http2), None)
+        if client is None or client.is_closed:
+            client = cls.create_client(http2=bool(http2))
+            clients[bool(http2)] = client
+        # end if
+        return client
+    # end def
+
+    @classmethod
+    async def close_shared_client(cls) -> None:
+        """
+        Closes the shared connection pools of the current event loop.
+        They will be recreated if needed again.
+        """
+        clients = cls._shared_clients.pop(asyncio.get_running_loop(), {})
+        for client in clients.values():
+            await client.aclose()
+        # end for
     # end def
 
     @classmethod
@@ -1332,21 +3637,221 @@ class DerpiClient(object):
         method: str,
         url: str,
         params: Union[Dict, None] = None,
-        client: Union[None, internet.AsyncClient, 'DerpiClient'] = None
+        client: Union[None, internet.AsyncClient, 'DerpiClient'] = None,
+        route: Union[str, None] = None,
     ) -> internet.Response:
+        """
+        Sends a request, answering it from the cache of the `DerpiClient` given as `client`, if it has one.
+
+        :param route: The name of the route, e.g. `'tag'`, used to look up how long the response may be cached.
+        """
+        cache: Union[BaseCache, None] = None
+        retry: Union[RetryPolicy, None] = None
+        rate_limiter: Union[RateLimiter, None] = None
+        concurrency_limiter: Union[AdaptiveConcurrencyLimiter, None] = None
+        http2: Union[bool, None] = None
         if isinstance(client, DerpiClient):
+            cache = client._cache
+            retry = client._retry
+            rate_limiter = client._rate_limiter
+            concurrency_limiter = client._concurrency_limiter
+            http2 = client._http2
             client: internet.AsyncClient = client._client
         # end if
-        if client is None:  # if we have no client, call ourself recursively with a with statement.
-            async with internet.AsyncClient() as client:
-                return await cls.static_request(method=method, url=url, params=params, client=client)
-            # end with
+        if params is not None:  # httpx would send `None` as empty string.
+            params = {name: value for name, value in params.items() if value is not None}
+        # end if
+        if retry is None:
+            retry = cls.DEFAULT_RETRY
+        # end if
+        if rate_limiter is None:
+            rate_limiter = cls.DEFAULT_RATE_LIMITER
+        # end if
+        if concurrency_limiter is None:
+            concurrency_limiter = cls.DEFAULT_CONCURRENCY_LIMITER
         # end if
-        response: internet.Response = await client.request(method=method, url=url, params=params)
-        cls._check_response(response)
+        ttl = cache.ttl_for(route) if cache is not None and method == 'GET' else None
+        cache_key = make_cache_key(method, url, params)
+        if ttl:
+            content = cache.get(cache_key)
+            if content is not None:
+                return cls._cached_response(method=method, url=url, content=content)
+            # end if
+        # end if
+        if client is None:  # if we have no client, use the shared connection pool.
+            client = cls.get_shared_client(http2=http2)
+        # end if
+        if method != 'GET' or not cls.COALESCE_REQUESTS:
+            return await cls._send_request(
+                client, method, url, params,
+                cache=cache, cache_key=cache_key, ttl=ttl, retry=retry, rate_limiter=rate_limiter,
+                concurrency_limiter=concurrency_limiter,
+            )
+        # end if
+        # identical GET requests still running are joined, instead of sending the same request again.
+        # keyed by the client as well, as different clients may have different headers, cookies or base urls.
+        # it's kept alive by the request running with it, so its id can't be reused while in there.
+        in_flight = cls._in_flight.setdefault(asyncio.get_running_loop(), {})
+        flight_key = (id(client), cache_key)
+        task = in_flight.get(flight_key, None)
+        if task is None:
+            task = asyncio.ensure_future(cls._send_request(
+                client, method, url, params,
+                cache=cache, cache_key=cache_key, ttl=ttl, retry=retry, rate_limiter=rate_limiter,
+                concurrency_limiter=concurrency_limiter,
+            ))
+            in_flight[flight_key] = task
+
+            def forget(done_task: asyncio.Future) -> None:
+                if in_flight.get(flight_key, None) is done_task:
+                    del in_flight[flight_key]
+                # end if
+            # end def
+            task.add_done_callback(forget)
+        # end if
+        # shielded, so one of the waiting callers being cancelled doesn't cancel the request for the others.
+        return await asyncio.shield(task)
+    # end def
+
+    @classmethod
+    async def static_stream(
+        cls: Type['DerpiClient'],
+        method: str,
+        url: str,
+        params: Union[Dict, None] = None,
+        client: Union[None, internet.AsyncClient, 'DerpiClient'] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Sends a request, yielding the chunks of the response body as they arrive.
+        Unlike `static_request(...)` the response can't be cached, and the request isn't retried
+        as we might have passed on parts of the response already. It still waits for the rate limiter, though.
+        """
+        rate_limiter: Union[RateLimiter, None] = None
+        http2: Union[bool, None] = None
+        if isinstance(client, DerpiClient):
+            rate_limiter = client._rate_limiter
+            http2 = client._http2
+            client: internet.AsyncClient = client._client
+        # end if
+        if rate_limiter is None:
+            rate_limiter = cls.DEFAULT_RATE_LIMITER
+        # end if
+        if params is not None:  # httpx would send `None` as empty string.
+            params = {name: value for name, value in params.items() if value is not None}
+        # end if
+        if client is None:  # if we have no client, use the shared connection pool.
+            client = cls.get_shared_client(http2=http2)
+        # end if
+        if rate_limiter is not None:
+            wait = rate_limiter.reserve(url)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            # end if
+        # end if
+        async with client.stream(method=method, url=url, params=params) as response:
+            cls._check_response(response)
+            async for chunk in response.aiter_bytes(cls.STREAM_CHUNK_SIZE):
+                yield chunk
+            # end for
+        # end with
+    # end def
+
+    @classmethod
+    async def _send_request(
+        cls: Type['DerpiClient'],
+        client: internet.AsyncClient,
+        method: str,
+        url: str,
+        params: Union[Dict, None],
+        cache: Union[BaseCache, None],
+        cache_key: str,
+        ttl: Union[float, None],
+        retry: RetryPolicy,
+        rate_limiter: Union[RateLimiter, None],
+        concurrency_limiter: Union[AdaptiveConcurrencyLimiter, None],
+    ) -> internet.Response:
+        """
+        Actually sends the request, storing the response in the `cache` if it should be kept (`ttl`).
+        Failing `GET` requests are sent again, as long as the `retry` policy allows it.
+        Every try waits for the `rate_limiter` first, and runs within the `concurrency_limiter`.
+        """
+        attempt = 0
+        while True:
+            if rate_limiter is not None:
+                wait = rate_limiter.reserve(url)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                # end if
+            # end if
+            try:
+                response: internet.Response = await cls._limited_request(
+                    client, method, url, params, concurrency_limiter=concurrency_limiter,
+                )
+                break
+            except TRANSPORT_ERRORS + (DerpiResponseError,) as e:
+                if method != 'GET' or not retry.should_retry(attempt, e, transport_error=isinstance(e, TRANSPORT_ERRORS)):
+                    raise
+                # end if
+                delay = retry.delay(attempt, e)
+                attempt += 1
+                logger.warning(f'Request to {url} failed ({e!r}), retry {attempt}/{retry.max_retries} in {delay:.1f}s.')
+                await asyncio.sleep(delay)
+            # end try
+        # end while
+        if ttl:
+            cache.set(cache_key, response.content, ttl)
+        # end if
+        return response
+    # end def
+
+    @classmethod
+    async def _limited_request(
+        cls: Type['DerpiClient'],
+        client: internet.AsyncClient,
+        method: str,
+        url: str,
+        params: Union[Dict, None],
+        concurrency_limiter: Union[AdaptiveConcurrencyLimiter, None],
+    ) -> internet.Response:
+        """
+        Sends a single request and checks the response,
+        waiting for a free slot of the `concurrency_limiter` and reporting back how it went.
+        """
+        if concurrency_limiter is None:
+            response: internet.Response = await client.request(method=method, url=url, params=params)
+            cls._check_response(response)
+            return response
+        # end if
+        await concurrency_limiter.acquire()
+        started = time.monotonic()
+        try:
+            response: internet.Response = await client.request(method=method, url=url, params=params)
+            cls._check_response(response)
+        except (NotFoundError, UnexpectedResponseError):  # the server is fine, it's us asking for the wrong things.
+            concurrency_limiter.release(time.monotonic() - started)
+            raise
+        except TRANSPORT_ERRORS + (DerpiResponseError,):  # rate limited, failing, timing out, ...
+            concurrency_limiter.release(time.monotonic() - started, overloaded=True)
+            raise
+        except BaseException:  # e.g. cancelled
+            concurrency_limiter.release()
+            raise
+        # end try
+        concurrency_limiter.release(time.monotonic() - started)
         return response
     # end def
 
+    @staticmethod
+    def _cached_response(method: str, url: str, content: bytes) -> internet.Response:
+        """
+        Builds a response object from a cached response body, looking like the server just sent it.
+        """
+        return internet.Response(
+            status_code=200, headers={'content-type': 'application/json; charset=utf-8'}, content=content,
+            request=internet.Request(method=method, url=url),
+        )
+    # end def
+
     @staticmethod
     def _check_response(response: internet.Response) -> None:
         """
@@ -1355,9 +3860,17 @@ class DerpiClient(object):
 
         :param response: A requests/httpx response.
         :type  response: requests.Response|httpx.Response
+
+        :raises NotFoundError: The object doesn't exist (`404`).
+        :raises RateLimitedError: Too many requests (`429`), see its `retry_after`.
+        :raises ServerError: The server failed (`5xx`).
+        :raises CloudflareChallengeError: Cloudflare wants us to solve a challenge.
+        :raises UnexpectedResponseError: Any other status, or the response isn't json.
         """
-        assert response.status_code == 200  # TODO
-        assert response.headers['content-type'] == 'application/json; charset=utf-8'
+        error = error_for_response(response)
+        if error is not None:
+            raise error
+        # end if
     # end def
     
     # noinspection PyMethodMayBeStatic
@@ -1365,6 +3878,7 @@ class DerpiClient(object):
         self, 
         comment_id: int,
         _client: Union[None, internet.AsyncClient] = None,
+        _raw: Union[None, bool, str] = None,
     ) -> Comment:
         """
         Fetches a **comment response** for the comment ID referenced by the `comment_id` URL parameter.
@@ -1385,12 +3899,17 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
         :rtype:  Comment
         """
         return await comment(
             comment_id=comment_id,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def comment
     
@@ -1400,6 +3919,7 @@ class DerpiClient(object):
         image_id: int,
         filter_id: Union[int, None] = None,
         _client: Union[None, internet.AsyncClient] = None,
+        _raw: Union[None, bool, str] = None,
     ) -> Image:
         """
         Fetches an **image response** for the image ID referenced by the `image_id` URL parameter.
@@ -1428,6 +3948,10 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
         :rtype:  Image
         """
@@ -1435,7 +3959,8 @@ class DerpiClient(object):
             image_id=image_id,
             filter_id=filter_id,
             key=self._key,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def image
     
@@ -1444,6 +3969,7 @@ class DerpiClient(object):
         self, 
         url: str,
         _client: Union[None, internet.AsyncClient] = None,
+        _raw: Union[None, bool, str] = None,
     ) -> Image:
         """
         Submits a new image. Both `key` and `url` are required. Errors will result in an `{"errors":image-errors-response}`.
@@ -1469,13 +3995,18 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
         :rtype:  Image
         """
         return await image_upload(
             url=url,
             key=self._key,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def image_upload
     
@@ -1483,6 +4014,7 @@ class DerpiClient(object):
     async def featured_image(
         self, 
         _client: Union[None, internet.AsyncClient] = None,
+        _raw: Union[None, bool, str] = None,
     ) -> Image:
         """
         Fetches an **image response** for the for the current featured image.
@@ -1500,11 +4032,16 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
         :rtype:  Image
         """
         return await featured_image(
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def featured_image
     
@@ -1513,6 +4050,7 @@ class DerpiClient(object):
         self, 
         tag_id: str,
         _client: Union[None, internet.AsyncClient] = None,
+        _raw: Union[None, bool, str] = None,
     ) -> Tag:
         """
         Fetches a **tag response** for the **tag slug** given by the `tag_id` URL parameter. The tag's ID is **not** used. For getting a tag by ID the search endpoint can be used like `search/tags?q=id:4458`.
@@ -1533,12 +4071,17 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
         :rtype:  Tag
         """
         return await tag(
             tag_id=tag_id,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def tag
     
@@ -1547,6 +4090,7 @@ class DerpiClient(object):
         self, 
         post_id: int,
         _client: Union[None, internet.AsyncClient] = None,
+        _raw: Union[None, bool, str] = None,
     ) -> Post:
         """
         Fetches a **post response** for the post ID given by the `post_id` URL parameter.
@@ -1567,12 +4111,17 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
         :rtype:  Post
         """
         return await post(
             post_id=post_id,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def post
     
@@ -1581,6 +4130,7 @@ class DerpiClient(object):
         self, 
         user_id: int,
         _client: Union[None, internet.AsyncClient] = None,
+        _raw: Union[None, bool, str] = None,
     ) -> User:
         """
         Fetches a **profile response** for the user ID given by the `user_id` URL parameter.
@@ -1601,12 +4151,17 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
         :rtype:  User
         """
         return await user(
             user_id=user_id,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def user
     
@@ -1615,6 +4170,7 @@ class DerpiClient(object):
         self, 
         filter_id: int,
         _client: Union[None, internet.AsyncClient] = None,
+        _raw: Union[None, bool, str] = None,
     ) -> Filter:
         """
         Fetches a **filter response** for the filter ID given by the `filter_id` URL parameter.
@@ -1640,13 +4196,18 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
         :rtype:  Filter
         """
         return await filter(
             filter_id=filter_id,
             key=self._key,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def filter
     
@@ -1655,6 +4216,7 @@ class DerpiClient(object):
         self, 
         page: Union[int, None] = None,
         _client: Union[None, internet.AsyncClient] = None,
+        _raw: Union[None, bool, str] = None,
     ) -> List[Filter]:
         """
         Fetches a list of **filter responses** that are flagged as being **system** filters (and thus usable by anyone).
@@ -1675,20 +4237,53 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
         :rtype:  List[Filter]
         """
         return await system_filters(
             page=page,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def system_filters
     
+    def iter_system_filters(
+        self, 
+        limit: Union[int, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: Union[None, bool, str] = None,
+    ) -> AsyncIterator[Filter]:
+        """
+        Walks through all the pages of `system_filters(...)`, yielding every single `Filter`.
+        While the items of a page are consumed, the next page is already requested in the background.
+        See `iter_system_filters(...)` on module level for the parameters.
+
+        :param limit: Stop after that many items. `None` to get all of them.
+        :type  limit: int|None
+
+        :param _raw: Skip building the models, see `iter_system_filters(...)` on module level. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: Async iterator over the parsed results from the API.
+        :rtype:  AsyncIterator[Filter]
+        """
+        return iter_system_filters(
+            limit=limit,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def iter_system_filters
+    
     # noinspection PyMethodMayBeStatic
     async def user_filters(
         self, 
         page: Union[int, None] = None,
         _client: Union[None, internet.AsyncClient] = None,
+        _raw: Union[None, bool, str] = None,
     ) -> List[Filter]:
         """
         Fetches a list of **filter responses** that belong to the user given by **key**. If no **key** is given or it is invalid, will return a **403 Forbidden** error.
@@ -1714,21 +4309,55 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
         :rtype:  List[Filter]
         """
         return await user_filters(
             key=self._key,
             page=page,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def user_filters
     
+    def iter_user_filters(
+        self, 
+        limit: Union[int, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: Union[None, bool, str] = None,
+    ) -> AsyncIterator[Filter]:
+        """
+        Walks through all the pages of `user_filters(...)`, yielding every single `Filter`.
+        While the items of a page are consumed, the next page is already requested in the background.
+        See `iter_user_filters(...)` on module level for the parameters.
+
+        :param limit: Stop after that many items. `None` to get all of them.
+        :type  limit: int|None
+
+        :param _raw: Skip building the models, see `iter_user_filters(...)` on module level. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: Async iterator over the parsed results from the API.
+        :rtype:  AsyncIterator[Filter]
+        """
+        return iter_user_filters(
+            key=self._key,
+            limit=limit,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def iter_user_filters
+    
     # noinspection PyMethodMayBeStatic
     async def oembed(
         self, 
         url: str,
         _client: Union[None, internet.AsyncClient] = None,
+        _raw: Union[None, bool, str] = None,
     ) -> Oembed:
         """
         Fetches an **oEmbed response** for the given app link or CDN URL.
@@ -1749,12 +4378,17 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
         :rtype:  Oembed
         """
         return await oembed(
             url=url,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def oembed
     
@@ -1764,7 +4398,8 @@ class DerpiClient(object):
         query: str,
         page: Union[int, None] = None,
         _client: Union[None, internet.AsyncClient] = None,
-    ) -> List[Comment]:
+        _raw: Union[None, bool, str] = None,
+    ) -> SearchResult[Comment]:
         """
         Executes the search given by the `q` query parameter (case insensitive and stemming is applied. If you search for **best pony** results like **Best Ponies** are also be returned), and returns **comment responses** sorted by descending creation time.
 
@@ -1772,7 +4407,7 @@ class DerpiClient(object):
         It will take in account `self._base_url` and fill in all url variables and append the data parameters as needed,
         which would for example look like this: https://derpibooru.org/api/v1/json/search/comments?q=image_id:1000000
 
-        The API should return json looking like `{"comments":[Comment]}` which will then be parsed to the python result `List[Comment]`.
+        The API should return json looking like `{"comments":[Comment]}` which will then be parsed to the python result `SearchResult[Comment]`.
         
         :param query: The current search query, if the request is a search request.
         :type  query: str
@@ -1782,26 +4417,121 @@ class DerpiClient(object):
         
         :param key: An optional authentication token. If omitted, no user will be authenticated.
 
-                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
-        :type  key: str|None
-        
-        :param _client: If you wanna to provide your custom, already opened httpx.AsyncClient.
-                        For example:
-                        >>> async with httpx.AsyncClient() as client:
-                        ...    result = await search_comments(..., _client=client)
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+        :type  key: str|None
+        
+        :param _client: If you wanna to provide your custom, already opened httpx.AsyncClient.
+                        For example:
+                        >>> async with httpx.AsyncClient() as client:
+                        ...    result = await search_comments(..., _client=client)
+
+        :type  _client: httpx.AsyncClient|None
+        
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: The parsed result from the API.
+        :rtype:  SearchResult[Comment]
+        """
+        return await search_comments(
+            query=query,
+            page=page,
+            key=self._key,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def search_comments
+    
+    def iter_search_comments(
+        self, 
+        query: str,
+        limit: Union[int, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: Union[None, bool, str] = None,
+    ) -> AsyncIterator[Comment]:
+        """
+        Walks through all the pages of `search_comments(...)`, yielding every single `Comment`.
+        While the items of a page are consumed, the next page is already requested in the background.
+        See `iter_search_comments(...)` on module level for the parameters.
+
+        :param limit: Stop after that many items. `None` to get all of them.
+        :type  limit: int|None
+
+        :param _raw: Skip building the models, see `iter_search_comments(...)` on module level. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: Async iterator over the parsed results from the API.
+        :rtype:  AsyncIterator[Comment]
+        """
+        return iter_search_comments(
+            query=query,
+            key=self._key,
+            limit=limit,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def iter_search_comments
+    
+    async def fan_out_search_comments(
+        self, 
+        query: str,
+        limit: Union[int, None] = None,
+        max_concurrency: int = 4,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: Union[None, bool, str] = None,
+    ) -> SearchResult[Comment]:
+        """
+        Loads all the results of `search_comments(...)` at once, requesting the pages concurrently.
+        See `fan_out_search_comments(...)` on module level for the parameters.
+
+        :param limit: Stop after that many items. `None` to get all of them.
+        :type  limit: int|None
+
+        :param max_concurrency: How many pages may be requested at the same time.
+        :type  max_concurrency: int
+
+        :param _raw: Skip building the models, see `fan_out_search_comments(...)` on module level. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: All the parsed results from the API.
+        :rtype:  SearchResult[Comment]
+        """
+        return await fan_out_search_comments(
+            query=query,
+            key=self._key,
+            limit=limit,
+            max_concurrency=max_concurrency,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def fan_out_search_comments
+    
+    def stream_search_comments(
+        self, 
+        query: str,
+        page: Union[int, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: Union[None, bool, str] = None,
+    ) -> AsyncIterator[Comment]:
+        """
+        Like `search_comments(...)`, but yields every single `Comment` as soon as it was downloaded.
+        See `stream_search_comments(...)` on module level for the parameters.
+
+        :param _raw: Skip building the models, see `stream_search_comments(...)` on module level. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
 
-        :type  _client: httpx.AsyncClient|None
-        
-        :return: The parsed result from the API.
-        :rtype:  List[Comment]
+        :return: Async iterator over the parsed results from the API.
+        :rtype:  AsyncIterator[Comment]
         """
-        return await search_comments(
+        return stream_search_comments(
             query=query,
             page=page,
             key=self._key,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
-    # end def search_comments
+    # end def stream_search_comments
     
     # noinspection PyMethodMayBeStatic
     async def search_galleries(
@@ -1809,7 +4539,8 @@ class DerpiClient(object):
         query: str,
         page: Union[int, None] = None,
         _client: Union[None, internet.AsyncClient] = None,
-    ) -> List[Gallery]:
+        _raw: Union[None, bool, str] = None,
+    ) -> SearchResult[Gallery]:
         """
         Executes the search given by the `q` query parameter, and returns **gallery responses** sorted by descending creation time.
 
@@ -1817,7 +4548,7 @@ class DerpiClient(object):
         It will take in account `self._base_url` and fill in all url variables and append the data parameters as needed,
         which would for example look like this: https://derpibooru.org/api/v1/json/search/galleries?q=title:mean*
 
-        The API should return json looking like `{"galleries":[Gallery]}` which will then be parsed to the python result `List[Gallery]`.
+        The API should return json looking like `{"galleries":[Gallery]}` which will then be parsed to the python result `SearchResult[Gallery]`.
         
         :param query: The current search query, if the request is a search request.
         :type  query: str
@@ -1837,24 +4568,120 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
-        :rtype:  List[Gallery]
+        :rtype:  SearchResult[Gallery]
         """
         return await search_galleries(
             query=query,
             page=page,
             key=self._key,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def search_galleries
     
+    def iter_search_galleries(
+        self, 
+        query: str,
+        limit: Union[int, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: Union[None, bool, str] = None,
+    ) -> AsyncIterator[Gallery]:
+        """
+        Walks through all the pages of `search_galleries(...)`, yielding every single `Gallery`.
+        While the items of a page are consumed, the next page is already requested in the background.
+        See `iter_search_galleries(...)` on module level for the parameters.
+
+        :param limit: Stop after that many items. `None` to get all of them.
+        :type  limit: int|None
+
+        :param _raw: Skip building the models, see `iter_search_galleries(...)` on module level. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: Async iterator over the parsed results from the API.
+        :rtype:  AsyncIterator[Gallery]
+        """
+        return iter_search_galleries(
+            query=query,
+            key=self._key,
+            limit=limit,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def iter_search_galleries
+    
+    async def fan_out_search_galleries(
+        self, 
+        query: str,
+        limit: Union[int, None] = None,
+        max_concurrency: int = 4,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: Union[None, bool, str] = None,
+    ) -> SearchResult[Gallery]:
+        """
+        Loads all the results of `search_galleries(...)` at once, requesting the pages concurrently.
+        See `fan_out_search_galleries(...)` on module level for the parameters.
+
+        :param limit: Stop after that many items. `None` to get all of them.
+        :type  limit: int|None
+
+        :param max_concurrency: How many pages may be requested at the same time.
+        :type  max_concurrency: int
+
+        :param _raw: Skip building the models, see `fan_out_search_galleries(...)` on module level. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: All the parsed results from the API.
+        :rtype:  SearchResult[Gallery]
+        """
+        return await fan_out_search_galleries(
+            query=query,
+            key=self._key,
+            limit=limit,
+            max_concurrency=max_concurrency,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def fan_out_search_galleries
+    
+    def stream_search_galleries(
+        self, 
+        query: str,
+        page: Union[int, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: Union[None, bool, str] = None,
+    ) -> AsyncIterator[Gallery]:
+        """
+        Like `search_galleries(...)`, but yields every single `Gallery` as soon as it was downloaded.
+        See `stream_search_galleries(...)` on module level for the parameters.
+
+        :param _raw: Skip building the models, see `stream_search_galleries(...)` on module level. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: Async iterator over the parsed results from the API.
+        :rtype:  AsyncIterator[Gallery]
+        """
+        return stream_search_galleries(
+            query=query,
+            page=page,
+            key=self._key,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def stream_search_galleries
+    
     # noinspection PyMethodMayBeStatic
     async def search_posts(
         self, 
         query: str,
         page: Union[int, None] = None,
         _client: Union[None, internet.AsyncClient] = None,
-    ) -> List[Post]:
+        _raw: Union[None, bool, str] = None,
+    ) -> SearchResult[Post]:
         """
         Executes the search given by the `q` query parameter, and returns **post responses** sorted by descending creation time.
 
@@ -1862,7 +4689,7 @@ class DerpiClient(object):
         It will take in account `self._base_url` and fill in all url variables and append the data parameters as needed,
         which would for example look like this: https://derpibooru.org/api/v1/json/search/posts?q=subject:time wasting thread
 
-        The API should return json looking like `{"posts":[Post]}` which will then be parsed to the python result `List[Post]`.
+        The API should return json looking like `{"posts":[Post]}` which will then be parsed to the python result `SearchResult[Post]`.
         
         :param query: The current search query, if the request is a search request.
         :type  query: str
@@ -1882,17 +4709,112 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
-        :rtype:  List[Post]
+        :rtype:  SearchResult[Post]
         """
         return await search_posts(
             query=query,
             page=page,
             key=self._key,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def search_posts
     
+    def iter_search_posts(
+        self, 
+        query: str,
+        limit: Union[int, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: Union[None, bool, str] = None,
+    ) -> AsyncIterator[Post]:
+        """
+        Walks through all the pages of `search_posts(...)`, yielding every single `Post`.
+        While the items of a page are consumed, the next page is already requested in the background.
+        See `iter_search_posts(...)` on module level for the parameters.
+
+        :param limit: Stop after that many items. `None` to get all of them.
+        :type  limit: int|None
+
+        :param _raw: Skip building the models, see `iter_search_posts(...)` on module level. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: Async iterator over the parsed results from the API.
+        :rtype:  AsyncIterator[Post]
+        """
+        return iter_search_posts(
+            query=query,
+            key=self._key,
+            limit=limit,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def iter_search_posts
+    
+    async def fan_out_search_posts(
+        self, 
+        query: str,
+        limit: Union[int, None] = None,
+        max_concurrency: int = 4,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: Union[None, bool, str] = None,
+    ) -> SearchResult[Post]:
+        """
+        Loads all the results of `search_posts(...)` at once, requesting the pages concurrently.
+        See `fan_out_search_posts(...)` on module level for the parameters.
+
+        :param limit: Stop after that many items. `None` to get all of them.
+        :type  limit: int|None
+
+        :param max_concurrency: How many pages may be requested at the same time.
+        :type  max_concurrency: int
+
+        :param _raw: Skip building the models, see `fan_out_search_posts(...)` on module level. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: All the parsed results from the API.
+        :rtype:  SearchResult[Post]
+        """
+        return await fan_out_search_posts(
+            query=query,
+            key=self._key,
+            limit=limit,
+            max_concurrency=max_concurrency,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def fan_out_search_posts
+    
+    def stream_search_posts(
+        self, 
+        query: str,
+        page: Union[int, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: Union[None, bool, str] = None,
+    ) -> AsyncIterator[Post]:
+        """
+        Like `search_posts(...)`, but yields every single `Post` as soon as it was downloaded.
+        See `stream_search_posts(...)` on module level for the parameters.
+
+        :param _raw: Skip building the models, see `stream_search_posts(...)` on module level. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: Async iterator over the parsed results from the API.
+        :rtype:  AsyncIterator[Post]
+        """
+        return stream_search_posts(
+            query=query,
+            page=page,
+            key=self._key,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def stream_search_posts
+    
     # noinspection PyMethodMayBeStatic
     async def search_images(
         self, 
@@ -1903,7 +4825,8 @@ class DerpiClient(object):
         sort_direction: Union[str, None] = None,
         sort_field: Union[str, None] = None,
         _client: Union[None, internet.AsyncClient] = None,
-    ) -> List[Image]:
+        _raw: Union[None, bool, str] = None,
+    ) -> SearchResult[Image]:
         """
         Executes the search given by the `q` query parameter, and returns **image responses**.
 
@@ -1911,7 +4834,7 @@ class DerpiClient(object):
         It will take in account `self._base_url` and fill in all url variables and append the data parameters as needed,
         which would for example look like this: https://derpibooru.org/api/v1/json/search/images?q=safe
 
-        The API should return json looking like `{"images":[Image]}` which will then be parsed to the python result `List[Image]`.
+        The API should return json looking like `{"images":[Image]}` which will then be parsed to the python result `SearchResult[Image]`.
         
         :param query: The current search query, if the request is a search request.
         :type  query: str
@@ -1943,8 +4866,12 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
-        :rtype:  List[Image]
+        :rtype:  SearchResult[Image]
         """
         return await search_images(
             query=query,
@@ -1954,17 +4881,171 @@ class DerpiClient(object):
             sort_direction=sort_direction,
             sort_field=sort_field,
             key=self._key,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def search_images
     
+    def iter_search_images(
+        self, 
+        query: str,
+        filter_id: Union[int, None] = None,
+        per_page: Union[int, None] = 50,
+        sort_direction: Union[str, None] = None,
+        sort_field: Union[str, None] = None,
+        limit: Union[int, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: Union[None, bool, str] = None,
+    ) -> AsyncIterator[Image]:
+        """
+        Walks through all the pages of `search_images(...)`, yielding every single `Image`.
+        While the items of a page are consumed, the next page is already requested in the background.
+        See `iter_search_images(...)` on module level for the parameters.
+
+        :param limit: Stop after that many items. `None` to get all of them.
+        :type  limit: int|None
+
+        :param _raw: Skip building the models, see `iter_search_images(...)` on module level. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: Async iterator over the parsed results from the API.
+        :rtype:  AsyncIterator[Image]
+        """
+        return iter_search_images(
+            query=query,
+            filter_id=filter_id,
+            per_page=per_page,
+            sort_direction=sort_direction,
+            sort_field=sort_field,
+            key=self._key,
+            limit=limit,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def iter_search_images
+    
+    async def fan_out_search_images(
+        self, 
+        query: str,
+        filter_id: Union[int, None] = None,
+        per_page: Union[int, None] = 50,
+        sort_direction: Union[str, None] = None,
+        sort_field: Union[str, None] = None,
+        limit: Union[int, None] = None,
+        max_concurrency: int = 4,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: Union[None, bool, str] = None,
+    ) -> SearchResult[Image]:
+        """
+        Loads all the results of `search_images(...)` at once, requesting the pages concurrently.
+        See `fan_out_search_images(...)` on module level for the parameters.
+
+        :param limit: Stop after that many items. `None` to get all of them.
+        :type  limit: int|None
+
+        :param max_concurrency: How many pages may be requested at the same time.
+        :type  max_concurrency: int
+
+        :param _raw: Skip building the models, see `fan_out_search_images(...)` on module level. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: All the parsed results from the API.
+        :rtype:  SearchResult[Image]
+        """
+        return await fan_out_search_images(
+            query=query,
+            filter_id=filter_id,
+            per_page=per_page,
+            sort_direction=sort_direction,
+            sort_field=sort_field,
+            key=self._key,
+            limit=limit,
+            max_concurrency=max_concurrency,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def fan_out_search_images
+    
+    def cursor_search_images(
+        self, 
+        query: str,
+        filter_id: Union[int, None] = None,
+        per_page: Union[int, None] = 50,
+        cursor: Union[str, None] = None,
+        limit: Union[int, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: Union[None, bool, str] = None,
+    ) -> SearchCursor:
+        """
+        Walks through all the results of `search_images(...)` with keyset pagination, newest first.
+        See `cursor_search_images(...)` on module level for the parameters.
+
+        :param cursor: The `token` of an earlier `SearchCursor` for the same query, to continue after its last item.
+        :type  cursor: str|None
+
+        :param limit: Stop after that many items. `None` to get all of them.
+        :type  limit: int|None
+
+        :param _raw: Skip building the models, see `cursor_search_images(...)` on module level. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: Async iterator over the parsed results from the API, with a resumable `token`.
+        :rtype:  SearchCursor
+        """
+        return cursor_search_images(
+            query=query,
+            filter_id=filter_id,
+            per_page=per_page,
+            key=self._key,
+            cursor=cursor,
+            limit=limit,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def cursor_search_images
+    
+    def stream_search_images(
+        self, 
+        query: str,
+        filter_id: Union[int, None] = None,
+        page: Union[int, None] = None,
+        per_page: Union[int, None] = None,
+        sort_direction: Union[str, None] = None,
+        sort_field: Union[str, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: Union[None, bool, str] = None,
+    ) -> AsyncIterator[Image]:
+        """
+        Like `search_images(...)`, but yields every single `Image` as soon as it was downloaded.
+        See `stream_search_images(...)` on module level for the parameters.
+
+        :param _raw: Skip building the models, see `stream_search_images(...)` on module level. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: Async iterator over the parsed results from the API.
+        :rtype:  AsyncIterator[Image]
+        """
+        return stream_search_images(
+            query=query,
+            filter_id=filter_id,
+            page=page,
+            per_page=per_page,
+            sort_direction=sort_direction,
+            sort_field=sort_field,
+            key=self._key,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def stream_search_images
+    
     # noinspection PyMethodMayBeStatic
     async def search_tags(
         self, 
         query: str,
         page: Union[int, None] = None,
         _client: Union[None, internet.AsyncClient] = None,
-    ) -> List[Tag]:
+        _raw: Union[None, bool, str] = None,
+    ) -> SearchResult[Tag]:
         """
         Executes the search given by the `q` query parameter, and returns **tag responses** sorted by descending image count.
 
@@ -1972,7 +5053,7 @@ class DerpiClient(object):
         It will take in account `self._base_url` and fill in all url variables and append the data parameters as needed,
         which would for example look like this: https://derpibooru.org/api/v1/json/search/tags?q=analyzed_name:wing
 
-        The API should return json looking like `{"tags":[Tag]}` which will then be parsed to the python result `List[Tag]`.
+        The API should return json looking like `{"tags":[Tag]}` which will then be parsed to the python result `SearchResult[Tag]`.
         
         :param query: The current search query, if the request is a search request.
         :type  query: str
@@ -1987,23 +5068,116 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
-        :rtype:  List[Tag]
+        :rtype:  SearchResult[Tag]
         """
         return await search_tags(
             query=query,
             page=page,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def search_tags
     
+    def iter_search_tags(
+        self, 
+        query: str,
+        limit: Union[int, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: Union[None, bool, str] = None,
+    ) -> AsyncIterator[Tag]:
+        """
+        Walks through all the pages of `search_tags(...)`, yielding every single `Tag`.
+        While the items of a page are consumed, the next page is already requested in the background.
+        See `iter_search_tags(...)` on module level for the parameters.
+
+        :param limit: Stop after that many items. `None` to get all of them.
+        :type  limit: int|None
+
+        :param _raw: Skip building the models, see `iter_search_tags(...)` on module level. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: Async iterator over the parsed results from the API.
+        :rtype:  AsyncIterator[Tag]
+        """
+        return iter_search_tags(
+            query=query,
+            limit=limit,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def iter_search_tags
+    
+    async def fan_out_search_tags(
+        self, 
+        query: str,
+        limit: Union[int, None] = None,
+        max_concurrency: int = 4,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: Union[None, bool, str] = None,
+    ) -> SearchResult[Tag]:
+        """
+        Loads all the results of `search_tags(...)` at once, requesting the pages concurrently.
+        See `fan_out_search_tags(...)` on module level for the parameters.
+
+        :param limit: Stop after that many items. `None` to get all of them.
+        :type  limit: int|None
+
+        :param max_concurrency: How many pages may be requested at the same time.
+        :type  max_concurrency: int
+
+        :param _raw: Skip building the models, see `fan_out_search_tags(...)` on module level. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: All the parsed results from the API.
+        :rtype:  SearchResult[Tag]
+        """
+        return await fan_out_search_tags(
+            query=query,
+            limit=limit,
+            max_concurrency=max_concurrency,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def fan_out_search_tags
+    
+    def stream_search_tags(
+        self, 
+        query: str,
+        page: Union[int, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: Union[None, bool, str] = None,
+    ) -> AsyncIterator[Tag]:
+        """
+        Like `search_tags(...)`, but yields every single `Tag` as soon as it was downloaded.
+        See `stream_search_tags(...)` on module level for the parameters.
+
+        :param _raw: Skip building the models, see `stream_search_tags(...)` on module level. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: Async iterator over the parsed results from the API.
+        :rtype:  AsyncIterator[Tag]
+        """
+        return stream_search_tags(
+            query=query,
+            page=page,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def stream_search_tags
+    
     # noinspection PyMethodMayBeStatic
     async def search_reverse(
         self, 
         url: str,
         distance: Union[float, None] = None,
         _client: Union[None, internet.AsyncClient] = None,
-    ) -> List[Image]:
+        _raw: Union[None, bool, str] = None,
+    ) -> SearchResult[Image]:
         """
         Returns **image responses** based on the results of reverse-searching the image given by the `url` query parameter.
 
@@ -2011,7 +5185,7 @@ class DerpiClient(object):
         It will take in account `self._base_url` and fill in all url variables and append the data parameters as needed,
         which would for example look like this: https://derpibooru.org/api/v1/json/search/reverse?url=https://derpicdn.net/img/2019/12/24/2228439/full.jpg
 
-        The API should return json looking like `{"images":[Image]}` which will then be parsed to the python result `List[Image]`.
+        The API should return json looking like `{"images":[Image]}` which will then be parsed to the python result `SearchResult[Image]`.
         
         :param url: Link a deviantART page, a Tumblr post, or the image directly.
         :type  url: str
@@ -2031,14 +5205,19 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
-        :rtype:  List[Image]
+        :rtype:  SearchResult[Image]
         """
         return await search_reverse(
             url=url,
             distance=distance,
             key=self._key,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def search_reverse
     
@@ -2046,6 +5225,7 @@ class DerpiClient(object):
     async def forums(
         self, 
         _client: Union[None, internet.AsyncClient] = None,
+        _raw: Union[None, bool, str] = None,
     ) -> List[Forum]:
         """
         Fetches a list of **forum responses**.
@@ -2063,11 +5243,16 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
         :rtype:  List[Forum]
         """
         return await forums(
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def forums
     
@@ -2076,6 +5261,7 @@ class DerpiClient(object):
         self, 
         short_name: str,
         _client: Union[None, internet.AsyncClient] = None,
+        _raw: Union[None, bool, str] = None,
     ) -> Forum:
         """
         Fetches a **forum response** for the abbreviated name given by the `short_name` URL parameter.
@@ -2096,12 +5282,17 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
         :rtype:  Forum
         """
         return await forum(
             short_name=short_name,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def forum
     
@@ -2111,6 +5302,7 @@ class DerpiClient(object):
         short_name: str,
         page: Union[int, None] = None,
         _client: Union[None, internet.AsyncClient] = None,
+        _raw: Union[None, bool, str] = None,
     ) -> List[Topic]:
         """
         Fetches a list of **topic responses** for the abbreviated forum name given by the `short_name` URL parameter.
@@ -2134,22 +5326,57 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
         :rtype:  List[Topic]
         """
         return await forum_topics(
             short_name=short_name,
             page=page,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def forum_topics
     
+    def iter_forum_topics(
+        self, 
+        short_name: str,
+        limit: Union[int, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: Union[None, bool, str] = None,
+    ) -> AsyncIterator[Topic]:
+        """
+        Walks through all the pages of `forum_topics(...)`, yielding every single `Topic`.
+        While the items of a page are consumed, the next page is already requested in the background.
+        See `iter_forum_topics(...)` on module level for the parameters.
+
+        :param limit: Stop after that many items. `None` to get all of them.
+        :type  limit: int|None
+
+        :param _raw: Skip building the models, see `iter_forum_topics(...)` on module level. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: Async iterator over the parsed results from the API.
+        :rtype:  AsyncIterator[Topic]
+        """
+        return iter_forum_topics(
+            short_name=short_name,
+            limit=limit,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def iter_forum_topics
+    
     # noinspection PyMethodMayBeStatic
     async def forum_topic(
         self, 
         short_name: str,
         topic_slug: str,
         _client: Union[None, internet.AsyncClient] = None,
+        _raw: Union[None, bool, str] = None,
     ) -> Topic:
         """
         Fetches a **topic response** for the abbreviated forum name given by the `short_name` and topic given by `topic_slug` URL parameters.
@@ -2173,13 +5400,18 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
         :rtype:  Topic
         """
         return await forum_topic(
             short_name=short_name,
             topic_slug=topic_slug,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def forum_topic
     
@@ -2190,6 +5422,7 @@ class DerpiClient(object):
         topic_slug: str,
         page: Union[int, None] = None,
         _client: Union[None, internet.AsyncClient] = None,
+        _raw: Union[None, bool, str] = None,
     ) -> List[Post]:
         """
         Fetches a list of **post responses** for the abbreviated forum name given by the `short_name` and topic given by `topic_slug` URL parameters.
@@ -2216,6 +5449,10 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
         :rtype:  List[Post]
         """
@@ -2223,10 +5460,42 @@ class DerpiClient(object):
             short_name=short_name,
             topic_slug=topic_slug,
             page=page,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def forum_posts
     
+    def iter_forum_posts(
+        self, 
+        short_name: str,
+        topic_slug: str,
+        limit: Union[int, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: Union[None, bool, str] = None,
+    ) -> AsyncIterator[Post]:
+        """
+        Walks through all the pages of `forum_posts(...)`, yielding every single `Post`.
+        While the items of a page are consumed, the next page is already requested in the background.
+        See `iter_forum_posts(...)` on module level for the parameters.
+
+        :param limit: Stop after that many items. `None` to get all of them.
+        :type  limit: int|None
+
+        :param _raw: Skip building the models, see `iter_forum_posts(...)` on module level. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: Async iterator over the parsed results from the API.
+        :rtype:  AsyncIterator[Post]
+        """
+        return iter_forum_posts(
+            short_name=short_name,
+            topic_slug=topic_slug,
+            limit=limit,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def iter_forum_posts
+    
     # noinspection PyMethodMayBeStatic
     async def forum_post(
         self, 
@@ -2234,6 +5503,7 @@ class DerpiClient(object):
         topic_slug: str,
         post_id: int,
         _client: Union[None, internet.AsyncClient] = None,
+        _raw: Union[None, bool, str] = None,
     ) -> Post:
         """
         Fetches a **post response** for the abbreviated forum name given by the `short_name`, topic given by `topic_slug` and post given by `post_id` URL parameters.
@@ -2260,6 +5530,10 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
         :rtype:  Post
         """
@@ -2267,8 +5541,56 @@ class DerpiClient(object):
             short_name=short_name,
             topic_slug=topic_slug,
             post_id=post_id,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def forum_post
     
+    async def images(
+        self,
+        image_ids: List[int],
+        filter_id: Union[int, None] = None,
+        max_concurrency: int = 4,
+        _client: Union[None, internet.AsyncClient] = None,
+    ) -> Tuple[List[Image], List[int]]:
+        """
+        Fetches a lot of images by their ID at once, with up to `BULK_BATCH_SIZE` IDs per search request.
+        See `images(...)` on module level for the parameters.
+
+        :return: The found images in the order of `image_ids`, and the IDs which could not be found.
+        :rtype:  Tuple[List[Image], List[int]]
+        """
+        return await images(
+            image_ids=image_ids,
+            filter_id=filter_id,
+            key=self._key,
+            max_concurrency=max_concurrency,
+            _client=_client if _client else self,
+        )
+    # end def images
+
+    async def images_by_hash(
+        self,
+        hashes: List[str],
+        original: bool = False,
+        filter_id: Union[int, None] = None,
+        max_concurrency: int = 4,
+        _client: Union[None, internet.AsyncClient] = None,
+    ) -> Tuple[List[Image], List[str]]:
+        """
+        Fetches a lot of images by their SHA512 hash at once, with up to `BULK_BATCH_SIZE` hashes per search request.
+        See `images_by_hash(...)` on module level for the parameters.
+
+        :return: The found images in the order of `hashes`, and the hashes which could not be found.
+        :rtype:  Tuple[List[Image], List[str]]
+        """
+        return await images_by_hash(
+            hashes=hashes,
+            original=original,
+            filter_id=filter_id,
+            key=self._key,
+            max_concurrency=max_concurrency,
+            _client=_client if _client else self,
+        )
+    # end def images_by_hash
 # end class
\ No newline at end of file
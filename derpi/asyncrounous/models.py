@@ -1,18 +1,21 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 from __future__ import annotations
-import iso8601
 
 from datetime import datetime
-from typing import Union, List, Dict, Type, TypeVar, Generic
+from typing import Union, List, Dict, Type, TypeVar, Generic, Callable, Any, Iterable
 
 from luckydonaldUtils.logger import logging
 from luckydonaldUtils.typing import JSONType
-from luckydonaldUtils.exceptions import assert_type_or_raise
+
+from ..timestamps import parse_datetime, format_datetime
+from ..tags import TAG_TABLE, compact_tag_ids, has_tag, intersects
+from ..representations import split_representations, derive_url
+from ..serialization import to_json_value, dump_json, pack_msgpack, unpack_msgpack
 
 
 __author__ = 'luckydonald'
-__all__ = ['DerpiModel', 'SearchResult', 'Image', 'Representations', 'Intensities', 'Comment', 'Forum', 'Topic', 'Post', 'Tag', 'User', 'Filter', 'Links', 'Awards', 'Gallery', 'ImageErrors', 'Oembed']
+__all__ = ['DerpiModel', 'LazyField', 'SearchResult', 'Image', 'Representations', 'Intensities', 'Comment', 'Forum', 'Topic', 'Post', 'Tag', 'User', 'Filter', 'Links', 'Awards', 'Gallery', 'ImageErrors', 'Oembed', 'LazyImage', 'LazyRepresentations', 'LazyIntensities', 'LazyComment', 'LazyForum', 'LazyTopic', 'LazyPost', 'LazyTag', 'LazyUser', 'LazyFilter', 'LazyLinks', 'LazyAwards', 'LazyGallery', 'LazyImageErrors', 'LazyOembed']
 
 logger = logging.getLogger(__name__)
 if __name__ == '__main__':
@@ -27,7 +30,11 @@ class DerpiModel(object):
     Base class for all models
     """
 
+    __slots__ = ('_raw',)
+
     _assert_consuming_all_params = True  # If set to true we check that we have consumed all arguments.
+    _keep_raw = False  # If set to true, `from_dict(...)` keeps the original dict as `_raw`. Otherwise `_raw` is `None`.
+    _FIELDS = frozenset()  # all the keys we know.
 
     @classmethod
     def prepare_dict(cls: Type[DerpiModel], data: Union[Dict[str, JSONType]]) -> Dict[str, JSONType]:
@@ -39,9 +46,105 @@ class DerpiModel(object):
         """
         return {}
     # end def prepare_dict
+
+    @classmethod
+    def _check_keys(cls: Type[DerpiModel], data: Dict[str, JSONType]) -> None:
+        """
+        Makes sure `data` is a dict without any keys we don't know about.
+
+        :raises TypeError: `data` isn't a dict.
+        :raises ValueError: `data` has unknown keys, and `_assert_consuming_all_params` is set.
+        """
+        if not isinstance(data, dict):
+            raise TypeError(f'Parameter "data" should be type dict, but is type {type(data)!r}: {data!r}')
+        # end if
+        if data.keys() <= cls._FIELDS:
+            return
+        # end if
+        unknown = data.keys() - cls._FIELDS
+        logger.warning(f'still got leftover data: { {key: data[key] for key in unknown}!r}')
+        if cls._assert_consuming_all_params:
+            raise ValueError(
+                f'the dict should be consumed completely, but still has the following elements left: {sorted(unknown)!r}'
+            )
+        # end if
+    # end def _check_keys
+
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        Serializes this model to a json compatible dict, like the API returns it.
+        """
+        return {}
+    # end def to_dict
+
+    def to_json(self) -> str:
+        """
+        Serializes this model to json, see `to_dict()`.
+        """
+        return dump_json(self.to_dict())
+    # end def to_json
+
+    def to_msgpack(self) -> bytes:
+        """
+        Serializes this model to msgpack, see `to_dict()`. Needs `pip install derpi[msgpack]`.
+        """
+        return pack_msgpack(self.to_dict())
+    # end def to_msgpack
+
+    @classmethod
+    def from_msgpack(cls: Type[DerpiModel], packed: bytes) -> DerpiModel:
+        """
+        Deserialize a model from the output of `to_msgpack()`. Needs `pip install derpi[msgpack]`.
+        """
+        return cls.from_dict(unpack_msgpack(packed))
+    # end def from_msgpack
 # end class DerpiModel
 
 
+class LazyField(object):
+    """
+    A field of a lazy model, reading the value from the wrapped dict only when accessed.
+    Converted values (e.g. nested models) and assigned ones are kept in the `_values` of the model.
+    """
+    __slots__ = ('key', 'convert')
+
+    def __init__(self, key: str, convert: Union[Callable[[JSONType], Any], None] = None):
+        """
+        :param key: The key in the wrapped dict.
+        :param convert: Called with the value (if not `None`) on first access, e.g. building a nested model.
+        """
+        self.key = key
+        self.convert = convert
+    # end def __init__
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        # end if
+        values = instance._values
+        if values is not None and self.key in values:
+            return values[self.key]
+        # end if
+        value = instance._data.get(self.key)
+        if self.convert is not None and value is not None:
+            value = self.convert(value)
+            if values is None:
+                values = instance._values = {}
+            # end if
+            values[self.key] = value
+        # end if
+        return value
+    # end def __get__
+
+    def __set__(self, instance, value):
+        if instance._values is None:
+            instance._values = {}
+        # end if
+        instance._values[self.key] = value
+    # end def __set__
+# end class LazyField
+
+
 class SearchResult(DerpiModel, Generic[T]):
     """
     A parsed SearchResult response of the Derpibooru API.
@@ -56,6 +159,8 @@ class SearchResult(DerpiModel, Generic[T]):
     
     """
 
+    __slots__ = ('hits', 'total')
+
     
     """ List of results """
     hits: List[T]
@@ -82,40 +187,32 @@ class SearchResult(DerpiModel, Generic[T]):
         """
         self.hits = hits
         self.total = total
+        self._raw = None
     # end def __init__
 
+    _FIELDS = frozenset({'hits', 'total'})  # all the keys we know.
+
     @classmethod
     def prepare_dict(cls: Type[SearchResult], data: Union[Dict[str, JSONType]]) -> Dict[str, JSONType]:
         """
         Builds a new dict with valid values for the SearchResult constructor.
+        The given `data` is not modified.
 
         :return: new dict with valid values
         :rtype: dict
         """
-        assert_type_or_raise(data, dict, parameter_name="data")
-
-        arguments = super().prepare_dict(data) 
-        arguments['hits'] = List[T].from_dict(data['hits'])
-        arguments['total'] = data['total']
-        
-        del data['hits']
-        del data['total']
-
-        if data:
-            logger.warning(f'still got leftover data: {data!r}')
-            if cls._assert_consuming_all_params:
-                raise ValueError(
-                    f'the dict should be consumed completely, but still has the following elements left: {list(data.keys())!r}'
-                )
-            # end if
-        # end if
-        return arguments
+        cls._check_keys(data)
+        return {
+            'hits': data['hits'],
+            'total': data['total'],
+        }
     # end def prepare_dict
 
     @classmethod
     def from_dict(cls: Type[SearchResult], data: Union[Dict, None, List[Dict]]) -> Union[SearchResult, None]:
         """
         Deserialize a new SearchResult from a given dictionary.
+        The given `data` is not modified. If `_keep_raw` is set, it is kept as `_raw`.
 
         :return: new SearchResult instance.
         :rtype: SearchResult|None
@@ -127,9 +224,14 @@ class SearchResult(DerpiModel, Generic[T]):
             return [cls.from_dict(item) for item in data]
         # end if
 
-        data: Dict = cls.prepare_dict(data)
-        instance: SearchResult = cls(**data)
-        instance._raw = data
+        cls._check_keys(data)
+        instance: SearchResult = cls(
+            hits=data['hits'],
+            total=data['total'],
+        )
+        if cls._keep_raw:
+            instance._raw = data
+        # end if
         return instance
     # end def from_dict
 
@@ -148,15 +250,75 @@ class SearchResult(DerpiModel, Generic[T]):
         return "{s.__class__.__name__}(hits={s.hits!r}, total={s.total!r})".format(s=self)
     # end def __repr__
 
-    def __eq__(self, other):
+    def fields_equal(self, other) -> bool:
         """
-        Implements equality check, i.e. `searchresult_instance_a == searchresult_instance_b`
+        Compares all the fields, i.e. if `searchresult_instance_a` and `searchresult_instance_b` hold the same data.
         """
-        if not (hasattr(other, 'hits') and hasattr(other, 'total')):
+        if not isinstance(other, SearchResult):
             return False
         # end if
         return self.hits == other.hits and self.total == other.total
+    # end def fields_equal
+
+    def __eq__(self, other):
+        """
+        Implements equality check, i.e. `searchresult_instance_a == searchresult_instance_b`, see `fields_equal(...)`.
+        """
+        return self.fields_equal(other)
     # end __eq__
+
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        Serializes this SearchResult to a json compatible dict, like the API returns it.
+        `SearchResult.from_dict(...)` builds an equal SearchResult from it.
+        """
+        return {
+            'hits': to_json_value(self.hits),
+            'total': self.total,
+        }
+    # end def to_dict
+
+    def __reduce__(self):
+        """
+        Implements pickling, storing just the values of the `__slots__`.
+        """
+        return self._from_state, ((self._raw, self.hits, self.total),)
+    # end def __reduce__
+
+    @classmethod
+    def _from_state(cls: Type[SearchResult], state: tuple) -> SearchResult:
+        """
+        Restores a pickled SearchResult, see `__reduce__`.
+        """
+        instance: SearchResult = cls.__new__(cls)
+        (
+            instance._raw,
+            instance.hits,
+            instance.total,
+        ) = state
+        return instance
+    # end def _from_state
+
+    def __iter__(self):
+        """
+        Implements `iter(searchresult_instance)`, iterating over the `hits`.
+        """
+        return iter(self.hits)
+    # end def __iter__
+
+    def __len__(self):
+        """
+        Implements `len(searchresult_instance)`, the amount of `hits` we got, not the `total`.
+        """
+        return len(self.hits)
+    # end def __len__
+
+    def __getitem__(self, index):
+        """
+        Implements `searchresult_instance[index]`, accessing the `hits`.
+        """
+        return self.hits[index]
+    # end def __getitem__
 # end class
 
 
@@ -279,6 +441,8 @@ class Image(DerpiModel):
     
     """
 
+    __slots__ = ('animated', 'aspect_ratio', 'comment_count', '_created_at', 'deletion_reason', 'description', 'downvotes', 'duplicate_of', 'duration', 'faves', '_first_seen_at', 'format', 'height', 'hidden_from_users', 'id', 'intensities', 'mime_type', 'name', 'orig_sha512_hash', 'processed', 'representations', 'score', 'sha512_hash', 'size', 'source_url', 'spoilered', 'tag_count', 'tag_ids', 'tags', 'thumbnails_generated', '_updated_at', 'uploader', 'uploader_id', 'upvotes', 'view_url', 'width', 'wilson_score')
+
     
     """ Whether the image is animated. """
     animated: bool
@@ -396,12 +560,12 @@ class Image(DerpiModel):
         animated: bool,
         aspect_ratio: float,
         comment_count: int,
-        created_at: datetime,
+        created_at: Union[datetime, str],
         description: str,
         downvotes: int,
         duration: float,
         faves: int,
-        first_seen_at: datetime,
+        first_seen_at: Union[datetime, str],
         format: str,
         height: int,
         hidden_from_users: bool,
@@ -420,7 +584,7 @@ class Image(DerpiModel):
         tag_ids: list,
         tags: list,
         thumbnails_generated: bool,
-        updated_at: datetime,
+        updated_at: Union[datetime, str],
         uploader: str,
         upvotes: int,
         view_url: str,
@@ -551,14 +715,14 @@ class Image(DerpiModel):
         self.animated = animated
         self.aspect_ratio = aspect_ratio
         self.comment_count = comment_count
-        self.created_at = created_at
+        self._created_at = created_at
         self.deletion_reason = deletion_reason
         self.description = description
         self.downvotes = downvotes
         self.duplicate_of = duplicate_of
         self.duration = duration
         self.faves = faves
-        self.first_seen_at = first_seen_at
+        self._first_seen_at = first_seen_at
         self.format = format
         self.height = height
         self.hidden_from_users = hidden_from_users
@@ -578,125 +742,130 @@ class Image(DerpiModel):
         self.tag_ids = tag_ids
         self.tags = tags
         self.thumbnails_generated = thumbnails_generated
-        self.updated_at = updated_at
+        self._updated_at = updated_at
         self.uploader = uploader
         self.uploader_id = uploader_id
         self.upvotes = upvotes
         self.view_url = view_url
         self.width = width
         self.wilson_score = wilson_score
+        self._raw = None
     # end def __init__
 
+    @property
+    def created_at(self) -> datetime:
+        """
+        The creation time, in UTC, of the image.
+        Parsed on first access.
+        """
+        value = self._created_at
+        if isinstance(value, str):
+            value = self._created_at = parse_datetime(value)
+        # end if
+        return value
+    # end def created_at
+
+    @created_at.setter
+    def created_at(self, value: Union[datetime, str]):
+        self._created_at = value
+    # end def created_at
+
+    @property
+    def first_seen_at(self) -> datetime:
+        """
+        The time, in UTC, the image was first seen (before any duplicate merging).
+        Parsed on first access.
+        """
+        value = self._first_seen_at
+        if isinstance(value, str):
+            value = self._first_seen_at = parse_datetime(value)
+        # end if
+        return value
+    # end def first_seen_at
+
+    @first_seen_at.setter
+    def first_seen_at(self, value: Union[datetime, str]):
+        self._first_seen_at = value
+    # end def first_seen_at
+
+    @property
+    def updated_at(self) -> datetime:
+        """
+        The time, in UTC, the image was last updated.
+        Parsed on first access.
+        """
+        value = self._updated_at
+        if isinstance(value, str):
+            value = self._updated_at = parse_datetime(value)
+        # end if
+        return value
+    # end def updated_at
+
+    @updated_at.setter
+    def updated_at(self, value: Union[datetime, str]):
+        self._updated_at = value
+    # end def updated_at
+
+    _compact_tags = False  # If set to true, `tags` are interned in `TAG_TABLE` and `tag_ids` stored as sorted `array('I')`.
+
+    _FIELDS = frozenset({'animated', 'aspect_ratio', 'comment_count', 'created_at', 'deletion_reason', 'description', 'downvotes', 'duplicate_of', 'duration', 'faves', 'first_seen_at', 'format', 'height', 'hidden_from_users', 'id', 'intensities', 'mime_type', 'name', 'orig_sha512_hash', 'processed', 'representations', 'score', 'sha512_hash', 'size', 'source_url', 'spoilered', 'tag_count', 'tag_ids', 'tags', 'thumbnails_generated', 'updated_at', 'uploader', 'uploader_id', 'upvotes', 'view_url', 'width', 'wilson_score'})  # all the keys we know.
+
     @classmethod
     def prepare_dict(cls: Type[Image], data: Union[Dict[str, JSONType]]) -> Dict[str, JSONType]:
         """
         Builds a new dict with valid values for the Image constructor.
+        The given `data` is not modified.
 
         :return: new dict with valid values
         :rtype: dict
         """
-        assert_type_or_raise(data, dict, parameter_name="data")
-
-        arguments = super().prepare_dict(data) 
-        arguments['animated'] = data['animated']
-        arguments['aspect_ratio'] = data['aspect_ratio']
-        arguments['comment_count'] = data['comment_count']
-        arguments['created_at'] = iso8601.parse_date(data['created_at'])
-        arguments['deletion_reason'] = data['deletion_reason'] if data.get('deletion_reason', None) is not None else None
-        arguments['description'] = data['description']
-        arguments['downvotes'] = data['downvotes']
-        arguments['duplicate_of'] = data['duplicate_of'] if data.get('duplicate_of', None) is not None else None
-        arguments['duration'] = data['duration']
-        arguments['faves'] = data['faves']
-        arguments['first_seen_at'] = iso8601.parse_date(data['first_seen_at'])
-        arguments['format'] = data['format']
-        arguments['height'] = data['height']
-        arguments['hidden_from_users'] = data['hidden_from_users']
-        arguments['id'] = data['id']
-        arguments['intensities'] = Intensities.from_dict(data['intensities']) if data.get('intensities', None) is not None else None
-        arguments['mime_type'] = data['mime_type']
-        arguments['name'] = data['name']
-        arguments['orig_sha512_hash'] = data['orig_sha512_hash']
-        arguments['processed'] = data['processed']
-        arguments['representations'] = Representations.from_dict(data['representations'])
-        arguments['score'] = data['score']
-        arguments['sha512_hash'] = data['sha512_hash']
-        arguments['size'] = data['size']
-        arguments['source_url'] = data['source_url']
-        arguments['spoilered'] = data['spoilered']
-        arguments['tag_count'] = data['tag_count']
-        arguments['tag_ids'] = data['tag_ids']
-        arguments['tags'] = data['tags']
-        arguments['thumbnails_generated'] = data['thumbnails_generated']
-        arguments['updated_at'] = iso8601.parse_date(data['updated_at'])
-        arguments['uploader'] = data['uploader']
-        arguments['uploader_id'] = data['uploader_id'] if data.get('uploader_id', None) is not None else None
-        arguments['upvotes'] = data['upvotes']
-        arguments['view_url'] = data['view_url']
-        arguments['width'] = data['width']
-        arguments['wilson_score'] = data['wilson_score']
-        
-        del data['animated']
-        del data['aspect_ratio']
-        del data['comment_count']
-        del data['created_at']
-        if 'deletion_reason' in data:
-            del data['deletion_reason']
-        # end if
-        del data['description']
-        del data['downvotes']
-        if 'duplicate_of' in data:
-            del data['duplicate_of']
-        # end if
-        del data['duration']
-        del data['faves']
-        del data['first_seen_at']
-        del data['format']
-        del data['height']
-        del data['hidden_from_users']
-        del data['id']
-        if 'intensities' in data:
-            del data['intensities']
-        # end if
-        del data['mime_type']
-        del data['name']
-        del data['orig_sha512_hash']
-        del data['processed']
-        del data['representations']
-        del data['score']
-        del data['sha512_hash']
-        del data['size']
-        del data['source_url']
-        del data['spoilered']
-        del data['tag_count']
-        del data['tag_ids']
-        del data['tags']
-        del data['thumbnails_generated']
-        del data['updated_at']
-        del data['uploader']
-        if 'uploader_id' in data:
-            del data['uploader_id']
-        # end if
-        del data['upvotes']
-        del data['view_url']
-        del data['width']
-        del data['wilson_score']
-
-        if data:
-            logger.warning(f'still got leftover data: {data!r}')
-            if cls._assert_consuming_all_params:
-                raise ValueError(
-                    f'the dict should be consumed completely, but still has the following elements left: {list(data.keys())!r}'
-                )
-            # end if
-        # end if
-        return arguments
+        cls._check_keys(data)
+        return {
+            'animated': data['animated'],
+            'aspect_ratio': data['aspect_ratio'],
+            'comment_count': data['comment_count'],
+            'created_at': data['created_at'],
+            'deletion_reason': data.get('deletion_reason'),
+            'description': data['description'],
+            'downvotes': data['downvotes'],
+            'duplicate_of': data.get('duplicate_of'),
+            'duration': data['duration'],
+            'faves': data['faves'],
+            'first_seen_at': data['first_seen_at'],
+            'format': data['format'],
+            'height': data['height'],
+            'hidden_from_users': data['hidden_from_users'],
+            'id': data['id'],
+            'intensities': Intensities.from_dict(data.get('intensities')),
+            'mime_type': data['mime_type'],
+            'name': data['name'],
+            'orig_sha512_hash': data['orig_sha512_hash'],
+            'processed': data['processed'],
+            'representations': Representations.from_dict(data['representations']),
+            'score': data['score'],
+            'sha512_hash': data['sha512_hash'],
+            'size': data['size'],
+            'source_url': data['source_url'],
+            'spoilered': data['spoilered'],
+            'tag_count': data['tag_count'],
+            'tag_ids': compact_tag_ids(data['tag_ids']) if cls._compact_tags else data['tag_ids'],
+            'tags': TAG_TABLE.intern(data['tags']) if cls._compact_tags else data['tags'],
+            'thumbnails_generated': data['thumbnails_generated'],
+            'updated_at': data['updated_at'],
+            'uploader': data['uploader'],
+            'uploader_id': data.get('uploader_id'),
+            'upvotes': data['upvotes'],
+            'view_url': data['view_url'],
+            'width': data['width'],
+            'wilson_score': data['wilson_score'],
+        }
     # end def prepare_dict
 
     @classmethod
     def from_dict(cls: Type[Image], data: Union[Dict, None, List[Dict]]) -> Union[Image, None]:
         """
         Deserialize a new Image from a given dictionary.
+        The given `data` is not modified. If `_keep_raw` is set, it is kept as `_raw`.
 
         :return: new Image instance.
         :rtype: Image|None
@@ -708,9 +877,49 @@ class Image(DerpiModel):
             return [cls.from_dict(item) for item in data]
         # end if
 
-        data: Dict = cls.prepare_dict(data)
-        instance: Image = cls(**data)
-        instance._raw = data
+        cls._check_keys(data)
+        instance: Image = cls(
+            animated=data['animated'],
+            aspect_ratio=data['aspect_ratio'],
+            comment_count=data['comment_count'],
+            created_at=data['created_at'],
+            deletion_reason=data.get('deletion_reason'),
+            description=data['description'],
+            downvotes=data['downvotes'],
+            duplicate_of=data.get('duplicate_of'),
+            duration=data['duration'],
+            faves=data['faves'],
+            first_seen_at=data['first_seen_at'],
+            format=data['format'],
+            height=data['height'],
+            hidden_from_users=data['hidden_from_users'],
+            id=data['id'],
+            intensities=Intensities.from_dict(data.get('intensities')),
+            mime_type=data['mime_type'],
+            name=data['name'],
+            orig_sha512_hash=data['orig_sha512_hash'],
+            processed=data['processed'],
+            representations=Representations.from_dict(data['representations']),
+            score=data['score'],
+            sha512_hash=data['sha512_hash'],
+            size=data['size'],
+            source_url=data['source_url'],
+            spoilered=data['spoilered'],
+            tag_count=data['tag_count'],
+            tag_ids=compact_tag_ids(data['tag_ids']) if cls._compact_tags else data['tag_ids'],
+            tags=TAG_TABLE.intern(data['tags']) if cls._compact_tags else data['tags'],
+            thumbnails_generated=data['thumbnails_generated'],
+            updated_at=data['updated_at'],
+            uploader=data['uploader'],
+            uploader_id=data.get('uploader_id'),
+            upvotes=data['upvotes'],
+            view_url=data['view_url'],
+            width=data['width'],
+            wilson_score=data['wilson_score'],
+        )
+        if cls._keep_raw:
+            instance._raw = data
+        # end if
         return instance
     # end def from_dict
 
@@ -729,15 +938,150 @@ class Image(DerpiModel):
         return "{s.__class__.__name__}(animated={s.animated!r}, aspect_ratio={s.aspect_ratio!r}, comment_count={s.comment_count!r}, created_at={s.created_at!r}, deletion_reason={s.deletion_reason!r}, description={s.description!r}, downvotes={s.downvotes!r}, duplicate_of={s.duplicate_of!r}, duration={s.duration!r}, faves={s.faves!r}, first_seen_at={s.first_seen_at!r}, format={s.format!r}, height={s.height!r}, hidden_from_users={s.hidden_from_users!r}, id={s.id!r}, intensities={s.intensities!r}, mime_type={s.mime_type!r}, name={s.name!r}, orig_sha512_hash={s.orig_sha512_hash!r}, processed={s.processed!r}, representations={s.representations!r}, score={s.score!r}, sha512_hash={s.sha512_hash!r}, size={s.size!r}, source_url={s.source_url!r}, spoilered={s.spoilered!r}, tag_count={s.tag_count!r}, tag_ids={s.tag_ids!r}, tags={s.tags!r}, thumbnails_generated={s.thumbnails_generated!r}, updated_at={s.updated_at!r}, uploader={s.uploader!r}, uploader_id={s.uploader_id!r}, upvotes={s.upvotes!r}, view_url={s.view_url!r}, width={s.width!r}, wilson_score={s.wilson_score!r})".format(s=self)
     # end def __repr__
 
-    def __eq__(self, other):
+    def fields_equal(self, other) -> bool:
         """
-        Implements equality check, i.e. `image_instance_a == image_instance_b`
+        Compares all the fields, i.e. if `image_instance_a` and `image_instance_b` hold the same data.
+        `image_instance_a == image_instance_b` only compares the `id`.
         """
-        if not (hasattr(other, 'animated') and hasattr(other, 'aspect_ratio') and hasattr(other, 'comment_count') and hasattr(other, 'created_at') and hasattr(other, 'deletion_reason') and hasattr(other, 'description') and hasattr(other, 'downvotes') and hasattr(other, 'duplicate_of') and hasattr(other, 'duration') and hasattr(other, 'faves') and hasattr(other, 'first_seen_at') and hasattr(other, 'format') and hasattr(other, 'height') and hasattr(other, 'hidden_from_users') and hasattr(other, 'id') and hasattr(other, 'intensities') and hasattr(other, 'mime_type') and hasattr(other, 'name') and hasattr(other, 'orig_sha512_hash') and hasattr(other, 'processed') and hasattr(other, 'representations') and hasattr(other, 'score') and hasattr(other, 'sha512_hash') and hasattr(other, 'size') and hasattr(other, 'source_url') and hasattr(other, 'spoilered') and hasattr(other, 'tag_count') and hasattr(other, 'tag_ids') and hasattr(other, 'tags') and hasattr(other, 'thumbnails_generated') and hasattr(other, 'updated_at') and hasattr(other, 'uploader') and hasattr(other, 'uploader_id') and hasattr(other, 'upvotes') and hasattr(other, 'view_url') and hasattr(other, 'width') and hasattr(other, 'wilson_score')):
+        if not isinstance(other, Image):
             return False
         # end if
-        return self.animated == other.animated and self.aspect_ratio == other.aspect_ratio and self.comment_count == other.comment_count and self.created_at == other.created_at and self.deletion_reason == other.deletion_reason and self.description == other.description and self.downvotes == other.downvotes and self.duplicate_of == other.duplicate_of and self.duration == other.duration and self.faves == other.faves and self.first_seen_at == other.first_seen_at and self.format == other.format and self.height == other.height and self.hidden_from_users == other.hidden_from_users and self.id == other.id and self.intensities == other.intensities and self.mime_type == other.mime_type and self.name == other.name and self.orig_sha512_hash == other.orig_sha512_hash and self.processed == other.processed and self.representations == other.representations and self.score == other.score and self.sha512_hash == other.sha512_hash and self.size == other.size and self.source_url == other.source_url and self.spoilered == other.spoilered and self.tag_count == other.tag_count and self.tag_ids == other.tag_ids and self.tags == other.tags and self.thumbnails_generated == other.thumbnails_generated and self.updated_at == other.updated_at and self.uploader == other.uploader and self.uploader_id == other.uploader_id and self.upvotes == other.upvotes and self.view_url == other.view_url and self.width == other.width and self.wilson_score == other.wilson_score
+        return self.animated == other.animated and self.aspect_ratio == other.aspect_ratio and self.comment_count == other.comment_count and (self._created_at == other._created_at or self.created_at == other.created_at) and self.deletion_reason == other.deletion_reason and self.description == other.description and self.downvotes == other.downvotes and self.duplicate_of == other.duplicate_of and self.duration == other.duration and self.faves == other.faves and (self._first_seen_at == other._first_seen_at or self.first_seen_at == other.first_seen_at) and self.format == other.format and self.height == other.height and self.hidden_from_users == other.hidden_from_users and self.id == other.id and self.intensities == other.intensities and self.mime_type == other.mime_type and self.name == other.name and self.orig_sha512_hash == other.orig_sha512_hash and self.processed == other.processed and self.representations == other.representations and self.score == other.score and self.sha512_hash == other.sha512_hash and self.size == other.size and self.source_url == other.source_url and self.spoilered == other.spoilered and self.tag_count == other.tag_count and self.tag_ids == other.tag_ids and self.tags == other.tags and self.thumbnails_generated == other.thumbnails_generated and (self._updated_at == other._updated_at or self.updated_at == other.updated_at) and self.uploader == other.uploader and self.uploader_id == other.uploader_id and self.upvotes == other.upvotes and self.view_url == other.view_url and self.width == other.width and self.wilson_score == other.wilson_score
+    # end def fields_equal
+
+    def __eq__(self, other):
+        """
+        Implements equality check, i.e. `image_instance_a == image_instance_b`.
+        Only compares the `id`, use `fields_equal(...)` to compare all the fields.
+        """
+        if not isinstance(other, Image):
+            return NotImplemented
+        # end if
+        return self.id == other.id
     # end __eq__
+
+    def __hash__(self):
+        """
+        Implements hashing by the `id`, for sets and dict keys, i.e. `{image_instance}`.
+        """
+        return hash((Image, self.id))
+    # end __hash__
+
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        Serializes this Image to a json compatible dict, like the API returns it.
+        `Image.from_dict(...)` builds an equal Image from it.
+        """
+        return {
+            'animated': self.animated,
+            'aspect_ratio': self.aspect_ratio,
+            'comment_count': self.comment_count,
+            'created_at': format_datetime(self._created_at),
+            'deletion_reason': self.deletion_reason,
+            'description': self.description,
+            'downvotes': self.downvotes,
+            'duplicate_of': self.duplicate_of,
+            'duration': self.duration,
+            'faves': self.faves,
+            'first_seen_at': format_datetime(self._first_seen_at),
+            'format': self.format,
+            'height': self.height,
+            'hidden_from_users': self.hidden_from_users,
+            'id': self.id,
+            'intensities': to_json_value(self.intensities),
+            'mime_type': self.mime_type,
+            'name': self.name,
+            'orig_sha512_hash': self.orig_sha512_hash,
+            'processed': self.processed,
+            'representations': to_json_value(self.representations),
+            'score': self.score,
+            'sha512_hash': self.sha512_hash,
+            'size': self.size,
+            'source_url': self.source_url,
+            'spoilered': self.spoilered,
+            'tag_count': self.tag_count,
+            'tag_ids': to_json_value(self.tag_ids),
+            'tags': to_json_value(self.tags),
+            'thumbnails_generated': self.thumbnails_generated,
+            'updated_at': format_datetime(self._updated_at),
+            'uploader': self.uploader,
+            'uploader_id': self.uploader_id,
+            'upvotes': self.upvotes,
+            'view_url': self.view_url,
+            'width': self.width,
+            'wilson_score': self.wilson_score,
+        }
+    # end def to_dict
+
+    def __reduce__(self):
+        """
+        Implements pickling, storing just the values of the `__slots__`.
+        """
+        return self._from_state, ((self._raw, self.animated, self.aspect_ratio, self.comment_count, self._created_at, self.deletion_reason, self.description, self.downvotes, self.duplicate_of, self.duration, self.faves, self._first_seen_at, self.format, self.height, self.hidden_from_users, self.id, self.intensities, self.mime_type, self.name, self.orig_sha512_hash, self.processed, self.representations, self.score, self.sha512_hash, self.size, self.source_url, self.spoilered, self.tag_count, self.tag_ids, self.tags, self.thumbnails_generated, self._updated_at, self.uploader, self.uploader_id, self.upvotes, self.view_url, self.width, self.wilson_score),)
+    # end def __reduce__
+
+    @classmethod
+    def _from_state(cls: Type[Image], state: tuple) -> Image:
+        """
+        Restores a pickled Image, see `__reduce__`.
+        """
+        instance: Image = cls.__new__(cls)
+        (
+            instance._raw,
+            instance.animated,
+            instance.aspect_ratio,
+            instance.comment_count,
+            instance._created_at,
+            instance.deletion_reason,
+            instance.description,
+            instance.downvotes,
+            instance.duplicate_of,
+            instance.duration,
+            instance.faves,
+            instance._first_seen_at,
+            instance.format,
+            instance.height,
+            instance.hidden_from_users,
+            instance.id,
+            instance.intensities,
+            instance.mime_type,
+            instance.name,
+            instance.orig_sha512_hash,
+            instance.processed,
+            instance.representations,
+            instance.score,
+            instance.sha512_hash,
+            instance.size,
+            instance.source_url,
+            instance.spoilered,
+            instance.tag_count,
+            instance.tag_ids,
+            instance.tags,
+            instance.thumbnails_generated,
+            instance._updated_at,
+            instance.uploader,
+            instance.uploader_id,
+            instance.upvotes,
+            instance.view_url,
+            instance.width,
+            instance.wilson_score,
+        ) = state
+        return instance
+    # end def _from_state
+
+    def has_tag(self, tag: Union[str, int]) -> bool:
+        """
+        If this image has the given tag, by name (`'safe'`) or id (`40482`).
+        """
+        return has_tag(self.tags, self.tag_ids, tag)
+    # end def has_tag
+
+    def intersects(self, tags: Iterable[Union[str, int]]) -> bool:
+        """
+        If this image has any of the given tags, by name and/or id. Best give a `set`, when checking a lot of images.
+        """
+        return intersects(self.tags, self.tag_ids, tags)
+    # end def intersects
 # end class
 
 
@@ -779,6 +1123,8 @@ class Representations(DerpiModel):
     
     """
 
+    __slots__ = ('_prefix', '_extension', '_urls')  # the urls are derived from the prefix and extension, see `derive_url`.
+
     
     """ The url to the image in original resolution. """
     full: str
@@ -859,70 +1205,203 @@ class Representations(DerpiModel):
         :type  webm: str|None
         
         """
-        self.full = full
-        self.large = large
-        self.medium = medium
-        self.small = small
-        self.tall = tall
-        self.thumb = thumb
-        self.thumb_small = thumb_small
-        self.thumb_tiny = thumb_tiny
-        self.mp4 = mp4
-        self.webm = webm
+        self._prefix, self._extension, self._urls = split_representations({
+            'full': full,
+            'large': large,
+            'medium': medium,
+            'small': small,
+            'tall': tall,
+            'thumb': thumb,
+            'thumb_small': thumb_small,
+            'thumb_tiny': thumb_tiny,
+            'mp4': mp4,
+            'webm': webm,
+        }, optional=('mp4', 'webm'))
+        self._raw = None
     # end def __init__
 
+    def _url(self, name: str) -> Union[str, None]:
+        """
+        Returns the url of the representation `name`, stored as is or derived from the prefix and extension.
+        """
+        urls = self._urls
+        if urls is not None and name in urls:
+            return urls[name]
+        # end if
+        return derive_url(self._prefix, name, self._extension)
+    # end def _url
+
+    def _set_url(self, name: str, url: Union[str, None]):
+        """
+        Stores the url of the representation `name` as is.
+        """
+        if self._urls is None:
+            self._urls = {}
+        # end if
+        self._urls[name] = url
+    # end def _set_url
+
+    @property
+    def full(self) -> str:
+        """
+        The url to the image in original resolution.
+        """
+        return self._url('full')
+    # end def full
+
+    @full.setter
+    def full(self, value: str):
+        self._set_url('full', value)
+    # end def full
+
+    @property
+    def large(self) -> str:
+        """
+        The url to the image in large resolution.
+        """
+        return self._url('large')
+    # end def large
+
+    @large.setter
+    def large(self, value: str):
+        self._set_url('large', value)
+    # end def large
+
+    @property
+    def medium(self) -> str:
+        """
+        The url to the image in medium resolution.
+        """
+        return self._url('medium')
+    # end def medium
+
+    @medium.setter
+    def medium(self, value: str):
+        self._set_url('medium', value)
+    # end def medium
+
+    @property
+    def small(self) -> str:
+        """
+        The url to the image in small resolution.
+        """
+        return self._url('small')
+    # end def small
+
+    @small.setter
+    def small(self, value: str):
+        self._set_url('small', value)
+    # end def small
+
+    @property
+    def tall(self) -> str:
+        """
+        The url to the image in tall resolution.
+        """
+        return self._url('tall')
+    # end def tall
+
+    @tall.setter
+    def tall(self, value: str):
+        self._set_url('tall', value)
+    # end def tall
+
+    @property
+    def thumb(self) -> str:
+        """
+        The url to the image thumbnail in normal resolution.
+        """
+        return self._url('thumb')
+    # end def thumb
+
+    @thumb.setter
+    def thumb(self, value: str):
+        self._set_url('thumb', value)
+    # end def thumb
+
+    @property
+    def thumb_small(self) -> str:
+        """
+        The url to the image thumbnail in small resolution.
+        """
+        return self._url('thumb_small')
+    # end def thumb_small
+
+    @thumb_small.setter
+    def thumb_small(self, value: str):
+        self._set_url('thumb_small', value)
+    # end def thumb_small
+
+    @property
+    def thumb_tiny(self) -> str:
+        """
+        The url to the image thumbnail in tiny resolution.
+        """
+        return self._url('thumb_tiny')
+    # end def thumb_tiny
+
+    @thumb_tiny.setter
+    def thumb_tiny(self, value: str):
+        self._set_url('thumb_tiny', value)
+    # end def thumb_tiny
+
+    @property
+    def mp4(self) -> Union[str, None]:
+        """
+        Optional. The url to the animated image as mp4 format.
+        """
+        return (self._urls or {}).get('mp4')
+    # end def mp4
+
+    @mp4.setter
+    def mp4(self, value: Union[str, None]):
+        self._set_url('mp4', value)
+    # end def mp4
+
+    @property
+    def webm(self) -> Union[str, None]:
+        """
+        Optional. The url to the animated image as webm format.
+        """
+        return (self._urls or {}).get('webm')
+    # end def webm
+
+    @webm.setter
+    def webm(self, value: Union[str, None]):
+        self._set_url('webm', value)
+    # end def webm
+
+    _FIELDS = frozenset({'full', 'large', 'medium', 'small', 'tall', 'thumb', 'thumb_small', 'thumb_tiny', 'mp4', 'webm'})  # all the keys we know.
+
     @classmethod
     def prepare_dict(cls: Type[Representations], data: Union[Dict[str, JSONType]]) -> Dict[str, JSONType]:
         """
         Builds a new dict with valid values for the Representations constructor.
+        The given `data` is not modified.
 
         :return: new dict with valid values
         :rtype: dict
         """
-        assert_type_or_raise(data, dict, parameter_name="data")
-
-        arguments = super().prepare_dict(data) 
-        arguments['full'] = data['full']
-        arguments['large'] = data['large']
-        arguments['medium'] = data['medium']
-        arguments['small'] = data['small']
-        arguments['tall'] = data['tall']
-        arguments['thumb'] = data['thumb']
-        arguments['thumb_small'] = data['thumb_small']
-        arguments['thumb_tiny'] = data['thumb_tiny']
-        arguments['mp4'] = data['mp4'] if data.get('mp4', None) is not None else None
-        arguments['webm'] = data['webm'] if data.get('webm', None) is not None else None
-        
-        del data['full']
-        del data['large']
-        del data['medium']
-        del data['small']
-        del data['tall']
-        del data['thumb']
-        del data['thumb_small']
-        del data['thumb_tiny']
-        if 'mp4' in data:
-            del data['mp4']
-        # end if
-        if 'webm' in data:
-            del data['webm']
-        # end if
-
-        if data:
-            logger.warning(f'still got leftover data: {data!r}')
-            if cls._assert_consuming_all_params:
-                raise ValueError(
-                    f'the dict should be consumed completely, but still has the following elements left: {list(data.keys())!r}'
-                )
-            # end if
-        # end if
-        return arguments
+        cls._check_keys(data)
+        return {
+            'full': data['full'],
+            'large': data['large'],
+            'medium': data['medium'],
+            'small': data['small'],
+            'tall': data['tall'],
+            'thumb': data['thumb'],
+            'thumb_small': data['thumb_small'],
+            'thumb_tiny': data['thumb_tiny'],
+            'mp4': data.get('mp4'),
+            'webm': data.get('webm'),
+        }
     # end def prepare_dict
 
     @classmethod
     def from_dict(cls: Type[Representations], data: Union[Dict, None, List[Dict]]) -> Union[Representations, None]:
         """
         Deserialize a new Representations from a given dictionary.
+        The given `data` is not modified. If `_keep_raw` is set, it is kept as `_raw`.
 
         :return: new Representations instance.
         :rtype: Representations|None
@@ -934,9 +1413,22 @@ class Representations(DerpiModel):
             return [cls.from_dict(item) for item in data]
         # end if
 
-        data: Dict = cls.prepare_dict(data)
-        instance: Representations = cls(**data)
-        instance._raw = data
+        cls._check_keys(data)
+        instance: Representations = cls(
+            full=data['full'],
+            large=data['large'],
+            medium=data['medium'],
+            small=data['small'],
+            tall=data['tall'],
+            thumb=data['thumb'],
+            thumb_small=data['thumb_small'],
+            thumb_tiny=data['thumb_tiny'],
+            mp4=data.get('mp4'),
+            webm=data.get('webm'),
+        )
+        if cls._keep_raw:
+            instance._raw = data
+        # end if
         return instance
     # end def from_dict
 
@@ -955,15 +1447,67 @@ class Representations(DerpiModel):
         return "{s.__class__.__name__}(full={s.full!r}, large={s.large!r}, medium={s.medium!r}, small={s.small!r}, tall={s.tall!r}, thumb={s.thumb!r}, thumb_small={s.thumb_small!r}, thumb_tiny={s.thumb_tiny!r}, mp4={s.mp4!r}, webm={s.webm!r})".format(s=self)
     # end def __repr__
 
-    def __eq__(self, other):
+    def fields_equal(self, other) -> bool:
         """
-        Implements equality check, i.e. `representations_instance_a == representations_instance_b`
+        Compares all the fields, i.e. if `representations_instance_a` and `representations_instance_b` hold the same data.
         """
-        if not (hasattr(other, 'full') and hasattr(other, 'large') and hasattr(other, 'medium') and hasattr(other, 'small') and hasattr(other, 'tall') and hasattr(other, 'thumb') and hasattr(other, 'thumb_small') and hasattr(other, 'thumb_tiny') and hasattr(other, 'mp4') and hasattr(other, 'webm')):
+        if not isinstance(other, Representations):
             return False
         # end if
         return self.full == other.full and self.large == other.large and self.medium == other.medium and self.small == other.small and self.tall == other.tall and self.thumb == other.thumb and self.thumb_small == other.thumb_small and self.thumb_tiny == other.thumb_tiny and self.mp4 == other.mp4 and self.webm == other.webm
+    # end def fields_equal
+
+    def __eq__(self, other):
+        """
+        Implements equality check, i.e. `representations_instance_a == representations_instance_b`, see `fields_equal(...)`.
+        """
+        return self.fields_equal(other)
     # end __eq__
+
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        Serializes this Representations to a json compatible dict, like the API returns it.
+        `Representations.from_dict(...)` builds an equal Representations from it.
+        """
+        data = {
+            'full': self.full,
+            'large': self.large,
+            'medium': self.medium,
+            'small': self.small,
+            'tall': self.tall,
+            'thumb': self.thumb,
+            'thumb_small': self.thumb_small,
+            'thumb_tiny': self.thumb_tiny,
+        }
+        for name, url in (('mp4', self.mp4), ('webm', self.webm)):
+            if url is not None:  # like the API, only present for videos.
+                data[name] = url
+            # end if
+        # end for
+        return data
+    # end def to_dict
+
+    def __reduce__(self):
+        """
+        Implements pickling, storing just the values of the `__slots__`.
+        """
+        return self._from_state, ((self._raw, self._prefix, self._extension, self._urls),)
+    # end def __reduce__
+
+    @classmethod
+    def _from_state(cls: Type[Representations], state: tuple) -> Representations:
+        """
+        Restores a pickled Representations, see `__reduce__`.
+        """
+        instance: Representations = cls.__new__(cls)
+        (
+            instance._raw,
+            instance._prefix,
+            instance._extension,
+            instance._urls,
+        ) = state
+        return instance
+    # end def _from_state
 # end class
 
 
@@ -987,6 +1531,8 @@ class Intensities(DerpiModel):
     
     """
 
+    __slots__ = ('ne', 'nw', 'se', 'sw')
+
     
     """ Northeast intensity. Whatever that means… """
     ne: float
@@ -1029,44 +1575,34 @@ class Intensities(DerpiModel):
         self.nw = nw
         self.se = se
         self.sw = sw
+        self._raw = None
     # end def __init__
 
+    _FIELDS = frozenset({'ne', 'nw', 'se', 'sw'})  # all the keys we know.
+
     @classmethod
     def prepare_dict(cls: Type[Intensities], data: Union[Dict[str, JSONType]]) -> Dict[str, JSONType]:
         """
         Builds a new dict with valid values for the Intensities constructor.
+        The given `data` is not modified.
 
         :return: new dict with valid values
         :rtype: dict
         """
-        assert_type_or_raise(data, dict, parameter_name="data")
-
-        arguments = super().prepare_dict(data) 
-        arguments['ne'] = data['ne']
-        arguments['nw'] = data['nw']
-        arguments['se'] = data['se']
-        arguments['sw'] = data['sw']
-        
-        del data['ne']
-        del data['nw']
-        del data['se']
-        del data['sw']
-
-        if data:
-            logger.warning(f'still got leftover data: {data!r}')
-            if cls._assert_consuming_all_params:
-                raise ValueError(
-                    f'the dict should be consumed completely, but still has the following elements left: {list(data.keys())!r}'
-                )
-            # end if
-        # end if
-        return arguments
+        cls._check_keys(data)
+        return {
+            'ne': data['ne'],
+            'nw': data['nw'],
+            'se': data['se'],
+            'sw': data['sw'],
+        }
     # end def prepare_dict
 
     @classmethod
     def from_dict(cls: Type[Intensities], data: Union[Dict, None, List[Dict]]) -> Union[Intensities, None]:
         """
         Deserialize a new Intensities from a given dictionary.
+        The given `data` is not modified. If `_keep_raw` is set, it is kept as `_raw`.
 
         :return: new Intensities instance.
         :rtype: Intensities|None
@@ -1078,9 +1614,16 @@ class Intensities(DerpiModel):
             return [cls.from_dict(item) for item in data]
         # end if
 
-        data: Dict = cls.prepare_dict(data)
-        instance: Intensities = cls(**data)
-        instance._raw = data
+        cls._check_keys(data)
+        instance: Intensities = cls(
+            ne=data['ne'],
+            nw=data['nw'],
+            se=data['se'],
+            sw=data['sw'],
+        )
+        if cls._keep_raw:
+            instance._raw = data
+        # end if
         return instance
     # end def from_dict
 
@@ -1099,15 +1642,58 @@ class Intensities(DerpiModel):
         return "{s.__class__.__name__}(ne={s.ne!r}, nw={s.nw!r}, se={s.se!r}, sw={s.sw!r})".format(s=self)
     # end def __repr__
 
-    def __eq__(self, other):
+    def fields_equal(self, other) -> bool:
         """
-        Implements equality check, i.e. `intensities_instance_a == intensities_instance_b`
+        Compares all the fields, i.e. if `intensities_instance_a` and `intensities_instance_b` hold the same data.
         """
-        if not (hasattr(other, 'ne') and hasattr(other, 'nw') and hasattr(other, 'se') and hasattr(other, 'sw')):
+        if not isinstance(other, Intensities):
             return False
         # end if
         return self.ne == other.ne and self.nw == other.nw and self.se == other.se and self.sw == other.sw
+    # end def fields_equal
+
+    def __eq__(self, other):
+        """
+        Implements equality check, i.e. `intensities_instance_a == intensities_instance_b`, see `fields_equal(...)`.
+        """
+        return self.fields_equal(other)
     # end __eq__
+
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        Serializes this Intensities to a json compatible dict, like the API returns it.
+        `Intensities.from_dict(...)` builds an equal Intensities from it.
+        """
+        return {
+            'ne': self.ne,
+            'nw': self.nw,
+            'se': self.se,
+            'sw': self.sw,
+        }
+    # end def to_dict
+
+    def __reduce__(self):
+        """
+        Implements pickling, storing just the values of the `__slots__`.
+        """
+        return self._from_state, ((self._raw, self.ne, self.nw, self.se, self.sw),)
+    # end def __reduce__
+
+    @classmethod
+    def _from_state(cls: Type[Intensities], state: tuple) -> Intensities:
+        """
+        Restores a pickled Intensities, see `__reduce__`.
+        """
+        instance: Intensities = cls.__new__(cls)
+        (
+            instance._raw,
+            instance.ne,
+            instance.nw,
+            instance.se,
+            instance.sw,
+        ) = state
+        return instance
+    # end def _from_state
 # end class
 
 
@@ -1149,6 +1735,8 @@ class Comment(DerpiModel):
     
     """
 
+    __slots__ = ('author', 'avatar', 'body', '_created_at', 'edit_reason', '_edited_at', 'id', 'image_id', '_updated_at', 'user_id')
+
     
     """ The comment's author. """
     author: str
@@ -1185,13 +1773,13 @@ class Comment(DerpiModel):
         author: str,
         avatar: str,
         body: str,
-        created_at: datetime,
+        created_at: Union[datetime, str],
         id: int,
         image_id: int,
-        updated_at: datetime,
+        updated_at: Union[datetime, str],
         user_id: int,
         edit_reason: Union[str, None] = None,
-        edited_at: Union[datetime, None] = None,
+        edited_at: Union[datetime, str, None] = None,
     ):
         """
         A parsed Comment response of the Derpibooru API.
@@ -1232,67 +1820,101 @@ class Comment(DerpiModel):
         self.author = author
         self.avatar = avatar
         self.body = body
-        self.created_at = created_at
+        self._created_at = created_at
         self.edit_reason = edit_reason
-        self.edited_at = edited_at
+        self._edited_at = edited_at
         self.id = id
         self.image_id = image_id
-        self.updated_at = updated_at
+        self._updated_at = updated_at
         self.user_id = user_id
+        self._raw = None
     # end def __init__
 
+    @property
+    def created_at(self) -> datetime:
+        """
+        The creation time, in UTC, of the comment.
+        Parsed on first access.
+        """
+        value = self._created_at
+        if isinstance(value, str):
+            value = self._created_at = parse_datetime(value)
+        # end if
+        return value
+    # end def created_at
+
+    @created_at.setter
+    def created_at(self, value: Union[datetime, str]):
+        self._created_at = value
+    # end def created_at
+
+    @property
+    def edited_at(self) -> Union[datetime, None]:
+        """
+        The time, in UTC, this comment was last edited at, or `null` if it was not edited.
+        Parsed on first access.
+        """
+        value = self._edited_at
+        if isinstance(value, str):
+            value = self._edited_at = parse_datetime(value)
+        # end if
+        return value
+    # end def edited_at
+
+    @edited_at.setter
+    def edited_at(self, value: Union[datetime, str, None]):
+        self._edited_at = value
+    # end def edited_at
+
+    @property
+    def updated_at(self) -> datetime:
+        """
+        The time, in UTC, the comment was last updated at.
+        Parsed on first access.
+        """
+        value = self._updated_at
+        if isinstance(value, str):
+            value = self._updated_at = parse_datetime(value)
+        # end if
+        return value
+    # end def updated_at
+
+    @updated_at.setter
+    def updated_at(self, value: Union[datetime, str]):
+        self._updated_at = value
+    # end def updated_at
+
+    _FIELDS = frozenset({'author', 'avatar', 'body', 'created_at', 'edit_reason', 'edited_at', 'id', 'image_id', 'updated_at', 'user_id'})  # all the keys we know.
+
     @classmethod
     def prepare_dict(cls: Type[Comment], data: Union[Dict[str, JSONType]]) -> Dict[str, JSONType]:
         """
         Builds a new dict with valid values for the Comment constructor.
+        The given `data` is not modified.
 
         :return: new dict with valid values
         :rtype: dict
         """
-        assert_type_or_raise(data, dict, parameter_name="data")
-
-        arguments = super().prepare_dict(data) 
-        arguments['author'] = data['author']
-        arguments['avatar'] = data['avatar']
-        arguments['body'] = data['body']
-        arguments['created_at'] = iso8601.parse_date(data['created_at'])
-        arguments['edit_reason'] = data['edit_reason'] if data.get('edit_reason', None) is not None else None
-        arguments['edited_at'] = iso8601.parse_date(data['edited_at']) if data.get('edited_at', None) is not None else None
-        arguments['id'] = data['id']
-        arguments['image_id'] = data['image_id']
-        arguments['updated_at'] = iso8601.parse_date(data['updated_at'])
-        arguments['user_id'] = data['user_id']
-        
-        del data['author']
-        del data['avatar']
-        del data['body']
-        del data['created_at']
-        if 'edit_reason' in data:
-            del data['edit_reason']
-        # end if
-        if 'edited_at' in data:
-            del data['edited_at']
-        # end if
-        del data['id']
-        del data['image_id']
-        del data['updated_at']
-        del data['user_id']
-
-        if data:
-            logger.warning(f'still got leftover data: {data!r}')
-            if cls._assert_consuming_all_params:
-                raise ValueError(
-                    f'the dict should be consumed completely, but still has the following elements left: {list(data.keys())!r}'
-                )
-            # end if
-        # end if
-        return arguments
+        cls._check_keys(data)
+        return {
+            'author': data['author'],
+            'avatar': data['avatar'],
+            'body': data['body'],
+            'created_at': data['created_at'],
+            'edit_reason': data.get('edit_reason'),
+            'edited_at': data.get('edited_at'),
+            'id': data['id'],
+            'image_id': data['image_id'],
+            'updated_at': data['updated_at'],
+            'user_id': data['user_id'],
+        }
     # end def prepare_dict
 
     @classmethod
     def from_dict(cls: Type[Comment], data: Union[Dict, None, List[Dict]]) -> Union[Comment, None]:
         """
         Deserialize a new Comment from a given dictionary.
+        The given `data` is not modified. If `_keep_raw` is set, it is kept as `_raw`.
 
         :return: new Comment instance.
         :rtype: Comment|None
@@ -1304,9 +1926,22 @@ class Comment(DerpiModel):
             return [cls.from_dict(item) for item in data]
         # end if
 
-        data: Dict = cls.prepare_dict(data)
-        instance: Comment = cls(**data)
-        instance._raw = data
+        cls._check_keys(data)
+        instance: Comment = cls(
+            author=data['author'],
+            avatar=data['avatar'],
+            body=data['body'],
+            created_at=data['created_at'],
+            edit_reason=data.get('edit_reason'),
+            edited_at=data.get('edited_at'),
+            id=data['id'],
+            image_id=data['image_id'],
+            updated_at=data['updated_at'],
+            user_id=data['user_id'],
+        )
+        if cls._keep_raw:
+            instance._raw = data
+        # end if
         return instance
     # end def from_dict
 
@@ -1325,15 +1960,82 @@ class Comment(DerpiModel):
         return "{s.__class__.__name__}(author={s.author!r}, avatar={s.avatar!r}, body={s.body!r}, created_at={s.created_at!r}, edit_reason={s.edit_reason!r}, edited_at={s.edited_at!r}, id={s.id!r}, image_id={s.image_id!r}, updated_at={s.updated_at!r}, user_id={s.user_id!r})".format(s=self)
     # end def __repr__
 
-    def __eq__(self, other):
+    def fields_equal(self, other) -> bool:
         """
-        Implements equality check, i.e. `comment_instance_a == comment_instance_b`
+        Compares all the fields, i.e. if `comment_instance_a` and `comment_instance_b` hold the same data.
+        `comment_instance_a == comment_instance_b` only compares the `id`.
         """
-        if not (hasattr(other, 'author') and hasattr(other, 'avatar') and hasattr(other, 'body') and hasattr(other, 'created_at') and hasattr(other, 'edit_reason') and hasattr(other, 'edited_at') and hasattr(other, 'id') and hasattr(other, 'image_id') and hasattr(other, 'updated_at') and hasattr(other, 'user_id')):
+        if not isinstance(other, Comment):
             return False
         # end if
-        return self.author == other.author and self.avatar == other.avatar and self.body == other.body and self.created_at == other.created_at and self.edit_reason == other.edit_reason and self.edited_at == other.edited_at and self.id == other.id and self.image_id == other.image_id and self.updated_at == other.updated_at and self.user_id == other.user_id
+        return self.author == other.author and self.avatar == other.avatar and self.body == other.body and (self._created_at == other._created_at or self.created_at == other.created_at) and self.edit_reason == other.edit_reason and (self._edited_at == other._edited_at or self.edited_at == other.edited_at) and self.id == other.id and self.image_id == other.image_id and (self._updated_at == other._updated_at or self.updated_at == other.updated_at) and self.user_id == other.user_id
+    # end def fields_equal
+
+    def __eq__(self, other):
+        """
+        Implements equality check, i.e. `comment_instance_a == comment_instance_b`.
+        Only compares the `id`, use `fields_equal(...)` to compare all the fields.
+        """
+        if not isinstance(other, Comment):
+            return NotImplemented
+        # end if
+        return self.id == other.id
     # end __eq__
+
+    def __hash__(self):
+        """
+        Implements hashing by the `id`, for sets and dict keys, i.e. `{comment_instance}`.
+        """
+        return hash((Comment, self.id))
+    # end __hash__
+
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        Serializes this Comment to a json compatible dict, like the API returns it.
+        `Comment.from_dict(...)` builds an equal Comment from it.
+        """
+        return {
+            'author': self.author,
+            'avatar': self.avatar,
+            'body': self.body,
+            'created_at': format_datetime(self._created_at),
+            'edit_reason': self.edit_reason,
+            'edited_at': format_datetime(self._edited_at),
+            'id': self.id,
+            'image_id': self.image_id,
+            'updated_at': format_datetime(self._updated_at),
+            'user_id': self.user_id,
+        }
+    # end def to_dict
+
+    def __reduce__(self):
+        """
+        Implements pickling, storing just the values of the `__slots__`.
+        """
+        return self._from_state, ((self._raw, self.author, self.avatar, self.body, self._created_at, self.edit_reason, self._edited_at, self.id, self.image_id, self._updated_at, self.user_id),)
+    # end def __reduce__
+
+    @classmethod
+    def _from_state(cls: Type[Comment], state: tuple) -> Comment:
+        """
+        Restores a pickled Comment, see `__reduce__`.
+        """
+        instance: Comment = cls.__new__(cls)
+        (
+            instance._raw,
+            instance.author,
+            instance.avatar,
+            instance.body,
+            instance._created_at,
+            instance.edit_reason,
+            instance._edited_at,
+            instance.id,
+            instance.image_id,
+            instance._updated_at,
+            instance.user_id,
+        ) = state
+        return instance
+    # end def _from_state
 # end class
 
 
@@ -1360,6 +2062,8 @@ class Forum(DerpiModel):
     
     """
 
+    __slots__ = ('name', 'short_name', 'description', 'topic_count', 'post_count')
+
     
     """ The forum's name. """
     name: str
@@ -1410,46 +2114,35 @@ class Forum(DerpiModel):
         self.description = description
         self.topic_count = topic_count
         self.post_count = post_count
+        self._raw = None
     # end def __init__
 
+    _FIELDS = frozenset({'name', 'short_name', 'description', 'topic_count', 'post_count'})  # all the keys we know.
+
     @classmethod
     def prepare_dict(cls: Type[Forum], data: Union[Dict[str, JSONType]]) -> Dict[str, JSONType]:
         """
         Builds a new dict with valid values for the Forum constructor.
+        The given `data` is not modified.
 
         :return: new dict with valid values
         :rtype: dict
         """
-        assert_type_or_raise(data, dict, parameter_name="data")
-
-        arguments = super().prepare_dict(data) 
-        arguments['name'] = data['name']
-        arguments['short_name'] = data['short_name']
-        arguments['description'] = data['description']
-        arguments['topic_count'] = data['topic_count']
-        arguments['post_count'] = data['post_count']
-        
-        del data['name']
-        del data['short_name']
-        del data['description']
-        del data['topic_count']
-        del data['post_count']
-
-        if data:
-            logger.warning(f'still got leftover data: {data!r}')
-            if cls._assert_consuming_all_params:
-                raise ValueError(
-                    f'the dict should be consumed completely, but still has the following elements left: {list(data.keys())!r}'
-                )
-            # end if
-        # end if
-        return arguments
+        cls._check_keys(data)
+        return {
+            'name': data['name'],
+            'short_name': data['short_name'],
+            'description': data['description'],
+            'topic_count': data['topic_count'],
+            'post_count': data['post_count'],
+        }
     # end def prepare_dict
 
     @classmethod
     def from_dict(cls: Type[Forum], data: Union[Dict, None, List[Dict]]) -> Union[Forum, None]:
         """
         Deserialize a new Forum from a given dictionary.
+        The given `data` is not modified. If `_keep_raw` is set, it is kept as `_raw`.
 
         :return: new Forum instance.
         :rtype: Forum|None
@@ -1461,9 +2154,17 @@ class Forum(DerpiModel):
             return [cls.from_dict(item) for item in data]
         # end if
 
-        data: Dict = cls.prepare_dict(data)
-        instance: Forum = cls(**data)
-        instance._raw = data
+        cls._check_keys(data)
+        instance: Forum = cls(
+            name=data['name'],
+            short_name=data['short_name'],
+            description=data['description'],
+            topic_count=data['topic_count'],
+            post_count=data['post_count'],
+        )
+        if cls._keep_raw:
+            instance._raw = data
+        # end if
         return instance
     # end def from_dict
 
@@ -1482,15 +2183,60 @@ class Forum(DerpiModel):
         return "{s.__class__.__name__}(name={s.name!r}, short_name={s.short_name!r}, description={s.description!r}, topic_count={s.topic_count!r}, post_count={s.post_count!r})".format(s=self)
     # end def __repr__
 
-    def __eq__(self, other):
+    def fields_equal(self, other) -> bool:
         """
-        Implements equality check, i.e. `forum_instance_a == forum_instance_b`
+        Compares all the fields, i.e. if `forum_instance_a` and `forum_instance_b` hold the same data.
         """
-        if not (hasattr(other, 'name') and hasattr(other, 'short_name') and hasattr(other, 'description') and hasattr(other, 'topic_count') and hasattr(other, 'post_count')):
+        if not isinstance(other, Forum):
             return False
         # end if
         return self.name == other.name and self.short_name == other.short_name and self.description == other.description and self.topic_count == other.topic_count and self.post_count == other.post_count
+    # end def fields_equal
+
+    def __eq__(self, other):
+        """
+        Implements equality check, i.e. `forum_instance_a == forum_instance_b`, see `fields_equal(...)`.
+        """
+        return self.fields_equal(other)
     # end __eq__
+
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        Serializes this Forum to a json compatible dict, like the API returns it.
+        `Forum.from_dict(...)` builds an equal Forum from it.
+        """
+        return {
+            'name': self.name,
+            'short_name': self.short_name,
+            'description': self.description,
+            'topic_count': self.topic_count,
+            'post_count': self.post_count,
+        }
+    # end def to_dict
+
+    def __reduce__(self):
+        """
+        Implements pickling, storing just the values of the `__slots__`.
+        """
+        return self._from_state, ((self._raw, self.name, self.short_name, self.description, self.topic_count, self.post_count),)
+    # end def __reduce__
+
+    @classmethod
+    def _from_state(cls: Type[Forum], state: tuple) -> Forum:
+        """
+        Restores a pickled Forum, see `__reduce__`.
+        """
+        instance: Forum = cls.__new__(cls)
+        (
+            instance._raw,
+            instance.name,
+            instance.short_name,
+            instance.description,
+            instance.topic_count,
+            instance.post_count,
+        ) = state
+        return instance
+    # end def _from_state
 # end class
 
 
@@ -1529,6 +2275,8 @@ class Topic(DerpiModel):
     
     """
 
+    __slots__ = ('slug', 'title', 'post_count', 'view_count', 'sticky', '_last_replied_to_at', 'locked', 'user_id', 'author')
+
     
     """ The topic's slug (used to identify it). """
     slug: str
@@ -1564,7 +2312,7 @@ class Topic(DerpiModel):
         post_count: int,
         view_count: int,
         sticky: bool,
-        last_replied_to_at: datetime,
+        last_replied_to_at: Union[datetime, str],
         locked: bool,
         author: str,
         user_id: Union[int, None] = None,
@@ -1607,60 +2355,61 @@ class Topic(DerpiModel):
         self.post_count = post_count
         self.view_count = view_count
         self.sticky = sticky
-        self.last_replied_to_at = last_replied_to_at
+        self._last_replied_to_at = last_replied_to_at
         self.locked = locked
         self.user_id = user_id
         self.author = author
+        self._raw = None
     # end def __init__
 
-    @classmethod
-    def prepare_dict(cls: Type[Topic], data: Union[Dict[str, JSONType]]) -> Dict[str, JSONType]:
+    @property
+    def last_replied_to_at(self) -> datetime:
+        """
+        The time, in UTC, when the last reply was made.
+        Parsed on first access.
+        """
+        value = self._last_replied_to_at
+        if isinstance(value, str):
+            value = self._last_replied_to_at = parse_datetime(value)
+        # end if
+        return value
+    # end def last_replied_to_at
+
+    @last_replied_to_at.setter
+    def last_replied_to_at(self, value: Union[datetime, str]):
+        self._last_replied_to_at = value
+    # end def last_replied_to_at
+
+    _FIELDS = frozenset({'slug', 'title', 'post_count', 'view_count', 'sticky', 'last_replied_to_at', 'locked', 'user_id', 'author'})  # all the keys we know.
+
+    @classmethod
+    def prepare_dict(cls: Type[Topic], data: Union[Dict[str, JSONType]]) -> Dict[str, JSONType]:
         """
         Builds a new dict with valid values for the Topic constructor.
+        The given `data` is not modified.
 
         :return: new dict with valid values
         :rtype: dict
         """
-        assert_type_or_raise(data, dict, parameter_name="data")
-
-        arguments = super().prepare_dict(data) 
-        arguments['slug'] = data['slug']
-        arguments['title'] = data['title']
-        arguments['post_count'] = data['post_count']
-        arguments['view_count'] = data['view_count']
-        arguments['sticky'] = data['sticky']
-        arguments['last_replied_to_at'] = iso8601.parse_date(data['last_replied_to_at'])
-        arguments['locked'] = data['locked']
-        arguments['user_id'] = data['user_id'] if data.get('user_id', None) is not None else None
-        arguments['author'] = data['author']
-        
-        del data['slug']
-        del data['title']
-        del data['post_count']
-        del data['view_count']
-        del data['sticky']
-        del data['last_replied_to_at']
-        del data['locked']
-        if 'user_id' in data:
-            del data['user_id']
-        # end if
-        del data['author']
-
-        if data:
-            logger.warning(f'still got leftover data: {data!r}')
-            if cls._assert_consuming_all_params:
-                raise ValueError(
-                    f'the dict should be consumed completely, but still has the following elements left: {list(data.keys())!r}'
-                )
-            # end if
-        # end if
-        return arguments
+        cls._check_keys(data)
+        return {
+            'slug': data['slug'],
+            'title': data['title'],
+            'post_count': data['post_count'],
+            'view_count': data['view_count'],
+            'sticky': data['sticky'],
+            'last_replied_to_at': data['last_replied_to_at'],
+            'locked': data['locked'],
+            'user_id': data.get('user_id'),
+            'author': data['author'],
+        }
     # end def prepare_dict
 
     @classmethod
     def from_dict(cls: Type[Topic], data: Union[Dict, None, List[Dict]]) -> Union[Topic, None]:
         """
         Deserialize a new Topic from a given dictionary.
+        The given `data` is not modified. If `_keep_raw` is set, it is kept as `_raw`.
 
         :return: new Topic instance.
         :rtype: Topic|None
@@ -1672,9 +2421,21 @@ class Topic(DerpiModel):
             return [cls.from_dict(item) for item in data]
         # end if
 
-        data: Dict = cls.prepare_dict(data)
-        instance: Topic = cls(**data)
-        instance._raw = data
+        cls._check_keys(data)
+        instance: Topic = cls(
+            slug=data['slug'],
+            title=data['title'],
+            post_count=data['post_count'],
+            view_count=data['view_count'],
+            sticky=data['sticky'],
+            last_replied_to_at=data['last_replied_to_at'],
+            locked=data['locked'],
+            user_id=data.get('user_id'),
+            author=data['author'],
+        )
+        if cls._keep_raw:
+            instance._raw = data
+        # end if
         return instance
     # end def from_dict
 
@@ -1693,15 +2454,68 @@ class Topic(DerpiModel):
         return "{s.__class__.__name__}(slug={s.slug!r}, title={s.title!r}, post_count={s.post_count!r}, view_count={s.view_count!r}, sticky={s.sticky!r}, last_replied_to_at={s.last_replied_to_at!r}, locked={s.locked!r}, user_id={s.user_id!r}, author={s.author!r})".format(s=self)
     # end def __repr__
 
-    def __eq__(self, other):
+    def fields_equal(self, other) -> bool:
         """
-        Implements equality check, i.e. `topic_instance_a == topic_instance_b`
+        Compares all the fields, i.e. if `topic_instance_a` and `topic_instance_b` hold the same data.
         """
-        if not (hasattr(other, 'slug') and hasattr(other, 'title') and hasattr(other, 'post_count') and hasattr(other, 'view_count') and hasattr(other, 'sticky') and hasattr(other, 'last_replied_to_at') and hasattr(other, 'locked') and hasattr(other, 'user_id') and hasattr(other, 'author')):
+        if not isinstance(other, Topic):
             return False
         # end if
-        return self.slug == other.slug and self.title == other.title and self.post_count == other.post_count and self.view_count == other.view_count and self.sticky == other.sticky and self.last_replied_to_at == other.last_replied_to_at and self.locked == other.locked and self.user_id == other.user_id and self.author == other.author
+        return self.slug == other.slug and self.title == other.title and self.post_count == other.post_count and self.view_count == other.view_count and self.sticky == other.sticky and (self._last_replied_to_at == other._last_replied_to_at or self.last_replied_to_at == other.last_replied_to_at) and self.locked == other.locked and self.user_id == other.user_id and self.author == other.author
+    # end def fields_equal
+
+    def __eq__(self, other):
+        """
+        Implements equality check, i.e. `topic_instance_a == topic_instance_b`, see `fields_equal(...)`.
+        """
+        return self.fields_equal(other)
     # end __eq__
+
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        Serializes this Topic to a json compatible dict, like the API returns it.
+        `Topic.from_dict(...)` builds an equal Topic from it.
+        """
+        return {
+            'slug': self.slug,
+            'title': self.title,
+            'post_count': self.post_count,
+            'view_count': self.view_count,
+            'sticky': self.sticky,
+            'last_replied_to_at': format_datetime(self._last_replied_to_at),
+            'locked': self.locked,
+            'user_id': self.user_id,
+            'author': self.author,
+        }
+    # end def to_dict
+
+    def __reduce__(self):
+        """
+        Implements pickling, storing just the values of the `__slots__`.
+        """
+        return self._from_state, ((self._raw, self.slug, self.title, self.post_count, self.view_count, self.sticky, self._last_replied_to_at, self.locked, self.user_id, self.author),)
+    # end def __reduce__
+
+    @classmethod
+    def _from_state(cls: Type[Topic], state: tuple) -> Topic:
+        """
+        Restores a pickled Topic, see `__reduce__`.
+        """
+        instance: Topic = cls.__new__(cls)
+        (
+            instance._raw,
+            instance.slug,
+            instance.title,
+            instance.post_count,
+            instance.view_count,
+            instance.sticky,
+            instance._last_replied_to_at,
+            instance.locked,
+            instance.user_id,
+            instance.author,
+        ) = state
+        return instance
+    # end def _from_state
 # end class
 
 
@@ -1740,6 +2554,8 @@ class Post(DerpiModel):
     
     """
 
+    __slots__ = ('author', 'avatar', 'body', '_created_at', 'edit_reason', '_edited_at', 'id', '_updated_at', 'user_id')
+
     
     """ The post's author. """
     author: str
@@ -1773,12 +2589,12 @@ class Post(DerpiModel):
         author: str,
         avatar: str,
         body: str,
-        created_at: datetime,
+        created_at: Union[datetime, str],
         edit_reason: str,
         id: int,
-        updated_at: datetime,
+        updated_at: Union[datetime, str],
         user_id: int,
-        edited_at: Union[datetime, None] = None,
+        edited_at: Union[datetime, str, None] = None,
     ):
         """
         A parsed Post response of the Derpibooru API.
@@ -1816,62 +2632,99 @@ class Post(DerpiModel):
         self.author = author
         self.avatar = avatar
         self.body = body
-        self.created_at = created_at
+        self._created_at = created_at
         self.edit_reason = edit_reason
-        self.edited_at = edited_at
+        self._edited_at = edited_at
         self.id = id
-        self.updated_at = updated_at
+        self._updated_at = updated_at
         self.user_id = user_id
+        self._raw = None
     # end def __init__
 
+    @property
+    def created_at(self) -> datetime:
+        """
+        The creation time, in UTC, of the post.
+        Parsed on first access.
+        """
+        value = self._created_at
+        if isinstance(value, str):
+            value = self._created_at = parse_datetime(value)
+        # end if
+        return value
+    # end def created_at
+
+    @created_at.setter
+    def created_at(self, value: Union[datetime, str]):
+        self._created_at = value
+    # end def created_at
+
+    @property
+    def edited_at(self) -> Union[datetime, None]:
+        """
+        The time, in UTC, this post was last edited at, or `null` if it was not edited.
+        Parsed on first access.
+        """
+        value = self._edited_at
+        if isinstance(value, str):
+            value = self._edited_at = parse_datetime(value)
+        # end if
+        return value
+    # end def edited_at
+
+    @edited_at.setter
+    def edited_at(self, value: Union[datetime, str, None]):
+        self._edited_at = value
+    # end def edited_at
+
+    @property
+    def updated_at(self) -> datetime:
+        """
+        The time, in UTC, the post was last updated at.
+        Parsed on first access.
+        """
+        value = self._updated_at
+        if isinstance(value, str):
+            value = self._updated_at = parse_datetime(value)
+        # end if
+        return value
+    # end def updated_at
+
+    @updated_at.setter
+    def updated_at(self, value: Union[datetime, str]):
+        self._updated_at = value
+    # end def updated_at
+
+    _FIELDS = frozenset({'author', 'avatar', 'body', 'created_at', 'edit_reason', 'edited_at', 'id', 'updated_at', 'user_id'})  # all the keys we know.
+
     @classmethod
     def prepare_dict(cls: Type[Post], data: Union[Dict[str, JSONType]]) -> Dict[str, JSONType]:
         """
         Builds a new dict with valid values for the Post constructor.
+        The given `data` is not modified.
 
         :return: new dict with valid values
         :rtype: dict
         """
-        assert_type_or_raise(data, dict, parameter_name="data")
-
-        arguments = super().prepare_dict(data) 
-        arguments['author'] = data['author']
-        arguments['avatar'] = data['avatar']
-        arguments['body'] = data['body']
-        arguments['created_at'] = iso8601.parse_date(data['created_at'])
-        arguments['edit_reason'] = data['edit_reason']
-        arguments['edited_at'] = iso8601.parse_date(data['edited_at']) if data.get('edited_at', None) is not None else None
-        arguments['id'] = data['id']
-        arguments['updated_at'] = iso8601.parse_date(data['updated_at'])
-        arguments['user_id'] = data['user_id']
-        
-        del data['author']
-        del data['avatar']
-        del data['body']
-        del data['created_at']
-        del data['edit_reason']
-        if 'edited_at' in data:
-            del data['edited_at']
-        # end if
-        del data['id']
-        del data['updated_at']
-        del data['user_id']
-
-        if data:
-            logger.warning(f'still got leftover data: {data!r}')
-            if cls._assert_consuming_all_params:
-                raise ValueError(
-                    f'the dict should be consumed completely, but still has the following elements left: {list(data.keys())!r}'
-                )
-            # end if
-        # end if
-        return arguments
+        cls._check_keys(data)
+        return {
+            'author': data['author'],
+            'avatar': data['avatar'],
+            'body': data['body'],
+            'created_at': data['created_at'],
+            'edit_reason': data['edit_reason'],
+            'edited_at': data.get('edited_at'),
+            'id': data['id'],
+            'updated_at': data['updated_at'],
+            'user_id': data['user_id'],
+        }
     # end def prepare_dict
 
     @classmethod
     def from_dict(cls: Type[Post], data: Union[Dict, None, List[Dict]]) -> Union[Post, None]:
         """
         Deserialize a new Post from a given dictionary.
+        The given `data` is not modified. If `_keep_raw` is set, it is kept as `_raw`.
 
         :return: new Post instance.
         :rtype: Post|None
@@ -1883,9 +2736,21 @@ class Post(DerpiModel):
             return [cls.from_dict(item) for item in data]
         # end if
 
-        data: Dict = cls.prepare_dict(data)
-        instance: Post = cls(**data)
-        instance._raw = data
+        cls._check_keys(data)
+        instance: Post = cls(
+            author=data['author'],
+            avatar=data['avatar'],
+            body=data['body'],
+            created_at=data['created_at'],
+            edit_reason=data['edit_reason'],
+            edited_at=data.get('edited_at'),
+            id=data['id'],
+            updated_at=data['updated_at'],
+            user_id=data['user_id'],
+        )
+        if cls._keep_raw:
+            instance._raw = data
+        # end if
         return instance
     # end def from_dict
 
@@ -1904,15 +2769,80 @@ class Post(DerpiModel):
         return "{s.__class__.__name__}(author={s.author!r}, avatar={s.avatar!r}, body={s.body!r}, created_at={s.created_at!r}, edit_reason={s.edit_reason!r}, edited_at={s.edited_at!r}, id={s.id!r}, updated_at={s.updated_at!r}, user_id={s.user_id!r})".format(s=self)
     # end def __repr__
 
-    def __eq__(self, other):
+    def fields_equal(self, other) -> bool:
         """
-        Implements equality check, i.e. `post_instance_a == post_instance_b`
+        Compares all the fields, i.e. if `post_instance_a` and `post_instance_b` hold the same data.
+        `post_instance_a == post_instance_b` only compares the `id`.
         """
-        if not (hasattr(other, 'author') and hasattr(other, 'avatar') and hasattr(other, 'body') and hasattr(other, 'created_at') and hasattr(other, 'edit_reason') and hasattr(other, 'edited_at') and hasattr(other, 'id') and hasattr(other, 'updated_at') and hasattr(other, 'user_id')):
+        if not isinstance(other, Post):
             return False
         # end if
-        return self.author == other.author and self.avatar == other.avatar and self.body == other.body and self.created_at == other.created_at and self.edit_reason == other.edit_reason and self.edited_at == other.edited_at and self.id == other.id and self.updated_at == other.updated_at and self.user_id == other.user_id
+        return self.author == other.author and self.avatar == other.avatar and self.body == other.body and (self._created_at == other._created_at or self.created_at == other.created_at) and self.edit_reason == other.edit_reason and (self._edited_at == other._edited_at or self.edited_at == other.edited_at) and self.id == other.id and (self._updated_at == other._updated_at or self.updated_at == other.updated_at) and self.user_id == other.user_id
+    # end def fields_equal
+
+    def __eq__(self, other):
+        """
+        Implements equality check, i.e. `post_instance_a == post_instance_b`.
+        Only compares the `id`, use `fields_equal(...)` to compare all the fields.
+        """
+        if not isinstance(other, Post):
+            return NotImplemented
+        # end if
+        return self.id == other.id
     # end __eq__
+
+    def __hash__(self):
+        """
+        Implements hashing by the `id`, for sets and dict keys, i.e. `{post_instance}`.
+        """
+        return hash((Post, self.id))
+    # end __hash__
+
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        Serializes this Post to a json compatible dict, like the API returns it.
+        `Post.from_dict(...)` builds an equal Post from it.
+        """
+        return {
+            'author': self.author,
+            'avatar': self.avatar,
+            'body': self.body,
+            'created_at': format_datetime(self._created_at),
+            'edit_reason': self.edit_reason,
+            'edited_at': format_datetime(self._edited_at),
+            'id': self.id,
+            'updated_at': format_datetime(self._updated_at),
+            'user_id': self.user_id,
+        }
+    # end def to_dict
+
+    def __reduce__(self):
+        """
+        Implements pickling, storing just the values of the `__slots__`.
+        """
+        return self._from_state, ((self._raw, self.author, self.avatar, self.body, self._created_at, self.edit_reason, self._edited_at, self.id, self._updated_at, self.user_id),)
+    # end def __reduce__
+
+    @classmethod
+    def _from_state(cls: Type[Post], state: tuple) -> Post:
+        """
+        Restores a pickled Post, see `__reduce__`.
+        """
+        instance: Post = cls.__new__(cls)
+        (
+            instance._raw,
+            instance.author,
+            instance.avatar,
+            instance.body,
+            instance._created_at,
+            instance.edit_reason,
+            instance._edited_at,
+            instance.id,
+            instance._updated_at,
+            instance.user_id,
+        ) = state
+        return instance
+    # end def _from_state
 # end class
 
 
@@ -1969,6 +2899,8 @@ class Tag(DerpiModel):
     
     """
 
+    __slots__ = ('aliased_tag', 'aliases', 'category', 'description', 'dnp_entries', 'id', 'images', 'implied_by_tags', 'implied_tags', 'name', 'name_in_namespace', 'namespace', 'short_description', 'slug', 'spoiler_image_uri')
+
     
     """ The slug of the tag this tag is aliased to, if any. """
     aliased_tag: str
@@ -2099,68 +3031,45 @@ class Tag(DerpiModel):
         self.short_description = short_description
         self.slug = slug
         self.spoiler_image_uri = spoiler_image_uri
+        self._raw = None
     # end def __init__
 
+    _FIELDS = frozenset({'aliased_tag', 'aliases', 'category', 'description', 'dnp_entries', 'id', 'images', 'implied_by_tags', 'implied_tags', 'name', 'name_in_namespace', 'namespace', 'short_description', 'slug', 'spoiler_image_uri'})  # all the keys we know.
+
     @classmethod
     def prepare_dict(cls: Type[Tag], data: Union[Dict[str, JSONType]]) -> Dict[str, JSONType]:
         """
         Builds a new dict with valid values for the Tag constructor.
+        The given `data` is not modified.
 
         :return: new dict with valid values
         :rtype: dict
         """
-        assert_type_or_raise(data, dict, parameter_name="data")
-
-        arguments = super().prepare_dict(data) 
-        arguments['aliased_tag'] = data['aliased_tag']
-        arguments['aliases'] = data['aliases']
-        arguments['category'] = data['category']
-        arguments['description'] = data['description']
-        arguments['dnp_entries'] = data['dnp_entries']
-        arguments['id'] = data['id']
-        arguments['images'] = data['images']
-        arguments['implied_by_tags'] = data['implied_by_tags']
-        arguments['implied_tags'] = data['implied_tags']
-        arguments['name'] = data['name']
-        arguments['name_in_namespace'] = data['name_in_namespace']
-        arguments['namespace'] = data['namespace']
-        arguments['short_description'] = data['short_description']
-        arguments['slug'] = data['slug']
-        arguments['spoiler_image_uri'] = data['spoiler_image_uri'] if data.get('spoiler_image_uri', None) is not None else None
-        
-        del data['aliased_tag']
-        del data['aliases']
-        del data['category']
-        del data['description']
-        del data['dnp_entries']
-        del data['id']
-        del data['images']
-        del data['implied_by_tags']
-        del data['implied_tags']
-        del data['name']
-        del data['name_in_namespace']
-        del data['namespace']
-        del data['short_description']
-        del data['slug']
-        if 'spoiler_image_uri' in data:
-            del data['spoiler_image_uri']
-        # end if
-
-        if data:
-            logger.warning(f'still got leftover data: {data!r}')
-            if cls._assert_consuming_all_params:
-                raise ValueError(
-                    f'the dict should be consumed completely, but still has the following elements left: {list(data.keys())!r}'
-                )
-            # end if
-        # end if
-        return arguments
+        cls._check_keys(data)
+        return {
+            'aliased_tag': data['aliased_tag'],
+            'aliases': data['aliases'],
+            'category': data['category'],
+            'description': data['description'],
+            'dnp_entries': data['dnp_entries'],
+            'id': data['id'],
+            'images': data['images'],
+            'implied_by_tags': data['implied_by_tags'],
+            'implied_tags': data['implied_tags'],
+            'name': data['name'],
+            'name_in_namespace': data['name_in_namespace'],
+            'namespace': data['namespace'],
+            'short_description': data['short_description'],
+            'slug': data['slug'],
+            'spoiler_image_uri': data.get('spoiler_image_uri'),
+        }
     # end def prepare_dict
 
     @classmethod
     def from_dict(cls: Type[Tag], data: Union[Dict, None, List[Dict]]) -> Union[Tag, None]:
         """
         Deserialize a new Tag from a given dictionary.
+        The given `data` is not modified. If `_keep_raw` is set, it is kept as `_raw`.
 
         :return: new Tag instance.
         :rtype: Tag|None
@@ -2172,9 +3081,27 @@ class Tag(DerpiModel):
             return [cls.from_dict(item) for item in data]
         # end if
 
-        data: Dict = cls.prepare_dict(data)
-        instance: Tag = cls(**data)
-        instance._raw = data
+        cls._check_keys(data)
+        instance: Tag = cls(
+            aliased_tag=data['aliased_tag'],
+            aliases=data['aliases'],
+            category=data['category'],
+            description=data['description'],
+            dnp_entries=data['dnp_entries'],
+            id=data['id'],
+            images=data['images'],
+            implied_by_tags=data['implied_by_tags'],
+            implied_tags=data['implied_tags'],
+            name=data['name'],
+            name_in_namespace=data['name_in_namespace'],
+            namespace=data['namespace'],
+            short_description=data['short_description'],
+            slug=data['slug'],
+            spoiler_image_uri=data.get('spoiler_image_uri'),
+        )
+        if cls._keep_raw:
+            instance._raw = data
+        # end if
         return instance
     # end def from_dict
 
@@ -2193,15 +3120,92 @@ class Tag(DerpiModel):
         return "{s.__class__.__name__}(aliased_tag={s.aliased_tag!r}, aliases={s.aliases!r}, category={s.category!r}, description={s.description!r}, dnp_entries={s.dnp_entries!r}, id={s.id!r}, images={s.images!r}, implied_by_tags={s.implied_by_tags!r}, implied_tags={s.implied_tags!r}, name={s.name!r}, name_in_namespace={s.name_in_namespace!r}, namespace={s.namespace!r}, short_description={s.short_description!r}, slug={s.slug!r}, spoiler_image_uri={s.spoiler_image_uri!r})".format(s=self)
     # end def __repr__
 
-    def __eq__(self, other):
+    def fields_equal(self, other) -> bool:
         """
-        Implements equality check, i.e. `tag_instance_a == tag_instance_b`
+        Compares all the fields, i.e. if `tag_instance_a` and `tag_instance_b` hold the same data.
+        `tag_instance_a == tag_instance_b` only compares the `id`.
         """
-        if not (hasattr(other, 'aliased_tag') and hasattr(other, 'aliases') and hasattr(other, 'category') and hasattr(other, 'description') and hasattr(other, 'dnp_entries') and hasattr(other, 'id') and hasattr(other, 'images') and hasattr(other, 'implied_by_tags') and hasattr(other, 'implied_tags') and hasattr(other, 'name') and hasattr(other, 'name_in_namespace') and hasattr(other, 'namespace') and hasattr(other, 'short_description') and hasattr(other, 'slug') and hasattr(other, 'spoiler_image_uri')):
+        if not isinstance(other, Tag):
             return False
         # end if
         return self.aliased_tag == other.aliased_tag and self.aliases == other.aliases and self.category == other.category and self.description == other.description and self.dnp_entries == other.dnp_entries and self.id == other.id and self.images == other.images and self.implied_by_tags == other.implied_by_tags and self.implied_tags == other.implied_tags and self.name == other.name and self.name_in_namespace == other.name_in_namespace and self.namespace == other.namespace and self.short_description == other.short_description and self.slug == other.slug and self.spoiler_image_uri == other.spoiler_image_uri
+    # end def fields_equal
+
+    def __eq__(self, other):
+        """
+        Implements equality check, i.e. `tag_instance_a == tag_instance_b`.
+        Only compares the `id`, use `fields_equal(...)` to compare all the fields.
+        """
+        if not isinstance(other, Tag):
+            return NotImplemented
+        # end if
+        return self.id == other.id
     # end __eq__
+
+    def __hash__(self):
+        """
+        Implements hashing by the `id`, for sets and dict keys, i.e. `{tag_instance}`.
+        """
+        return hash((Tag, self.id))
+    # end __hash__
+
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        Serializes this Tag to a json compatible dict, like the API returns it.
+        `Tag.from_dict(...)` builds an equal Tag from it.
+        """
+        return {
+            'aliased_tag': self.aliased_tag,
+            'aliases': to_json_value(self.aliases),
+            'category': self.category,
+            'description': self.description,
+            'dnp_entries': to_json_value(self.dnp_entries),
+            'id': self.id,
+            'images': self.images,
+            'implied_by_tags': to_json_value(self.implied_by_tags),
+            'implied_tags': to_json_value(self.implied_tags),
+            'name': self.name,
+            'name_in_namespace': self.name_in_namespace,
+            'namespace': self.namespace,
+            'short_description': self.short_description,
+            'slug': self.slug,
+            'spoiler_image_uri': self.spoiler_image_uri,
+        }
+    # end def to_dict
+
+    def __reduce__(self):
+        """
+        Implements pickling, storing just the values of the `__slots__`.
+        """
+        return self._from_state, ((self._raw, self.aliased_tag, self.aliases, self.category, self.description, self.dnp_entries, self.id, self.images, self.implied_by_tags, self.implied_tags, self.name, self.name_in_namespace, self.namespace, self.short_description, self.slug, self.spoiler_image_uri),)
+    # end def __reduce__
+
+    @classmethod
+    def _from_state(cls: Type[Tag], state: tuple) -> Tag:
+        """
+        Restores a pickled Tag, see `__reduce__`.
+        """
+        instance: Tag = cls.__new__(cls)
+        (
+            instance._raw,
+            instance.aliased_tag,
+            instance.aliases,
+            instance.category,
+            instance.description,
+            instance.dnp_entries,
+            instance.id,
+            instance.images,
+            instance.implied_by_tags,
+            instance.implied_tags,
+            instance.name,
+            instance.name_in_namespace,
+            instance.namespace,
+            instance.short_description,
+            instance.slug,
+            instance.spoiler_image_uri,
+        ) = state
+        return instance
+    # end def _from_state
 # end class
 
 
@@ -2252,6 +3256,8 @@ class User(DerpiModel):
     
     """
 
+    __slots__ = ('id', 'name', 'slug', 'role', 'description', 'avatar_url', '_created_at', 'comments_count', 'uploads_count', 'posts_count', 'topics_count', 'links', 'awards')
+
     
     """ The ID of the user. """
     id: int
@@ -2299,7 +3305,7 @@ class User(DerpiModel):
         slug: str,
         role: str,
         description: str,
-        created_at: datetime,
+        created_at: Union[datetime, str],
         comments_count: int,
         uploads_count: int,
         posts_count: int,
@@ -2359,71 +3365,68 @@ class User(DerpiModel):
         self.role = role
         self.description = description
         self.avatar_url = avatar_url
-        self.created_at = created_at
+        self._created_at = created_at
         self.comments_count = comments_count
         self.uploads_count = uploads_count
         self.posts_count = posts_count
         self.topics_count = topics_count
         self.links = links
         self.awards = awards
+        self._raw = None
     # end def __init__
 
+    @property
+    def created_at(self) -> datetime:
+        """
+        The creation time, in UTC, of the user.
+        Parsed on first access.
+        """
+        value = self._created_at
+        if isinstance(value, str):
+            value = self._created_at = parse_datetime(value)
+        # end if
+        return value
+    # end def created_at
+
+    @created_at.setter
+    def created_at(self, value: Union[datetime, str]):
+        self._created_at = value
+    # end def created_at
+
+    _FIELDS = frozenset({'id', 'name', 'slug', 'role', 'description', 'avatar_url', 'created_at', 'comments_count', 'uploads_count', 'posts_count', 'topics_count', 'links', 'awards'})  # all the keys we know.
+
     @classmethod
     def prepare_dict(cls: Type[User], data: Union[Dict[str, JSONType]]) -> Dict[str, JSONType]:
         """
         Builds a new dict with valid values for the User constructor.
+        The given `data` is not modified.
 
         :return: new dict with valid values
         :rtype: dict
         """
-        assert_type_or_raise(data, dict, parameter_name="data")
-
-        arguments = super().prepare_dict(data) 
-        arguments['id'] = data['id']
-        arguments['name'] = data['name']
-        arguments['slug'] = data['slug']
-        arguments['role'] = data['role']
-        arguments['description'] = data['description']
-        arguments['avatar_url'] = data['avatar_url'] if data.get('avatar_url', None) is not None else None
-        arguments['created_at'] = iso8601.parse_date(data['created_at'])
-        arguments['comments_count'] = data['comments_count']
-        arguments['uploads_count'] = data['uploads_count']
-        arguments['posts_count'] = data['posts_count']
-        arguments['topics_count'] = data['topics_count']
-        arguments['links'] = Links.from_dict(data['links'])
-        arguments['awards'] = Awards.from_dict(data['awards'])
-        
-        del data['id']
-        del data['name']
-        del data['slug']
-        del data['role']
-        del data['description']
-        if 'avatar_url' in data:
-            del data['avatar_url']
-        # end if
-        del data['created_at']
-        del data['comments_count']
-        del data['uploads_count']
-        del data['posts_count']
-        del data['topics_count']
-        del data['links']
-        del data['awards']
-
-        if data:
-            logger.warning(f'still got leftover data: {data!r}')
-            if cls._assert_consuming_all_params:
-                raise ValueError(
-                    f'the dict should be consumed completely, but still has the following elements left: {list(data.keys())!r}'
-                )
-            # end if
-        # end if
-        return arguments
+        cls._check_keys(data)
+        return {
+            'id': data['id'],
+            'name': data['name'],
+            'slug': data['slug'],
+            'role': data['role'],
+            'description': data['description'],
+            'avatar_url': data.get('avatar_url'),
+            'created_at': data['created_at'],
+            'comments_count': data['comments_count'],
+            'uploads_count': data['uploads_count'],
+            'posts_count': data['posts_count'],
+            'topics_count': data['topics_count'],
+            'links': Links.from_dict(data['links']),
+            'awards': Awards.from_dict(data['awards']),
+        }
     # end def prepare_dict
 
     @classmethod
     def from_dict(cls: Type[User], data: Union[Dict, None, List[Dict]]) -> Union[User, None]:
         """
         Deserialize a new User from a given dictionary.
+        The given `data` is not modified. If `_keep_raw` is set, it is kept as `_raw`.
 
         :return: new User instance.
         :rtype: User|None
@@ -2435,9 +3438,25 @@ class User(DerpiModel):
             return [cls.from_dict(item) for item in data]
         # end if
 
-        data: Dict = cls.prepare_dict(data)
-        instance: User = cls(**data)
-        instance._raw = data
+        cls._check_keys(data)
+        instance: User = cls(
+            id=data['id'],
+            name=data['name'],
+            slug=data['slug'],
+            role=data['role'],
+            description=data['description'],
+            avatar_url=data.get('avatar_url'),
+            created_at=data['created_at'],
+            comments_count=data['comments_count'],
+            uploads_count=data['uploads_count'],
+            posts_count=data['posts_count'],
+            topics_count=data['topics_count'],
+            links=Links.from_dict(data['links']),
+            awards=Awards.from_dict(data['awards']),
+        )
+        if cls._keep_raw:
+            instance._raw = data
+        # end if
         return instance
     # end def from_dict
 
@@ -2456,15 +3475,88 @@ class User(DerpiModel):
         return "{s.__class__.__name__}(id={s.id!r}, name={s.name!r}, slug={s.slug!r}, role={s.role!r}, description={s.description!r}, avatar_url={s.avatar_url!r}, created_at={s.created_at!r}, comments_count={s.comments_count!r}, uploads_count={s.uploads_count!r}, posts_count={s.posts_count!r}, topics_count={s.topics_count!r}, links={s.links!r}, awards={s.awards!r})".format(s=self)
     # end def __repr__
 
-    def __eq__(self, other):
+    def fields_equal(self, other) -> bool:
         """
-        Implements equality check, i.e. `user_instance_a == user_instance_b`
+        Compares all the fields, i.e. if `user_instance_a` and `user_instance_b` hold the same data.
+        `user_instance_a == user_instance_b` only compares the `id`.
         """
-        if not (hasattr(other, 'id') and hasattr(other, 'name') and hasattr(other, 'slug') and hasattr(other, 'role') and hasattr(other, 'description') and hasattr(other, 'avatar_url') and hasattr(other, 'created_at') and hasattr(other, 'comments_count') and hasattr(other, 'uploads_count') and hasattr(other, 'posts_count') and hasattr(other, 'topics_count') and hasattr(other, 'links') and hasattr(other, 'awards')):
+        if not isinstance(other, User):
             return False
         # end if
-        return self.id == other.id and self.name == other.name and self.slug == other.slug and self.role == other.role and self.description == other.description and self.avatar_url == other.avatar_url and self.created_at == other.created_at and self.comments_count == other.comments_count and self.uploads_count == other.uploads_count and self.posts_count == other.posts_count and self.topics_count == other.topics_count and self.links == other.links and self.awards == other.awards
+        return self.id == other.id and self.name == other.name and self.slug == other.slug and self.role == other.role and self.description == other.description and self.avatar_url == other.avatar_url and (self._created_at == other._created_at or self.created_at == other.created_at) and self.comments_count == other.comments_count and self.uploads_count == other.uploads_count and self.posts_count == other.posts_count and self.topics_count == other.topics_count and self.links == other.links and self.awards == other.awards
+    # end def fields_equal
+
+    def __eq__(self, other):
+        """
+        Implements equality check, i.e. `user_instance_a == user_instance_b`.
+        Only compares the `id`, use `fields_equal(...)` to compare all the fields.
+        """
+        if not isinstance(other, User):
+            return NotImplemented
+        # end if
+        return self.id == other.id
     # end __eq__
+
+    def __hash__(self):
+        """
+        Implements hashing by the `id`, for sets and dict keys, i.e. `{user_instance}`.
+        """
+        return hash((User, self.id))
+    # end __hash__
+
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        Serializes this User to a json compatible dict, like the API returns it.
+        `User.from_dict(...)` builds an equal User from it.
+        """
+        return {
+            'id': self.id,
+            'name': self.name,
+            'slug': self.slug,
+            'role': self.role,
+            'description': self.description,
+            'avatar_url': self.avatar_url,
+            'created_at': format_datetime(self._created_at),
+            'comments_count': self.comments_count,
+            'uploads_count': self.uploads_count,
+            'posts_count': self.posts_count,
+            'topics_count': self.topics_count,
+            'links': to_json_value(self.links),
+            'awards': to_json_value(self.awards),
+        }
+    # end def to_dict
+
+    def __reduce__(self):
+        """
+        Implements pickling, storing just the values of the `__slots__`.
+        """
+        return self._from_state, ((self._raw, self.id, self.name, self.slug, self.role, self.description, self.avatar_url, self._created_at, self.comments_count, self.uploads_count, self.posts_count, self.topics_count, self.links, self.awards),)
+    # end def __reduce__
+
+    @classmethod
+    def _from_state(cls: Type[User], state: tuple) -> User:
+        """
+        Restores a pickled User, see `__reduce__`.
+        """
+        instance: User = cls.__new__(cls)
+        (
+            instance._raw,
+            instance.id,
+            instance.name,
+            instance.slug,
+            instance.role,
+            instance.description,
+            instance.avatar_url,
+            instance._created_at,
+            instance.comments_count,
+            instance.uploads_count,
+            instance.posts_count,
+            instance.topics_count,
+            instance.links,
+            instance.awards,
+        ) = state
+        return instance
+    # end def _from_state
 # end class
 
 
@@ -2509,6 +3601,8 @@ class Filter(DerpiModel):
     
     """
 
+    __slots__ = ('id', 'name', 'description', 'user_id', 'user_count', 'system', 'public', 'spoilered_tag_ids', 'spoilered_complex', 'hidden_tag_ids', 'hidden_complex')
+
     
     """ The id of the filter. """
     id: int
@@ -2607,60 +3701,41 @@ class Filter(DerpiModel):
         self.spoilered_complex = spoilered_complex
         self.hidden_tag_ids = hidden_tag_ids
         self.hidden_complex = hidden_complex
+        self._raw = None
     # end def __init__
 
+    _FIELDS = frozenset({'id', 'name', 'description', 'user_id', 'user_count', 'system', 'public', 'spoilered_tag_ids', 'spoilered_complex', 'hidden_tag_ids', 'hidden_complex'})  # all the keys we know.
+
     @classmethod
     def prepare_dict(cls: Type[Filter], data: Union[Dict[str, JSONType]]) -> Dict[str, JSONType]:
         """
         Builds a new dict with valid values for the Filter constructor.
+        The given `data` is not modified.
 
         :return: new dict with valid values
         :rtype: dict
         """
-        assert_type_or_raise(data, dict, parameter_name="data")
-
-        arguments = super().prepare_dict(data) 
-        arguments['id'] = data['id']
-        arguments['name'] = data['name']
-        arguments['description'] = data['description']
-        arguments['user_id'] = data['user_id'] if data.get('user_id', None) is not None else None
-        arguments['user_count'] = data['user_count']
-        arguments['system'] = data['system']
-        arguments['public'] = data['public']
-        arguments['spoilered_tag_ids'] = data['spoilered_tag_ids']
-        arguments['spoilered_complex'] = data['spoilered_complex']
-        arguments['hidden_tag_ids'] = data['hidden_tag_ids']
-        arguments['hidden_complex'] = data['hidden_complex']
-        
-        del data['id']
-        del data['name']
-        del data['description']
-        if 'user_id' in data:
-            del data['user_id']
-        # end if
-        del data['user_count']
-        del data['system']
-        del data['public']
-        del data['spoilered_tag_ids']
-        del data['spoilered_complex']
-        del data['hidden_tag_ids']
-        del data['hidden_complex']
-
-        if data:
-            logger.warning(f'still got leftover data: {data!r}')
-            if cls._assert_consuming_all_params:
-                raise ValueError(
-                    f'the dict should be consumed completely, but still has the following elements left: {list(data.keys())!r}'
-                )
-            # end if
-        # end if
-        return arguments
+        cls._check_keys(data)
+        return {
+            'id': data['id'],
+            'name': data['name'],
+            'description': data['description'],
+            'user_id': data.get('user_id'),
+            'user_count': data['user_count'],
+            'system': data['system'],
+            'public': data['public'],
+            'spoilered_tag_ids': data['spoilered_tag_ids'],
+            'spoilered_complex': data['spoilered_complex'],
+            'hidden_tag_ids': data['hidden_tag_ids'],
+            'hidden_complex': data['hidden_complex'],
+        }
     # end def prepare_dict
 
     @classmethod
     def from_dict(cls: Type[Filter], data: Union[Dict, None, List[Dict]]) -> Union[Filter, None]:
         """
         Deserialize a new Filter from a given dictionary.
+        The given `data` is not modified. If `_keep_raw` is set, it is kept as `_raw`.
 
         :return: new Filter instance.
         :rtype: Filter|None
@@ -2672,9 +3747,23 @@ class Filter(DerpiModel):
             return [cls.from_dict(item) for item in data]
         # end if
 
-        data: Dict = cls.prepare_dict(data)
-        instance: Filter = cls(**data)
-        instance._raw = data
+        cls._check_keys(data)
+        instance: Filter = cls(
+            id=data['id'],
+            name=data['name'],
+            description=data['description'],
+            user_id=data.get('user_id'),
+            user_count=data['user_count'],
+            system=data['system'],
+            public=data['public'],
+            spoilered_tag_ids=data['spoilered_tag_ids'],
+            spoilered_complex=data['spoilered_complex'],
+            hidden_tag_ids=data['hidden_tag_ids'],
+            hidden_complex=data['hidden_complex'],
+        )
+        if cls._keep_raw:
+            instance._raw = data
+        # end if
         return instance
     # end def from_dict
 
@@ -2693,15 +3782,84 @@ class Filter(DerpiModel):
         return "{s.__class__.__name__}(id={s.id!r}, name={s.name!r}, description={s.description!r}, user_id={s.user_id!r}, user_count={s.user_count!r}, system={s.system!r}, public={s.public!r}, spoilered_tag_ids={s.spoilered_tag_ids!r}, spoilered_complex={s.spoilered_complex!r}, hidden_tag_ids={s.hidden_tag_ids!r}, hidden_complex={s.hidden_complex!r})".format(s=self)
     # end def __repr__
 
-    def __eq__(self, other):
+    def fields_equal(self, other) -> bool:
         """
-        Implements equality check, i.e. `filter_instance_a == filter_instance_b`
+        Compares all the fields, i.e. if `filter_instance_a` and `filter_instance_b` hold the same data.
+        `filter_instance_a == filter_instance_b` only compares the `id`.
         """
-        if not (hasattr(other, 'id') and hasattr(other, 'name') and hasattr(other, 'description') and hasattr(other, 'user_id') and hasattr(other, 'user_count') and hasattr(other, 'system') and hasattr(other, 'public') and hasattr(other, 'spoilered_tag_ids') and hasattr(other, 'spoilered_complex') and hasattr(other, 'hidden_tag_ids') and hasattr(other, 'hidden_complex')):
+        if not isinstance(other, Filter):
             return False
         # end if
         return self.id == other.id and self.name == other.name and self.description == other.description and self.user_id == other.user_id and self.user_count == other.user_count and self.system == other.system and self.public == other.public and self.spoilered_tag_ids == other.spoilered_tag_ids and self.spoilered_complex == other.spoilered_complex and self.hidden_tag_ids == other.hidden_tag_ids and self.hidden_complex == other.hidden_complex
+    # end def fields_equal
+
+    def __eq__(self, other):
+        """
+        Implements equality check, i.e. `filter_instance_a == filter_instance_b`.
+        Only compares the `id`, use `fields_equal(...)` to compare all the fields.
+        """
+        if not isinstance(other, Filter):
+            return NotImplemented
+        # end if
+        return self.id == other.id
     # end __eq__
+
+    def __hash__(self):
+        """
+        Implements hashing by the `id`, for sets and dict keys, i.e. `{filter_instance}`.
+        """
+        return hash((Filter, self.id))
+    # end __hash__
+
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        Serializes this Filter to a json compatible dict, like the API returns it.
+        `Filter.from_dict(...)` builds an equal Filter from it.
+        """
+        return {
+            'id': self.id,
+            'name': self.name,
+            'description': self.description,
+            'user_id': self.user_id,
+            'user_count': self.user_count,
+            'system': self.system,
+            'public': self.public,
+            'spoilered_tag_ids': to_json_value(self.spoilered_tag_ids),
+            'spoilered_complex': self.spoilered_complex,
+            'hidden_tag_ids': to_json_value(self.hidden_tag_ids),
+            'hidden_complex': self.hidden_complex,
+        }
+    # end def to_dict
+
+    def __reduce__(self):
+        """
+        Implements pickling, storing just the values of the `__slots__`.
+        """
+        return self._from_state, ((self._raw, self.id, self.name, self.description, self.user_id, self.user_count, self.system, self.public, self.spoilered_tag_ids, self.spoilered_complex, self.hidden_tag_ids, self.hidden_complex),)
+    # end def __reduce__
+
+    @classmethod
+    def _from_state(cls: Type[Filter], state: tuple) -> Filter:
+        """
+        Restores a pickled Filter, see `__reduce__`.
+        """
+        instance: Filter = cls.__new__(cls)
+        (
+            instance._raw,
+            instance.id,
+            instance.name,
+            instance.description,
+            instance.user_id,
+            instance.user_count,
+            instance.system,
+            instance.public,
+            instance.spoilered_tag_ids,
+            instance.spoilered_complex,
+            instance.hidden_tag_ids,
+            instance.hidden_complex,
+        ) = state
+        return instance
+    # end def _from_state
 # end class
 
 
@@ -2725,6 +3883,8 @@ class Links(DerpiModel):
     
     """
 
+    __slots__ = ('user_id', '_created_at', 'state', 'tag_id')
+
     
     """ The ID of the user who owns this link. """
     user_id: int
@@ -2741,7 +3901,7 @@ class Links(DerpiModel):
     def __init__(
         self, 
         user_id: int,
-        created_at: datetime,
+        created_at: Union[datetime, str],
         state: str,
         tag_id: Union[int, None] = None,
     ):
@@ -2764,49 +3924,55 @@ class Links(DerpiModel):
         
         """
         self.user_id = user_id
-        self.created_at = created_at
+        self._created_at = created_at
         self.state = state
         self.tag_id = tag_id
+        self._raw = None
     # end def __init__
 
+    @property
+    def created_at(self) -> datetime:
+        """
+        The creation time, in UTC, of this link.
+        Parsed on first access.
+        """
+        value = self._created_at
+        if isinstance(value, str):
+            value = self._created_at = parse_datetime(value)
+        # end if
+        return value
+    # end def created_at
+
+    @created_at.setter
+    def created_at(self, value: Union[datetime, str]):
+        self._created_at = value
+    # end def created_at
+
+    _FIELDS = frozenset({'user_id', 'created_at', 'state', 'tag_id'})  # all the keys we know.
+
     @classmethod
     def prepare_dict(cls: Type[Links], data: Union[Dict[str, JSONType]]) -> Dict[str, JSONType]:
         """
         Builds a new dict with valid values for the Links constructor.
+        The given `data` is not modified.
 
         :return: new dict with valid values
         :rtype: dict
         """
-        assert_type_or_raise(data, dict, parameter_name="data")
-
-        arguments = super().prepare_dict(data) 
-        arguments['user_id'] = data['user_id']
-        arguments['created_at'] = iso8601.parse_date(data['created_at'])
-        arguments['state'] = data['state']
-        arguments['tag_id'] = data['tag_id'] if data.get('tag_id', None) is not None else None
-        
-        del data['user_id']
-        del data['created_at']
-        del data['state']
-        if 'tag_id' in data:
-            del data['tag_id']
-        # end if
-
-        if data:
-            logger.warning(f'still got leftover data: {data!r}')
-            if cls._assert_consuming_all_params:
-                raise ValueError(
-                    f'the dict should be consumed completely, but still has the following elements left: {list(data.keys())!r}'
-                )
-            # end if
-        # end if
-        return arguments
+        cls._check_keys(data)
+        return {
+            'user_id': data['user_id'],
+            'created_at': data['created_at'],
+            'state': data['state'],
+            'tag_id': data.get('tag_id'),
+        }
     # end def prepare_dict
 
     @classmethod
     def from_dict(cls: Type[Links], data: Union[Dict, None, List[Dict]]) -> Union[Links, None]:
         """
         Deserialize a new Links from a given dictionary.
+        The given `data` is not modified. If `_keep_raw` is set, it is kept as `_raw`.
 
         :return: new Links instance.
         :rtype: Links|None
@@ -2818,9 +3984,16 @@ class Links(DerpiModel):
             return [cls.from_dict(item) for item in data]
         # end if
 
-        data: Dict = cls.prepare_dict(data)
-        instance: Links = cls(**data)
-        instance._raw = data
+        cls._check_keys(data)
+        instance: Links = cls(
+            user_id=data['user_id'],
+            created_at=data['created_at'],
+            state=data['state'],
+            tag_id=data.get('tag_id'),
+        )
+        if cls._keep_raw:
+            instance._raw = data
+        # end if
         return instance
     # end def from_dict
 
@@ -2839,15 +4012,58 @@ class Links(DerpiModel):
         return "{s.__class__.__name__}(user_id={s.user_id!r}, created_at={s.created_at!r}, state={s.state!r}, tag_id={s.tag_id!r})".format(s=self)
     # end def __repr__
 
-    def __eq__(self, other):
+    def fields_equal(self, other) -> bool:
         """
-        Implements equality check, i.e. `links_instance_a == links_instance_b`
+        Compares all the fields, i.e. if `links_instance_a` and `links_instance_b` hold the same data.
         """
-        if not (hasattr(other, 'user_id') and hasattr(other, 'created_at') and hasattr(other, 'state') and hasattr(other, 'tag_id')):
+        if not isinstance(other, Links):
             return False
         # end if
-        return self.user_id == other.user_id and self.created_at == other.created_at and self.state == other.state and self.tag_id == other.tag_id
+        return self.user_id == other.user_id and (self._created_at == other._created_at or self.created_at == other.created_at) and self.state == other.state and self.tag_id == other.tag_id
+    # end def fields_equal
+
+    def __eq__(self, other):
+        """
+        Implements equality check, i.e. `links_instance_a == links_instance_b`, see `fields_equal(...)`.
+        """
+        return self.fields_equal(other)
     # end __eq__
+
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        Serializes this Links to a json compatible dict, like the API returns it.
+        `Links.from_dict(...)` builds an equal Links from it.
+        """
+        return {
+            'user_id': self.user_id,
+            'created_at': format_datetime(self._created_at),
+            'state': self.state,
+            'tag_id': self.tag_id,
+        }
+    # end def to_dict
+
+    def __reduce__(self):
+        """
+        Implements pickling, storing just the values of the `__slots__`.
+        """
+        return self._from_state, ((self._raw, self.user_id, self._created_at, self.state, self.tag_id),)
+    # end def __reduce__
+
+    @classmethod
+    def _from_state(cls: Type[Links], state: tuple) -> Links:
+        """
+        Restores a pickled Links, see `__reduce__`.
+        """
+        instance: Links = cls.__new__(cls)
+        (
+            instance._raw,
+            instance.user_id,
+            instance._created_at,
+            instance.state,
+            instance.tag_id,
+        ) = state
+        return instance
+    # end def _from_state
 # end class
 
 
@@ -2874,6 +4090,8 @@ class Awards(DerpiModel):
     
     """
 
+    __slots__ = ('image_url', 'title', 'id', 'label', '_awarded_on')
+
     
     """ The URL of this award. """
     image_url: str
@@ -2896,7 +4114,7 @@ class Awards(DerpiModel):
         title: str,
         id: int,
         label: str,
-        awarded_on: datetime,
+        awarded_on: Union[datetime, str],
     ):
         """
         A parsed Awards response of the Derpibooru API.
@@ -2923,47 +4141,54 @@ class Awards(DerpiModel):
         self.title = title
         self.id = id
         self.label = label
-        self.awarded_on = awarded_on
+        self._awarded_on = awarded_on
+        self._raw = None
     # end def __init__
 
+    @property
+    def awarded_on(self) -> datetime:
+        """
+        The time, in UTC, when this award was given.
+        Parsed on first access.
+        """
+        value = self._awarded_on
+        if isinstance(value, str):
+            value = self._awarded_on = parse_datetime(value)
+        # end if
+        return value
+    # end def awarded_on
+
+    @awarded_on.setter
+    def awarded_on(self, value: Union[datetime, str]):
+        self._awarded_on = value
+    # end def awarded_on
+
+    _FIELDS = frozenset({'image_url', 'title', 'id', 'label', 'awarded_on'})  # all the keys we know.
+
     @classmethod
     def prepare_dict(cls: Type[Awards], data: Union[Dict[str, JSONType]]) -> Dict[str, JSONType]:
         """
         Builds a new dict with valid values for the Awards constructor.
+        The given `data` is not modified.
 
         :return: new dict with valid values
         :rtype: dict
         """
-        assert_type_or_raise(data, dict, parameter_name="data")
-
-        arguments = super().prepare_dict(data) 
-        arguments['image_url'] = data['image_url']
-        arguments['title'] = data['title']
-        arguments['id'] = data['id']
-        arguments['label'] = data['label']
-        arguments['awarded_on'] = iso8601.parse_date(data['awarded_on'])
-        
-        del data['image_url']
-        del data['title']
-        del data['id']
-        del data['label']
-        del data['awarded_on']
-
-        if data:
-            logger.warning(f'still got leftover data: {data!r}')
-            if cls._assert_consuming_all_params:
-                raise ValueError(
-                    f'the dict should be consumed completely, but still has the following elements left: {list(data.keys())!r}'
-                )
-            # end if
-        # end if
-        return arguments
+        cls._check_keys(data)
+        return {
+            'image_url': data['image_url'],
+            'title': data['title'],
+            'id': data['id'],
+            'label': data['label'],
+            'awarded_on': data['awarded_on'],
+        }
     # end def prepare_dict
 
     @classmethod
     def from_dict(cls: Type[Awards], data: Union[Dict, None, List[Dict]]) -> Union[Awards, None]:
         """
         Deserialize a new Awards from a given dictionary.
+        The given `data` is not modified. If `_keep_raw` is set, it is kept as `_raw`.
 
         :return: new Awards instance.
         :rtype: Awards|None
@@ -2975,9 +4200,17 @@ class Awards(DerpiModel):
             return [cls.from_dict(item) for item in data]
         # end if
 
-        data: Dict = cls.prepare_dict(data)
-        instance: Awards = cls(**data)
-        instance._raw = data
+        cls._check_keys(data)
+        instance: Awards = cls(
+            image_url=data['image_url'],
+            title=data['title'],
+            id=data['id'],
+            label=data['label'],
+            awarded_on=data['awarded_on'],
+        )
+        if cls._keep_raw:
+            instance._raw = data
+        # end if
         return instance
     # end def from_dict
 
@@ -2996,15 +4229,60 @@ class Awards(DerpiModel):
         return "{s.__class__.__name__}(image_url={s.image_url!r}, title={s.title!r}, id={s.id!r}, label={s.label!r}, awarded_on={s.awarded_on!r})".format(s=self)
     # end def __repr__
 
-    def __eq__(self, other):
+    def fields_equal(self, other) -> bool:
         """
-        Implements equality check, i.e. `awards_instance_a == awards_instance_b`
+        Compares all the fields, i.e. if `awards_instance_a` and `awards_instance_b` hold the same data.
         """
-        if not (hasattr(other, 'image_url') and hasattr(other, 'title') and hasattr(other, 'id') and hasattr(other, 'label') and hasattr(other, 'awarded_on')):
+        if not isinstance(other, Awards):
             return False
         # end if
-        return self.image_url == other.image_url and self.title == other.title and self.id == other.id and self.label == other.label and self.awarded_on == other.awarded_on
+        return self.image_url == other.image_url and self.title == other.title and self.id == other.id and self.label == other.label and (self._awarded_on == other._awarded_on or self.awarded_on == other.awarded_on)
+    # end def fields_equal
+
+    def __eq__(self, other):
+        """
+        Implements equality check, i.e. `awards_instance_a == awards_instance_b`, see `fields_equal(...)`.
+        """
+        return self.fields_equal(other)
     # end __eq__
+
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        Serializes this Awards to a json compatible dict, like the API returns it.
+        `Awards.from_dict(...)` builds an equal Awards from it.
+        """
+        return {
+            'image_url': self.image_url,
+            'title': self.title,
+            'id': self.id,
+            'label': self.label,
+            'awarded_on': format_datetime(self._awarded_on),
+        }
+    # end def to_dict
+
+    def __reduce__(self):
+        """
+        Implements pickling, storing just the values of the `__slots__`.
+        """
+        return self._from_state, ((self._raw, self.image_url, self.title, self.id, self.label, self._awarded_on),)
+    # end def __reduce__
+
+    @classmethod
+    def _from_state(cls: Type[Awards], state: tuple) -> Awards:
+        """
+        Restores a pickled Awards, see `__reduce__`.
+        """
+        instance: Awards = cls.__new__(cls)
+        (
+            instance._raw,
+            instance.image_url,
+            instance.title,
+            instance.id,
+            instance.label,
+            instance._awarded_on,
+        ) = state
+        return instance
+    # end def _from_state
 # end class
 
 
@@ -3037,6 +4315,8 @@ class Gallery(DerpiModel):
     
     """
 
+    __slots__ = ('description', 'id', 'spoiler_warning', 'thumbnail_id', 'title', 'user', 'user_id')
+
     
     """ The gallery's description. """
     description: str
@@ -3103,50 +4383,37 @@ class Gallery(DerpiModel):
         self.title = title
         self.user = user
         self.user_id = user_id
+        self._raw = None
     # end def __init__
 
+    _FIELDS = frozenset({'description', 'id', 'spoiler_warning', 'thumbnail_id', 'title', 'user', 'user_id'})  # all the keys we know.
+
     @classmethod
     def prepare_dict(cls: Type[Gallery], data: Union[Dict[str, JSONType]]) -> Dict[str, JSONType]:
         """
         Builds a new dict with valid values for the Gallery constructor.
+        The given `data` is not modified.
 
         :return: new dict with valid values
         :rtype: dict
         """
-        assert_type_or_raise(data, dict, parameter_name="data")
-
-        arguments = super().prepare_dict(data) 
-        arguments['description'] = data['description']
-        arguments['id'] = data['id']
-        arguments['spoiler_warning'] = data['spoiler_warning']
-        arguments['thumbnail_id'] = data['thumbnail_id']
-        arguments['title'] = data['title']
-        arguments['user'] = data['user']
-        arguments['user_id'] = data['user_id']
-        
-        del data['description']
-        del data['id']
-        del data['spoiler_warning']
-        del data['thumbnail_id']
-        del data['title']
-        del data['user']
-        del data['user_id']
-
-        if data:
-            logger.warning(f'still got leftover data: {data!r}')
-            if cls._assert_consuming_all_params:
-                raise ValueError(
-                    f'the dict should be consumed completely, but still has the following elements left: {list(data.keys())!r}'
-                )
-            # end if
-        # end if
-        return arguments
+        cls._check_keys(data)
+        return {
+            'description': data['description'],
+            'id': data['id'],
+            'spoiler_warning': data['spoiler_warning'],
+            'thumbnail_id': data['thumbnail_id'],
+            'title': data['title'],
+            'user': data['user'],
+            'user_id': data['user_id'],
+        }
     # end def prepare_dict
 
     @classmethod
     def from_dict(cls: Type[Gallery], data: Union[Dict, None, List[Dict]]) -> Union[Gallery, None]:
         """
         Deserialize a new Gallery from a given dictionary.
+        The given `data` is not modified. If `_keep_raw` is set, it is kept as `_raw`.
 
         :return: new Gallery instance.
         :rtype: Gallery|None
@@ -3158,9 +4425,19 @@ class Gallery(DerpiModel):
             return [cls.from_dict(item) for item in data]
         # end if
 
-        data: Dict = cls.prepare_dict(data)
-        instance: Gallery = cls(**data)
-        instance._raw = data
+        cls._check_keys(data)
+        instance: Gallery = cls(
+            description=data['description'],
+            id=data['id'],
+            spoiler_warning=data['spoiler_warning'],
+            thumbnail_id=data['thumbnail_id'],
+            title=data['title'],
+            user=data['user'],
+            user_id=data['user_id'],
+        )
+        if cls._keep_raw:
+            instance._raw = data
+        # end if
         return instance
     # end def from_dict
 
@@ -3179,15 +4456,76 @@ class Gallery(DerpiModel):
         return "{s.__class__.__name__}(description={s.description!r}, id={s.id!r}, spoiler_warning={s.spoiler_warning!r}, thumbnail_id={s.thumbnail_id!r}, title={s.title!r}, user={s.user!r}, user_id={s.user_id!r})".format(s=self)
     # end def __repr__
 
-    def __eq__(self, other):
+    def fields_equal(self, other) -> bool:
         """
-        Implements equality check, i.e. `gallery_instance_a == gallery_instance_b`
+        Compares all the fields, i.e. if `gallery_instance_a` and `gallery_instance_b` hold the same data.
+        `gallery_instance_a == gallery_instance_b` only compares the `id`.
         """
-        if not (hasattr(other, 'description') and hasattr(other, 'id') and hasattr(other, 'spoiler_warning') and hasattr(other, 'thumbnail_id') and hasattr(other, 'title') and hasattr(other, 'user') and hasattr(other, 'user_id')):
+        if not isinstance(other, Gallery):
             return False
         # end if
         return self.description == other.description and self.id == other.id and self.spoiler_warning == other.spoiler_warning and self.thumbnail_id == other.thumbnail_id and self.title == other.title and self.user == other.user and self.user_id == other.user_id
+    # end def fields_equal
+
+    def __eq__(self, other):
+        """
+        Implements equality check, i.e. `gallery_instance_a == gallery_instance_b`.
+        Only compares the `id`, use `fields_equal(...)` to compare all the fields.
+        """
+        if not isinstance(other, Gallery):
+            return NotImplemented
+        # end if
+        return self.id == other.id
     # end __eq__
+
+    def __hash__(self):
+        """
+        Implements hashing by the `id`, for sets and dict keys, i.e. `{gallery_instance}`.
+        """
+        return hash((Gallery, self.id))
+    # end __hash__
+
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        Serializes this Gallery to a json compatible dict, like the API returns it.
+        `Gallery.from_dict(...)` builds an equal Gallery from it.
+        """
+        return {
+            'description': self.description,
+            'id': self.id,
+            'spoiler_warning': self.spoiler_warning,
+            'thumbnail_id': self.thumbnail_id,
+            'title': self.title,
+            'user': self.user,
+            'user_id': self.user_id,
+        }
+    # end def to_dict
+
+    def __reduce__(self):
+        """
+        Implements pickling, storing just the values of the `__slots__`.
+        """
+        return self._from_state, ((self._raw, self.description, self.id, self.spoiler_warning, self.thumbnail_id, self.title, self.user, self.user_id),)
+    # end def __reduce__
+
+    @classmethod
+    def _from_state(cls: Type[Gallery], state: tuple) -> Gallery:
+        """
+        Restores a pickled Gallery, see `__reduce__`.
+        """
+        instance: Gallery = cls.__new__(cls)
+        (
+            instance._raw,
+            instance.description,
+            instance.id,
+            instance.spoiler_warning,
+            instance.thumbnail_id,
+            instance.title,
+            instance.user,
+            instance.user_id,
+        ) = state
+        return instance
+    # end def _from_state
 # end class
 
 
@@ -3235,6 +4573,8 @@ class ImageErrors(DerpiModel):
     
     """
 
+    __slots__ = ('image', 'image_aspect_ratio', 'image_format', 'image_height', 'image_width', 'image_size', 'image_is_animated', 'image_mime_type', 'image_orig_sha512_hash', 'image_sha512_hash', 'tag_input', 'uploaded_image')
+
     
     """ Errors in the submitted image """
     image: list
@@ -3341,60 +4681,42 @@ class ImageErrors(DerpiModel):
         self.image_sha512_hash = image_sha512_hash
         self.tag_input = tag_input
         self.uploaded_image = uploaded_image
+        self._raw = None
     # end def __init__
 
+    _FIELDS = frozenset({'image', 'image_aspect_ratio', 'image_format', 'image_height', 'image_width', 'image_size', 'image_is_animated', 'image_mime_type', 'image_orig_sha512_hash', 'image_sha512_hash', 'tag_input', 'uploaded_image'})  # all the keys we know.
+
     @classmethod
     def prepare_dict(cls: Type[ImageErrors], data: Union[Dict[str, JSONType]]) -> Dict[str, JSONType]:
         """
         Builds a new dict with valid values for the ImageErrors constructor.
+        The given `data` is not modified.
 
         :return: new dict with valid values
         :rtype: dict
         """
-        assert_type_or_raise(data, dict, parameter_name="data")
-
-        arguments = super().prepare_dict(data) 
-        arguments['image'] = data['image']
-        arguments['image_aspect_ratio'] = data['image_aspect_ratio']
-        arguments['image_format'] = data['image_format']
-        arguments['image_height'] = data['image_height']
-        arguments['image_width'] = data['image_width']
-        arguments['image_size'] = data['image_size']
-        arguments['image_is_animated'] = data['image_is_animated']
-        arguments['image_mime_type'] = data['image_mime_type']
-        arguments['image_orig_sha512_hash'] = data['image_orig_sha512_hash']
-        arguments['image_sha512_hash'] = data['image_sha512_hash']
-        arguments['tag_input'] = data['tag_input']
-        arguments['uploaded_image'] = data['uploaded_image']
-        
-        del data['image']
-        del data['image_aspect_ratio']
-        del data['image_format']
-        del data['image_height']
-        del data['image_width']
-        del data['image_size']
-        del data['image_is_animated']
-        del data['image_mime_type']
-        del data['image_orig_sha512_hash']
-        del data['image_sha512_hash']
-        del data['tag_input']
-        del data['uploaded_image']
-
-        if data:
-            logger.warning(f'still got leftover data: {data!r}')
-            if cls._assert_consuming_all_params:
-                raise ValueError(
-                    f'the dict should be consumed completely, but still has the following elements left: {list(data.keys())!r}'
-                )
-            # end if
-        # end if
-        return arguments
+        cls._check_keys(data)
+        return {
+            'image': data['image'],
+            'image_aspect_ratio': data['image_aspect_ratio'],
+            'image_format': data['image_format'],
+            'image_height': data['image_height'],
+            'image_width': data['image_width'],
+            'image_size': data['image_size'],
+            'image_is_animated': data['image_is_animated'],
+            'image_mime_type': data['image_mime_type'],
+            'image_orig_sha512_hash': data['image_orig_sha512_hash'],
+            'image_sha512_hash': data['image_sha512_hash'],
+            'tag_input': data['tag_input'],
+            'uploaded_image': data['uploaded_image'],
+        }
     # end def prepare_dict
 
     @classmethod
     def from_dict(cls: Type[ImageErrors], data: Union[Dict, None, List[Dict]]) -> Union[ImageErrors, None]:
         """
         Deserialize a new ImageErrors from a given dictionary.
+        The given `data` is not modified. If `_keep_raw` is set, it is kept as `_raw`.
 
         :return: new ImageErrors instance.
         :rtype: ImageErrors|None
@@ -3406,9 +4728,24 @@ class ImageErrors(DerpiModel):
             return [cls.from_dict(item) for item in data]
         # end if
 
-        data: Dict = cls.prepare_dict(data)
-        instance: ImageErrors = cls(**data)
-        instance._raw = data
+        cls._check_keys(data)
+        instance: ImageErrors = cls(
+            image=data['image'],
+            image_aspect_ratio=data['image_aspect_ratio'],
+            image_format=data['image_format'],
+            image_height=data['image_height'],
+            image_width=data['image_width'],
+            image_size=data['image_size'],
+            image_is_animated=data['image_is_animated'],
+            image_mime_type=data['image_mime_type'],
+            image_orig_sha512_hash=data['image_orig_sha512_hash'],
+            image_sha512_hash=data['image_sha512_hash'],
+            tag_input=data['tag_input'],
+            uploaded_image=data['uploaded_image'],
+        )
+        if cls._keep_raw:
+            instance._raw = data
+        # end if
         return instance
     # end def from_dict
 
@@ -3427,15 +4764,74 @@ class ImageErrors(DerpiModel):
         return "{s.__class__.__name__}(image={s.image!r}, image_aspect_ratio={s.image_aspect_ratio!r}, image_format={s.image_format!r}, image_height={s.image_height!r}, image_width={s.image_width!r}, image_size={s.image_size!r}, image_is_animated={s.image_is_animated!r}, image_mime_type={s.image_mime_type!r}, image_orig_sha512_hash={s.image_orig_sha512_hash!r}, image_sha512_hash={s.image_sha512_hash!r}, tag_input={s.tag_input!r}, uploaded_image={s.uploaded_image!r})".format(s=self)
     # end def __repr__
 
-    def __eq__(self, other):
+    def fields_equal(self, other) -> bool:
         """
-        Implements equality check, i.e. `imageerrors_instance_a == imageerrors_instance_b`
+        Compares all the fields, i.e. if `imageerrors_instance_a` and `imageerrors_instance_b` hold the same data.
         """
-        if not (hasattr(other, 'image') and hasattr(other, 'image_aspect_ratio') and hasattr(other, 'image_format') and hasattr(other, 'image_height') and hasattr(other, 'image_width') and hasattr(other, 'image_size') and hasattr(other, 'image_is_animated') and hasattr(other, 'image_mime_type') and hasattr(other, 'image_orig_sha512_hash') and hasattr(other, 'image_sha512_hash') and hasattr(other, 'tag_input') and hasattr(other, 'uploaded_image')):
+        if not isinstance(other, ImageErrors):
             return False
         # end if
         return self.image == other.image and self.image_aspect_ratio == other.image_aspect_ratio and self.image_format == other.image_format and self.image_height == other.image_height and self.image_width == other.image_width and self.image_size == other.image_size and self.image_is_animated == other.image_is_animated and self.image_mime_type == other.image_mime_type and self.image_orig_sha512_hash == other.image_orig_sha512_hash and self.image_sha512_hash == other.image_sha512_hash and self.tag_input == other.tag_input and self.uploaded_image == other.uploaded_image
+    # end def fields_equal
+
+    def __eq__(self, other):
+        """
+        Implements equality check, i.e. `imageerrors_instance_a == imageerrors_instance_b`, see `fields_equal(...)`.
+        """
+        return self.fields_equal(other)
     # end __eq__
+
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        Serializes this ImageErrors to a json compatible dict, like the API returns it.
+        `ImageErrors.from_dict(...)` builds an equal ImageErrors from it.
+        """
+        return {
+            'image': to_json_value(self.image),
+            'image_aspect_ratio': to_json_value(self.image_aspect_ratio),
+            'image_format': to_json_value(self.image_format),
+            'image_height': to_json_value(self.image_height),
+            'image_width': to_json_value(self.image_width),
+            'image_size': to_json_value(self.image_size),
+            'image_is_animated': to_json_value(self.image_is_animated),
+            'image_mime_type': to_json_value(self.image_mime_type),
+            'image_orig_sha512_hash': to_json_value(self.image_orig_sha512_hash),
+            'image_sha512_hash': to_json_value(self.image_sha512_hash),
+            'tag_input': to_json_value(self.tag_input),
+            'uploaded_image': to_json_value(self.uploaded_image),
+        }
+    # end def to_dict
+
+    def __reduce__(self):
+        """
+        Implements pickling, storing just the values of the `__slots__`.
+        """
+        return self._from_state, ((self._raw, self.image, self.image_aspect_ratio, self.image_format, self.image_height, self.image_width, self.image_size, self.image_is_animated, self.image_mime_type, self.image_orig_sha512_hash, self.image_sha512_hash, self.tag_input, self.uploaded_image),)
+    # end def __reduce__
+
+    @classmethod
+    def _from_state(cls: Type[ImageErrors], state: tuple) -> ImageErrors:
+        """
+        Restores a pickled ImageErrors, see `__reduce__`.
+        """
+        instance: ImageErrors = cls.__new__(cls)
+        (
+            instance._raw,
+            instance.image,
+            instance.image_aspect_ratio,
+            instance.image_format,
+            instance.image_height,
+            instance.image_width,
+            instance.image_size,
+            instance.image_is_animated,
+            instance.image_mime_type,
+            instance.image_orig_sha512_hash,
+            instance.image_sha512_hash,
+            instance.tag_input,
+            instance.uploaded_image,
+        ) = state
+        return instance
+    # end def _from_state
 # end class
 
 
@@ -3483,6 +4879,8 @@ class Oembed(DerpiModel):
     
     """
 
+    __slots__ = ('author_name', 'author_url', 'cache_age', 'derpibooru_comments', 'derpibooru_id', 'derpibooru_score', 'derpibooru_tags', 'provider_name', 'provider_url', 'title', 'type', 'version')
+
     
     """ The comma-delimited names of the image authors. """
     author_name: str
@@ -3589,60 +4987,42 @@ class Oembed(DerpiModel):
         self.title = title
         self.type = type
         self.version = version
+        self._raw = None
     # end def __init__
 
+    _FIELDS = frozenset({'author_name', 'author_url', 'cache_age', 'derpibooru_comments', 'derpibooru_id', 'derpibooru_score', 'derpibooru_tags', 'provider_name', 'provider_url', 'title', 'type', 'version'})  # all the keys we know.
+
     @classmethod
     def prepare_dict(cls: Type[Oembed], data: Union[Dict[str, JSONType]]) -> Dict[str, JSONType]:
         """
         Builds a new dict with valid values for the Oembed constructor.
+        The given `data` is not modified.
 
         :return: new dict with valid values
         :rtype: dict
         """
-        assert_type_or_raise(data, dict, parameter_name="data")
-
-        arguments = super().prepare_dict(data) 
-        arguments['author_name'] = data['author_name']
-        arguments['author_url'] = data['author_url']
-        arguments['cache_age'] = data['cache_age']
-        arguments['derpibooru_comments'] = data['derpibooru_comments']
-        arguments['derpibooru_id'] = data['derpibooru_id']
-        arguments['derpibooru_score'] = data['derpibooru_score']
-        arguments['derpibooru_tags'] = data['derpibooru_tags']
-        arguments['provider_name'] = data['provider_name']
-        arguments['provider_url'] = data['provider_url']
-        arguments['title'] = data['title']
-        arguments['type'] = data['type']
-        arguments['version'] = data['version']
-        
-        del data['author_name']
-        del data['author_url']
-        del data['cache_age']
-        del data['derpibooru_comments']
-        del data['derpibooru_id']
-        del data['derpibooru_score']
-        del data['derpibooru_tags']
-        del data['provider_name']
-        del data['provider_url']
-        del data['title']
-        del data['type']
-        del data['version']
-
-        if data:
-            logger.warning(f'still got leftover data: {data!r}')
-            if cls._assert_consuming_all_params:
-                raise ValueError(
-                    f'the dict should be consumed completely, but still has the following elements left: {list(data.keys())!r}'
-                )
-            # end if
-        # end if
-        return arguments
+        cls._check_keys(data)
+        return {
+            'author_name': data['author_name'],
+            'author_url': data['author_url'],
+            'cache_age': data['cache_age'],
+            'derpibooru_comments': data['derpibooru_comments'],
+            'derpibooru_id': data['derpibooru_id'],
+            'derpibooru_score': data['derpibooru_score'],
+            'derpibooru_tags': data['derpibooru_tags'],
+            'provider_name': data['provider_name'],
+            'provider_url': data['provider_url'],
+            'title': data['title'],
+            'type': data['type'],
+            'version': data['version'],
+        }
     # end def prepare_dict
 
     @classmethod
     def from_dict(cls: Type[Oembed], data: Union[Dict, None, List[Dict]]) -> Union[Oembed, None]:
         """
         Deserialize a new Oembed from a given dictionary.
+        The given `data` is not modified. If `_keep_raw` is set, it is kept as `_raw`.
 
         :return: new Oembed instance.
         :rtype: Oembed|None
@@ -3654,9 +5034,24 @@ class Oembed(DerpiModel):
             return [cls.from_dict(item) for item in data]
         # end if
 
-        data: Dict = cls.prepare_dict(data)
-        instance: Oembed = cls(**data)
-        instance._raw = data
+        cls._check_keys(data)
+        instance: Oembed = cls(
+            author_name=data['author_name'],
+            author_url=data['author_url'],
+            cache_age=data['cache_age'],
+            derpibooru_comments=data['derpibooru_comments'],
+            derpibooru_id=data['derpibooru_id'],
+            derpibooru_score=data['derpibooru_score'],
+            derpibooru_tags=data['derpibooru_tags'],
+            provider_name=data['provider_name'],
+            provider_url=data['provider_url'],
+            title=data['title'],
+            type=data['type'],
+            version=data['version'],
+        )
+        if cls._keep_raw:
+            instance._raw = data
+        # end if
         return instance
     # end def from_dict
 
@@ -3675,14 +5070,1272 @@ class Oembed(DerpiModel):
         return "{s.__class__.__name__}(author_name={s.author_name!r}, author_url={s.author_url!r}, cache_age={s.cache_age!r}, derpibooru_comments={s.derpibooru_comments!r}, derpibooru_id={s.derpibooru_id!r}, derpibooru_score={s.derpibooru_score!r}, derpibooru_tags={s.derpibooru_tags!r}, provider_name={s.provider_name!r}, provider_url={s.provider_url!r}, title={s.title!r}, type={s.type!r}, version={s.version!r})".format(s=self)
     # end def __repr__
 
-    def __eq__(self, other):
+    def fields_equal(self, other) -> bool:
         """
-        Implements equality check, i.e. `oembed_instance_a == oembed_instance_b`
+        Compares all the fields, i.e. if `oembed_instance_a` and `oembed_instance_b` hold the same data.
         """
-        if not (hasattr(other, 'author_name') and hasattr(other, 'author_url') and hasattr(other, 'cache_age') and hasattr(other, 'derpibooru_comments') and hasattr(other, 'derpibooru_id') and hasattr(other, 'derpibooru_score') and hasattr(other, 'derpibooru_tags') and hasattr(other, 'provider_name') and hasattr(other, 'provider_url') and hasattr(other, 'title') and hasattr(other, 'type') and hasattr(other, 'version')):
+        if not isinstance(other, Oembed):
             return False
         # end if
         return self.author_name == other.author_name and self.author_url == other.author_url and self.cache_age == other.cache_age and self.derpibooru_comments == other.derpibooru_comments and self.derpibooru_id == other.derpibooru_id and self.derpibooru_score == other.derpibooru_score and self.derpibooru_tags == other.derpibooru_tags and self.provider_name == other.provider_name and self.provider_url == other.provider_url and self.title == other.title and self.type == other.type and self.version == other.version
+    # end def fields_equal
+
+    def __eq__(self, other):
+        """
+        Implements equality check, i.e. `oembed_instance_a == oembed_instance_b`, see `fields_equal(...)`.
+        """
+        return self.fields_equal(other)
     # end __eq__
+
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        Serializes this Oembed to a json compatible dict, like the API returns it.
+        `Oembed.from_dict(...)` builds an equal Oembed from it.
+        """
+        return {
+            'author_name': self.author_name,
+            'author_url': self.author_url,
+            'cache_age': self.cache_age,
+            'derpibooru_comments': self.derpibooru_comments,
+            'derpibooru_id': self.derpibooru_id,
+            'derpibooru_score': self.derpibooru_score,
+            'derpibooru_tags': to_json_value(self.derpibooru_tags),
+            'provider_name': self.provider_name,
+            'provider_url': self.provider_url,
+            'title': self.title,
+            'type': self.type,
+            'version': self.version,
+        }
+    # end def to_dict
+
+    def __reduce__(self):
+        """
+        Implements pickling, storing just the values of the `__slots__`.
+        """
+        return self._from_state, ((self._raw, self.author_name, self.author_url, self.cache_age, self.derpibooru_comments, self.derpibooru_id, self.derpibooru_score, self.derpibooru_tags, self.provider_name, self.provider_url, self.title, self.type, self.version),)
+    # end def __reduce__
+
+    @classmethod
+    def _from_state(cls: Type[Oembed], state: tuple) -> Oembed:
+        """
+        Restores a pickled Oembed, see `__reduce__`.
+        """
+        instance: Oembed = cls.__new__(cls)
+        (
+            instance._raw,
+            instance.author_name,
+            instance.author_url,
+            instance.cache_age,
+            instance.derpibooru_comments,
+            instance.derpibooru_id,
+            instance.derpibooru_score,
+            instance.derpibooru_tags,
+            instance.provider_name,
+            instance.provider_url,
+            instance.title,
+            instance.type,
+            instance.version,
+        ) = state
+        return instance
+    # end def _from_state
+# end class
+
+
+
+class LazyImage(Image):
+    """
+    A Image, wrapping the dict from the API and converting its fields only when they are accessed.
+    Building it is about as cheap as keeping the dict, while the attributes and equality are the same.
+    The dict is not checked for unknown keys, and missing ones only fail when they are accessed.
+    """
+    __slots__ = ('_data', '_values')
+
+    animated = LazyField('animated')
+    aspect_ratio = LazyField('aspect_ratio')
+    comment_count = LazyField('comment_count')
+    _created_at = LazyField('created_at')  # parsed by Image.created_at.
+    deletion_reason = LazyField('deletion_reason')
+    description = LazyField('description')
+    downvotes = LazyField('downvotes')
+    duplicate_of = LazyField('duplicate_of')
+    duration = LazyField('duration')
+    faves = LazyField('faves')
+    _first_seen_at = LazyField('first_seen_at')  # parsed by Image.first_seen_at.
+    format = LazyField('format')
+    height = LazyField('height')
+    hidden_from_users = LazyField('hidden_from_users')
+    id = LazyField('id')
+    intensities = LazyField('intensities', lambda value: LazyIntensities.from_dict(value))
+    mime_type = LazyField('mime_type')
+    name = LazyField('name')
+    orig_sha512_hash = LazyField('orig_sha512_hash')
+    processed = LazyField('processed')
+    representations = LazyField('representations', lambda value: LazyRepresentations.from_dict(value))
+    score = LazyField('score')
+    sha512_hash = LazyField('sha512_hash')
+    size = LazyField('size')
+    source_url = LazyField('source_url')
+    spoilered = LazyField('spoilered')
+    tag_count = LazyField('tag_count')
+    tag_ids = LazyField('tag_ids')
+    tags = LazyField('tags')
+    thumbnails_generated = LazyField('thumbnails_generated')
+    _updated_at = LazyField('updated_at')  # parsed by Image.updated_at.
+    uploader = LazyField('uploader')
+    uploader_id = LazyField('uploader_id')
+    upvotes = LazyField('upvotes')
+    view_url = LazyField('view_url')
+    width = LazyField('width')
+    wilson_score = LazyField('wilson_score')
+
+    def __init__(self, data: Dict[str, JSONType]):
+        """
+        :param data: The dict as returned by the API. It is not modified.
+        """
+        self._data = data
+        self._values = None
+        self._raw = data if self._keep_raw else None
+    # end def __init__
+
+    @classmethod
+    def from_dict(cls: Type[LazyImage], data: Union[Dict, None, List[Dict]]) -> Union[LazyImage, None]:
+        """
+        Wraps a given dictionary in a new LazyImage.
+
+        :return: new LazyImage instance.
+        :rtype: LazyImage|None
+        """
+        if not data:  # None or {}
+            return None
+        # end if
+        if isinstance(data, list):
+            return [cls(item) for item in data]
+        # end if
+        if not isinstance(data, dict):
+            raise TypeError(f'Parameter "data" should be type dict, but is type {type(data)!r}: {data!r}')
+        # end if
+        return cls(data)
+    # end def from_dict
+
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        Serializes this LazyImage to a json compatible dict, like the API returns it.
+        If nothing was accessed or changed yet, that's just a copy of the wrapped dict.
+        """
+        if self._values is None:
+            return dict(self._data)
+        # end if
+        return super().to_dict()
+    # end def to_dict
+
+    def __reduce__(self):
+        """
+        Implements pickling, storing the wrapped dict and the values converted or changed so far.
+        """
+        return self._from_lazy_state, (self._data, self._values, self._raw)
+    # end def __reduce__
+
+    @classmethod
+    def _from_lazy_state(cls: Type[LazyImage], data: Dict[str, JSONType], values: Union[Dict, None], raw: Union[Dict, None]) -> LazyImage:
+        """
+        Restores a pickled LazyImage, see `__reduce__`.
+        """
+        instance: LazyImage = cls(data)
+        instance._values = values
+        instance._raw = raw
+        return instance
+    # end def _from_lazy_state
+# end class
+
+
+class LazyRepresentations(Representations):
+    """
+    A Representations, wrapping the dict from the API and converting its fields only when they are accessed.
+    Building it is about as cheap as keeping the dict, while the attributes and equality are the same.
+    The dict is not checked for unknown keys, and missing ones only fail when they are accessed.
+    """
+    __slots__ = ('_data', '_values')
+
+    full = LazyField('full')
+    large = LazyField('large')
+    medium = LazyField('medium')
+    small = LazyField('small')
+    tall = LazyField('tall')
+    thumb = LazyField('thumb')
+    thumb_small = LazyField('thumb_small')
+    thumb_tiny = LazyField('thumb_tiny')
+    mp4 = LazyField('mp4')
+    webm = LazyField('webm')
+
+    def __init__(self, data: Dict[str, JSONType]):
+        """
+        :param data: The dict as returned by the API. It is not modified.
+        """
+        self._data = data
+        self._values = None
+        self._raw = data if self._keep_raw else None
+    # end def __init__
+
+    @classmethod
+    def from_dict(cls: Type[LazyRepresentations], data: Union[Dict, None, List[Dict]]) -> Union[LazyRepresentations, None]:
+        """
+        Wraps a given dictionary in a new LazyRepresentations.
+
+        :return: new LazyRepresentations instance.
+        :rtype: LazyRepresentations|None
+        """
+        if not data:  # None or {}
+            return None
+        # end if
+        if isinstance(data, list):
+            return [cls(item) for item in data]
+        # end if
+        if not isinstance(data, dict):
+            raise TypeError(f'Parameter "data" should be type dict, but is type {type(data)!r}: {data!r}')
+        # end if
+        return cls(data)
+    # end def from_dict
+
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        Serializes this LazyRepresentations to a json compatible dict, like the API returns it.
+        If nothing was accessed or changed yet, that's just a copy of the wrapped dict.
+        """
+        if self._values is None:
+            return dict(self._data)
+        # end if
+        return super().to_dict()
+    # end def to_dict
+
+    def __reduce__(self):
+        """
+        Implements pickling, storing the wrapped dict and the values converted or changed so far.
+        """
+        return self._from_lazy_state, (self._data, self._values, self._raw)
+    # end def __reduce__
+
+    @classmethod
+    def _from_lazy_state(cls: Type[LazyRepresentations], data: Dict[str, JSONType], values: Union[Dict, None], raw: Union[Dict, None]) -> LazyRepresentations:
+        """
+        Restores a pickled LazyRepresentations, see `__reduce__`.
+        """
+        instance: LazyRepresentations = cls(data)
+        instance._values = values
+        instance._raw = raw
+        return instance
+    # end def _from_lazy_state
+# end class
+
+
+class LazyIntensities(Intensities):
+    """
+    A Intensities, wrapping the dict from the API and converting its fields only when they are accessed.
+    Building it is about as cheap as keeping the dict, while the attributes and equality are the same.
+    The dict is not checked for unknown keys, and missing ones only fail when they are accessed.
+    """
+    __slots__ = ('_data', '_values')
+
+    ne = LazyField('ne')
+    nw = LazyField('nw')
+    se = LazyField('se')
+    sw = LazyField('sw')
+
+    def __init__(self, data: Dict[str, JSONType]):
+        """
+        :param data: The dict as returned by the API. It is not modified.
+        """
+        self._data = data
+        self._values = None
+        self._raw = data if self._keep_raw else None
+    # end def __init__
+
+    @classmethod
+    def from_dict(cls: Type[LazyIntensities], data: Union[Dict, None, List[Dict]]) -> Union[LazyIntensities, None]:
+        """
+        Wraps a given dictionary in a new LazyIntensities.
+
+        :return: new LazyIntensities instance.
+        :rtype: LazyIntensities|None
+        """
+        if not data:  # None or {}
+            return None
+        # end if
+        if isinstance(data, list):
+            return [cls(item) for item in data]
+        # end if
+        if not isinstance(data, dict):
+            raise TypeError(f'Parameter "data" should be type dict, but is type {type(data)!r}: {data!r}')
+        # end if
+        return cls(data)
+    # end def from_dict
+
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        Serializes this LazyIntensities to a json compatible dict, like the API returns it.
+        If nothing was accessed or changed yet, that's just a copy of the wrapped dict.
+        """
+        if self._values is None:
+            return dict(self._data)
+        # end if
+        return super().to_dict()
+    # end def to_dict
+
+    def __reduce__(self):
+        """
+        Implements pickling, storing the wrapped dict and the values converted or changed so far.
+        """
+        return self._from_lazy_state, (self._data, self._values, self._raw)
+    # end def __reduce__
+
+    @classmethod
+    def _from_lazy_state(cls: Type[LazyIntensities], data: Dict[str, JSONType], values: Union[Dict, None], raw: Union[Dict, None]) -> LazyIntensities:
+        """
+        Restores a pickled LazyIntensities, see `__reduce__`.
+        """
+        instance: LazyIntensities = cls(data)
+        instance._values = values
+        instance._raw = raw
+        return instance
+    # end def _from_lazy_state
+# end class
+
+
+class LazyComment(Comment):
+    """
+    A Comment, wrapping the dict from the API and converting its fields only when they are accessed.
+    Building it is about as cheap as keeping the dict, while the attributes and equality are the same.
+    The dict is not checked for unknown keys, and missing ones only fail when they are accessed.
+    """
+    __slots__ = ('_data', '_values')
+
+    author = LazyField('author')
+    avatar = LazyField('avatar')
+    body = LazyField('body')
+    _created_at = LazyField('created_at')  # parsed by Comment.created_at.
+    edit_reason = LazyField('edit_reason')
+    _edited_at = LazyField('edited_at')  # parsed by Comment.edited_at.
+    id = LazyField('id')
+    image_id = LazyField('image_id')
+    _updated_at = LazyField('updated_at')  # parsed by Comment.updated_at.
+    user_id = LazyField('user_id')
+
+    def __init__(self, data: Dict[str, JSONType]):
+        """
+        :param data: The dict as returned by the API. It is not modified.
+        """
+        self._data = data
+        self._values = None
+        self._raw = data if self._keep_raw else None
+    # end def __init__
+
+    @classmethod
+    def from_dict(cls: Type[LazyComment], data: Union[Dict, None, List[Dict]]) -> Union[LazyComment, None]:
+        """
+        Wraps a given dictionary in a new LazyComment.
+
+        :return: new LazyComment instance.
+        :rtype: LazyComment|None
+        """
+        if not data:  # None or {}
+            return None
+        # end if
+        if isinstance(data, list):
+            return [cls(item) for item in data]
+        # end if
+        if not isinstance(data, dict):
+            raise TypeError(f'Parameter "data" should be type dict, but is type {type(data)!r}: {data!r}')
+        # end if
+        return cls(data)
+    # end def from_dict
+
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        Serializes this LazyComment to a json compatible dict, like the API returns it.
+        If nothing was accessed or changed yet, that's just a copy of the wrapped dict.
+        """
+        if self._values is None:
+            return dict(self._data)
+        # end if
+        return super().to_dict()
+    # end def to_dict
+
+    def __reduce__(self):
+        """
+        Implements pickling, storing the wrapped dict and the values converted or changed so far.
+        """
+        return self._from_lazy_state, (self._data, self._values, self._raw)
+    # end def __reduce__
+
+    @classmethod
+    def _from_lazy_state(cls: Type[LazyComment], data: Dict[str, JSONType], values: Union[Dict, None], raw: Union[Dict, None]) -> LazyComment:
+        """
+        Restores a pickled LazyComment, see `__reduce__`.
+        """
+        instance: LazyComment = cls(data)
+        instance._values = values
+        instance._raw = raw
+        return instance
+    # end def _from_lazy_state
+# end class
+
+
+class LazyForum(Forum):
+    """
+    A Forum, wrapping the dict from the API and converting its fields only when they are accessed.
+    Building it is about as cheap as keeping the dict, while the attributes and equality are the same.
+    The dict is not checked for unknown keys, and missing ones only fail when they are accessed.
+    """
+    __slots__ = ('_data', '_values')
+
+    name = LazyField('name')
+    short_name = LazyField('short_name')
+    description = LazyField('description')
+    topic_count = LazyField('topic_count')
+    post_count = LazyField('post_count')
+
+    def __init__(self, data: Dict[str, JSONType]):
+        """
+        :param data: The dict as returned by the API. It is not modified.
+        """
+        self._data = data
+        self._values = None
+        self._raw = data if self._keep_raw else None
+    # end def __init__
+
+    @classmethod
+    def from_dict(cls: Type[LazyForum], data: Union[Dict, None, List[Dict]]) -> Union[LazyForum, None]:
+        """
+        Wraps a given dictionary in a new LazyForum.
+
+        :return: new LazyForum instance.
+        :rtype: LazyForum|None
+        """
+        if not data:  # None or {}
+            return None
+        # end if
+        if isinstance(data, list):
+            return [cls(item) for item in data]
+        # end if
+        if not isinstance(data, dict):
+            raise TypeError(f'Parameter "data" should be type dict, but is type {type(data)!r}: {data!r}')
+        # end if
+        return cls(data)
+    # end def from_dict
+
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        Serializes this LazyForum to a json compatible dict, like the API returns it.
+        If nothing was accessed or changed yet, that's just a copy of the wrapped dict.
+        """
+        if self._values is None:
+            return dict(self._data)
+        # end if
+        return super().to_dict()
+    # end def to_dict
+
+    def __reduce__(self):
+        """
+        Implements pickling, storing the wrapped dict and the values converted or changed so far.
+        """
+        return self._from_lazy_state, (self._data, self._values, self._raw)
+    # end def __reduce__
+
+    @classmethod
+    def _from_lazy_state(cls: Type[LazyForum], data: Dict[str, JSONType], values: Union[Dict, None], raw: Union[Dict, None]) -> LazyForum:
+        """
+        Restores a pickled LazyForum, see `__reduce__`.
+        """
+        instance: LazyForum = cls(data)
+        instance._values = values
+        instance._raw = raw
+        return instance
+    # end def _from_lazy_state
+# end class
+
+
+class LazyTopic(Topic):
+    """
+    A Topic, wrapping the dict from the API and converting its fields only when they are accessed.
+    Building it is about as cheap as keeping the dict, while the attributes and equality are the same.
+    The dict is not checked for unknown keys, and missing ones only fail when they are accessed.
+    """
+    __slots__ = ('_data', '_values')
+
+    slug = LazyField('slug')
+    title = LazyField('title')
+    post_count = LazyField('post_count')
+    view_count = LazyField('view_count')
+    sticky = LazyField('sticky')
+    _last_replied_to_at = LazyField('last_replied_to_at')  # parsed by Topic.last_replied_to_at.
+    locked = LazyField('locked')
+    user_id = LazyField('user_id')
+    author = LazyField('author')
+
+    def __init__(self, data: Dict[str, JSONType]):
+        """
+        :param data: The dict as returned by the API. It is not modified.
+        """
+        self._data = data
+        self._values = None
+        self._raw = data if self._keep_raw else None
+    # end def __init__
+
+    @classmethod
+    def from_dict(cls: Type[LazyTopic], data: Union[Dict, None, List[Dict]]) -> Union[LazyTopic, None]:
+        """
+        Wraps a given dictionary in a new LazyTopic.
+
+        :return: new LazyTopic instance.
+        :rtype: LazyTopic|None
+        """
+        if not data:  # None or {}
+            return None
+        # end if
+        if isinstance(data, list):
+            return [cls(item) for item in data]
+        # end if
+        if not isinstance(data, dict):
+            raise TypeError(f'Parameter "data" should be type dict, but is type {type(data)!r}: {data!r}')
+        # end if
+        return cls(data)
+    # end def from_dict
+
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        Serializes this LazyTopic to a json compatible dict, like the API returns it.
+        If nothing was accessed or changed yet, that's just a copy of the wrapped dict.
+        """
+        if self._values is None:
+            return dict(self._data)
+        # end if
+        return super().to_dict()
+    # end def to_dict
+
+    def __reduce__(self):
+        """
+        Implements pickling, storing the wrapped dict and the values converted or changed so far.
+        """
+        return self._from_lazy_state, (self._data, self._values, self._raw)
+    # end def __reduce__
+
+    @classmethod
+    def _from_lazy_state(cls: Type[LazyTopic], data: Dict[str, JSONType], values: Union[Dict, None], raw: Union[Dict, None]) -> LazyTopic:
+        """
+        Restores a pickled LazyTopic, see `__reduce__`.
+        """
+        instance: LazyTopic = cls(data)
+        instance._values = values
+        instance._raw = raw
+        return instance
+    # end def _from_lazy_state
+# end class
+
+
+class LazyPost(Post):
+    """
+    A Post, wrapping the dict from the API and converting its fields only when they are accessed.
+    Building it is about as cheap as keeping the dict, while the attributes and equality are the same.
+    The dict is not checked for unknown keys, and missing ones only fail when they are accessed.
+    """
+    __slots__ = ('_data', '_values')
+
+    author = LazyField('author')
+    avatar = LazyField('avatar')
+    body = LazyField('body')
+    _created_at = LazyField('created_at')  # parsed by Post.created_at.
+    edit_reason = LazyField('edit_reason')
+    _edited_at = LazyField('edited_at')  # parsed by Post.edited_at.
+    id = LazyField('id')
+    _updated_at = LazyField('updated_at')  # parsed by Post.updated_at.
+    user_id = LazyField('user_id')
+
+    def __init__(self, data: Dict[str, JSONType]):
+        """
+        :param data: The dict as returned by the API. It is not modified.
+        """
+        self._data = data
+        self._values = None
+        self._raw = data if self._keep_raw else None
+    # end def __init__
+
+    @classmethod
+    def from_dict(cls: Type[LazyPost], data: Union[Dict, None, List[Dict]]) -> Union[LazyPost, None]:
+        """
+        Wraps a given dictionary in a new LazyPost.
+
+        :return: new LazyPost instance.
+        :rtype: LazyPost|None
+        """
+        if not data:  # None or {}
+            return None
+        # end if
+        if isinstance(data, list):
+            return [cls(item) for item in data]
+        # end if
+        if not isinstance(data, dict):
+            raise TypeError(f'Parameter "data" should be type dict, but is type {type(data)!r}: {data!r}')
+        # end if
+        return cls(data)
+    # end def from_dict
+
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        Serializes this LazyPost to a json compatible dict, like the API returns it.
+        If nothing was accessed or changed yet, that's just a copy of the wrapped dict.
+        """
+        if self._values is None:
+            return dict(self._data)
+        # end if
+        return super().to_dict()
+    # end def to_dict
+
+    def __reduce__(self):
+        """
+        Implements pickling, storing the wrapped dict and the values converted or changed so far.
+        """
+        return self._from_lazy_state, (self._data, self._values, self._raw)
+    # end def __reduce__
+
+    @classmethod
+    def _from_lazy_state(cls: Type[LazyPost], data: Dict[str, JSONType], values: Union[Dict, None], raw: Union[Dict, None]) -> LazyPost:
+        """
+        Restores a pickled LazyPost, see `__reduce__`.
+        """
+        instance: LazyPost = cls(data)
+        instance._values = values
+        instance._raw = raw
+        return instance
+    # end def _from_lazy_state
+# end class
+
+
+class LazyTag(Tag):
+    """
+    A Tag, wrapping the dict from the API and converting its fields only when they are accessed.
+    Building it is about as cheap as keeping the dict, while the attributes and equality are the same.
+    The dict is not checked for unknown keys, and missing ones only fail when they are accessed.
+    """
+    __slots__ = ('_data', '_values')
+
+    aliased_tag = LazyField('aliased_tag')
+    aliases = LazyField('aliases')
+    category = LazyField('category')
+    description = LazyField('description')
+    dnp_entries = LazyField('dnp_entries')
+    id = LazyField('id')
+    images = LazyField('images')
+    implied_by_tags = LazyField('implied_by_tags')
+    implied_tags = LazyField('implied_tags')
+    name = LazyField('name')
+    name_in_namespace = LazyField('name_in_namespace')
+    namespace = LazyField('namespace')
+    short_description = LazyField('short_description')
+    slug = LazyField('slug')
+    spoiler_image_uri = LazyField('spoiler_image_uri')
+
+    def __init__(self, data: Dict[str, JSONType]):
+        """
+        :param data: The dict as returned by the API. It is not modified.
+        """
+        self._data = data
+        self._values = None
+        self._raw = data if self._keep_raw else None
+    # end def __init__
+
+    @classmethod
+    def from_dict(cls: Type[LazyTag], data: Union[Dict, None, List[Dict]]) -> Union[LazyTag, None]:
+        """
+        Wraps a given dictionary in a new LazyTag.
+
+        :return: new LazyTag instance.
+        :rtype: LazyTag|None
+        """
+        if not data:  # None or {}
+            return None
+        # end if
+        if isinstance(data, list):
+            return [cls(item) for item in data]
+        # end if
+        if not isinstance(data, dict):
+            raise TypeError(f'Parameter "data" should be type dict, but is type {type(data)!r}: {data!r}')
+        # end if
+        return cls(data)
+    # end def from_dict
+
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        Serializes this LazyTag to a json compatible dict, like the API returns it.
+        If nothing was accessed or changed yet, that's just a copy of the wrapped dict.
+        """
+        if self._values is None:
+            return dict(self._data)
+        # end if
+        return super().to_dict()
+    # end def to_dict
+
+    def __reduce__(self):
+        """
+        Implements pickling, storing the wrapped dict and the values converted or changed so far.
+        """
+        return self._from_lazy_state, (self._data, self._values, self._raw)
+    # end def __reduce__
+
+    @classmethod
+    def _from_lazy_state(cls: Type[LazyTag], data: Dict[str, JSONType], values: Union[Dict, None], raw: Union[Dict, None]) -> LazyTag:
+        """
+        Restores a pickled LazyTag, see `__reduce__`.
+        """
+        instance: LazyTag = cls(data)
+        instance._values = values
+        instance._raw = raw
+        return instance
+    # end def _from_lazy_state
+# end class
+
+
+class LazyUser(User):
+    """
+    A User, wrapping the dict from the API and converting its fields only when they are accessed.
+    Building it is about as cheap as keeping the dict, while the attributes and equality are the same.
+    The dict is not checked for unknown keys, and missing ones only fail when they are accessed.
+    """
+    __slots__ = ('_data', '_values')
+
+    id = LazyField('id')
+    name = LazyField('name')
+    slug = LazyField('slug')
+    role = LazyField('role')
+    description = LazyField('description')
+    avatar_url = LazyField('avatar_url')
+    _created_at = LazyField('created_at')  # parsed by User.created_at.
+    comments_count = LazyField('comments_count')
+    uploads_count = LazyField('uploads_count')
+    posts_count = LazyField('posts_count')
+    topics_count = LazyField('topics_count')
+    links = LazyField('links', lambda value: LazyLinks.from_dict(value))
+    awards = LazyField('awards', lambda value: LazyAwards.from_dict(value))
+
+    def __init__(self, data: Dict[str, JSONType]):
+        """
+        :param data: The dict as returned by the API. It is not modified.
+        """
+        self._data = data
+        self._values = None
+        self._raw = data if self._keep_raw else None
+    # end def __init__
+
+    @classmethod
+    def from_dict(cls: Type[LazyUser], data: Union[Dict, None, List[Dict]]) -> Union[LazyUser, None]:
+        """
+        Wraps a given dictionary in a new LazyUser.
+
+        :return: new LazyUser instance.
+        :rtype: LazyUser|None
+        """
+        if not data:  # None or {}
+            return None
+        # end if
+        if isinstance(data, list):
+            return [cls(item) for item in data]
+        # end if
+        if not isinstance(data, dict):
+            raise TypeError(f'Parameter "data" should be type dict, but is type {type(data)!r}: {data!r}')
+        # end if
+        return cls(data)
+    # end def from_dict
+
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        Serializes this LazyUser to a json compatible dict, like the API returns it.
+        If nothing was accessed or changed yet, that's just a copy of the wrapped dict.
+        """
+        if self._values is None:
+            return dict(self._data)
+        # end if
+        return super().to_dict()
+    # end def to_dict
+
+    def __reduce__(self):
+        """
+        Implements pickling, storing the wrapped dict and the values converted or changed so far.
+        """
+        return self._from_lazy_state, (self._data, self._values, self._raw)
+    # end def __reduce__
+
+    @classmethod
+    def _from_lazy_state(cls: Type[LazyUser], data: Dict[str, JSONType], values: Union[Dict, None], raw: Union[Dict, None]) -> LazyUser:
+        """
+        Restores a pickled LazyUser, see `__reduce__`.
+        """
+        instance: LazyUser = cls(data)
+        instance._values = values
+        instance._raw = raw
+        return instance
+    # end def _from_lazy_state
+# end class
+
+
+class LazyFilter(Filter):
+    """
+    A Filter, wrapping the dict from the API and converting its fields only when they are accessed.
+    Building it is about as cheap as keeping the dict, while the attributes and equality are the same.
+    The dict is not checked for unknown keys, and missing ones only fail when they are accessed.
+    """
+    __slots__ = ('_data', '_values')
+
+    id = LazyField('id')
+    name = LazyField('name')
+    description = LazyField('description')
+    user_id = LazyField('user_id')
+    user_count = LazyField('user_count')
+    system = LazyField('system')
+    public = LazyField('public')
+    spoilered_tag_ids = LazyField('spoilered_tag_ids')
+    spoilered_complex = LazyField('spoilered_complex')
+    hidden_tag_ids = LazyField('hidden_tag_ids')
+    hidden_complex = LazyField('hidden_complex')
+
+    def __init__(self, data: Dict[str, JSONType]):
+        """
+        :param data: The dict as returned by the API. It is not modified.
+        """
+        self._data = data
+        self._values = None
+        self._raw = data if self._keep_raw else None
+    # end def __init__
+
+    @classmethod
+    def from_dict(cls: Type[LazyFilter], data: Union[Dict, None, List[Dict]]) -> Union[LazyFilter, None]:
+        """
+        Wraps a given dictionary in a new LazyFilter.
+
+        :return: new LazyFilter instance.
+        :rtype: LazyFilter|None
+        """
+        if not data:  # None or {}
+            return None
+        # end if
+        if isinstance(data, list):
+            return [cls(item) for item in data]
+        # end if
+        if not isinstance(data, dict):
+            raise TypeError(f'Parameter "data" should be type dict, but is type {type(data)!r}: {data!r}')
+        # end if
+        return cls(data)
+    # end def from_dict
+
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        Serializes this LazyFilter to a json compatible dict, like the API returns it.
+        If nothing was accessed or changed yet, that's just a copy of the wrapped dict.
+        """
+        if self._values is None:
+            return dict(self._data)
+        # end if
+        return super().to_dict()
+    # end def to_dict
+
+    def __reduce__(self):
+        """
+        Implements pickling, storing the wrapped dict and the values converted or changed so far.
+        """
+        return self._from_lazy_state, (self._data, self._values, self._raw)
+    # end def __reduce__
+
+    @classmethod
+    def _from_lazy_state(cls: Type[LazyFilter], data: Dict[str, JSONType], values: Union[Dict, None], raw: Union[Dict, None]) -> LazyFilter:
+        """
+        Restores a pickled LazyFilter, see `__reduce__`.
+        """
+        instance: LazyFilter = cls(data)
+        instance._values = values
+        instance._raw = raw
+        return instance
+    # end def _from_lazy_state
+# end class
+
+
+class LazyLinks(Links):
+    """
+    A Links, wrapping the dict from the API and converting its fields only when they are accessed.
+    Building it is about as cheap as keeping the dict, while the attributes and equality are the same.
+    The dict is not checked for unknown keys, and missing ones only fail when they are accessed.
+    """
+    __slots__ = ('_data', '_values')
+
+    user_id = LazyField('user_id')
+    _created_at = LazyField('created_at')  # parsed by Links.created_at.
+    state = LazyField('state')
+    tag_id = LazyField('tag_id')
+
+    def __init__(self, data: Dict[str, JSONType]):
+        """
+        :param data: The dict as returned by the API. It is not modified.
+        """
+        self._data = data
+        self._values = None
+        self._raw = data if self._keep_raw else None
+    # end def __init__
+
+    @classmethod
+    def from_dict(cls: Type[LazyLinks], data: Union[Dict, None, List[Dict]]) -> Union[LazyLinks, None]:
+        """
+        Wraps a given dictionary in a new LazyLinks.
+
+        :return: new LazyLinks instance.
+        :rtype: LazyLinks|None
+        """
+        if not data:  # None or {}
+            return None
+        # end if
+        if isinstance(data, list):
+            return [cls(item) for item in data]
+        # end if
+        if not isinstance(data, dict):
+            raise TypeError(f'Parameter "data" should be type dict, but is type {type(data)!r}: {data!r}')
+        # end if
+        return cls(data)
+    # end def from_dict
+
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        Serializes this LazyLinks to a json compatible dict, like the API returns it.
+        If nothing was accessed or changed yet, that's just a copy of the wrapped dict.
+        """
+        if self._values is None:
+            return dict(self._data)
+        # end if
+        return super().to_dict()
+    # end def to_dict
+
+    def __reduce__(self):
+        """
+        Implements pickling, storing the wrapped dict and the values converted or changed so far.
+        """
+        return self._from_lazy_state, (self._data, self._values, self._raw)
+    # end def __reduce__
+
+    @classmethod
+    def _from_lazy_state(cls: Type[LazyLinks], data: Dict[str, JSONType], values: Union[Dict, None], raw: Union[Dict, None]) -> LazyLinks:
+        """
+        Restores a pickled LazyLinks, see `__reduce__`.
+        """
+        instance: LazyLinks = cls(data)
+        instance._values = values
+        instance._raw = raw
+        return instance
+    # end def _from_lazy_state
+# end class
+
+
+class LazyAwards(Awards):
+    """
+    A Awards, wrapping the dict from the API and converting its fields only when they are accessed.
+    Building it is about as cheap as keeping the dict, while the attributes and equality are the same.
+    The dict is not checked for unknown keys, and missing ones only fail when they are accessed.
+    """
+    __slots__ = ('_data', '_values')
+
+    image_url = LazyField('image_url')
+    title = LazyField('title')
+    id = LazyField('id')
+    label = LazyField('label')
+    _awarded_on = LazyField('awarded_on')  # parsed by Awards.awarded_on.
+
+    def __init__(self, data: Dict[str, JSONType]):
+        """
+        :param data: The dict as returned by the API. It is not modified.
+        """
+        self._data = data
+        self._values = None
+        self._raw = data if self._keep_raw else None
+    # end def __init__
+
+    @classmethod
+    def from_dict(cls: Type[LazyAwards], data: Union[Dict, None, List[Dict]]) -> Union[LazyAwards, None]:
+        """
+        Wraps a given dictionary in a new LazyAwards.
+
+        :return: new LazyAwards instance.
+        :rtype: LazyAwards|None
+        """
+        if not data:  # None or {}
+            return None
+        # end if
+        if isinstance(data, list):
+            return [cls(item) for item in data]
+        # end if
+        if not isinstance(data, dict):
+            raise TypeError(f'Parameter "data" should be type dict, but is type {type(data)!r}: {data!r}')
+        # end if
+        return cls(data)
+    # end def from_dict
+
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        Serializes this LazyAwards to a json compatible dict, like the API returns it.
+        If nothing was accessed or changed yet, that's just a copy of the wrapped dict.
+        """
+        if self._values is None:
+            return dict(self._data)
+        # end if
+        return super().to_dict()
+    # end def to_dict
+
+    def __reduce__(self):
+        """
+        Implements pickling, storing the wrapped dict and the values converted or changed so far.
+        """
+        return self._from_lazy_state, (self._data, self._values, self._raw)
+    # end def __reduce__
+
+    @classmethod
+    def _from_lazy_state(cls: Type[LazyAwards], data: Dict[str, JSONType], values: Union[Dict, None], raw: Union[Dict, None]) -> LazyAwards:
+        """
+        Restores a pickled LazyAwards, see `__reduce__`.
+        """
+        instance: LazyAwards = cls(data)
+        instance._values = values
+        instance._raw = raw
+        return instance
+    # end def _from_lazy_state
+# end class
+
+
+class LazyGallery(Gallery):
+    """
+    A Gallery, wrapping the dict from the API and converting its fields only when they are accessed.
+    Building it is about as cheap as keeping the dict, while the attributes and equality are the same.
+    The dict is not checked for unknown keys, and missing ones only fail when they are accessed.
+    """
+    __slots__ = ('_data', '_values')
+
+    description = LazyField('description')
+    id = LazyField('id')
+    spoiler_warning = LazyField('spoiler_warning')
+    thumbnail_id = LazyField('thumbnail_id')
+    title = LazyField('title')
+    user = LazyField('user')
+    user_id = LazyField('user_id')
+
+    def __init__(self, data: Dict[str, JSONType]):
+        """
+        :param data: The dict as returned by the API. It is not modified.
+        """
+        self._data = data
+        self._values = None
+        self._raw = data if self._keep_raw else None
+    # end def __init__
+
+    @classmethod
+    def from_dict(cls: Type[LazyGallery], data: Union[Dict, None, List[Dict]]) -> Union[LazyGallery, None]:
+        """
+        Wraps a given dictionary in a new LazyGallery.
+
+        :return: new LazyGallery instance.
+        :rtype: LazyGallery|None
+        """
+        if not data:  # None or {}
+            return None
+        # end if
+        if isinstance(data, list):
+            return [cls(item) for item in data]
+        # end if
+        if not isinstance(data, dict):
+            raise TypeError(f'Parameter "data" should be type dict, but is type {type(data)!r}: {data!r}')
+        # end if
+        return cls(data)
+    # end def from_dict
+
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        Serializes this LazyGallery to a json compatible dict, like the API returns it.
+        If nothing was accessed or changed yet, that's just a copy of the wrapped dict.
+        """
+        if self._values is None:
+            return dict(self._data)
+        # end if
+        return super().to_dict()
+    # end def to_dict
+
+    def __reduce__(self):
+        """
+        Implements pickling, storing the wrapped dict and the values converted or changed so far.
+        """
+        return self._from_lazy_state, (self._data, self._values, self._raw)
+    # end def __reduce__
+
+    @classmethod
+    def _from_lazy_state(cls: Type[LazyGallery], data: Dict[str, JSONType], values: Union[Dict, None], raw: Union[Dict, None]) -> LazyGallery:
+        """
+        Restores a pickled LazyGallery, see `__reduce__`.
+        """
+        instance: LazyGallery = cls(data)
+        instance._values = values
+        instance._raw = raw
+        return instance
+    # end def _from_lazy_state
+# end class
+
+
+class LazyImageErrors(ImageErrors):
+    """
+    A ImageErrors, wrapping the dict from the API and converting its fields only when they are accessed.
+    Building it is about as cheap as keeping the dict, while the attributes and equality are the same.
+    The dict is not checked for unknown keys, and missing ones only fail when they are accessed.
+    """
+    __slots__ = ('_data', '_values')
+
+    image = LazyField('image')
+    image_aspect_ratio = LazyField('image_aspect_ratio')
+    image_format = LazyField('image_format')
+    image_height = LazyField('image_height')
+    image_width = LazyField('image_width')
+    image_size = LazyField('image_size')
+    image_is_animated = LazyField('image_is_animated')
+    image_mime_type = LazyField('image_mime_type')
+    image_orig_sha512_hash = LazyField('image_orig_sha512_hash')
+    image_sha512_hash = LazyField('image_sha512_hash')
+    tag_input = LazyField('tag_input')
+    uploaded_image = LazyField('uploaded_image')
+
+    def __init__(self, data: Dict[str, JSONType]):
+        """
+        :param data: The dict as returned by the API. It is not modified.
+        """
+        self._data = data
+        self._values = None
+        self._raw = data if self._keep_raw else None
+    # end def __init__
+
+    @classmethod
+    def from_dict(cls: Type[LazyImageErrors], data: Union[Dict, None, List[Dict]]) -> Union[LazyImageErrors, None]:
+        """
+        Wraps a given dictionary in a new LazyImageErrors.
+
+        :return: new LazyImageErrors instance.
+        :rtype: LazyImageErrors|None
+        """
+        if not data:  # None or {}
+            return None
+        # end if
+        if isinstance(data, list):
+            return [cls(item) for item in data]
+        # end if
+        if not isinstance(data, dict):
+            raise TypeError(f'Parameter "data" should be type dict, but is type {type(data)!r}: {data!r}')
+        # end if
+        return cls(data)
+    # end def from_dict
+
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        Serializes this LazyImageErrors to a json compatible dict, like the API returns it.
+        If nothing was accessed or changed yet, that's just a copy of the wrapped dict.
+        """
+        if self._values is None:
+            return dict(self._data)
+        # end if
+        return super().to_dict()
+    # end def to_dict
+
+    def __reduce__(self):
+        """
+        Implements pickling, storing the wrapped dict and the values converted or changed so far.
+        """
+        return self._from_lazy_state, (self._data, self._values, self._raw)
+    # end def __reduce__
+
+    @classmethod
+    def _from_lazy_state(cls: Type[LazyImageErrors], data: Dict[str, JSONType], values: Union[Dict, None], raw: Union[Dict, None]) -> LazyImageErrors:
+        """
+        Restores a pickled LazyImageErrors, see `__reduce__`.
+        """
+        instance: LazyImageErrors = cls(data)
+        instance._values = values
+        instance._raw = raw
+        return instance
+    # end def _from_lazy_state
+# end class
+
+
+class LazyOembed(Oembed):
+    """
+    A Oembed, wrapping the dict from the API and converting its fields only when they are accessed.
+    Building it is about as cheap as keeping the dict, while the attributes and equality are the same.
+    The dict is not checked for unknown keys, and missing ones only fail when they are accessed.
+    """
+    __slots__ = ('_data', '_values')
+
+    author_name = LazyField('author_name')
+    author_url = LazyField('author_url')
+    cache_age = LazyField('cache_age')
+    derpibooru_comments = LazyField('derpibooru_comments')
+    derpibooru_id = LazyField('derpibooru_id')
+    derpibooru_score = LazyField('derpibooru_score')
+    derpibooru_tags = LazyField('derpibooru_tags')
+    provider_name = LazyField('provider_name')
+    provider_url = LazyField('provider_url')
+    title = LazyField('title')
+    type = LazyField('type')
+    version = LazyField('version')
+
+    def __init__(self, data: Dict[str, JSONType]):
+        """
+        :param data: The dict as returned by the API. It is not modified.
+        """
+        self._data = data
+        self._values = None
+        self._raw = data if self._keep_raw else None
+    # end def __init__
+
+    @classmethod
+    def from_dict(cls: Type[LazyOembed], data: Union[Dict, None, List[Dict]]) -> Union[LazyOembed, None]:
+        """
+        Wraps a given dictionary in a new LazyOembed.
+
+        :return: new LazyOembed instance.
+        :rtype: LazyOembed|None
+        """
+        if not data:  # None or {}
+            return None
+        # end if
+        if isinstance(data, list):
+            return [cls(item) for item in data]
+        # end if
+        if not isinstance(data, dict):
+            raise TypeError(f'Parameter "data" should be type dict, but is type {type(data)!r}: {data!r}')
+        # end if
+        return cls(data)
+    # end def from_dict
+
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        Serializes this LazyOembed to a json compatible dict, like the API returns it.
+        If nothing was accessed or changed yet, that's just a copy of the wrapped dict.
+        """
+        if self._values is None:
+            return dict(self._data)
+        # end if
+        return super().to_dict()
+    # end def to_dict
+
+    def __reduce__(self):
+        """
+        Implements pickling, storing the wrapped dict and the values converted or changed so far.
+        """
+        return self._from_lazy_state, (self._data, self._values, self._raw)
+    # end def __reduce__
+
+    @classmethod
+    def _from_lazy_state(cls: Type[LazyOembed], data: Dict[str, JSONType], values: Union[Dict, None], raw: Union[Dict, None]) -> LazyOembed:
+        """
+        Restores a pickled LazyOembed, see `__reduce__`.
+        """
+        instance: LazyOembed = cls(data)
+        instance._values = values
+        instance._raw = raw
+        return instance
+    # end def _from_lazy_state
 # end class
 
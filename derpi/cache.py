@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Response caches for `DerpiClient.static_request(...)`.
+
+Those store the raw response body of successful `GET` requests,
+so the sync and the async client can share the same cache implementation.
+"""
+import os
+import time
+import zlib
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Union, Dict, Tuple, Any
+from urllib.parse import urlencode
+
+from luckydonaldUtils.logger import logging
+
+__author__ = 'luckydonald'
+
+logger = logging.getLogger(__name__)
+if __name__ == '__main__':
+    logging.add_colored_handler(level=logging.DEBUG)
+# end if
+
+
+__all__ = ['DEFAULT_TTLS', 'make_cache_key', 'BaseCache', 'MemoryCache', 'SQLiteCache']
+
+
+MINUTE = 60.0
+HOUR = 60 * MINUTE
+
+# How long (in seconds) responses of the different routes are kept by default.
+# Tags, filters and the forum list barely ever change, the featured image does every now and then.
+DEFAULT_TTLS: Dict[str, float] = {
+    'tag': 6 * HOUR,
+    'filter': 6 * HOUR,
+    'system_filters': 6 * HOUR,
+    'forums': 6 * HOUR,
+    'forum': 6 * HOUR,
+    'featured_image': 1 * MINUTE,
+}
+
+
+def make_cache_key(method: str, url: str, params: Union[Dict[str, Any], None] = None) -> str:
+    """
+    Builds the key a response is stored under.
+
+    Parameters being `None` are dropped and the rest is sorted, so equal requests end up with the same key.
+    The API `key` is not part of it, so anonymous requests share their entries.
+    Requests with a `key` are stored in a separate namespace per user, as the result depends on the user's filter.
+
+    :param method: The http method, like `GET`.
+    :param url: The full url, including the base url.
+    :param params: The query parameters of the request.
+    :return: The cache key.
+    """
+    params = {} if params is None else {name: value for name, value in params.items() if value is not None}
+    key = params.pop('key', None)
+    namespace = '' if key is None else hashlib.sha256(str(key).encode('utf-8')).hexdigest()[:16]
+    query = urlencode(sorted(params.items()), doseq=True)
+    return f'{namespace}|{method.upper()} {url}?{query}'
+# end def
+
+
+class BaseCache(object):
+    """
+    Base class of the response caches.
+
+    A cache decides how long the responses of a route should be kept with `ttl_for(route)`,
+    and stores the raw response bodies under a key built by `make_cache_key(...)`.
+    """
+    def __init__(self, default_ttl: Union[float, None] = 5 * MINUTE, ttls: Union[Dict[str, float], None] = None):
+        """
+        :param default_ttl: Seconds to keep responses of routes not listed in `ttls`. `None` or `0` to not cache those.
+        :param ttls: Seconds to keep the responses, per route name. Defaults to `DEFAULT_TTLS`.
+                     A ttl of `None` or `0` disables caching for that route.
+        """
+        self.default_ttl = default_ttl
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.hits = 0
+        self.misses = 0
+    # end def
+
+    def ttl_for(self, route: Union[str, None]) -> Union[float, None]:
+        """
+        :param route: The name of the route, e.g. `'tag'`.
+        :return: How many seconds a response of that route may be cached, or `None` if it should not be cached at all.
+        """
+        ttl = self.ttls.get(route, self.default_ttl)
+        return ttl if ttl else None
+    # end def
+
+    def get(self, key: str) -> Union[bytes, None]:
+        """
+        :param key: A key built by `make_cache_key(...)`.
+        :return: The stored response body, or `None` if there is no (unexpired) entry.
+        """
+        raise NotImplementedError('Subclasses need to implement this.')
+    # end def
+
+    def set(self, key: str, content: bytes, ttl: float) -> None:
+        """
+        :param key: A key built by `make_cache_key(...)`.
+        :param content: The response body to store.
+        :param ttl: How many seconds the entry is valid.
+        """
+        raise NotImplementedError('Subclasses need to implement this.')
+    # end def
+
+    def clear(self) -> None:
+        """
+        Removes all the entries.
+        """
+        raise NotImplementedError('Subclasses need to implement this.')
+    # end def
+
+    def stats(self) -> Dict[str, int]:
+        """
+        :return: The hit and miss counters.
+        """
+        return {'hits': self.hits, 'misses': self.misses}
+    # end def
+# end class
+
+
+class MemoryCache(BaseCache):
+    """
+    In-process cache, evicting the least recently used entries if it grows over `max_bytes`.
+    It is thread safe, so a single instance can be shared between multiple `DerpiClient`s.
+
+    >>> derpi = DerpiClient(key=None, cache=MemoryCache(max_bytes=16 * 1024 * 1024))
+    """
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        default_ttl: Union[float, None] = 5 * MINUTE,
+        ttls: Union[Dict[str, float], None] = None,
+    ):
+        """
+        :param max_bytes: How big the stored keys and response bodies may get in total.
+        :param default_ttl: Seconds to keep responses of routes not listed in `ttls`. `None` or `0` to not cache those.
+        :param ttls: Seconds to keep the responses, per route name. Defaults to `DEFAULT_TTLS`.
+        """
+        super().__init__(default_ttl=default_ttl, ttls=ttls)
+        self.max_bytes = max_bytes
+        self.size = 0  # current bytes used by keys and bodies.
+        self.evictions = 0
+        self._entries: 'OrderedDict[str, Tuple[float, bytes]]' = OrderedDict()  # key -> (expires_at, content)
+        self._lock = threading.Lock()
+    # end def
+
+    def get(self, key: str) -> Union[bytes, None]:
+        with self._lock:
+            entry = self._entries.get(key, None)
+            if entry is not None and entry[0] < time.monotonic():
+                self._remove(key)
+                entry = None
+            # end if
+            if entry is None:
+                self.misses += 1
+                return None
+            # end if
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+        # end with
+    # end def
+
+    def set(self, key: str, content: bytes, ttl: float) -> None:
+        size = len(key) + len(content)
+        if size > self.max_bytes:
+            logger.debug(f'Not caching {key!r}, as its {size} bytes exceed the cache size.')
+            return
+        # end if
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            # end if
+            self._entries[key] = (time.monotonic() + ttl, content)
+            self.size += size
+            while self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+            # end while
+        # end with
+    # end def
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+        # end with
+    # end def
+
+    def stats(self) -> Dict[str, int]:
+        stats = super().stats()
+        stats.update(evictions=self.evictions, entries=len(self._entries), size=self.size)
+        return stats
+    # end def
+
+    def _remove(self, key: str) -> None:
+        """ Drops an entry. The lock must be held. """
+        expires_at, content = self._entries.pop(key)
+        self.size -= len(key) + len(content)
+    # end def
+
+    def __len__(self) -> int:
+        return len(self._entries)
+    # end def
+# end class
+
+
+class SQLiteCache(BaseCache):
+    """
+    Persistent cache, storing the zlib compressed response bodies in a single SQLite file.
+    That survives restarts, and can be used by multiple threads and processes at the same time.
+    If the stored bodies grow over `max_bytes`, the expired and then the least recently used entries are removed.
+
+    >>> derpi = DerpiClient(key=None, cache=SQLiteCache('~/.cache/derpi.sqlite'))
+    """
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 256 * 1024 * 1024,
+        default_ttl: Union[float, None] = 5 * MINUTE,
+        ttls: Union[Dict[str, float], None] = None,
+        compression_level: int = 6,
+    ):
+        """
+        :param path: The SQLite file to use. It will be created if needed.
+        :param max_bytes: How big the stored (compressed) response bodies may get in total.
+        :param default_ttl: Seconds to keep responses of routes not listed in `ttls`. `None` or `0` to not cache those.
+        :param ttls: Seconds to keep the responses, per route name. Defaults to `DEFAULT_TTLS`.
+        :param compression_level: The zlib compression level, from `1` (fastest) to `9` (smallest).
+        """
+        super().__init__(default_ttl=default_ttl, ttls=ttls)
+        self.path = os.path.expanduser(path)
+        self.max_bytes = max_bytes
+        self.compression_level = compression_level
+        self.evictions = 0
+        self._local = threading.local()  # sqlite connections can't be shared between threads.
+        self._connection()  # creates the table
+    # end def
+
+    def _connection(self) -> sqlite3.Connection:
+        """
+        :return: The connection of the current thread, opening it if needed.
+        """
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            # autocommit mode, we do the transactions ourself.
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            # write ahead log, so readers don't block the writer (of other processes) and vice versa.
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                connection.execute(
+                    'CREATE TABLE IF NOT EXISTS responses ('
+                    ' key TEXT PRIMARY KEY, expires_at REAL NOT NULL, accessed_at REAL NOT NULL,'
+                    ' size INTEGER NOT NULL, content BLOB NOT NULL'
+                    ')'
+                )
+                connection.execute('CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)')
+                connection.execute('CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at)')
+                # the total size of all responses, kept up to date by the triggers below,
+                # so `set(...)` doesn't have to sum up the whole table every time.
+                connection.execute('CREATE TABLE IF NOT EXISTS meta (id INTEGER PRIMARY KEY CHECK (id = 0), size INTEGER NOT NULL)')
+                connection.execute(  # a cache file of an older version has no total yet.
+                    'INSERT OR IGNORE INTO meta (id, size) SELECT 0, COALESCE(SUM(size), 0) FROM responses'
+                )
+                connection.execute(
+                    'CREATE TRIGGER IF NOT EXISTS responses_inserted AFTER INSERT ON responses'
+                    ' BEGIN UPDATE meta SET size = size + NEW.size WHERE id = 0; END'
+                )
+                connection.execute(
+                    'CREATE TRIGGER IF NOT EXISTS responses_deleted AFTER DELETE ON responses'
+                    ' BEGIN UPDATE meta SET size = size - OLD.size WHERE id = 0; END'
+                )
+                connection.execute(
+                    'CREATE TRIGGER IF NOT EXISTS responses_resized AFTER UPDATE OF size ON responses'
+                    ' BEGIN UPDATE meta SET size = size - OLD.size + NEW.size WHERE id = 0; END'
+                )
+                connection.execute('COMMIT')
+            except BaseException:
+                connection.execute('ROLLBACK')
+                connection.close()
+                raise
+            # end try
+            self._local.connection = connection
+        # end if
+        return connection
+    # end def
+
+    def get(self, key: str) -> Union[bytes, None]:
+        connection = self._connection()
+        now = time.time()  # wall clock, as it has to be comparable between processes.
+        row = connection.execute('SELECT expires_at, content FROM responses WHERE key = ?', (key,)).fetchone()
+        if row is None or row[0] < now:
+            self.misses += 1
+            return None
+        # end if
+        connection.execute('UPDATE responses SET accessed_at = ? WHERE key = ?', (now, key))
+        self.hits += 1
+        return zlib.decompress(row[1])
+    # end def
+
+    def set(self, key: str, content: bytes, ttl: float) -> None:
+        compressed = zlib.compress(content, self.compression_level)
+        if len(compressed) > self.max_bytes:
+            logger.debug(f'Not caching {key!r}, as its {len(compressed)} bytes exceed the cache size.')
+            return
+        # end if
+        connection = self._connection()
+        now = time.time()
+        connection.execute('BEGIN IMMEDIATE')  # takes the write lock right away, so the size check is not racy.
+        try:
+            # not `INSERT OR REPLACE`, as the rows it replaces don't fire the delete trigger.
+            connection.execute('DELETE FROM responses WHERE key = ?', (key,))
+            connection.execute(
+                'INSERT INTO responses (key, expires_at, accessed_at, size, content) VALUES (?, ?, ?, ?, ?)',
+                (key, now + ttl, now, len(compressed), compressed),
+            )
+            size = connection.execute('SELECT size FROM meta WHERE id = 0').fetchone()[0]
+            if size > self.max_bytes:
+                self.evictions += connection.execute('DELETE FROM responses WHERE expires_at < ?', (now,)).rowcount
+                size = connection.execute('SELECT size FROM meta WHERE id = 0').fetchone()[0]
+            # end if
+            while size > self.max_bytes:
+                oldest_key, oldest_size = connection.execute(
+                    'SELECT key, size FROM responses ORDER BY accessed_at LIMIT 1'
+                ).fetchone()
+                connection.execute('DELETE FROM responses WHERE key = ?', (oldest_key,))
+                size -= oldest_size
+                self.evictions += 1
+            # end while
+            connection.execute('COMMIT')
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+        # end try
+    # end def
+
+    def clear(self) -> None:
+        self._connection().execute('DELETE FROM responses')
+    # end def
+
+    def stats(self) -> Dict[str, int]:
+        stats = super().stats()
+        connection = self._connection()
+        entries = connection.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+        size = connection.execute('SELECT size FROM meta WHERE id = 0').fetchone()[0]
+        stats.update(evictions=self.evictions, entries=entries, size=size)
+        return stats
+    # end def
+
+    def close(self) -> None:
+        """
+        Closes the database connection of the current thread.
+        """
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+        # end if
+    # end def
+# end class
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Decodes search pages straight into columns of NumPy arrays, without building an `Image` for every result,
+so analyzing millions of images is array math instead of looping over their attributes:
+
+>>> pages = (search_images('safe', page=page, per_page=50, _raw='bytes') for page in range(1, 101))
+>>> columns = decode_image_columns(pages)
+>>> columns.score[columns.has_tag(40482)].mean()
+
+The tag ids of all images are stored in a single array, with `tag_offsets[i]:tag_offsets[i + 1]`
+being the ones of the `i`-th image.
+
+NumPy is optional, install it with `pip install derpi[numpy]`.
+"""
+from datetime import timezone
+from itertools import chain
+from typing import Union, List, Dict, Iterable, Any
+
+from .decoding import decode_json
+from .timestamps import parse_datetime
+
+__author__ = 'luckydonald'
+
+
+__all__ = ['INTEGER_COLUMNS', 'FLOAT_COLUMNS', 'TIMESTAMP_COLUMNS', 'ImageColumns', 'decode_image_columns']
+
+
+INTEGER_COLUMNS = ('id', 'score', 'faves', 'upvotes', 'downvotes', 'width', 'height')  # int64, float64 with NaN if missing.
+FLOAT_COLUMNS = ('aspect_ratio', 'wilson_score')  # float64, NaN if missing.
+TIMESTAMP_COLUMNS = ('created_at', 'first_seen_at', 'updated_at')  # datetime64[us] in UTC, NaT if missing.
+
+Page = Union[bytes, str, Dict[str, Any]]
+
+
+def _import_numpy():
+    import numpy
+    return numpy
+# end def
+
+
+class ImageColumns(object):
+    """
+    The fields of a lot of images, in a NumPy array per field.
+    Access them as attributes (`columns.score`) or by name (`columns['score']`).
+    """
+    def __init__(self, columns: Dict[str, Any], tag_ids: Any, tag_offsets: Any):
+        """
+        :param columns: The field names and their arrays, see `INTEGER_COLUMNS`, `FLOAT_COLUMNS` and `TIMESTAMP_COLUMNS`.
+        :param tag_ids: The tag ids of all the images, one after another, as `uint32`.
+        :param tag_offsets: Where the tag ids of every image start in `tag_ids`, and where the last one ends.
+        """
+        self.columns = columns
+        self.tag_ids = tag_ids
+        self.tag_offsets = tag_offsets
+    # end def
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self.__dict__['columns'][name]
+        except KeyError:
+            raise AttributeError(name) from None
+        # end try
+    # end def
+
+    def __getitem__(self, name: str) -> Any:
+        return self.columns[name]
+    # end def
+
+    def __len__(self) -> int:
+        return len(self.tag_offsets) - 1
+    # end def
+
+    def tags_of(self, index: int) -> Any:
+        """
+        :param index: The position of the image.
+        :return: The tag ids of that image.
+        """
+        return self.tag_ids[self.tag_offsets[index]:self.tag_offsets[index + 1]]
+    # end def
+
+    def tag_counts(self) -> Any:
+        """
+        :return: The amount of tags of every image.
+        """
+        return _import_numpy().diff(self.tag_offsets)
+    # end def
+
+    def has_tag(self, tag_id: int) -> Any:
+        """
+        :param tag_id: A tag id.
+        :return: A boolean array, which images have that tag.
+        """
+        return self.has_any_tag([tag_id])
+    # end def
+
+    def has_any_tag(self, tag_ids: Iterable[int]) -> Any:
+        """
+        :param tag_ids: Some tag ids.
+        :return: A boolean array, which images have any of those tags.
+        """
+        numpy = _import_numpy()
+        images = numpy.repeat(numpy.arange(len(self)), self.tag_counts())
+        found = numpy.zeros(len(self), dtype=bool)
+        found[images[numpy.isin(self.tag_ids, numpy.fromiter(tag_ids, dtype=numpy.int64))]] = True
+        return found
+    # end def
+
+    @classmethod
+    def concatenate(cls, parts: List['ImageColumns']) -> 'ImageColumns':
+        """
+        :param parts: Columns of different images.
+        :return: The columns of all those images, in that order.
+        """
+        numpy = _import_numpy()
+        offsets = [numpy.zeros(1, dtype=numpy.int64)]
+        start = 0
+        for part in parts:
+            offsets.append(part.tag_offsets[1:] + start)
+            start += part.tag_offsets[-1]
+        # end for
+        return cls(
+            columns={name: numpy.concatenate([part.columns[name] for part in parts]) for name in parts[0].columns},
+            tag_ids=numpy.concatenate([part.tag_ids for part in parts]),
+            tag_offsets=numpy.concatenate(offsets),
+        )
+    # end def
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(images={len(self)!r}, columns={list(self.columns)!r})'
+    # end def
+# end class
+
+
+def _integers(numpy, values: List[Union[int, None]]) -> Any:
+    try:
+        return numpy.array(values, dtype=numpy.int64)
+    except TypeError:  # there's a `None`.
+        return numpy.array(values, dtype=numpy.float64)
+    # end try
+# end def
+
+
+def _timestamp(value: Union[str, None]) -> Union[str, None]:
+    """
+    Makes the timestamp something NumPy can parse: no offset, in UTC.
+    """
+    if not value:
+        return None
+    # end if
+    if value[-1] == 'Z':
+        return value[:-1]
+    # end if
+    if value[-6] in '+-' and value[-3] == ':':
+        return parse_datetime(value).astimezone(timezone.utc).replace(tzinfo=None).isoformat()
+    # end if
+    return value  # no offset means UTC already.
+# end def
+
+
+def _decode_images(numpy, images: List[Dict[str, Any]]) -> ImageColumns:
+    columns = {}
+    for name in INTEGER_COLUMNS:
+        columns[name] = _integers(numpy, [image[name] for image in images])
+    # end for
+    for name in FLOAT_COLUMNS:
+        columns[name] = numpy.array([image[name] for image in images], dtype=numpy.float64)
+    # end for
+    for name in TIMESTAMP_COLUMNS:
+        columns[name] = numpy.array([_timestamp(image[name]) for image in images], dtype='datetime64[us]')
+    # end for
+    tag_lists = [image['tag_ids'] for image in images]
+    tag_offsets = numpy.zeros(len(tag_lists) + 1, dtype=numpy.int64)
+    numpy.cumsum(numpy.fromiter(map(len, tag_lists), dtype=numpy.int64, count=len(tag_lists)), out=tag_offsets[1:])
+    tag_ids = numpy.fromiter(chain.from_iterable(tag_lists), dtype=numpy.uint32, count=int(tag_offsets[-1]))
+    return ImageColumns(columns=columns, tag_ids=tag_ids, tag_offsets=tag_offsets)
+# end def
+
+
+def _images_of(page: Page) -> List[Dict[str, Any]]:
+    if isinstance(page, (bytes, bytearray, str)):
+        page = decode_json(page)
+    # end if
+    return page['images']
+# end def
+
+
+def decode_image_columns(pages: Union[Page, Iterable[Page]], chunk_size: int = 65536) -> ImageColumns:
+    """
+    :param pages: A page of `search_images(...)`, or an iterable of them. Either the undecoded response body
+                  (`_raw='bytes'`) or the decoded json (`_raw=True`).
+    :param chunk_size: Amount of images converted to arrays at once, so the parsed json of only
+                       that many images is kept in memory at the same time.
+    :return: The fields of all images, in columns.
+    :raises ImportError: NumPy isn't installed.
+    """
+    numpy = _import_numpy()
+    if isinstance(pages, (bytes, bytearray, str, dict)):
+        pages = [pages]
+    # end if
+    parts = []
+    images = []
+    for page in pages:
+        images.extend(_images_of(page))
+        if len(images) >= chunk_size:
+            parts.append(_decode_images(numpy, images))
+            images = []
+        # end if
+    # end for
+    if images or not parts:
+        parts.append(_decode_images(numpy, images))
+    # end if
+    return parts[0] if len(parts) == 1 else ImageColumns.concatenate(parts)
+# end def
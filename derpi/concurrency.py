@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Adaptive limit of how many requests the async client runs at the same time.
+"""
+import time
+import asyncio
+from collections import deque
+from typing import Union, Dict, Deque
+
+__author__ = 'luckydonald'
+
+
+__all__ = ['AdaptiveConcurrencyLimiter']
+
+
+class AdaptiveConcurrencyLimiter(object):
+    """
+    Limits the requests running at the same time, adapting that limit like TCP's congestion control (AIMD):
+    While the responses are fine and not much slower than the fastest ones seen, the limit grows by `increase`
+    for every `limit` successful requests (additive increase).
+    If the server is overloaded (rate limited, server errors, timeouts) or the latency spikes,
+    it gets multiplied with `decrease_factor` (multiplicative decrease).
+
+    >>> limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=32)
+    >>> derpi = DerpiClient(key=None, concurrency_limiter=limiter)
+    >>> ...
+    >>> limiter.stats()
+    {'limit': 11, 'in_flight': 0, 'latency': 0.21, 'min_latency': 0.18, ...}
+    """
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        smoothing: float = 0.2,
+    ):
+        """
+        :param initial_limit: How many requests may run at the same time, to begin with.
+        :param min_limit: Never go below that many.
+        :param max_limit: Never go above that many.
+        :param increase: How much the limit grows, per `limit` successful requests.
+        :param decrease_factor: The limit is multiplied with it, if the server is overloaded.
+        :param latency_tolerance: Responses slower than `min_latency * latency_tolerance` count as overloaded.
+        :param smoothing: Weight of a new sample for the (exponentially weighted) average `latency`.
+        """
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+        self._limit = float(initial_limit)
+        self.in_flight = 0
+        self.latency: Union[float, None] = None  # average seconds of the recent requests.
+        self.min_latency: Union[float, None] = None  # what a healthy request takes.
+        self.successes = 0
+        self.overloads = 0
+        self._last_decrease = 0.0
+        self._waiters: Deque[asyncio.Future] = deque()  # requests waiting for a free slot, oldest first.
+    # end def
+
+    @property
+    def limit(self) -> int:
+        """
+        How many requests may currently run at the same time.
+        """
+        return max(self.min_limit, int(self._limit))
+    # end def
+
+    async def acquire(self) -> None:
+        """
+        Waits until another request may be sent.
+        Every call must be followed by a `release(...)`.
+        """
+        if not self._waiters and self.in_flight < self.limit:
+            self.in_flight += 1
+            return
+        # end if
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter  # `_wake()` takes the slot for us.
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():  # we got a slot already, give it to the next one.
+                self.in_flight -= 1
+                self._wake()
+            elif waiter in self._waiters:  # `_wake()` may have dropped it already, if it ran before we resumed.
+                self._waiters.remove(waiter)
+            # end if
+            raise
+        # end try
+    # end def
+
+    def release(self, latency: Union[float, None] = None, overloaded: bool = False) -> None:
+        """
+        Marks a request as finished, adapting the limit.
+
+        :param latency: How many seconds the request took. `None` if it didn't finish (e.g. got cancelled).
+        :param overloaded: If the server told us it is overloaded, e.g. by rate limiting, failing or timing out.
+        """
+        self.in_flight -= 1
+        if latency is not None:
+            self._adapt(latency, overloaded)
+        # end if
+        self._wake()
+    # end def
+
+    def _wake(self) -> None:
+        """
+        Hands out the free slots to the waiting requests.
+        """
+        while self._waiters and self.in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+            # end if
+        # end while
+    # end def
+
+    def _adapt(self, latency: float, overloaded: bool) -> None:
+        if not overloaded:
+            if self.min_latency is None or latency < self.min_latency:
+                self.min_latency = latency
+            else:  # slowly forget about it, in case the server just got slower in general.
+                self.min_latency += (latency - self.min_latency) * 0.01
+            # end if
+            self.latency = latency if self.latency is None else (
+                self.latency + (latency - self.latency) * self.smoothing
+            )
+            overloaded = latency > self.min_latency * self.latency_tolerance
+        # end if
+        if not overloaded:
+            self.successes += 1
+            self._limit = min(float(self.max_limit), self._limit + self.increase / self._limit)
+            return
+        # end if
+        self.overloads += 1
+        now = time.monotonic()
+        # all the requests which were already running when the server got overloaded will report that as well,
+        # so we only decrease once per round trip.
+        if now - self._last_decrease < (self.latency or 0.0):
+            return
+        # end if
+        self._last_decrease = now
+        self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+    # end def
+
+    def stats(self) -> Dict[str, Union[int, float, None]]:
+        """
+        :return: The current limit, the requests running and the observed latencies.
+        """
+        return {
+            'limit': self.limit, 'in_flight': self.in_flight, 'latency': self.latency, 'min_latency': self.min_latency,
+            'successes': self.successes, 'overloads': self.overloads,
+        }
+    # end def
+# end class
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Parses the json responses directly from the raw bytes, with the fastest json library installed.
+
+By default the first one installed of `orjson`, `msgspec`, `ujson` and the standard library's `json` is used.
+Another one can be chosen with `set_json_decoder(...)`:
+>>> set_json_decoder('json')
+"""
+import json
+from typing import Union, Dict, Callable, Any
+
+from luckydonaldUtils.logger import logging
+
+__author__ = 'luckydonald'
+
+logger = logging.getLogger(__name__)
+if __name__ == '__main__':
+    logging.add_colored_handler(level=logging.DEBUG)
+# end if
+
+
+__all__ = ['JSON_DECODERS', 'set_json_decoder', 'get_json_decoder', 'decode_json']
+
+
+def _load_orjson() -> Callable[[bytes], Any]:
+    import orjson
+    return orjson.loads
+# end def
+
+
+def _load_msgspec() -> Callable[[bytes], Any]:
+    import msgspec
+    return msgspec.json.Decoder().decode
+# end def
+
+
+def _load_ujson() -> Callable[[bytes], Any]:
+    import ujson
+    return ujson.loads
+# end def
+
+
+def _load_json() -> Callable[[bytes], Any]:
+    return json.loads  # detects the encoding of bytes itself.
+# end def
+
+
+# name -> function importing the library and returning its decode function. In order of preference.
+JSON_DECODERS: Dict[str, Callable[[], Callable[[bytes], Any]]] = {
+    'orjson': _load_orjson,
+    'msgspec': _load_msgspec,
+    'ujson': _load_ujson,
+    'json': _load_json,
+}
+
+_decoder_name: Union[str, None] = None
+_decoder: Union[Callable[[bytes], Any], None] = None
+
+
+def set_json_decoder(name: Union[str, None] = None) -> str:
+    """
+    Chooses the json library used to parse the responses.
+
+    :param name: One of `JSON_DECODERS`, like `'orjson'` or `'json'`. `None` to use the fastest one installed.
+    :return: The name of the library now in use.
+    :raises ImportError: The requested library isn't installed.
+    """
+    global _decoder, _decoder_name
+    if name is not None:
+        if name not in JSON_DECODERS:
+            raise ValueError(f'Unknown json decoder {name!r}, choose one of {list(JSON_DECODERS)!r}.')
+        # end if
+        _decoder = JSON_DECODERS[name]()
+        _decoder_name = name
+        return name
+    # end if
+    for name, loader in JSON_DECODERS.items():
+        try:
+            _decoder = loader()
+        except ImportError:
+            continue
+        # end try
+        _decoder_name = name
+        logger.debug(f'Using {name} to decode json.')
+        return name
+    # end for
+    raise ImportError('No json decoder available.')  # can't happen, as `json` is always there.
+# end def
+
+
+def get_json_decoder() -> str:
+    """
+    :return: The name of the json library in use.
+    """
+    if _decoder_name is None:
+        set_json_decoder()
+    # end if
+    return _decoder_name
+# end def
+
+
+def decode_json(content: bytes) -> Any:
+    """
+    Parses json.
+
+    :param content: The raw (utf-8) bytes of the response.
+    :return: The parsed json.
+    """
+    if _decoder is None:
+        set_json_decoder()
+    # end if
+    return _decoder(content)
+# end def
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Errors raised when the server didn't answer the way we expected.
+"""
+import datetime
+from email.utils import parsedate_to_datetime
+from typing import Union, Any
+
+__author__ = 'luckydonald'
+
+
+__all__ = [
+    'DerpiException', 'DerpiResponseError', 'UnexpectedResponseError', 'NotFoundError', 'RateLimitedError',
+    'ServerError', 'CloudflareChallengeError', 'parse_retry_after', 'error_for_response',
+]
+
+
+class DerpiException(Exception):
+    """
+    Base class of all the errors raised by this library.
+    """
+    pass
+# end class
+
+
+class DerpiResponseError(DerpiException):
+    """
+    The server answered, but not with what we asked for.
+    """
+    def __init__(self, message: str, response: Any):
+        """
+        :param message: What went wrong.
+        :param response: The requests/httpx response.
+        """
+        super().__init__(message)
+        self.response = response
+        self.status_code: int = response.status_code
+        self.url: str = str(response.url)
+        # seconds the server asked us to wait before trying again, for `429` as well as `503` and the like.
+        self.retry_after: Union[float, None] = parse_retry_after(response.headers.get('retry-after', None))
+    # end def
+# end class
+
+
+class UnexpectedResponseError(DerpiResponseError):
+    """
+    Any other status code, or a response not being json.
+    """
+    pass
+# end class
+
+
+class NotFoundError(DerpiResponseError):
+    """
+    The requested object doesn't exist (`404`).
+    """
+    pass
+# end class
+
+
+class RateLimitedError(DerpiResponseError):
+    """
+    We sent too many requests (`429`).
+    """
+    pass
+# end class
+
+
+class ServerError(DerpiResponseError):
+    """
+    The server (or a proxy in front of it) failed (`5xx`).
+    """
+    pass
+# end class
+
+
+class CloudflareChallengeError(DerpiResponseError):
+    """
+    Cloudflare wants us to solve a captcha or javascript challenge.
+    That can't be done by this library, so better slow down or try again later.
+    """
+    pass
+# end class
+
+
+def parse_retry_after(value: Union[str, None]) -> Union[float, None]:
+    """
+    Parses the `Retry-After` header, which is either the amount of seconds or a http date.
+
+    :param value: The header value.
+    :return: How many seconds to wait, or `None` if there's no (valid) value.
+    """
+    if not value:
+        return None
+    # end if
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    # end try
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    # end try
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=datetime.timezone.utc)
+    # end if
+    return max(0.0, (date - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+# end def
+
+
+def error_for_response(response: Any) -> Union[DerpiResponseError, None]:
+    """
+    Checks the response, and builds the matching error if it isn't a successful json response.
+
+    :param response: A requests/httpx response.
+    :return: The error to raise, or `None` if everything is fine.
+    """
+    status_code = response.status_code
+    content_type = response.headers.get('content-type', '')
+    if status_code == 200 and content_type == 'application/json; charset=utf-8':
+        return None
+    # end if
+    message = f'{status_code} for {response.url}'
+    if (
+        response.headers.get('cf-mitigated', None) == 'challenge' or
+        (status_code in (403, 503) and 'cloudflare' in response.headers.get('server', '') and 'text/html' in content_type)
+    ):
+        return CloudflareChallengeError(f'Cloudflare challenge: {message}', response)
+    # end if
+    if status_code == 404:
+        return NotFoundError(f'Not found: {message}', response)
+    # end if
+    if status_code == 429:
+        return RateLimitedError(f'Rate limited: {message}', response)
+    # end if
+    if 500 <= status_code < 600:
+        return ServerError(f'Server error: {message}', response)
+    # end if
+    if status_code == 200:
+        return UnexpectedResponseError(f'Unexpected content type {content_type!r}: {message}', response)
+    # end if
+    return UnexpectedResponseError(f'Unexpected status: {message}', response)
+# end def
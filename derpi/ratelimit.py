@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Client side rate limiting, so we stay just below the limits of the server instead of being throttled.
+"""
+import os
+import time
+import struct
+import threading
+from typing import Union, Dict
+from urllib.parse import urlsplit
+
+try:
+    import fcntl
+    msvcrt = None
+except ImportError:  # windows
+    fcntl = None
+    import msvcrt
+# end try
+
+__author__ = 'luckydonald'
+
+
+__all__ = ['TokenBucket', 'FileTokenBucket', 'RateLimiter']
+
+
+class TokenBucket(object):
+    """
+    Allows `rate` requests per second on average, with bursts of up to `burst` requests.
+    It is thread safe, so all the threads of a process can share one.
+    """
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        :param rate: Requests per second.
+        :param burst: How many requests may be sent at once, after being idle for a while.
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    # end def
+
+    def reserve(self) -> float:
+        """
+        Takes a token, going into debt if there is none left.
+        The caller has to wait the returned time before sending the request.
+
+        :return: Seconds to wait.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens, self._last = self._take(self._tokens, self._last, now)
+            return self._wait(self._tokens)
+        # end with
+    # end def
+
+    def _take(self, tokens: float, last: float, now: float):
+        """
+        Refills the bucket for the time passed since `last`, and takes a token from it.
+        :return: the new `tokens` and `last` values.
+        """
+        tokens = min(float(self.burst), tokens + (now - last) * self.rate) - 1
+        return tokens, now
+    # end def
+
+    def _wait(self, tokens: float) -> float:
+        return 0.0 if tokens >= 0 else -tokens / self.rate
+    # end def
+# end class
+
+
+class FileTokenBucket(TokenBucket):
+    """
+    A token bucket stored in a small file, locked while being updated,
+    so all the processes on the same host using the same `path` share the same limit.
+    """
+    STATE = struct.Struct('!dd')  # tokens, last update (unix timestamp)
+
+    def __init__(self, path: str, rate: float, burst: int = 1):
+        """
+        :param path: The file to store the state in. It will be created if needed.
+        :param rate: Requests per second.
+        :param burst: How many requests may be sent at once, after being idle for a while.
+        """
+        super().__init__(rate=rate, burst=burst)
+        self.path = os.path.expanduser(path)
+    # end def
+
+    def reserve(self) -> float:
+        with self._lock:  # the file lock is per process, so we need to lock between our threads as well.
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                self._lock_file(fd)
+                os.lseek(fd, 0, os.SEEK_SET)
+                data = os.read(fd, self.STATE.size)
+                now = time.time()  # wall clock, as it has to be comparable between processes.
+                if len(data) == self.STATE.size:
+                    tokens, last = self.STATE.unpack(data)
+                else:  # new file
+                    tokens, last = float(self.burst), now
+                # end if
+                tokens, last = self._take(tokens, min(last, now), now)
+                os.lseek(fd, 0, os.SEEK_SET)
+                os.write(fd, self.STATE.pack(tokens, last))
+                return self._wait(tokens)
+            finally:
+                self._unlock_file(fd)
+                os.close(fd)
+            # end try
+        # end with
+    # end def
+
+    @staticmethod
+    def _lock_file(fd: int) -> None:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        else:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+        # end if
+    # end def
+
+    @staticmethod
+    def _unlock_file(fd: int) -> None:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        else:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        # end if
+    # end def
+# end class
+
+
+class RateLimiter(object):
+    """
+    Picks the token bucket to use by the base url of the request,
+    so e.g. derpibooru.org and furbooru.org can have different limits.
+
+    Limit all requests to 5 per second, shared between all the processes using that file:
+    >>> derpi = DerpiClient(key=None, rate_limiter=RateLimiter(rate=5, burst=10, path='/tmp/derpi.bucket'))
+
+    Different limits per site:
+    >>> limiter = RateLimiter(per_base_url={
+    ...     'https://derpibooru.org': FileTokenBucket('/tmp/derpibooru.bucket', rate=5),
+    ...     'https://furbooru.org': TokenBucket(rate=2),
+    ... })
+    """
+    def __init__(
+        self,
+        rate: Union[float, None] = None,
+        burst: int = 1,
+        path: Union[str, None] = None,
+        per_base_url: Union[Dict[str, TokenBucket], None] = None,
+    ):
+        """
+        :param rate: Requests per second for base urls not listed in `per_base_url`. `None` to not limit those.
+        :param burst: How many of those requests may be sent at once, after being idle for a while.
+        :param path: If given, that limit is shared with other processes by storing it in that file.
+        :param per_base_url: Buckets for specific base urls, like `'https://derpibooru.org'`.
+        """
+        if rate is None:
+            self.default: Union[TokenBucket, None] = None
+        elif path is None:
+            self.default = TokenBucket(rate=rate, burst=burst)
+        else:
+            self.default = FileTokenBucket(path=path, rate=rate, burst=burst)
+        # end if
+        self.per_base_url: Dict[str, TokenBucket] = {
+            base_url.rstrip('/'): bucket for base_url, bucket in ({} if per_base_url is None else per_base_url).items()
+        }
+    # end def
+
+    def bucket_for(self, url: str) -> Union[TokenBucket, None]:
+        """
+        :param url: The full url of the request.
+        :return: The bucket limiting requests to that url, or `None` if they're not limited.
+        """
+        parts = urlsplit(url)
+        return self.per_base_url.get(f'{parts.scheme}://{parts.netloc}', self.default)
+    # end def
+
+    def reserve(self, url: str) -> float:
+        """
+        Takes a token for a request to that url.
+
+        :param url: The full url of the request.
+        :return: Seconds to wait before sending it.
+        """
+        bucket = self.bucket_for(url)
+        return 0.0 if bucket is None else bucket.reserve()
+    # end def
+# end class
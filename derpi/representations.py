@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compact storage of the representation urls of an image.
+
+They only differ by their name, like
+`https://derpicdn.net/img/2019/5/2/2028858/large.png` and `https://derpicdn.net/img/2019/5/2/2028858/thumb.png`,
+with the `full` one being `https://derpicdn.net/img/view/2019/5/2/2028858.png`.
+So only the prefix (`https://derpicdn.net/img/2019/5/2/2028858/`) and the extension (`.png`) are stored,
+and the urls are built again when accessed. Urls not following that pattern are stored as they are.
+"""
+from typing import Union, Dict, Tuple, Iterable
+
+__author__ = 'luckydonald'
+
+
+__all__ = ['split_representations', 'derive_url']
+
+
+def derive_url(prefix: str, name: str, extension: str) -> str:
+    """
+    :param prefix: The url up to the name, like `https://derpicdn.net/img/2019/5/2/2028858/`.
+    :param name: The name of the representation, like `'large'`.
+    :param extension: The file extension, like `'.png'`.
+    :return: The url of that representation.
+    """
+    if name == 'full':
+        return prefix.replace('/img/', '/img/view/', 1)[:-1] + extension
+    # end if
+    return prefix + name + extension
+# end def
+
+
+def split_representations(
+    urls: Dict[str, Union[str, None]], optional: Iterable[str] = (), reference: str = 'thumb',
+) -> Tuple[str, str, Union[Dict[str, Union[str, None]], None]]:
+    """
+    :param urls: The representation names and their urls.
+    :param optional: The names which are not derived, as they are mostly missing. Stored if given.
+    :param reference: The name of the url to take the prefix and extension from.
+    :return: The prefix, the extension and the urls which can't be derived from them (`None` if there are none).
+    """
+    url = urls.get(reference)
+    if not url:
+        return '', '', dict(urls)
+    # end if
+    head, _, file_name = url.rpartition('/')
+    if not file_name.startswith(reference):
+        return '', '', dict(urls)
+    # end if
+    prefix, extension = head + '/', file_name[len(reference):]
+    full = derive_url(prefix, 'full', extension)
+    others = {}
+    for name, url in urls.items():
+        if name in optional:
+            if url is None:
+                continue
+            # end if
+        elif url == (full if name == 'full' else prefix + name + extension):
+            continue
+        # end if
+        others[name] = url
+    # end for
+    return prefix, extension, others or None
+# end def
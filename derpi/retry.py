@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+When and how long to wait before sending a failed request again.
+"""
+import random
+from typing import Union, Tuple, Type
+
+from .exceptions import RateLimitedError, ServerError, CloudflareChallengeError
+
+__author__ = 'luckydonald'
+
+
+__all__ = ['RetryPolicy', 'NO_RETRY']
+
+
+class RetryPolicy(object):
+    """
+    Retries idempotent (`GET`) requests failing with a retryable error, waiting with jittered exponential backoff.
+    If the server tells us how long to wait with a `Retry-After` header, that is used instead.
+
+    >>> derpi = DerpiClient(key=None, retry=RetryPolicy(max_retries=10, max_backoff=5 * 60))
+    """
+    def __init__(
+        self,
+        max_retries: int = 5,
+        backoff_factor: float = 1.0,
+        max_backoff: float = 120.0,
+        retry_on: Tuple[Type[Exception], ...] = (RateLimitedError, ServerError, CloudflareChallengeError),
+    ):
+        """
+        :param max_retries: How often a request is sent again, before giving up. `0` to never retry.
+        :param backoff_factor: Maximum seconds to wait before the first retry, doubling with every further one.
+        :param max_backoff: Never wait longer than that many seconds, even if the server asked us to.
+        :param retry_on: The errors to retry. Connection errors and timeouts are always retried.
+        """
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_on = retry_on
+    # end def
+
+    def should_retry(self, attempt: int, error: Exception, transport_error: bool = False) -> bool:
+        """
+        :param attempt: How many retries were already done, `0` after the first request failed.
+        :param error: What went wrong.
+        :param transport_error: If the error is a connection error or timeout of the http library.
+        :return: If the request should be sent again.
+        """
+        return attempt < self.max_retries and (transport_error or isinstance(error, self.retry_on))
+    # end def
+
+    def delay(self, attempt: int, error: Exception) -> float:
+        """
+        :param attempt: How many retries were already done, `0` after the first request failed.
+        :param error: What went wrong.
+        :return: The seconds to wait before the next try.
+        """
+        retry_after: Union[float, None] = getattr(error, 'retry_after', None)
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+        # end if
+        # "full jitter", so many clients failing at the same time don't all come back at the same time.
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * 2 ** attempt))
+    # end def
+# end class
+
+
+NO_RETRY = RetryPolicy(max_retries=0)
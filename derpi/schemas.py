@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+The columns of every model, to store them in columnar files, see `derpi.export`.
+Generated from the model definitions, like the models themselves.
+
+Every column is `(name, type)`, with the type being one of
+`'int64'`, `'float64'`, `'bool'`, `'string'`, `'timestamp'` (in UTC), `'json'` (a string of json),
+the name of a model (a struct of its columns), or `'List[...]'` of one of those.
+All of them may be `null`, as the API returns `null` for more fields than it documents.
+"""
+from typing import Dict, Tuple
+
+__author__ = 'luckydonald'
+__all__ = ['SCHEMAS']
+
+
+SCHEMAS: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    'Image': (
+        ('animated', 'bool'),
+        ('aspect_ratio', 'float64'),
+        ('comment_count', 'int64'),
+        ('created_at', 'timestamp'),
+        ('deletion_reason', 'string'),
+        ('description', 'string'),
+        ('downvotes', 'int64'),
+        ('duplicate_of', 'int64'),
+        ('duration', 'float64'),
+        ('faves', 'int64'),
+        ('first_seen_at', 'timestamp'),
+        ('format', 'string'),
+        ('height', 'int64'),
+        ('hidden_from_users', 'bool'),
+        ('id', 'int64'),
+        ('intensities', 'Intensities'),
+        ('mime_type', 'string'),
+        ('name', 'string'),
+        ('orig_sha512_hash', 'string'),
+        ('processed', 'bool'),
+        ('representations', 'Representations'),
+        ('score', 'int64'),
+        ('sha512_hash', 'string'),
+        ('size', 'int64'),
+        ('source_url', 'string'),
+        ('spoilered', 'bool'),
+        ('tag_count', 'int64'),
+        ('tag_ids', 'List[int64]'),
+        ('tags', 'List[string]'),
+        ('thumbnails_generated', 'bool'),
+        ('updated_at', 'timestamp'),
+        ('uploader', 'string'),
+        ('uploader_id', 'int64'),
+        ('upvotes', 'int64'),
+        ('view_url', 'string'),
+        ('width', 'int64'),
+        ('wilson_score', 'float64'),
+    ),
+    'Representations': (
+        ('full', 'string'),
+        ('large', 'string'),
+        ('medium', 'string'),
+        ('small', 'string'),
+        ('tall', 'string'),
+        ('thumb', 'string'),
+        ('thumb_small', 'string'),
+        ('thumb_tiny', 'string'),
+        ('mp4', 'string'),
+        ('webm', 'string'),
+    ),
+    'Intensities': (
+        ('ne', 'float64'),
+        ('nw', 'float64'),
+        ('se', 'float64'),
+        ('sw', 'float64'),
+    ),
+    'Comment': (
+        ('author', 'string'),
+        ('avatar', 'string'),
+        ('body', 'string'),
+        ('created_at', 'timestamp'),
+        ('edit_reason', 'string'),
+        ('edited_at', 'timestamp'),
+        ('id', 'int64'),
+        ('image_id', 'int64'),
+        ('updated_at', 'timestamp'),
+        ('user_id', 'int64'),
+    ),
+    'Forum': (
+        ('name', 'string'),
+        ('short_name', 'string'),
+        ('description', 'string'),
+        ('topic_count', 'int64'),
+        ('post_count', 'int64'),
+    ),
+    'Topic': (
+        ('slug', 'string'),
+        ('title', 'string'),
+        ('post_count', 'int64'),
+        ('view_count', 'int64'),
+        ('sticky', 'bool'),
+        ('last_replied_to_at', 'timestamp'),
+        ('locked', 'bool'),
+        ('user_id', 'int64'),
+        ('author', 'string'),
+    ),
+    'Post': (
+        ('author', 'string'),
+        ('avatar', 'string'),
+        ('body', 'string'),
+        ('created_at', 'timestamp'),
+        ('edit_reason', 'string'),
+        ('edited_at', 'timestamp'),
+        ('id', 'int64'),
+        ('updated_at', 'timestamp'),
+        ('user_id', 'int64'),
+    ),
+    'Tag': (
+        ('aliased_tag', 'string'),
+        ('aliases', 'List[string]'),
+        ('category', 'string'),
+        ('description', 'string'),
+        ('dnp_entries', 'json'),
+        ('id', 'int64'),
+        ('images', 'int64'),
+        ('implied_by_tags', 'List[string]'),
+        ('implied_tags', 'List[string]'),
+        ('name', 'string'),
+        ('name_in_namespace', 'string'),
+        ('namespace', 'string'),
+        ('short_description', 'string'),
+        ('slug', 'string'),
+        ('spoiler_image_uri', 'string'),
+    ),
+    'User': (
+        ('id', 'int64'),
+        ('name', 'string'),
+        ('slug', 'string'),
+        ('role', 'string'),
+        ('description', 'string'),
+        ('avatar_url', 'string'),
+        ('created_at', 'timestamp'),
+        ('comments_count', 'int64'),
+        ('uploads_count', 'int64'),
+        ('posts_count', 'int64'),
+        ('topics_count', 'int64'),
+        ('links', 'List[Links]'),
+        ('awards', 'List[Awards]'),
+    ),
+    'Filter': (
+        ('id', 'int64'),
+        ('name', 'string'),
+        ('description', 'string'),
+        ('user_id', 'int64'),
+        ('user_count', 'int64'),
+        ('system', 'bool'),
+        ('public', 'bool'),
+        ('spoilered_tag_ids', 'List[int64]'),
+        ('spoilered_complex', 'string'),
+        ('hidden_tag_ids', 'List[int64]'),
+        ('hidden_complex', 'string'),
+    ),
+    'Links': (
+        ('user_id', 'int64'),
+        ('created_at', 'timestamp'),
+        ('state', 'string'),
+        ('tag_id', 'int64'),
+    ),
+    'Awards': (
+        ('image_url', 'string'),
+        ('title', 'string'),
+        ('id', 'int64'),
+        ('label', 'string'),
+        ('awarded_on', 'timestamp'),
+    ),
+    'Gallery': (
+        ('description', 'string'),
+        ('id', 'int64'),
+        ('spoiler_warning', 'string'),
+        ('thumbnail_id', 'int64'),
+        ('title', 'string'),
+        ('user', 'string'),
+        ('user_id', 'int64'),
+    ),
+    'ImageErrors': (
+        ('image', 'List[string]'),
+        ('image_aspect_ratio', 'List[string]'),
+        ('image_format', 'List[string]'),
+        ('image_height', 'List[string]'),
+        ('image_width', 'List[string]'),
+        ('image_size', 'List[string]'),
+        ('image_is_animated', 'List[string]'),
+        ('image_mime_type', 'List[string]'),
+        ('image_orig_sha512_hash', 'List[string]'),
+        ('image_sha512_hash', 'List[string]'),
+        ('tag_input', 'List[string]'),
+        ('uploaded_image', 'List[string]'),
+    ),
+    'Oembed': (
+        ('author_name', 'string'),
+        ('author_url', 'string'),
+        ('cache_age', 'int64'),
+        ('derpibooru_comments', 'int64'),
+        ('derpibooru_id', 'int64'),
+        ('derpibooru_score', 'int64'),
+        ('derpibooru_tags', 'List[string]'),
+        ('provider_name', 'string'),
+        ('provider_url', 'string'),
+        ('title', 'string'),
+        ('type', 'string'),
+        ('version', 'string'),
+    ),
+}
\ No newline at end of file
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Helpers for turning the models back into json compatible values, json or msgpack.
+
+msgpack is optional, install it with `pip install derpi[msgpack]`.
+"""
+import json
+from array import array
+from datetime import datetime
+from typing import Any, Dict
+
+from .timestamps import format_datetime
+
+__author__ = 'luckydonald'
+
+
+__all__ = ['to_json_value', 'dump_json', 'pack_msgpack', 'unpack_msgpack']
+
+
+def to_json_value(value: Any) -> Any:
+    """
+    Converts models (anything with a `to_dict()`), lists, tuples, arrays and datetimes to json compatible values.
+    """
+    if isinstance(value, (list, tuple)):
+        return [to_json_value(item) for item in value]
+    # end if
+    if isinstance(value, array):
+        return value.tolist()
+    # end if
+    if isinstance(value, datetime):
+        return format_datetime(value)
+    # end if
+    to_dict = getattr(value, 'to_dict', None)
+    if to_dict is not None:
+        return to_dict()
+    # end if
+    return value
+# end def
+
+
+def dump_json(data: Dict[str, Any]) -> str:
+    """
+    :param data: The output of a `to_dict()`.
+    :return: Compact json.
+    """
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+# end def
+
+
+def pack_msgpack(data: Dict[str, Any]) -> bytes:
+    """
+    :param data: The output of a `to_dict()`.
+    :return: msgpack bytes.
+    :raises ImportError: msgpack isn't installed.
+    """
+    import msgpack
+    return msgpack.packb(data, use_bin_type=True)
+# end def
+
+
+def unpack_msgpack(packed: bytes) -> Dict[str, Any]:
+    """
+    :param packed: The output of `pack_msgpack(...)`.
+    :return: The dict to give to `from_dict(...)`.
+    :raises ImportError: msgpack isn't installed.
+    """
+    import msgpack
+    return msgpack.unpackb(packed, raw=False)
+# end def
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Incremental parsing of responses like `{"images": [...], "total": 123}`,
+returning the items of that array as soon as they arrived completely.
+"""
+import re
+import json
+import codecs
+from typing import Union, List, Any
+
+__author__ = 'luckydonald'
+
+
+__all__ = ['JsonArrayStream']
+
+
+_STRUCTURAL = re.compile(r'["{}\[\],:]')  # everything that isn't part of a number, `true`, `false` or `null`.
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+_SEEK = 'seek'  # looking for the key of the array.
+_ARRAY = 'array'  # inside the array.
+_DONE = 'done'  # after the array.
+
+
+class JsonArrayStream(object):
+    """
+    Feed it the chunks of a json object, and it returns the parsed items of the array at `key`.
+    Only the current, incomplete item is buffered. Everything else of the object is skipped.
+
+    >>> stream = JsonArrayStream('images')
+    >>> stream.feed(b'{"images": [{"id": 1}, {"i')
+    [{'id': 1}]
+    >>> stream.feed(b'd": 2}], "total": 2}')
+    [{'id': 2}]
+    >>> stream.close()
+    """
+    def __init__(self, key: str):
+        """
+        :param key: The key of the array in the top level object, e.g. `'images'`.
+        """
+        self.key = key
+        self._utf8 = codecs.getincrementaldecoder('utf-8')()  # a character might be split between two chunks.
+        self._json = json.JSONDecoder()
+        self._text = ''
+        self._pos = 0  # where to continue.
+        self._state = _SEEK
+        self._depth = 0  # how many objects/arrays we are in, while looking for the array.
+        self._last_string: Union[str, None] = None  # the last string of the top level object, might be a key.
+        self._is_our_value = False  # if the value following is the one of our key.
+        self._expect_item = True  # if the next thing in the array has to be an item, not `,` or `]`.
+        self._count = 0  # items read so far.
+    # end def
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """
+        :param chunk: The next bytes of the response.
+        :return: The items completed by that chunk, parsed.
+        """
+        if self._state == _DONE:
+            return []
+        # end if
+        self._text += self._utf8.decode(chunk)
+        items = []
+        if self._state == _SEEK:
+            self._seek()
+        # end if
+        if self._state == _ARRAY:
+            self._read_items(items)
+        # end if
+        # drop what we already processed
+        if self._state == _DONE:
+            self._text = ''
+        elif self._pos:
+            self._text = self._text[self._pos:]
+            self._pos = 0
+        # end if
+        return items
+    # end def
+
+    def close(self) -> None:
+        """
+        Call it after the last chunk, to make sure the array was complete.
+
+        :raises ValueError: The response ended before the array did, was invalid, or didn't contain it at all.
+        """
+        if self._state != _DONE:
+            raise ValueError(f'The response ended before the array {self.key!r} was complete.')
+        # end if
+    # end def
+
+    def _seek(self) -> None:
+        """
+        Skips through the object until the start of our array.
+        """
+        text = self._text
+        while True:
+            match = _STRUCTURAL.search(text, self._pos)
+            if match is None:
+                self._pos = len(text)
+                return
+            # end if
+            pos = match.start()
+            char = text[pos]
+            if char == '"':
+                end = self._string_end(text, pos + 1)
+                if end is None:  # not complete yet, look at it again with the next chunk.
+                    self._pos = pos
+                    return
+                # end if
+                if self._depth == 1:
+                    self._last_string = text[pos + 1:end]
+                # end if
+                self._pos = end + 1
+                continue
+            # end if
+            self._pos = pos + 1
+            if char in '{[':
+                self._depth += 1
+                if char == '[' and self._depth == 2 and self._is_our_value:
+                    self._state = _ARRAY
+                    return
+                # end if
+            elif char in '}]':
+                self._depth -= 1
+            elif char == ',' and self._depth == 1:
+                self._is_our_value = False
+            elif char == ':' and self._depth == 1:
+                # keys don't contain escapes for this api, so comparing the raw text is fine.
+                self._is_our_value = self._last_string == self.key
+            # end if
+        # end while
+    # end def
+
+    def _read_items(self, items: List[Any]) -> None:
+        """
+        Parses the complete items of the array.
+        """
+        text = self._text
+        pos = self._pos
+        while True:
+            pos = _WHITESPACE.match(text, pos).end()
+            if pos == len(text):
+                break
+            # end if
+            char = text[pos]
+            if char == ']' and (not self._expect_item or self._count == 0):
+                self._state = _DONE
+                break
+            # end if
+            if char == ',' and not self._expect_item:
+                self._expect_item = True
+                pos += 1
+                continue
+            # end if
+            try:
+                item, end = self._json.raw_decode(text, pos)
+            except ValueError:  # not complete yet.
+                break
+            # end try
+            if end == len(text):  # a number might continue in the next chunk, so we wait for what follows.
+                break
+            # end if
+            items.append(item)
+            self._count += 1
+            self._expect_item = False
+            pos = end
+        # end while
+        self._pos = pos
+    # end def
+
+    @staticmethod
+    def _string_end(text: str, start: int) -> Union[int, None]:
+        """
+        :return: The position of the quote ending the string starting at `start`, or `None` if it didn't arrive yet.
+        """
+        while True:
+            end = text.find('"', start)
+            if end == -1:
+                return None
+            # end if
+            backslashes = 0
+            while text[end - 1 - backslashes] == '\\':
+                backslashes += 1
+            # end while
+            if backslashes % 2 == 0:  # not escaped
+                return end
+            # end if
+            start = end + 1
+        # end while
+    # end def
+# end class
@@ -6,14 +6,30 @@ __author__ = 'luckydonald'
 from luckydonaldUtils.logger import logging
 from luckydonaldUtils.exceptions import assert_type_or_raise
 
-from typing import Union, List, Dict, Type, Any
+from typing import Union, List, Dict, Type, Any, Tuple, Callable, Iterator
 from .models import *
+from ..cache import BaseCache, MemoryCache, SQLiteCache, make_cache_key
+from ..exceptions import *
+from ..retry import RetryPolicy, NO_RETRY
+from ..ratelimit import RateLimiter, TokenBucket, FileTokenBucket
+from ..decoding import set_json_decoder, get_json_decoder, decode_json
+from ..streaming import JsonArrayStream
+
+import json
+import math
+import time
+import base64
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
 
 # import either requests or httpx, whichever sync http client is available.
 try:
     is_requests = True
     import requests as internet
+    from requests.adapters import HTTPAdapter
     CLIENT_TYPE = internet.Session
+    TRANSPORT_ERRORS = (internet.ConnectionError, internet.Timeout)
 except ImportError:
     is_requests = False
     try:
@@ -22,6 +38,7 @@ except ImportError:
         raise ImportError('Neither "requests" nor "httpx" could be found. Make sure either of them is installed.')
     # end try
     CLIENT_TYPE = internet.Client
+    TRANSPORT_ERRORS = (internet.TransportError,)
 # end try
 
 
@@ -31,9 +48,213 @@ if __name__ == '__main__':
 # end if
 
 
+MAX_PER_PAGE = 50  # the api returns at most that many items per page, even if more were requested.
+
+
+def _pin_query(query: Union[str, None], condition: str) -> str:
+    """
+    Narrows a search query down with another condition, like `id.lte:1234`.
+
+    :param query: The search query.
+    :param condition: The condition the results have to match as well.
+    :return: Both combined. For an empty query (which `() && ...` would be a syntax error for) only the condition.
+    """
+    if not query or not query.strip():
+        return condition
+    # end if
+    return f'({query}) && {condition}'
+# end def
+
+
+def _paginate(
+    fetch_page: Callable[[int], List[Any]],
+    per_page: Union[int, None] = None,
+    limit: Union[int, None] = None,
+) -> Iterator[Any]:
+    """
+    Walks through all the pages, starting at page `1`, yielding every single item.
+    While the items of a page are consumed, the next page is already requested in a background thread.
+
+    :param fetch_page: Function loading a single page.
+    :param per_page: The page size we requested, if known. A shorter page is the last one.
+                     Capped at `MAX_PER_PAGE`, as the api doesn't return more.
+    :param limit: Stop after that many items. `None` to get all of them.
+    """
+    page = 1
+    count = 0
+    if per_page is not None:
+        per_page = min(per_page, MAX_PER_PAGE)
+    # end if
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='derpi-prefetch')
+    next_page: Union[Future, None] = executor.submit(fetch_page, page)
+    try:
+        while next_page is not None:
+            items = next_page.result()
+            next_page = None
+            if not items:
+                return
+            # end if
+            if per_page is None:  # the first page tells us how big they are.
+                per_page = len(items)
+            # end if
+            if len(items) >= per_page and (limit is None or count + len(items) < limit):
+                page += 1
+                next_page = executor.submit(fetch_page, page)
+            # end if
+            for item in items:
+                yield item
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+                # end if
+            # end for
+        # end while
+    finally:
+        if next_page is not None:  # we have been stopped early, so we don't need it any longer.
+            next_page.cancel()
+        # end if
+        executor.shutdown(wait=False)
+    # end try
+# end def
+
+
+def _fan_out(
+    fetch_page: Callable[[int], SearchResult],
+    first_page: SearchResult,
+    per_page: Union[int, None] = None,
+    limit: Union[int, None] = None,
+    max_concurrency: int = 4,
+) -> SearchResult:
+    """
+    Loads all the pages after `first_page` concurrently, with at most `max_concurrency` requests at the same time.
+
+    :param fetch_page: Function loading a single page.
+    :param first_page: The already loaded first page, telling us the `total` amount of results.
+    :param per_page: The page size we requested, if known. Otherwise the size of the first page is used.
+                     Capped at `MAX_PER_PAGE`, as the api doesn't return more.
+    :param limit: Stop after that many items. `None` to get all of them.
+    :param max_concurrency: How many pages may be requested at the same time.
+    """
+    hits = list(first_page.hits)
+    wanted = first_page.total if limit is None else min(first_page.total, limit)
+    if per_page is None:
+        per_page = len(hits)
+    # end if
+    per_page = min(per_page, MAX_PER_PAGE)
+    if per_page and len(hits) < wanted:
+        with ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix='derpi-fan-out') as executor:
+            for page in executor.map(fetch_page, range(2, math.ceil(wanted / per_page) + 1)):
+                hits.extend(page.hits)
+            # end for
+        # end with
+    # end if
+    return SearchResult(hits=hits[:wanted], total=first_page.total)
+# end def
+
+class SearchCursor(object):
+    """
+    Walks through the results of a search with keyset pagination:
+    Instead of requesting page after page, the results are sorted by `id` (descending),
+    and every next page is requested as the first page of everything older than the last item we've seen (`id.lt:<id>`).
+    That way every page costs the same, no matter how deep we are, and new items arriving while crawling don't shift the pages.
+
+    To be able to resume later, store the `token`. It always points after the last item yielded so far,
+    and can be handed in as `cursor=token` to continue from there.
+    >>> cursor = cursor_search_images('safe')
+    >>> for image in cursor:
+    ...     store(image, resume_token=cursor.token)
+    """
+
+    def __init__(
+        self,
+        fetch_page: Callable[[str], SearchResult],
+        query: str,
+        token: Union[str, None] = None,
+        limit: Union[int, None] = None,
+        raw: bool = False,
+    ):
+        """
+        :param fetch_page: Function loading the first page for a given query.
+        :param query: The search query to walk through.
+        :param token: A `token` of an earlier cursor with the same `query`, to continue where that one stopped.
+        :param limit: Stop after that many items. `None` to get all of them.
+        :param raw: Yield the json of the items (see their `to_dict()`) instead of the models.
+        """
+        self._fetch_page = fetch_page
+        self._raw = raw
+        self.query = query
+        self.last_id: Union[int, None] = None
+        if token is not None:
+            token_query, self.last_id = self.decode_token(token)
+            if token_query != query:
+                raise ValueError(f'The cursor token belongs to the query {token_query!r}, not {query!r}.')
+            # end if
+        # end if
+        self.limit = limit
+        self.count = 0
+        self._items: List[Any] = []
+        self._is_last_page = False
+    # end def
+
+    @property
+    def token(self) -> str:
+        """
+        A string representing the current position, to continue after the last yielded item.
+        """
+        return self.encode_token(self.query, self.last_id)
+    # end def
+
+    @staticmethod
+    def encode_token(query: str, last_id: Union[int, None]) -> str:
+        data = json.dumps({'q': query, 'lt': last_id}, separators=(',', ':')).encode('utf-8')
+        return base64.urlsafe_b64encode(data).decode('ascii')
+    # end def
+
+    @staticmethod
+    def decode_token(token: str) -> Tuple[str, Union[int, None]]:
+        data = json.loads(base64.urlsafe_b64decode(token.encode('ascii')).decode('utf-8'))
+        return data['q'], data['lt']
+    # end def
+
+    def page_query(self) -> str:
+        """
+        The query to request the next page with.
+        """
+        if self.last_id is None:
+            return self.query
+        # end if
+        return _pin_query(self.query, f'id.lt:{self.last_id}')
+    # end def
+
+    def __iter__(self) -> 'SearchCursor':
+        return self
+    # end def
+
+    def __next__(self) -> Any:
+        if self.limit is not None and self.count >= self.limit:
+            raise StopIteration
+        # end if
+        if not self._items and not self._is_last_page:
+            page: SearchResult = self._fetch_page(self.page_query())
+            self._items = list(page.hits)
+            # `total` counts everything older than `last_id`, so if we got all of that, there's nothing left.
+            self._is_last_page = len(self._items) >= page.total
+        # end if
+        if not self._items:
+            raise StopIteration
+        # end if
+        item = self._items.pop(0)
+        self.last_id = item.id
+        self.count += 1
+        return item.to_dict() if self._raw else item
+    # end def
+# end class
+
+
 def comment(
     comment_id: int,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: Union[None, bool, str] = None,
 ) -> Comment:
     """
     Fetches a **comment response** for the comment ID referenced by the `comment_id` URL parameter.
@@ -70,15 +291,34 @@ def comment(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
     :rtype:  Comment
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/comments/{comment_id}')
-    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client)
-    result: Dict[str, Dict] = response.json()
+    response: internet.Response = DerpiClient.static_request('GET', url=_url, route='comment', client=_client)
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, Dict] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Comment] = LazyComment
+    elif _raw:
+        return result
+    else:
+        model: Type[Comment] = Comment
+    # end if
     result: Dict = result['comment']
     assert_type_or_raise(result, dict, parameter_name='result')
-    result: Comment = Comment.from_dict(result)
+    result: Comment = model.from_dict(result)
     return result
 # end def comment
 
@@ -88,6 +328,7 @@ def image(
     filter_id: Union[int, None] = None,
     key: Union[str, None] = None,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: Union[None, bool, str] = None,
 ) -> Image:
     """
     Fetches an **image response** for the image ID referenced by the `image_id` URL parameter.
@@ -132,18 +373,37 @@ def image(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
     :rtype:  Image
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/images/{image_id}')
-    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params={
+    response: internet.Response = DerpiClient.static_request('GET', url=_url, route='image', client=_client, params={
         'filter_id': filter_id,
         'key': key,
     })
-    result: Dict[str, Dict] = response.json()
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, Dict] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Image] = LazyImage
+    elif _raw:
+        return result
+    else:
+        model: Type[Image] = Image
+    # end if
     result: Dict = result['image']
     assert_type_or_raise(result, dict, parameter_name='result')
-    result: Image = Image.from_dict(result)
+    result: Image = model.from_dict(result)
     return result
 # end def image
 
@@ -152,6 +412,7 @@ def image_upload(
     url: str,
     key: Union[str, None] = None,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: Union[None, bool, str] = None,
 ) -> Image:
     """
     Submits a new image. Both `key` and `url` are required. Errors will result in an `{"errors":image-errors-response}`.
@@ -193,24 +454,44 @@ def image_upload(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
     :rtype:  Image
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/images')
-    response: internet.Response = DerpiClient.static_request('POST', url=_url, client=_client, params={
+    response: internet.Response = DerpiClient.static_request('POST', url=_url, route='image_upload', client=_client, params={
         'url': url,
         'key': key,
     })
-    result: Dict[str, Dict] = response.json()
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, Dict] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Image] = LazyImage
+    elif _raw:
+        return result
+    else:
+        model: Type[Image] = Image
+    # end if
     result: Dict = result['image']
     assert_type_or_raise(result, dict, parameter_name='result')
-    result: Image = Image.from_dict(result)
+    result: Image = model.from_dict(result)
     return result
 # end def image_upload
 
 
 def featured_image(
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: Union[None, bool, str] = None,
 ) -> Image:
     """
     Fetches an **image response** for the for the current featured image.
@@ -244,15 +525,34 @@ def featured_image(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
     :rtype:  Image
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/images/featured')
-    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client)
-    result: Dict[str, Dict] = response.json()
+    response: internet.Response = DerpiClient.static_request('GET', url=_url, route='featured_image', client=_client)
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, Dict] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Image] = LazyImage
+    elif _raw:
+        return result
+    else:
+        model: Type[Image] = Image
+    # end if
     result: Dict = result['image']
     assert_type_or_raise(result, dict, parameter_name='result')
-    result: Image = Image.from_dict(result)
+    result: Image = model.from_dict(result)
     return result
 # end def featured_image
 
@@ -260,6 +560,7 @@ def featured_image(
 def tag(
     tag_id: str,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: Union[None, bool, str] = None,
 ) -> Tag:
     """
     Fetches a **tag response** for the **tag slug** given by the `tag_id` URL parameter. The tag's ID is **not** used. For getting a tag by ID the search endpoint can be used like `search/tags?q=id:4458`.
@@ -296,15 +597,34 @@ def tag(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
     :rtype:  Tag
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/tags/{tag_id}')
-    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client)
-    result: Dict[str, Dict] = response.json()
+    response: internet.Response = DerpiClient.static_request('GET', url=_url, route='tag', client=_client)
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, Dict] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Tag] = LazyTag
+    elif _raw:
+        return result
+    else:
+        model: Type[Tag] = Tag
+    # end if
     result: Dict = result['tag']
     assert_type_or_raise(result, dict, parameter_name='result')
-    result: Tag = Tag.from_dict(result)
+    result: Tag = model.from_dict(result)
     return result
 # end def tag
 
@@ -312,6 +632,7 @@ def tag(
 def post(
     post_id: int,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: Union[None, bool, str] = None,
 ) -> Post:
     """
     Fetches a **post response** for the post ID given by the `post_id` URL parameter.
@@ -348,15 +669,34 @@ def post(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
     :rtype:  Post
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/posts/{post_id}')
-    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client)
-    result: Dict[str, Dict] = response.json()
+    response: internet.Response = DerpiClient.static_request('GET', url=_url, route='post', client=_client)
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, Dict] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Post] = LazyPost
+    elif _raw:
+        return result
+    else:
+        model: Type[Post] = Post
+    # end if
     result: Dict = result['post']
     assert_type_or_raise(result, dict, parameter_name='result')
-    result: Post = Post.from_dict(result)
+    result: Post = model.from_dict(result)
     return result
 # end def post
 
@@ -364,6 +704,7 @@ def post(
 def user(
     user_id: int,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: Union[None, bool, str] = None,
 ) -> User:
     """
     Fetches a **profile response** for the user ID given by the `user_id` URL parameter.
@@ -400,15 +741,34 @@ def user(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
     :rtype:  User
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/profiles/{user_id}')
-    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client)
-    result: Dict[str, Dict] = response.json()
+    response: internet.Response = DerpiClient.static_request('GET', url=_url, route='user', client=_client)
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, Dict] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[User] = LazyUser
+    elif _raw:
+        return result
+    else:
+        model: Type[User] = User
+    # end if
     result: Dict = result['user']
     assert_type_or_raise(result, dict, parameter_name='result')
-    result: User = User.from_dict(result)
+    result: User = model.from_dict(result)
     return result
 # end def user
 
@@ -417,6 +777,7 @@ def filter(
     filter_id: int,
     key: Union[str, None] = None,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: Union[None, bool, str] = None,
 ) -> Filter:
     """
     Fetches a **filter response** for the filter ID given by the `filter_id` URL parameter.
@@ -458,17 +819,36 @@ def filter(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
     :rtype:  Filter
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/filters/{filter_id}')
-    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params={
+    response: internet.Response = DerpiClient.static_request('GET', url=_url, route='filter', client=_client, params={
         'key': key,
     })
-    result: Dict[str, Dict] = response.json()
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, Dict] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Filter] = LazyFilter
+    elif _raw:
+        return result
+    else:
+        model: Type[Filter] = Filter
+    # end if
     result: Dict = result['filter']
     assert_type_or_raise(result, dict, parameter_name='result')
-    result: Filter = Filter.from_dict(result)
+    result: Filter = model.from_dict(result)
     return result
 # end def filter
 
@@ -476,6 +856,7 @@ def filter(
 def system_filters(
     page: Union[int, None] = None,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: Union[None, bool, str] = None,
 ) -> List[Filter]:
     """
     Fetches a list of **filter responses** that are flagged as being **system** filters (and thus usable by anyone).
@@ -512,28 +893,96 @@ def system_filters(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
     :rtype:  List[Filter]
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/filters/system')
-    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params={
+    response: internet.Response = DerpiClient.static_request('GET', url=_url, route='system_filters', client=_client, params={
         'page': page,
     })
-    result: Dict[str, List[Dict]] = response.json()
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, List[Dict]] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Filter] = LazyFilter
+    elif _raw:
+        return result
+    else:
+        model: Type[Filter] = Filter
+    # end if
     result: List[Dict] = result['filters']
     assert_type_or_raise(result, list, parameter_name='result')
     result: List[Filter] = [
-        Filter.from_dict(item)
+        model.from_dict(item)
         for item in result
     ]
     return result
 # end def system_filters
 
 
+def iter_system_filters(
+    limit: Union[int, None] = None,
+    _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: Union[None, bool, str] = None,
+) -> Iterator[Filter]:
+    """
+    Walks through all the pages of `system_filters(...)`, yielding every single `Filter`.
+    While the items of a page are consumed, the next page is already requested in the background.
+
+    >>> for item in iter_system_filters(...):
+    ...     print(item)
+    
+    :param limit: Stop after that many items. `None` to get all of them.
+    :type  limit: int|None
+
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `requests.Session`/`httpx.Client`, see `system_filters(...)`.
+    :type  _client: requests.Session|httpx.Client|DerpiClient|None
+
+    :param _raw: Skip building the models: `True` (or `'bytes'`) yields the decoded json of every item.
+                 `'lazy'` yields lazy models (like `LazyImage`). `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: Iterator over the parsed results from the API.
+    :rtype:  Iterator[Filter]
+    """
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        _raw = True  # a single item has no undecoded body of its own.
+    # end if
+
+    def fetch_page(page: int) -> Union[List[Filter], List[Dict]]:
+        result = system_filters(
+            page=page,
+            _client=_client,
+            _raw=_raw,
+        )
+        if _raw is True:
+            return result['filters']
+        # end if
+        return result
+    # end def
+
+    return _paginate(fetch_page, per_page=None, limit=limit)
+# end def iter_system_filters
+
+
 def user_filters(
     key: str,
     page: Union[int, None] = None,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: Union[None, bool, str] = None,
 ) -> List[Filter]:
     """
     Fetches a list of **filter responses** that belong to the user given by **key**. If no **key** is given or it is invalid, will return a **403 Forbidden** error.
@@ -575,28 +1024,103 @@ def user_filters(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
     :rtype:  List[Filter]
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/filters/user')
-    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params={
+    response: internet.Response = DerpiClient.static_request('GET', url=_url, route='user_filters', client=_client, params={
         'key': key,
         'page': page,
     })
-    result: Dict[str, List[Dict]] = response.json()
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, List[Dict]] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Filter] = LazyFilter
+    elif _raw:
+        return result
+    else:
+        model: Type[Filter] = Filter
+    # end if
     result: List[Dict] = result['filters']
     assert_type_or_raise(result, list, parameter_name='result')
     result: List[Filter] = [
-        Filter.from_dict(item)
+        model.from_dict(item)
         for item in result
     ]
     return result
 # end def user_filters
 
 
+def iter_user_filters(
+    key: str,
+    limit: Union[int, None] = None,
+    _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: Union[None, bool, str] = None,
+) -> Iterator[Filter]:
+    """
+    Walks through all the pages of `user_filters(...)`, yielding every single `Filter`.
+    While the items of a page are consumed, the next page is already requested in the background.
+
+    >>> for item in iter_user_filters(...):
+    ...     print(item)
+    
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+    :type  key: str
+    
+    :param limit: Stop after that many items. `None` to get all of them.
+    :type  limit: int|None
+
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `requests.Session`/`httpx.Client`, see `user_filters(...)`.
+    :type  _client: requests.Session|httpx.Client|DerpiClient|None
+
+    :param _raw: Skip building the models: `True` (or `'bytes'`) yields the decoded json of every item.
+                 `'lazy'` yields lazy models (like `LazyImage`). `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: Iterator over the parsed results from the API.
+    :rtype:  Iterator[Filter]
+    """
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        _raw = True  # a single item has no undecoded body of its own.
+    # end if
+
+    def fetch_page(page: int) -> Union[List[Filter], List[Dict]]:
+        result = user_filters(
+            key=key,
+            page=page,
+            _client=_client,
+            _raw=_raw,
+        )
+        if _raw is True:
+            return result['filters']
+        # end if
+        return result
+    # end def
+
+    return _paginate(fetch_page, per_page=None, limit=limit)
+# end def iter_user_filters
+
+
 def oembed(
     url: str,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: Union[None, bool, str] = None,
 ) -> Oembed:
     """
     Fetches an **oEmbed response** for the given app link or CDN URL.
@@ -633,16 +1157,35 @@ def oembed(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
     :rtype:  Oembed
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/oembed')
-    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params={
+    response: internet.Response = DerpiClient.static_request('GET', url=_url, route='oembed', client=_client, params={
         'url': url,
     })
-    result: Dict = response.json()
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Oembed] = LazyOembed
+    elif _raw:
+        return result
+    else:
+        model: Type[Oembed] = Oembed
+    # end if
     assert_type_or_raise(result, dict, parameter_name='result')
-    result: Oembed = Oembed.from_dict(result)
+    result: Oembed = model.from_dict(result)
     return result
 # end def oembed
 
@@ -652,7 +1195,8 @@ def search_comments(
     page: Union[int, None] = None,
     key: Union[str, None] = None,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
-) -> List[Comment]:
+    _raw: Union[None, bool, str] = None,
+) -> SearchResult[Comment]:
     """
     Executes the search given by the `q` query parameter (case insensitive and stemming is applied. If you search for **best pony** results like **Best Ponies** are also be returned), and returns **comment responses** sorted by descending creation time.
 
@@ -660,7 +1204,7 @@ def search_comments(
     It will take in account `self._base_url` and fill in all url variables and append the data parameters as needed,
     which would for example look like this: https://derpibooru.org/api/v1/json/search/comments?q=image_id:1000000
 
-    The API should return json looking like `{"comments":[Comment]}` which will then be parsed to the python result `List[Comment]`.
+    The API should return json looking like `{"comments":[Comment]}` which will then be parsed to the python result `SearchResult[Comment]`.
     
     :param query: The current search query, if the request is a search request.
                   Note, on derpibooru's side this parameter is called `q`.
@@ -697,32 +1241,249 @@ def search_comments(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
-    :rtype:  List[Comment]
+    :rtype:  SearchResult[Comment]
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/search/comments')
-    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params={
+    response: internet.Response = DerpiClient.static_request('GET', url=_url, route='search_comments', client=_client, params={
         'q': query,
         'page': page,
         'key': key,
     })
-    result: Dict[str, List[Dict]] = response.json()
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, Union[List[Dict], int]] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Comment] = LazyComment
+    elif _raw:
+        return result
+    else:
+        model: Type[Comment] = Comment
+    # end if
+    total: int = result['total']
     result: List[Dict] = result['comments']
     assert_type_or_raise(result, list, parameter_name='result')
-    result: List[Comment] = [
-        Comment.from_dict(item)
-        for item in result
-    ]
+    result: SearchResult[Comment] = SearchResult(
+        hits=[
+            model.from_dict(item)
+            for item in result
+        ],
+        total=total,
+    )
     return result
 # end def search_comments
 
 
+def iter_search_comments(
+    query: str,
+    key: Union[str, None] = None,
+    limit: Union[int, None] = None,
+    _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: Union[None, bool, str] = None,
+) -> Iterator[Comment]:
+    """
+    Walks through all the pages of `search_comments(...)`, yielding every single `Comment`.
+    While the items of a page are consumed, the next page is already requested in the background.
+
+    >>> for item in iter_search_comments(...):
+    ...     print(item)
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+    :type  key: str|None
+    
+    :param limit: Stop after that many items. `None` to get all of them.
+    :type  limit: int|None
+
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `requests.Session`/`httpx.Client`, see `search_comments(...)`.
+    :type  _client: requests.Session|httpx.Client|DerpiClient|None
+
+    :param _raw: Skip building the models: `True` (or `'bytes'`) yields the decoded json of every item.
+                 `'lazy'` yields lazy models (like `LazyImage`). `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: Iterator over the parsed results from the API.
+    :rtype:  Iterator[Comment]
+    """
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        _raw = True  # a single item has no undecoded body of its own.
+    # end if
+
+    def fetch_page(page: int) -> Union[SearchResult[Comment], List[Dict]]:
+        result = search_comments(
+            query=query,
+            page=page,
+            key=key,
+            _client=_client,
+            _raw=_raw,
+        )
+        if _raw is True:
+            return result['comments']
+        # end if
+        return result
+    # end def
+
+    return _paginate(fetch_page, per_page=None, limit=limit)
+# end def iter_search_comments
+
+
+def fan_out_search_comments(
+    query: str,
+    key: Union[str, None] = None,
+    limit: Union[int, None] = None,
+    max_concurrency: int = 4,
+    _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: Union[None, bool, str] = None,
+) -> SearchResult[Comment]:
+    """
+    Loads all the results of `search_comments(...)` at once:
+    After the first page told us the `total` amount of results, all the remaining pages are requested concurrently,
+    with at most `max_concurrency` requests at the same time.
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+    :type  key: str|None
+    
+    :param limit: Stop after that many items. `None` to get all of them.
+    :type  limit: int|None
+
+    :param max_concurrency: How many pages may be requested at the same time.
+    :type  max_concurrency: int
+
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `requests.Session`/`httpx.Client`, see `search_comments(...)`.
+    :type  _client: requests.Session|httpx.Client|DerpiClient|None
+
+    :param _raw: Skip building the models: `True` (or `'bytes'`) returns json like a single page, with all the items.
+                 `'lazy'` returns lazy models (like `LazyImage`). `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: All the parsed results from the API.
+    :rtype:  SearchResult[Comment]
+    """
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    model_mode = 'lazy' if _raw else False  # the ids and the total are needed, the lazy models just wrap the json.
+
+    def fetch_page(page: int) -> SearchResult[Comment]:
+        return search_comments(
+            query=query,
+            page=page,
+            key=key,
+            _client=_client,
+            _raw=model_mode,
+        )
+    # end def
+
+    result = _fan_out(
+        fetch_page, fetch_page(1),
+        per_page=None, limit=limit, max_concurrency=max_concurrency,
+    )
+    if _raw and _raw != 'lazy':
+        return {'comments': [item.to_dict() for item in result.hits], 'total': result.total}
+    # end if
+    return result
+# end def fan_out_search_comments
+
+
+def stream_search_comments(
+    query: str,
+    page: Union[int, None] = None,
+    key: Union[str, None] = None,
+    _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: Union[None, bool, str] = None,
+) -> Iterator[Comment]:
+    """
+    Like `search_comments(...)`, but parses the page while it is still being downloaded,
+    yielding every single `Comment` as soon as it arrived completely.
+    That gets you the first results earlier, and never keeps the whole page in memory.
+    Note, those requests are neither cached nor retried, see `DerpiClient.static_stream(...)`.
+
+    >>> for item in stream_search_comments(...):
+    ...     print(item)
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+    :type  page: int|None
+    
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+    :type  key: str|None
+    
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `requests.Session`/`httpx.Client`, see `search_comments(...)`.
+    :type  _client: requests.Session|httpx.Client|DerpiClient|None
+
+    :param _raw: Skip building the models: `True` (or `'bytes'`) yields the decoded json of every item.
+                 `'lazy'` yields lazy models (like `LazyImage`). `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: Iterator over the parsed results from the API.
+    :rtype:  Iterator[Comment]
+    """
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'lazy':
+        model: Union[Type[Comment], None] = LazyComment
+    elif _raw:
+        model: Union[Type[Comment], None] = None
+    else:
+        model: Union[Type[Comment], None] = Comment
+    # end if
+    _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/search/comments')
+    items = JsonArrayStream('comments')
+    chunks = DerpiClient.static_stream('GET', url=_url, client=_client, params={
+        'q': query,
+        'page': page,
+        'key': key,
+    })
+    try:
+        for chunk in chunks:
+            for item in items.feed(chunk):
+                yield item if model is None else model.from_dict(item)
+            # end for
+        # end for
+    finally:
+        chunks.close()
+    # end try
+    items.close()
+# end def stream_search_comments
+
+
 def search_galleries(
     query: str,
     page: Union[int, None] = None,
     key: Union[str, None] = None,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
-) -> List[Gallery]:
+    _raw: Union[None, bool, str] = None,
+) -> SearchResult[Gallery]:
     """
     Executes the search given by the `q` query parameter, and returns **gallery responses** sorted by descending creation time.
 
@@ -730,7 +1491,7 @@ def search_galleries(
     It will take in account `self._base_url` and fill in all url variables and append the data parameters as needed,
     which would for example look like this: https://derpibooru.org/api/v1/json/search/galleries?q=title:mean*
 
-    The API should return json looking like `{"galleries":[Gallery]}` which will then be parsed to the python result `List[Gallery]`.
+    The API should return json looking like `{"galleries":[Gallery]}` which will then be parsed to the python result `SearchResult[Gallery]`.
     
     :param query: The current search query, if the request is a search request.
                   Note, on derpibooru's side this parameter is called `q`.
@@ -767,97 +1528,904 @@ def search_galleries(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
-    :rtype:  List[Gallery]
+    :rtype:  SearchResult[Gallery]
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/search/galleries')
-    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params={
+    response: internet.Response = DerpiClient.static_request('GET', url=_url, route='search_galleries', client=_client, params={
         'q': query,
         'page': page,
         'key': key,
     })
-    result: Dict[str, List[Dict]] = response.json()
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, Union[List[Dict], int]] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Gallery] = LazyGallery
+    elif _raw:
+        return result
+    else:
+        model: Type[Gallery] = Gallery
+    # end if
+    total: int = result['total']
     result: List[Dict] = result['galleries']
     assert_type_or_raise(result, list, parameter_name='result')
-    result: List[Gallery] = [
-        Gallery.from_dict(item)
-        for item in result
-    ]
+    result: SearchResult[Gallery] = SearchResult(
+        hits=[
+            model.from_dict(item)
+            for item in result
+        ],
+        total=total,
+    )
     return result
 # end def search_galleries
 
 
-def search_posts(
+def iter_search_galleries(
     query: str,
-    page: Union[int, None] = None,
     key: Union[str, None] = None,
+    limit: Union[int, None] = None,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
-) -> List[Post]:
+    _raw: Union[None, bool, str] = None,
+) -> Iterator[Gallery]:
+    """
+    Walks through all the pages of `search_galleries(...)`, yielding every single `Gallery`.
+    While the items of a page are consumed, the next page is already requested in the background.
+
+    >>> for item in iter_search_galleries(...):
+    ...     print(item)
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+    :type  key: str|None
+    
+    :param limit: Stop after that many items. `None` to get all of them.
+    :type  limit: int|None
+
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `requests.Session`/`httpx.Client`, see `search_galleries(...)`.
+    :type  _client: requests.Session|httpx.Client|DerpiClient|None
+
+    :param _raw: Skip building the models: `True` (or `'bytes'`) yields the decoded json of every item.
+                 `'lazy'` yields lazy models (like `LazyImage`). `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: Iterator over the parsed results from the API.
+    :rtype:  Iterator[Gallery]
+    """
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        _raw = True  # a single item has no undecoded body of its own.
+    # end if
+
+    def fetch_page(page: int) -> Union[SearchResult[Gallery], List[Dict]]:
+        result = search_galleries(
+            query=query,
+            page=page,
+            key=key,
+            _client=_client,
+            _raw=_raw,
+        )
+        if _raw is True:
+            return result['galleries']
+        # end if
+        return result
+    # end def
+
+    return _paginate(fetch_page, per_page=None, limit=limit)
+# end def iter_search_galleries
+
+
+def fan_out_search_galleries(
+    query: str,
+    key: Union[str, None] = None,
+    limit: Union[int, None] = None,
+    max_concurrency: int = 4,
+    _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: Union[None, bool, str] = None,
+) -> SearchResult[Gallery]:
+    """
+    Loads all the results of `search_galleries(...)` at once:
+    After the first page told us the `total` amount of results, all the remaining pages are requested concurrently,
+    with at most `max_concurrency` requests at the same time.
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+    :type  key: str|None
+    
+    :param limit: Stop after that many items. `None` to get all of them.
+    :type  limit: int|None
+
+    :param max_concurrency: How many pages may be requested at the same time.
+    :type  max_concurrency: int
+
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `requests.Session`/`httpx.Client`, see `search_galleries(...)`.
+    :type  _client: requests.Session|httpx.Client|DerpiClient|None
+
+    :param _raw: Skip building the models: `True` (or `'bytes'`) returns json like a single page, with all the items.
+                 `'lazy'` returns lazy models (like `LazyImage`). `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: All the parsed results from the API.
+    :rtype:  SearchResult[Gallery]
+    """
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    model_mode = 'lazy' if _raw else False  # the ids and the total are needed, the lazy models just wrap the json.
+
+    def fetch_page(page: int) -> SearchResult[Gallery]:
+        return search_galleries(
+            query=query,
+            page=page,
+            key=key,
+            _client=_client,
+            _raw=model_mode,
+        )
+    # end def
+
+    result = _fan_out(
+        fetch_page, fetch_page(1),
+        per_page=None, limit=limit, max_concurrency=max_concurrency,
+    )
+    if _raw and _raw != 'lazy':
+        return {'galleries': [item.to_dict() for item in result.hits], 'total': result.total}
+    # end if
+    return result
+# end def fan_out_search_galleries
+
+
+def stream_search_galleries(
+    query: str,
+    page: Union[int, None] = None,
+    key: Union[str, None] = None,
+    _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: Union[None, bool, str] = None,
+) -> Iterator[Gallery]:
+    """
+    Like `search_galleries(...)`, but parses the page while it is still being downloaded,
+    yielding every single `Gallery` as soon as it arrived completely.
+    That gets you the first results earlier, and never keeps the whole page in memory.
+    Note, those requests are neither cached nor retried, see `DerpiClient.static_stream(...)`.
+
+    >>> for item in stream_search_galleries(...):
+    ...     print(item)
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+    :type  page: int|None
+    
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+    :type  key: str|None
+    
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `requests.Session`/`httpx.Client`, see `search_galleries(...)`.
+    :type  _client: requests.Session|httpx.Client|DerpiClient|None
+
+    :param _raw: Skip building the models: `True` (or `'bytes'`) yields the decoded json of every item.
+                 `'lazy'` yields lazy models (like `LazyImage`). `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: Iterator over the parsed results from the API.
+    :rtype:  Iterator[Gallery]
+    """
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'lazy':
+        model: Union[Type[Gallery], None] = LazyGallery
+    elif _raw:
+        model: Union[Type[Gallery], None] = None
+    else:
+        model: Union[Type[Gallery], None] = Gallery
+    # end if
+    _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/search/galleries')
+    items = JsonArrayStream('galleries')
+    chunks = DerpiClient.static_stream('GET', url=_url, client=_client, params={
+        'q': query,
+        'page': page,
+        'key': key,
+    })
+    try:
+        for chunk in chunks:
+            for item in items.feed(chunk):
+                yield item if model is None else model.from_dict(item)
+            # end for
+        # end for
+    finally:
+        chunks.close()
+    # end try
+    items.close()
+# end def stream_search_galleries
+
+
+def search_posts(
+    query: str,
+    page: Union[int, None] = None,
+    key: Union[str, None] = None,
+    _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: Union[None, bool, str] = None,
+) -> SearchResult[Post]:
     """
     Executes the search given by the `q` query parameter, and returns **post responses** sorted by descending creation time.
 
-    A request will be sent to the following endpoint: `/api/v1/json/search/posts`
-    It will take in account `self._base_url` and fill in all url variables and append the data parameters as needed,
-    which would for example look like this: https://derpibooru.org/api/v1/json/search/posts?q=subject:time wasting thread
+    A request will be sent to the following endpoint: `/api/v1/json/search/posts`
+    It will take in account `self._base_url` and fill in all url variables and append the data parameters as needed,
+    which would for example look like this: https://derpibooru.org/api/v1/json/search/posts?q=subject:time wasting thread
+
+    The API should return json looking like `{"posts":[Post]}` which will then be parsed to the python result `SearchResult[Post]`.
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+    :type  page: int|None
+    
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+    :type  key: str|None
+    
+    :param _client: If you wanna to provide your custom `DerpiClient` or just an already opened `requests.Session`/`httpx.Client`.
+                    For example with requests:
+                    >>> client = requests.Session()
+                    >>> result = search_posts(..., _client=client)
+
+                    If you use httpx instead of requests, this would be with a context manager:
+                    >>> with httpx.Client() as client:
+                    ...     result = search_posts(..., _client=client)
+
+                    Or httpx and manually closing it:
+                    >>> client = httpx.Client()
+                    >>> try:
+                    ...     result = search_posts(..., _client=client)
+                    ... finally:
+                    ...     client.close()
+
+                    You can provide a DerpiClient instance as well, to that same variable:
+                    >>> client = DerpiClient(key='...')
+                    >>> client._base_url = 'https://furbooru.org'
+                    >>> result = search_posts(..., _client=client)
+
+    :type  _client: requests.Session|httpx.Client|DerpiClient|None
+    
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: The parsed result from the API.
+    :rtype:  SearchResult[Post]
+    """
+    _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/search/posts')
+    response: internet.Response = DerpiClient.static_request('GET', url=_url, route='search_posts', client=_client, params={
+        'q': query,
+        'page': page,
+        'key': key,
+    })
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, Union[List[Dict], int]] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Post] = LazyPost
+    elif _raw:
+        return result
+    else:
+        model: Type[Post] = Post
+    # end if
+    total: int = result['total']
+    result: List[Dict] = result['posts']
+    assert_type_or_raise(result, list, parameter_name='result')
+    result: SearchResult[Post] = SearchResult(
+        hits=[
+            model.from_dict(item)
+            for item in result
+        ],
+        total=total,
+    )
+    return result
+# end def search_posts
+
+
+def iter_search_posts(
+    query: str,
+    key: Union[str, None] = None,
+    limit: Union[int, None] = None,
+    _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: Union[None, bool, str] = None,
+) -> Iterator[Post]:
+    """
+    Walks through all the pages of `search_posts(...)`, yielding every single `Post`.
+    While the items of a page are consumed, the next page is already requested in the background.
+
+    >>> for item in iter_search_posts(...):
+    ...     print(item)
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+    :type  key: str|None
+    
+    :param limit: Stop after that many items. `None` to get all of them.
+    :type  limit: int|None
+
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `requests.Session`/`httpx.Client`, see `search_posts(...)`.
+    :type  _client: requests.Session|httpx.Client|DerpiClient|None
+
+    :param _raw: Skip building the models: `True` (or `'bytes'`) yields the decoded json of every item.
+                 `'lazy'` yields lazy models (like `LazyImage`). `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: Iterator over the parsed results from the API.
+    :rtype:  Iterator[Post]
+    """
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        _raw = True  # a single item has no undecoded body of its own.
+    # end if
+
+    def fetch_page(page: int) -> Union[SearchResult[Post], List[Dict]]:
+        result = search_posts(
+            query=query,
+            page=page,
+            key=key,
+            _client=_client,
+            _raw=_raw,
+        )
+        if _raw is True:
+            return result['posts']
+        # end if
+        return result
+    # end def
+
+    return _paginate(fetch_page, per_page=None, limit=limit)
+# end def iter_search_posts
+
+
+def fan_out_search_posts(
+    query: str,
+    key: Union[str, None] = None,
+    limit: Union[int, None] = None,
+    max_concurrency: int = 4,
+    _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: Union[None, bool, str] = None,
+) -> SearchResult[Post]:
+    """
+    Loads all the results of `search_posts(...)` at once:
+    After the first page told us the `total` amount of results, all the remaining pages are requested concurrently,
+    with at most `max_concurrency` requests at the same time.
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+    :type  key: str|None
+    
+    :param limit: Stop after that many items. `None` to get all of them.
+    :type  limit: int|None
+
+    :param max_concurrency: How many pages may be requested at the same time.
+    :type  max_concurrency: int
+
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `requests.Session`/`httpx.Client`, see `search_posts(...)`.
+    :type  _client: requests.Session|httpx.Client|DerpiClient|None
+
+    :param _raw: Skip building the models: `True` (or `'bytes'`) returns json like a single page, with all the items.
+                 `'lazy'` returns lazy models (like `LazyImage`). `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: All the parsed results from the API.
+    :rtype:  SearchResult[Post]
+    """
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    model_mode = 'lazy' if _raw else False  # the ids and the total are needed, the lazy models just wrap the json.
+
+    def fetch_page(page: int) -> SearchResult[Post]:
+        return search_posts(
+            query=query,
+            page=page,
+            key=key,
+            _client=_client,
+            _raw=model_mode,
+        )
+    # end def
+
+    result = _fan_out(
+        fetch_page, fetch_page(1),
+        per_page=None, limit=limit, max_concurrency=max_concurrency,
+    )
+    if _raw and _raw != 'lazy':
+        return {'posts': [item.to_dict() for item in result.hits], 'total': result.total}
+    # end if
+    return result
+# end def fan_out_search_posts
+
+
+def stream_search_posts(
+    query: str,
+    page: Union[int, None] = None,
+    key: Union[str, None] = None,
+    _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: Union[None, bool, str] = None,
+) -> Iterator[Post]:
+    """
+    Like `search_posts(...)`, but parses the page while it is still being downloaded,
+    yielding every single `Post` as soon as it arrived completely.
+    That gets you the first results earlier, and never keeps the whole page in memory.
+    Note, those requests are neither cached nor retried, see `DerpiClient.static_stream(...)`.
+
+    >>> for item in stream_search_posts(...):
+    ...     print(item)
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+    :type  page: int|None
+    
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+    :type  key: str|None
+    
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `requests.Session`/`httpx.Client`, see `search_posts(...)`.
+    :type  _client: requests.Session|httpx.Client|DerpiClient|None
+
+    :param _raw: Skip building the models: `True` (or `'bytes'`) yields the decoded json of every item.
+                 `'lazy'` yields lazy models (like `LazyImage`). `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: Iterator over the parsed results from the API.
+    :rtype:  Iterator[Post]
+    """
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'lazy':
+        model: Union[Type[Post], None] = LazyPost
+    elif _raw:
+        model: Union[Type[Post], None] = None
+    else:
+        model: Union[Type[Post], None] = Post
+    # end if
+    _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/search/posts')
+    items = JsonArrayStream('posts')
+    chunks = DerpiClient.static_stream('GET', url=_url, client=_client, params={
+        'q': query,
+        'page': page,
+        'key': key,
+    })
+    try:
+        for chunk in chunks:
+            for item in items.feed(chunk):
+                yield item if model is None else model.from_dict(item)
+            # end for
+        # end for
+    finally:
+        chunks.close()
+    # end try
+    items.close()
+# end def stream_search_posts
+
+
+def search_images(
+    query: str,
+    filter_id: Union[int, None] = None,
+    page: Union[int, None] = None,
+    per_page: Union[int, None] = None,
+    sort_direction: Union[str, None] = None,
+    sort_field: Union[str, None] = None,
+    key: Union[str, None] = None,
+    _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: Union[None, bool, str] = None,
+) -> SearchResult[Image]:
+    """
+    Executes the search given by the `q` query parameter, and returns **image responses**.
+
+    A request will be sent to the following endpoint: `/api/v1/json/search/images`
+    It will take in account `self._base_url` and fill in all url variables and append the data parameters as needed,
+    which would for example look like this: https://derpibooru.org/api/v1/json/search/images?q=safe
+
+    The API should return json looking like `{"images":[Image]}` which will then be parsed to the python result `SearchResult[Image]`.
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param filter_id: Assuming the user can access the filter ID given by the parameter, overrides the current filter for this request. This is primarily useful for unauthenticated API access.
+    :type  filter_id: int|None
+    
+    :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+    :type  page: int|None
+    
+    :param per_page: Controls the number of results per page, up to a limit of 50, if the response is paginated. The default is 25.
+    :type  per_page: int|None
+    
+    :param sort_direction: The current sort direction, if the request is a search request.
+                           Note, on derpibooru's side this parameter is called `sd`.
+    :type  sort_direction: str|None
+    
+    :param sort_field: The current sort field, if the request is a search request.
+                       Note, on derpibooru's side this parameter is called `sf`.
+    :type  sort_field: str|None
+    
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+    :type  key: str|None
+    
+    :param _client: If you wanna to provide your custom `DerpiClient` or just an already opened `requests.Session`/`httpx.Client`.
+                    For example with requests:
+                    >>> client = requests.Session()
+                    >>> result = search_images(..., _client=client)
+
+                    If you use httpx instead of requests, this would be with a context manager:
+                    >>> with httpx.Client() as client:
+                    ...     result = search_images(..., _client=client)
+
+                    Or httpx and manually closing it:
+                    >>> client = httpx.Client()
+                    >>> try:
+                    ...     result = search_images(..., _client=client)
+                    ... finally:
+                    ...     client.close()
+
+                    You can provide a DerpiClient instance as well, to that same variable:
+                    >>> client = DerpiClient(key='...')
+                    >>> client._base_url = 'https://furbooru.org'
+                    >>> result = search_images(..., _client=client)
+
+    :type  _client: requests.Session|httpx.Client|DerpiClient|None
+    
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: The parsed result from the API.
+    :rtype:  SearchResult[Image]
+    """
+    _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/search/images')
+    response: internet.Response = DerpiClient.static_request('GET', url=_url, route='search_images', client=_client, params={
+        'q': query,
+        'filter_id': filter_id,
+        'page': page,
+        'per_page': per_page,
+        'sd': sort_direction,
+        'sf': sort_field,
+        'key': key,
+    })
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, Union[List[Dict], int]] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Image] = LazyImage
+    elif _raw:
+        return result
+    else:
+        model: Type[Image] = Image
+    # end if
+    total: int = result['total']
+    result: List[Dict] = result['images']
+    assert_type_or_raise(result, list, parameter_name='result')
+    result: SearchResult[Image] = SearchResult(
+        hits=[
+            model.from_dict(item)
+            for item in result
+        ],
+        total=total,
+    )
+    return result
+# end def search_images
+
+
+def iter_search_images(
+    query: str,
+    filter_id: Union[int, None] = None,
+    per_page: Union[int, None] = 50,
+    sort_direction: Union[str, None] = None,
+    sort_field: Union[str, None] = None,
+    key: Union[str, None] = None,
+    limit: Union[int, None] = None,
+    _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: Union[None, bool, str] = None,
+) -> Iterator[Image]:
+    """
+    Walks through all the pages of `search_images(...)`, yielding every single `Image`.
+    While the items of a page are consumed, the next page is already requested in the background.
+
+    >>> for item in iter_search_images(...):
+    ...     print(item)
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param filter_id: Assuming the user can access the filter ID given by the parameter, overrides the current filter for this request. This is primarily useful for unauthenticated API access.
+    :type  filter_id: int|None
+    
+    :param per_page: Controls the number of results per page, up to a limit of 50, if the response is paginated. The default is 25.
+                     Here we default to the maximum of 50, to need as few requests as possible.
+    :type  per_page: int|None
+    
+    :param sort_direction: The current sort direction, if the request is a search request.
+                           Note, on derpibooru's side this parameter is called `sd`.
+    :type  sort_direction: str|None
+    
+    :param sort_field: The current sort field, if the request is a search request.
+                       Note, on derpibooru's side this parameter is called `sf`.
+    :type  sort_field: str|None
+    
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+    :type  key: str|None
+    
+    :param limit: Stop after that many items. `None` to get all of them.
+    :type  limit: int|None
+
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `requests.Session`/`httpx.Client`, see `search_images(...)`.
+    :type  _client: requests.Session|httpx.Client|DerpiClient|None
+
+    :param _raw: Skip building the models: `True` (or `'bytes'`) yields the decoded json of every item.
+                 `'lazy'` yields lazy models (like `LazyImage`). `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: Iterator over the parsed results from the API.
+    :rtype:  Iterator[Image]
+    """
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        _raw = True  # a single item has no undecoded body of its own.
+    # end if
+
+    def fetch_page(page: int) -> Union[SearchResult[Image], List[Dict]]:
+        result = search_images(
+            query=query,
+            filter_id=filter_id,
+            page=page,
+            per_page=per_page,
+            sort_direction=sort_direction,
+            sort_field=sort_field,
+            key=key,
+            _client=_client,
+            _raw=_raw,
+        )
+        if _raw is True:
+            return result['images']
+        # end if
+        return result
+    # end def
+
+    return _paginate(fetch_page, per_page=per_page, limit=limit)
+# end def iter_search_images
+
+
+def fan_out_search_images(
+    query: str,
+    filter_id: Union[int, None] = None,
+    per_page: Union[int, None] = 50,
+    sort_direction: Union[str, None] = None,
+    sort_field: Union[str, None] = None,
+    key: Union[str, None] = None,
+    limit: Union[int, None] = None,
+    max_concurrency: int = 4,
+    _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: Union[None, bool, str] = None,
+) -> SearchResult[Image]:
+    """
+    Loads all the results of `search_images(...)` at once:
+    After the first page told us the `total` amount of results, all the remaining pages are requested concurrently,
+    with at most `max_concurrency` requests at the same time.
+    To keep the pages from shifting while new items are added, the query gets pinned to the newest item existing beforehand,
+    by adding `id.lte:<newest id>` to it.
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param filter_id: Assuming the user can access the filter ID given by the parameter, overrides the current filter for this request. This is primarily useful for unauthenticated API access.
+    :type  filter_id: int|None
+    
+    :param per_page: Controls the number of results per page, up to a limit of 50, if the response is paginated. The default is 25.
+                     Here we default to the maximum of 50, to need as few requests as possible.
+    :type  per_page: int|None
+    
+    :param sort_direction: The current sort direction, if the request is a search request.
+                           Note, on derpibooru's side this parameter is called `sd`.
+    :type  sort_direction: str|None
+    
+    :param sort_field: The current sort field, if the request is a search request.
+                       Note, on derpibooru's side this parameter is called `sf`.
+    :type  sort_field: str|None
+    
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+    :type  key: str|None
+    
+    :param limit: Stop after that many items. `None` to get all of them.
+    :type  limit: int|None
 
-    The API should return json looking like `{"posts":[Post]}` which will then be parsed to the python result `List[Post]`.
+    :param max_concurrency: How many pages may be requested at the same time.
+    :type  max_concurrency: int
+
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `requests.Session`/`httpx.Client`, see `search_images(...)`.
+    :type  _client: requests.Session|httpx.Client|DerpiClient|None
+
+    :param _raw: Skip building the models: `True` (or `'bytes'`) returns json like a single page, with all the items.
+                 `'lazy'` returns lazy models (like `LazyImage`). `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: All the parsed results from the API.
+    :rtype:  SearchResult[Image]
+    """
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    model_mode = 'lazy' if _raw else False  # the ids and the total are needed, the lazy models just wrap the json.
+    newest: SearchResult[Image] = search_images(
+        query=query,
+        filter_id=filter_id,
+        page=1,
+        per_page=1,
+        sort_direction='desc',
+        sort_field='id',
+        key=key,
+        _client=_client,
+        _raw=model_mode,
+    )
+    if not newest.hits:
+        return newest if not _raw or _raw == 'lazy' else {'images': [], 'total': newest.total}
+    # end if
+    query = _pin_query(query, f'id.lte:{newest[0].id}')
+
+    def fetch_page(page: int) -> SearchResult[Image]:
+        return search_images(
+            query=query,
+            filter_id=filter_id,
+            page=page,
+            per_page=per_page,
+            sort_direction=sort_direction,
+            sort_field=sort_field,
+            key=key,
+            _client=_client,
+            _raw=model_mode,
+        )
+    # end def
+
+    result = _fan_out(
+        fetch_page, fetch_page(1),
+        per_page=per_page, limit=limit, max_concurrency=max_concurrency,
+    )
+    if _raw and _raw != 'lazy':
+        return {'images': [item.to_dict() for item in result.hits], 'total': result.total}
+    # end if
+    return result
+# end def fan_out_search_images
+
+
+def cursor_search_images(
+    query: str,
+    filter_id: Union[int, None] = None,
+    per_page: Union[int, None] = 50,
+    key: Union[str, None] = None,
+    cursor: Union[str, None] = None,
+    limit: Union[int, None] = None,
+    _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: Union[None, bool, str] = None,
+) -> SearchCursor:
+    """
+    Walks through all the results of `search_images(...)` with keyset pagination, newest first.
+    Every page is requested as `({query}) && id.lt:<last seen id>`, so deep crawls stay fast and don't skip or repeat items.
+    Use the `token` of the returned `SearchCursor` to resume a crawl later.
     
     :param query: The current search query, if the request is a search request.
                   Note, on derpibooru's side this parameter is called `q`.
     :type  query: str
     
-    :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
-    :type  page: int|None
+    :param filter_id: Assuming the user can access the filter ID given by the parameter, overrides the current filter for this request. This is primarily useful for unauthenticated API access.
+    :type  filter_id: int|None
+    
+    :param per_page: Controls the number of results per page, up to a limit of 50, if the response is paginated. The default is 25.
+                     Here we default to the maximum of 50, to need as few requests as possible.
+    :type  per_page: int|None
     
     :param key: An optional authentication token. If omitted, no user will be authenticated.
 
                     You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
     :type  key: str|None
     
-    :param _client: If you wanna to provide your custom `DerpiClient` or just an already opened `requests.Session`/`httpx.Client`.
-                    For example with requests:
-                    >>> client = requests.Session()
-                    >>> result = search_posts(..., _client=client)
+    :param cursor: The `token` of an earlier `SearchCursor` for the same query, to continue after its last item.
+    :type  cursor: str|None
 
-                    If you use httpx instead of requests, this would be with a context manager:
-                    >>> with httpx.Client() as client:
-                    ...     result = search_posts(..., _client=client)
+    :param limit: Stop after that many items. `None` to get all of them.
+    :type  limit: int|None
 
-                    Or httpx and manually closing it:
-                    >>> client = httpx.Client()
-                    >>> try:
-                    ...     result = search_posts(..., _client=client)
-                    ... finally:
-                    ...     client.close()
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `requests.Session`/`httpx.Client`, see `search_images(...)`.
+    :type  _client: requests.Session|httpx.Client|DerpiClient|None
 
-                    You can provide a DerpiClient instance as well, to that same variable:
-                    >>> client = DerpiClient(key='...')
-                    >>> client._base_url = 'https://furbooru.org'
-                    >>> result = search_posts(..., _client=client)
+    :param _raw: Skip building the models: `True` (or `'bytes'`) yields the decoded json of every item.
+                 `'lazy'` yields lazy models (like `LazyImage`). `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
 
-    :type  _client: requests.Session|httpx.Client|DerpiClient|None
-    
-    :return: The parsed result from the API.
-    :rtype:  List[Post]
+    :return: Iterator over the parsed results from the API, with a resumable `token`.
+    :rtype:  SearchCursor
     """
-    _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/search/posts')
-    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params={
-        'q': query,
-        'page': page,
-        'key': key,
-    })
-    result: Dict[str, List[Dict]] = response.json()
-    result: List[Dict] = result['posts']
-    assert_type_or_raise(result, list, parameter_name='result')
-    result: List[Post] = [
-        Post.from_dict(item)
-        for item in result
-    ]
-    return result
-# end def search_posts
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    model_mode = 'lazy' if _raw else False  # the ids are needed, the lazy models just wrap the json.
 
+    def fetch_page(page_query: str) -> SearchResult[Image]:
+        return search_images(
+            query=page_query,
+            filter_id=filter_id,
+            page=1,
+            per_page=per_page,
+            sort_direction='desc',
+            sort_field='id',
+            key=key,
+            _client=_client,
+            _raw=model_mode,
+        )
+    # end def
 
-def search_images(
+    return SearchCursor(fetch_page, query=query, token=cursor, limit=limit, raw=bool(_raw) and _raw != 'lazy')
+# end def cursor_search_images
+
+
+def stream_search_images(
     query: str,
     filter_id: Union[int, None] = None,
     page: Union[int, None] = None,
@@ -866,15 +2434,16 @@ def search_images(
     sort_field: Union[str, None] = None,
     key: Union[str, None] = None,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
-) -> List[Image]:
+    _raw: Union[None, bool, str] = None,
+) -> Iterator[Image]:
     """
-    Executes the search given by the `q` query parameter, and returns **image responses**.
-
-    A request will be sent to the following endpoint: `/api/v1/json/search/images`
-    It will take in account `self._base_url` and fill in all url variables and append the data parameters as needed,
-    which would for example look like this: https://derpibooru.org/api/v1/json/search/images?q=safe
+    Like `search_images(...)`, but parses the page while it is still being downloaded,
+    yielding every single `Image` as soon as it arrived completely.
+    That gets you the first results earlier, and never keeps the whole page in memory.
+    Note, those requests are neither cached nor retried, see `DerpiClient.static_stream(...)`.
 
-    The API should return json looking like `{"images":[Image]}` which will then be parsed to the python result `List[Image]`.
+    >>> for item in stream_search_images(...):
+    ...     print(item)
     
     :param query: The current search query, if the request is a search request.
                   Note, on derpibooru's side this parameter is called `q`.
@@ -902,34 +2471,29 @@ def search_images(
                     You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
     :type  key: str|None
     
-    :param _client: If you wanna to provide your custom `DerpiClient` or just an already opened `requests.Session`/`httpx.Client`.
-                    For example with requests:
-                    >>> client = requests.Session()
-                    >>> result = search_images(..., _client=client)
-
-                    If you use httpx instead of requests, this would be with a context manager:
-                    >>> with httpx.Client() as client:
-                    ...     result = search_images(..., _client=client)
-
-                    Or httpx and manually closing it:
-                    >>> client = httpx.Client()
-                    >>> try:
-                    ...     result = search_images(..., _client=client)
-                    ... finally:
-                    ...     client.close()
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `requests.Session`/`httpx.Client`, see `search_images(...)`.
+    :type  _client: requests.Session|httpx.Client|DerpiClient|None
 
-                    You can provide a DerpiClient instance as well, to that same variable:
-                    >>> client = DerpiClient(key='...')
-                    >>> client._base_url = 'https://furbooru.org'
-                    >>> result = search_images(..., _client=client)
+    :param _raw: Skip building the models: `True` (or `'bytes'`) yields the decoded json of every item.
+                 `'lazy'` yields lazy models (like `LazyImage`). `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
 
-    :type  _client: requests.Session|httpx.Client|DerpiClient|None
-    
-    :return: The parsed result from the API.
-    :rtype:  List[Image]
+    :return: Iterator over the parsed results from the API.
+    :rtype:  Iterator[Image]
     """
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'lazy':
+        model: Union[Type[Image], None] = LazyImage
+    elif _raw:
+        model: Union[Type[Image], None] = None
+    else:
+        model: Union[Type[Image], None] = Image
+    # end if
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/search/images')
-    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params={
+    items = JsonArrayStream('images')
+    chunks = DerpiClient.static_stream('GET', url=_url, client=_client, params={
         'q': query,
         'filter_id': filter_id,
         'page': page,
@@ -938,22 +2502,25 @@ def search_images(
         'sf': sort_field,
         'key': key,
     })
-    result: Dict[str, List[Dict]] = response.json()
-    result: List[Dict] = result['images']
-    assert_type_or_raise(result, list, parameter_name='result')
-    result: List[Image] = [
-        Image.from_dict(item)
-        for item in result
-    ]
-    return result
-# end def search_images
+    try:
+        for chunk in chunks:
+            for item in items.feed(chunk):
+                yield item if model is None else model.from_dict(item)
+            # end for
+        # end for
+    finally:
+        chunks.close()
+    # end try
+    items.close()
+# end def stream_search_images
 
 
 def search_tags(
     query: str,
     page: Union[int, None] = None,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
-) -> List[Tag]:
+    _raw: Union[None, bool, str] = None,
+) -> SearchResult[Tag]:
     """
     Executes the search given by the `q` query parameter, and returns **tag responses** sorted by descending image count.
 
@@ -961,7 +2528,7 @@ def search_tags(
     It will take in account `self._base_url` and fill in all url variables and append the data parameters as needed,
     which would for example look like this: https://derpibooru.org/api/v1/json/search/tags?q=analyzed_name:wing
 
-    The API should return json looking like `{"tags":[Tag]}` which will then be parsed to the python result `List[Tag]`.
+    The API should return json looking like `{"tags":[Tag]}` which will then be parsed to the python result `SearchResult[Tag]`.
     
     :param query: The current search query, if the request is a search request.
                   Note, on derpibooru's side this parameter is called `q`.
@@ -993,31 +2560,227 @@ def search_tags(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
-    :rtype:  List[Tag]
+    :rtype:  SearchResult[Tag]
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/search/tags')
-    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params={
+    response: internet.Response = DerpiClient.static_request('GET', url=_url, route='search_tags', client=_client, params={
         'q': query,
         'page': page,
     })
-    result: Dict[str, List[Dict]] = response.json()
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, Union[List[Dict], int]] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Tag] = LazyTag
+    elif _raw:
+        return result
+    else:
+        model: Type[Tag] = Tag
+    # end if
+    total: int = result['total']
     result: List[Dict] = result['tags']
     assert_type_or_raise(result, list, parameter_name='result')
-    result: List[Tag] = [
-        Tag.from_dict(item)
-        for item in result
-    ]
+    result: SearchResult[Tag] = SearchResult(
+        hits=[
+            model.from_dict(item)
+            for item in result
+        ],
+        total=total,
+    )
     return result
 # end def search_tags
 
 
+def iter_search_tags(
+    query: str,
+    limit: Union[int, None] = None,
+    _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: Union[None, bool, str] = None,
+) -> Iterator[Tag]:
+    """
+    Walks through all the pages of `search_tags(...)`, yielding every single `Tag`.
+    While the items of a page are consumed, the next page is already requested in the background.
+
+    >>> for item in iter_search_tags(...):
+    ...     print(item)
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param limit: Stop after that many items. `None` to get all of them.
+    :type  limit: int|None
+
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `requests.Session`/`httpx.Client`, see `search_tags(...)`.
+    :type  _client: requests.Session|httpx.Client|DerpiClient|None
+
+    :param _raw: Skip building the models: `True` (or `'bytes'`) yields the decoded json of every item.
+                 `'lazy'` yields lazy models (like `LazyImage`). `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: Iterator over the parsed results from the API.
+    :rtype:  Iterator[Tag]
+    """
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        _raw = True  # a single item has no undecoded body of its own.
+    # end if
+
+    def fetch_page(page: int) -> Union[SearchResult[Tag], List[Dict]]:
+        result = search_tags(
+            query=query,
+            page=page,
+            _client=_client,
+            _raw=_raw,
+        )
+        if _raw is True:
+            return result['tags']
+        # end if
+        return result
+    # end def
+
+    return _paginate(fetch_page, per_page=None, limit=limit)
+# end def iter_search_tags
+
+
+def fan_out_search_tags(
+    query: str,
+    limit: Union[int, None] = None,
+    max_concurrency: int = 4,
+    _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: Union[None, bool, str] = None,
+) -> SearchResult[Tag]:
+    """
+    Loads all the results of `search_tags(...)` at once:
+    After the first page told us the `total` amount of results, all the remaining pages are requested concurrently,
+    with at most `max_concurrency` requests at the same time.
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param limit: Stop after that many items. `None` to get all of them.
+    :type  limit: int|None
+
+    :param max_concurrency: How many pages may be requested at the same time.
+    :type  max_concurrency: int
+
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `requests.Session`/`httpx.Client`, see `search_tags(...)`.
+    :type  _client: requests.Session|httpx.Client|DerpiClient|None
+
+    :param _raw: Skip building the models: `True` (or `'bytes'`) returns json like a single page, with all the items.
+                 `'lazy'` returns lazy models (like `LazyImage`). `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: All the parsed results from the API.
+    :rtype:  SearchResult[Tag]
+    """
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    model_mode = 'lazy' if _raw else False  # the ids and the total are needed, the lazy models just wrap the json.
+
+    def fetch_page(page: int) -> SearchResult[Tag]:
+        return search_tags(
+            query=query,
+            page=page,
+            _client=_client,
+            _raw=model_mode,
+        )
+    # end def
+
+    result = _fan_out(
+        fetch_page, fetch_page(1),
+        per_page=None, limit=limit, max_concurrency=max_concurrency,
+    )
+    if _raw and _raw != 'lazy':
+        return {'tags': [item.to_dict() for item in result.hits], 'total': result.total}
+    # end if
+    return result
+# end def fan_out_search_tags
+
+
+def stream_search_tags(
+    query: str,
+    page: Union[int, None] = None,
+    _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: Union[None, bool, str] = None,
+) -> Iterator[Tag]:
+    """
+    Like `search_tags(...)`, but parses the page while it is still being downloaded,
+    yielding every single `Tag` as soon as it arrived completely.
+    That gets you the first results earlier, and never keeps the whole page in memory.
+    Note, those requests are neither cached nor retried, see `DerpiClient.static_stream(...)`.
+
+    >>> for item in stream_search_tags(...):
+    ...     print(item)
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+    :type  page: int|None
+    
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `requests.Session`/`httpx.Client`, see `search_tags(...)`.
+    :type  _client: requests.Session|httpx.Client|DerpiClient|None
+
+    :param _raw: Skip building the models: `True` (or `'bytes'`) yields the decoded json of every item.
+                 `'lazy'` yields lazy models (like `LazyImage`). `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: Iterator over the parsed results from the API.
+    :rtype:  Iterator[Tag]
+    """
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'lazy':
+        model: Union[Type[Tag], None] = LazyTag
+    elif _raw:
+        model: Union[Type[Tag], None] = None
+    else:
+        model: Union[Type[Tag], None] = Tag
+    # end if
+    _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/search/tags')
+    items = JsonArrayStream('tags')
+    chunks = DerpiClient.static_stream('GET', url=_url, client=_client, params={
+        'q': query,
+        'page': page,
+    })
+    try:
+        for chunk in chunks:
+            for item in items.feed(chunk):
+                yield item if model is None else model.from_dict(item)
+            # end for
+        # end for
+    finally:
+        chunks.close()
+    # end try
+    items.close()
+# end def stream_search_tags
+
+
 def search_reverse(
     url: str,
     distance: Union[float, None] = None,
     key: Union[str, None] = None,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
-) -> List[Image]:
+    _raw: Union[None, bool, str] = None,
+) -> SearchResult[Image]:
     """
     Returns **image responses** based on the results of reverse-searching the image given by the `url` query parameter.
 
@@ -1025,7 +2788,7 @@ def search_reverse(
     It will take in account `self._base_url` and fill in all url variables and append the data parameters as needed,
     which would for example look like this: https://derpibooru.org/api/v1/json/search/reverse?url=https://derpicdn.net/img/2019/12/24/2228439/full.jpg
 
-    The API should return json looking like `{"images":[Image]}` which will then be parsed to the python result `List[Image]`.
+    The API should return json looking like `{"images":[Image]}` which will then be parsed to the python result `SearchResult[Image]`.
     
     :param url: Link a deviantART page, a Tumblr post, or the image directly.
     :type  url: str
@@ -1061,28 +2824,52 @@ def search_reverse(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
-    :rtype:  List[Image]
+    :rtype:  SearchResult[Image]
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/search/reverse')
-    response: internet.Response = DerpiClient.static_request('POST', url=_url, client=_client, params={
+    response: internet.Response = DerpiClient.static_request('POST', url=_url, route='search_reverse', client=_client, params={
         'url': url,
         'distance': distance,
         'key': key,
     })
-    result: Dict[str, List[Dict]] = response.json()
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, Union[List[Dict], int]] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Image] = LazyImage
+    elif _raw:
+        return result
+    else:
+        model: Type[Image] = Image
+    # end if
+    total: int = result['total']
     result: List[Dict] = result['images']
     assert_type_or_raise(result, list, parameter_name='result')
-    result: List[Image] = [
-        Image.from_dict(item)
-        for item in result
-    ]
+    result: SearchResult[Image] = SearchResult(
+        hits=[
+            model.from_dict(item)
+            for item in result
+        ],
+        total=total,
+    )
     return result
 # end def search_reverse
 
 
 def forums(
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: Union[None, bool, str] = None,
 ) -> List[Forum]:
     """
     Fetches a list of **forum responses**.
@@ -1116,16 +2903,35 @@ def forums(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
     :rtype:  List[Forum]
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/forums')
-    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client)
-    result: Dict[str, List[Dict]] = response.json()
+    response: internet.Response = DerpiClient.static_request('GET', url=_url, route='forums', client=_client)
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, List[Dict]] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Forum] = LazyForum
+    elif _raw:
+        return result
+    else:
+        model: Type[Forum] = Forum
+    # end if
     result: List[Dict] = result['forums']
     assert_type_or_raise(result, list, parameter_name='result')
     result: List[Forum] = [
-        Forum.from_dict(item)
+        model.from_dict(item)
         for item in result
     ]
     return result
@@ -1135,6 +2941,7 @@ def forums(
 def forum(
     short_name: str,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: Union[None, bool, str] = None,
 ) -> Forum:
     """
     Fetches a **forum response** for the abbreviated name given by the `short_name` URL parameter.
@@ -1171,15 +2978,34 @@ def forum(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
     :rtype:  Forum
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/forums/{short_name}')
-    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client)
-    result: Dict[str, Dict] = response.json()
+    response: internet.Response = DerpiClient.static_request('GET', url=_url, route='forum', client=_client)
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, Dict] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Forum] = LazyForum
+    elif _raw:
+        return result
+    else:
+        model: Type[Forum] = Forum
+    # end if
     result: Dict = result['forum']
     assert_type_or_raise(result, dict, parameter_name='result')
-    result: Forum = Forum.from_dict(result)
+    result: Forum = model.from_dict(result)
     return result
 # end def forum
 
@@ -1188,6 +3014,7 @@ def forum_topics(
     short_name: str,
     page: Union[int, None] = None,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: Union[None, bool, str] = None,
 ) -> List[Topic]:
     """
     Fetches a list of **topic responses** for the abbreviated forum name given by the `short_name` URL parameter.
@@ -1227,28 +3054,101 @@ def forum_topics(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
     :rtype:  List[Topic]
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/forums/{short_name}/topics')
-    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params={
+    response: internet.Response = DerpiClient.static_request('GET', url=_url, route='forum_topics', client=_client, params={
         'page': page,
     })
-    result: Dict[str, List[Dict]] = response.json()
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, List[Dict]] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Topic] = LazyTopic
+    elif _raw:
+        return result
+    else:
+        model: Type[Topic] = Topic
+    # end if
     result: List[Dict] = result['topics']
     assert_type_or_raise(result, list, parameter_name='result')
     result: List[Topic] = [
-        Topic.from_dict(item)
+        model.from_dict(item)
         for item in result
     ]
     return result
 # end def forum_topics
 
 
+def iter_forum_topics(
+    short_name: str,
+    limit: Union[int, None] = None,
+    _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: Union[None, bool, str] = None,
+) -> Iterator[Topic]:
+    """
+    Walks through all the pages of `forum_topics(...)`, yielding every single `Topic`.
+    While the items of a page are consumed, the next page is already requested in the background.
+
+    >>> for item in iter_forum_topics(...):
+    ...     print(item)
+    
+    :param short_name: the variable short_name part of the url.
+    :type  short_name: str
+    
+    :param limit: Stop after that many items. `None` to get all of them.
+    :type  limit: int|None
+
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `requests.Session`/`httpx.Client`, see `forum_topics(...)`.
+    :type  _client: requests.Session|httpx.Client|DerpiClient|None
+
+    :param _raw: Skip building the models: `True` (or `'bytes'`) yields the decoded json of every item.
+                 `'lazy'` yields lazy models (like `LazyImage`). `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: Iterator over the parsed results from the API.
+    :rtype:  Iterator[Topic]
+    """
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        _raw = True  # a single item has no undecoded body of its own.
+    # end if
+
+    def fetch_page(page: int) -> Union[List[Topic], List[Dict]]:
+        result = forum_topics(
+            short_name=short_name,
+            page=page,
+            _client=_client,
+            _raw=_raw,
+        )
+        if _raw is True:
+            return result['topics']
+        # end if
+        return result
+    # end def
+
+    return _paginate(fetch_page, per_page=None, limit=limit)
+# end def iter_forum_topics
+
+
 def forum_topic(
     short_name: str,
     topic_slug: str,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: Union[None, bool, str] = None,
 ) -> Topic:
     """
     Fetches a **topic response** for the abbreviated forum name given by the `short_name` and topic given by `topic_slug` URL parameters.
@@ -1288,15 +3188,34 @@ def forum_topic(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
     :rtype:  Topic
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/forums/{short_name}/topics/{topic_slug}')
-    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client)
-    result: Dict[str, Dict] = response.json()
+    response: internet.Response = DerpiClient.static_request('GET', url=_url, route='forum_topic', client=_client)
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, Dict] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Topic] = LazyTopic
+    elif _raw:
+        return result
+    else:
+        model: Type[Topic] = Topic
+    # end if
     result: Dict = result['topic']
     assert_type_or_raise(result, dict, parameter_name='result')
-    result: Topic = Topic.from_dict(result)
+    result: Topic = model.from_dict(result)
     return result
 # end def forum_topic
 
@@ -1306,6 +3225,7 @@ def forum_posts(
     topic_slug: str,
     page: Union[int, None] = None,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: Union[None, bool, str] = None,
 ) -> List[Post]:
     """
     Fetches a list of **post responses** for the abbreviated forum name given by the `short_name` and topic given by `topic_slug` URL parameters.
@@ -1348,29 +3268,107 @@ def forum_posts(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
     :rtype:  List[Post]
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/forums/{short_name}/topics/{topic_slug}/posts')
-    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params={
+    response: internet.Response = DerpiClient.static_request('GET', url=_url, route='forum_posts', client=_client, params={
         'page': page,
     })
-    result: Dict[str, List[Dict]] = response.json()
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, List[Dict]] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Post] = LazyPost
+    elif _raw:
+        return result
+    else:
+        model: Type[Post] = Post
+    # end if
     result: List[Dict] = result['posts']
     assert_type_or_raise(result, list, parameter_name='result')
     result: List[Post] = [
-        Post.from_dict(item)
+        model.from_dict(item)
         for item in result
     ]
     return result
 # end def forum_posts
 
 
+def iter_forum_posts(
+    short_name: str,
+    topic_slug: str,
+    limit: Union[int, None] = None,
+    _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: Union[None, bool, str] = None,
+) -> Iterator[Post]:
+    """
+    Walks through all the pages of `forum_posts(...)`, yielding every single `Post`.
+    While the items of a page are consumed, the next page is already requested in the background.
+
+    >>> for item in iter_forum_posts(...):
+    ...     print(item)
+    
+    :param short_name: the variable short_name part of the url.
+    :type  short_name: str
+    
+    :param topic_slug: the variable topic_slug part of the url.
+    :type  topic_slug: str
+    
+    :param limit: Stop after that many items. `None` to get all of them.
+    :type  limit: int|None
+
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `requests.Session`/`httpx.Client`, see `forum_posts(...)`.
+    :type  _client: requests.Session|httpx.Client|DerpiClient|None
+
+    :param _raw: Skip building the models: `True` (or `'bytes'`) yields the decoded json of every item.
+                 `'lazy'` yields lazy models (like `LazyImage`). `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
+    :return: Iterator over the parsed results from the API.
+    :rtype:  Iterator[Post]
+    """
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        _raw = True  # a single item has no undecoded body of its own.
+    # end if
+
+    def fetch_page(page: int) -> Union[List[Post], List[Dict]]:
+        result = forum_posts(
+            short_name=short_name,
+            topic_slug=topic_slug,
+            page=page,
+            _client=_client,
+            _raw=_raw,
+        )
+        if _raw is True:
+            return result['posts']
+        # end if
+        return result
+    # end def
+
+    return _paginate(fetch_page, per_page=None, limit=limit)
+# end def iter_forum_posts
+
+
 def forum_post(
     short_name: str,
     topic_slug: str,
     post_id: int,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: Union[None, bool, str] = None,
 ) -> Post:
     """
     Fetches a **post response** for the abbreviated forum name given by the `short_name`, topic given by `topic_slug` and post given by `post_id` URL parameters.
@@ -1413,35 +3411,309 @@ def forum_post(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
+    :param _raw: Skip building the models, e.g. to just store the payload:
+                 `True` returns the decoded json as is, `'bytes'` even the undecoded response body.
+                 `'lazy'` returns lazy models (like `LazyImage`), converting the fields only when accessed.
+                 `None` uses the `raw` setting of the `DerpiClient` given as `_client`, if any.
+    :type  _raw: bool|str|None
+
     :return: The parsed result from the API.
     :rtype:  Post
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/forums/{short_name}/topics/{topic_slug}/posts/{post_id}')
-    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client)
-    result: Dict[str, Dict] = response.json()
+    response: internet.Response = DerpiClient.static_request('GET', url=_url, route='forum_post', client=_client)
+    if _raw is None:
+        _raw = _client._raw if isinstance(_client, DerpiClient) else False
+    # end if
+    if _raw == 'bytes':
+        return response.content
+    # end if
+    result: Dict[str, Dict] = decode_json(response.content)
+    if _raw == 'lazy':
+        model: Type[Post] = LazyPost
+    elif _raw:
+        return result
+    else:
+        model: Type[Post] = Post
+    # end if
     result: Dict = result['post']
     assert_type_or_raise(result, dict, parameter_name='result')
-    result: Post = Post.from_dict(result)
+    result: Post = model.from_dict(result)
     return result
 # end def forum_post
 
 
+BULK_BATCH_SIZE = 50  # amount of images looked up with a single search request, which is the maximum of `per_page`.
+
+
+def _search_images_batched(
+    terms: List[str],
+    filter_id: Union[int, None] = None,
+    key: Union[str, None] = None,
+    max_concurrency: int = 4,
+    _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+) -> List[Image]:
+    """
+    Searches for all images matching any of the given search terms,
+    combining up to `BULK_BATCH_SIZE` of them with `||` into a single query.
+    Those batches are requested concurrently, with at most `max_concurrency` requests at the same time.
+    """
+    queries = [
+        ' || '.join(terms[i:i + BULK_BATCH_SIZE])
+        for i in range(0, len(terms), BULK_BATCH_SIZE)
+    ]
+
+    def fetch_batch(query: str) -> SearchResult[Image]:
+        return search_images(
+            query=query, filter_id=filter_id, page=1, per_page=BULK_BATCH_SIZE, key=key, _client=_client, _raw=False,
+        )
+    # end def
+
+    with ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix='derpi-bulk') as executor:
+        batches = list(executor.map(fetch_batch, queries))
+    # end with
+    return [image for batch in batches for image in batch]
+# end def
+
+
+def images(
+    image_ids: List[int],
+    filter_id: Union[int, None] = None,
+    key: Union[str, None] = None,
+    max_concurrency: int = 4,
+    _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+) -> Tuple[List[Image], List[int]]:
+    """
+    Fetches a lot of images by their ID at once.
+    Instead of calling `image(...)` for every single one, up to `BULK_BATCH_SIZE` IDs are looked up per search request,
+    like `id:1 || id:2 || ...`, and those requests are run concurrently.
+
+    Note, this uses the search, so images hidden by the filter will be missing.
+    You probably want to use a `filter_id` of a filter hiding nothing, like the `Everything` filter (`56027`).
+
+    :param image_ids: The IDs of the images to get.
+    :type  image_ids: List[int]
+
+    :param filter_id: Assuming the user can access the filter ID given by the parameter, overrides the current filter for this request. This is primarily useful for unauthenticated API access.
+    :type  filter_id: int|None
+
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+    :type  key: str|None
+
+    :param max_concurrency: How many search requests may be run at the same time.
+    :type  max_concurrency: int
+
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `requests.Session`/`httpx.Client`, see `search_images(...)`.
+    :type  _client: requests.Session|httpx.Client|DerpiClient|None
+
+    :return: The found images in the order of `image_ids`, and the IDs which could not be found.
+    :rtype:  Tuple[List[Image], List[int]]
+    """
+    image_ids = list(dict.fromkeys(image_ids))  # removes duplicates, keeping the order.
+    found: Dict[int, Image] = {
+        image.id: image
+        for image in _search_images_batched(
+            [f'id:{image_id}' for image_id in image_ids],
+            filter_id=filter_id, key=key, max_concurrency=max_concurrency, _client=_client,
+        )
+    }
+    return (
+        [found[image_id] for image_id in image_ids if image_id in found],
+        [image_id for image_id in image_ids if image_id not in found],
+    )
+# end def images
+
+
+def images_by_hash(
+    hashes: List[str],
+    original: bool = False,
+    filter_id: Union[int, None] = None,
+    key: Union[str, None] = None,
+    max_concurrency: int = 4,
+    _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+) -> Tuple[List[Image], List[str]]:
+    """
+    Fetches a lot of images by their SHA512 hash at once.
+    Up to `BULK_BATCH_SIZE` hashes are looked up per search request,
+    like `sha512_hash:... || sha512_hash:...`, and those requests are run concurrently.
+
+    Note, this uses the search, so images hidden by the filter will be missing.
+    You probably want to use a `filter_id` of a filter hiding nothing, like the `Everything` filter (`56027`).
+
+    :param hashes: The SHA512 hashes of the images to get.
+    :type  hashes: List[str]
+
+    :param original: If the hashes are of the originally uploaded file (`orig_sha512_hash`), instead of the processed one (`sha512_hash`).
+    :type  original: bool
+
+    :param filter_id: Assuming the user can access the filter ID given by the parameter, overrides the current filter for this request. This is primarily useful for unauthenticated API access.
+    :type  filter_id: int|None
+
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+    :type  key: str|None
+
+    :param max_concurrency: How many search requests may be run at the same time.
+    :type  max_concurrency: int
+
+    :param _client: If you wanna to provide your custom `DerpiClient` or an already opened `requests.Session`/`httpx.Client`, see `search_images(...)`.
+    :type  _client: requests.Session|httpx.Client|DerpiClient|None
+
+    :return: The found images in the order of `hashes`, and the hashes which could not be found.
+    :rtype:  Tuple[List[Image], List[str]]
+    """
+    field = 'orig_sha512_hash' if original else 'sha512_hash'
+    hashes = list(dict.fromkeys(sha512.lower() for sha512 in hashes))  # removes duplicates, keeping the order.
+    found: Dict[str, Image] = {}
+    for image in _search_images_batched(
+        [f'{field}:{sha512}' for sha512 in hashes],
+        filter_id=filter_id, key=key, max_concurrency=max_concurrency, _client=_client,
+    ):
+        sha512 = getattr(image, field)
+        if sha512 is None:  # e.g. still being processed.
+            continue
+        # end if
+        found.setdefault(sha512.lower(), image)
+    # end for
+    return (
+        [found[sha512] for sha512 in hashes if sha512 in found],
+        [sha512 for sha512 in hashes if sha512 not in found],
+    )
+# end def images_by_hash
+
+
 class DerpiClient(object):
     """
     Synchronous client for Derpibooru.org
+
+    Without a `client` given, all requests go through a shared, process-wide connection pool (see `get_shared_client()`),
+    so connections - and with them the TLS sessions - are kept alive and reused between calls.
+    If you want a dedicated pool instead, use the client as context manager:
+    >>> with DerpiClient(key='...') as derpi:
+    ...     result = derpi.image(1)
+    That pool will be closed when leaving the `with` block.
     """
     DEFAULT_BASE_URL = 'https://derpibooru.org'  # default base url.
-
-    def __init__(self, key, client: Union[None, CLIENT_TYPE] = None, base_url = None):
+    POOL_CONNECTIONS = 10  # amount of hosts to keep connection pools for.
+    POOL_MAXSIZE = 10  # amount of connections to keep alive per host.
+    POOL_KEEPALIVE_EXPIRY = 60.0  # seconds an idle connection is kept open, before it gets closed.
+    DEFAULT_RETRY = RetryPolicy()  # used if no `retry` policy is given.
+    STREAM_CHUNK_SIZE = 16 * 1024  # bytes to read at once, when streaming a response.
+    DEFAULT_RATE_LIMITER: Union[RateLimiter, None] = None  # used if no `rate_limiter` is given. `None` to not limit.
+
+    _shared_client: Union[None, CLIENT_TYPE] = None  # process wide pool, see `get_shared_client()`.
+    _shared_client_lock = threading.Lock()
+
+    def __init__(
+        self, key, client: Union[None, CLIENT_TYPE] = None, base_url = None,
+        cache: Union[BaseCache, None] = None, retry: Union[RetryPolicy, None] = None,
+        rate_limiter: Union[RateLimiter, None] = None, raw: Union[bool, str] = False,
+    ):
         """
         :param key: API key
+
+        :param client: An already opened `requests.Session`/`httpx.Client` to use.
+                       If `None`, the shared connection pool is used, or a dedicated one if used as context manager.
+
+        :param cache: Optional cache to answer `GET` requests from, e.g. `MemoryCache()`. `None` to always ask the server.
+
+        :param retry: How failed `GET` requests are retried. `None` for `DEFAULT_RETRY`, `NO_RETRY` to never retry.
+
+        :param rate_limiter: Limits how many requests are sent per second. `None` for `DEFAULT_RATE_LIMITER`.
+
+        :param raw: Make the routes return the decoded json (`True`) or the undecoded response body (`'bytes'`),
+                    instead of building the models. `'lazy'` builds lazy models (like `LazyImage`) instead,
+                    converting the fields only when accessed. Can be overridden per call with `_raw`.
         """
         if base_url is None:
             base_url = self.DEFAULT_BASE_URL
         # end if
         self._key = key
         self._client = client
+        self._owns_client = False  # if we created `self._client` ourself, and thus have to close it again.
         self._base_url = base_url
+        self._cache = cache
+        self._retry = retry
+        self._rate_limiter = rate_limiter
+        self._raw = raw
+    # end def
+
+    def __enter__(self) -> 'DerpiClient':
+        if self._client is None:
+            self._client = self.create_client()
+            self._owns_client = True
+        # end if
+        return self
+    # end def
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    # end def
+
+    def close(self) -> None:
+        """
+        Closes the connection pool of this client, if it was created by us.
+        A `client` given to the constructor as well as the shared pool are left open.
+        """
+        if self._owns_client and self._client is not None:
+            self._client.close()
+            self._client = None
+            self._owns_client = False
+        # end if
+    # end def
+
+    @classmethod
+    def create_client(cls) -> CLIENT_TYPE:
+        """
+        Creates a new http client with a keep-alive connection pool.
+
+        :return: A new, pooled requests.Session/httpx.Client.
+        """
+        if is_requests:
+            client = internet.Session()
+            adapter = HTTPAdapter(pool_connections=cls.POOL_CONNECTIONS, pool_maxsize=cls.POOL_MAXSIZE)
+            client.mount('https://', adapter)
+            client.mount('http://', adapter)
+            return client
+        # end if
+        # httpx only supports a total limit, so we allow `POOL_CONNECTIONS * POOL_MAXSIZE` connections overall.
+        return internet.Client(limits=internet.Limits(
+            max_connections=cls.POOL_CONNECTIONS * cls.POOL_MAXSIZE,
+            max_keepalive_connections=cls.POOL_CONNECTIONS * cls.POOL_MAXSIZE,
+            keepalive_expiry=cls.POOL_KEEPALIVE_EXPIRY,
+        ))
+    # end def
+
+    @classmethod
+    def get_shared_client(cls) -> CLIENT_TYPE:
+        """
+        Returns the shared connection pool, creating it on first use.
+        It will be closed automatically when the interpreter exits.
+
+        :return: The shared, pooled requests.Session/httpx.Client.
+        """
+        if cls._shared_client is None:
+            with cls._shared_client_lock:
+                if cls._shared_client is None:
+                    DerpiClient._shared_client = cls.create_client()
+                # end if
+            # end with
+        # end if
+        return cls._shared_client
+    # end def
+
+    @classmethod
+    def close_shared_client(cls) -> None:
+        """
+        Closes the shared connection pool.
+        It will be recreated if needed again.
+        """
+        with cls._shared_client_lock:
+            client = DerpiClient._shared_client
+            DerpiClient._shared_client = None
+        # end with
+        if client is not None:
+            client.close()
+        # end if
     # end def
 
     @classmethod
@@ -1459,21 +3731,163 @@ class DerpiClient(object):
         method: str,
         url: str,
         params: Union[Dict, None] = None,
-        client: Union[None, CLIENT_TYPE, 'DerpiClient'] = None
+        client: Union[None, CLIENT_TYPE, 'DerpiClient'] = None,
+        route: Union[str, None] = None,
     ) -> internet.Response:
+        """
+        Sends a request, answering it from the cache of the `DerpiClient` given as `client`, if it has one.
+
+        :param route: The name of the route, e.g. `'tag'`, used to look up how long the response may be cached.
+        """
+        cache: Union[BaseCache, None] = None
+        retry: Union[RetryPolicy, None] = None
+        rate_limiter: Union[RateLimiter, None] = None
         if isinstance(client, DerpiClient):
+            cache = client._cache
+            retry = client._retry
+            rate_limiter = client._rate_limiter
             client: CLIENT_TYPE = client._client
         # end if
-        if client is None:  # if we have no client, call ourself recursively with a with statement.
-            with internet.Session() if is_requests else internet.Client() as client:
-                return cls.static_request(method=method, url=url, params=params, client=client)
-            # end with
+        if params is not None:  # httpx would send `None` as empty string.
+            params = {name: value for name, value in params.items() if value is not None}
+        # end if
+        if retry is None:
+            retry = cls.DEFAULT_RETRY
+        # end if
+        if rate_limiter is None:
+            rate_limiter = cls.DEFAULT_RATE_LIMITER
+        # end if
+        ttl = cache.ttl_for(route) if cache is not None and method == 'GET' else None
+        cache_key = make_cache_key(method, url, params)
+        if ttl:
+            content = cache.get(cache_key)
+            if content is not None:
+                return cls._cached_response(method=method, url=url, content=content)
+            # end if
+        # end if
+        if client is None:  # if we have no client, use the shared connection pool.
+            client = cls.get_shared_client()
+        # end if
+        return cls._send_request(
+            client, method, url, params,
+            cache=cache, cache_key=cache_key, ttl=ttl, retry=retry, rate_limiter=rate_limiter,
+        )
+    # end def
+
+    @classmethod
+    def static_stream(
+        cls: Type['DerpiClient'],
+        method: str,
+        url: str,
+        params: Union[Dict, None] = None,
+        client: Union[None, CLIENT_TYPE, 'DerpiClient'] = None,
+    ) -> Iterator[bytes]:
+        """
+        Sends a request, yielding the chunks of the response body as they arrive.
+        Unlike `static_request(...)` the response can't be cached, and the request isn't retried
+        as we might have passed on parts of the response already. It still waits for the rate limiter, though.
+        """
+        rate_limiter: Union[RateLimiter, None] = None
+        if isinstance(client, DerpiClient):
+            rate_limiter = client._rate_limiter
+            client: CLIENT_TYPE = client._client
+        # end if
+        if rate_limiter is None:
+            rate_limiter = cls.DEFAULT_RATE_LIMITER
+        # end if
+        if params is not None:  # httpx would send `None` as empty string.
+            params = {name: value for name, value in params.items() if value is not None}
+        # end if
+        if client is None:  # if we have no client, use the shared connection pool.
+            client = cls.get_shared_client()
+        # end if
+        if rate_limiter is not None:
+            wait = rate_limiter.reserve(url)
+            if wait > 0:
+                time.sleep(wait)
+            # end if
+        # end if
+        if is_requests:
+            response: internet.Response = client.request(method=method, url=url, params=params, stream=True)
+            try:
+                cls._check_response(response)
+                yield from response.iter_content(chunk_size=cls.STREAM_CHUNK_SIZE)
+            finally:
+                response.close()
+            # end try
+            return
+        # end if
+        with client.stream(method=method, url=url, params=params) as response:
+            cls._check_response(response)
+            yield from response.iter_bytes(cls.STREAM_CHUNK_SIZE)
+        # end with
+    # end def
+
+    @classmethod
+    def _send_request(
+        cls: Type['DerpiClient'],
+        client: CLIENT_TYPE,
+        method: str,
+        url: str,
+        params: Union[Dict, None],
+        cache: Union[BaseCache, None],
+        cache_key: str,
+        ttl: Union[float, None],
+        retry: RetryPolicy,
+        rate_limiter: Union[RateLimiter, None],
+    ) -> internet.Response:
+        """
+        Actually sends the request, storing the response in the `cache` if it should be kept (`ttl`).
+        Failing `GET` requests are sent again, as long as the `retry` policy allows it.
+        Every try waits for the `rate_limiter` first.
+        """
+        attempt = 0
+        while True:
+            if rate_limiter is not None:
+                wait = rate_limiter.reserve(url)
+                if wait > 0:
+                    time.sleep(wait)
+                # end if
+            # end if
+            try:
+                response: internet.Response = client.request(method=method, url=url, params=params)
+                cls._check_response(response)
+                break
+            except TRANSPORT_ERRORS + (DerpiResponseError,) as e:
+                if method != 'GET' or not retry.should_retry(attempt, e, transport_error=isinstance(e, TRANSPORT_ERRORS)):
+                    raise
+                # end if
+                delay = retry.delay(attempt, e)
+                attempt += 1
+                logger.warning(f'Request to {url} failed ({e!r}), retry {attempt}/{retry.max_retries} in {delay:.1f}s.')
+                time.sleep(delay)
+            # end try
+        # end while
+        if ttl:
+            cache.set(cache_key, response.content, ttl)
         # end if
-        response: internet.Response = client.request(method=method, url=url, params=params)
-        cls._check_response(response)
         return response
     # end def
 
+    @staticmethod
+    def _cached_response(method: str, url: str, content: bytes) -> internet.Response:
+        """
+        Builds a response object from a cached response body, looking like the server just sent it.
+        """
+        if is_requests:
+            response = internet.Response()
+            response.status_code = 200
+            response.headers['content-type'] = 'application/json; charset=utf-8'
+            response._content = content
+            response.url = url
+            return response
+        # end if
+        return internet.Response(
+            status_code=200, headers={'content-type': 'application/json; charset=utf-8'}, content=content,
+            request=internet.Request(method=method, url=url),
+        )
+    # end def
+
     @staticmethod
     def _check_response(response: internet.Response) -> None:
         """
@@ -1482,9 +3896,17 @@ class DerpiClient(object):
 
         :param response: A requests/httpx response.
         :type  response: requests.Response|httpx.Response
+
+        :raises NotFoundError: The object doesn't exist (`404`).
+        :raises RateLimitedError: Too many requests (`429`), see its `retry_after`.
+        :raises ServerError: The server failed (`5xx`).
+        :raises CloudflareChallengeError: Cloudflare wants us to solve a challenge.
+        :raises UnexpectedResponseError: Any other status, or the response isn't json.
         """
-        assert response.status_code == 200  # TODO
-        assert response.headers['content-type'] == 'application/json; charset=utf-8'
+        error = error_for_response(response)
+        if error is not None:
+            raise error
+        # end if
     # end def
     
     # noinspection PyMethodMayBeStatic
@@ -1492,6 +3914,7 @@ class DerpiClient(object):
         self, 
         comment_id: int,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: Union[None, bool, str] = None,
     ) -> Comment:
         """
         Fetches a **comment response** for the comment ID referenced by the `comment_id` URL parameter.
@@ -1524,12 +3947,17 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
         :rtype:  Comment
         """
         return comment(
             comment_id=comment_id,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def comment
     
@@ -1539,6 +3967,7 @@ class DerpiClient(object):
         image_id: int,
         filter_id: Union[int, None] = None,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: Union[None, bool, str] = None,
     ) -> Image:
         """
         Fetches an **image response** for the image ID referenced by the `image_id` URL parameter.
@@ -1579,6 +4008,10 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
         :rtype:  Image
         """
@@ -1586,7 +4019,8 @@ class DerpiClient(object):
             image_id=image_id,
             filter_id=filter_id,
             key=self._key,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def image
     
@@ -1595,6 +4029,7 @@ class DerpiClient(object):
         self, 
         url: str,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: Union[None, bool, str] = None,
     ) -> Image:
         """
         Submits a new image. Both `key` and `url` are required. Errors will result in an `{"errors":image-errors-response}`.
@@ -1632,13 +4067,18 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
         :rtype:  Image
         """
         return image_upload(
             url=url,
             key=self._key,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def image_upload
     
@@ -1646,6 +4086,7 @@ class DerpiClient(object):
     def featured_image(
         self, 
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: Union[None, bool, str] = None,
     ) -> Image:
         """
         Fetches an **image response** for the for the current featured image.
@@ -1675,11 +4116,16 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
         :rtype:  Image
         """
         return featured_image(
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def featured_image
     
@@ -1688,6 +4134,7 @@ class DerpiClient(object):
         self, 
         tag_id: str,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: Union[None, bool, str] = None,
     ) -> Tag:
         """
         Fetches a **tag response** for the **tag slug** given by the `tag_id` URL parameter. The tag's ID is **not** used. For getting a tag by ID the search endpoint can be used like `search/tags?q=id:4458`.
@@ -1720,12 +4167,17 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
         :rtype:  Tag
         """
         return tag(
             tag_id=tag_id,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def tag
     
@@ -1734,6 +4186,7 @@ class DerpiClient(object):
         self, 
         post_id: int,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: Union[None, bool, str] = None,
     ) -> Post:
         """
         Fetches a **post response** for the post ID given by the `post_id` URL parameter.
@@ -1766,12 +4219,17 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
         :rtype:  Post
         """
         return post(
             post_id=post_id,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def post
     
@@ -1780,6 +4238,7 @@ class DerpiClient(object):
         self, 
         user_id: int,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: Union[None, bool, str] = None,
     ) -> User:
         """
         Fetches a **profile response** for the user ID given by the `user_id` URL parameter.
@@ -1812,12 +4271,17 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
         :rtype:  User
         """
         return user(
             user_id=user_id,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def user
     
@@ -1826,6 +4290,7 @@ class DerpiClient(object):
         self, 
         filter_id: int,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: Union[None, bool, str] = None,
     ) -> Filter:
         """
         Fetches a **filter response** for the filter ID given by the `filter_id` URL parameter.
@@ -1863,13 +4328,18 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
         :rtype:  Filter
         """
         return filter(
             filter_id=filter_id,
             key=self._key,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def filter
     
@@ -1878,6 +4348,7 @@ class DerpiClient(object):
         self, 
         page: Union[int, None] = None,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: Union[None, bool, str] = None,
     ) -> List[Filter]:
         """
         Fetches a list of **filter responses** that are flagged as being **system** filters (and thus usable by anyone).
@@ -1910,20 +4381,53 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
         :rtype:  List[Filter]
         """
         return system_filters(
             page=page,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def system_filters
     
+    def iter_system_filters(
+        self, 
+        limit: Union[int, None] = None,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: Union[None, bool, str] = None,
+    ) -> Iterator[Filter]:
+        """
+        Walks through all the pages of `system_filters(...)`, yielding every single `Filter`.
+        While the items of a page are consumed, the next page is already requested in the background.
+        See `iter_system_filters(...)` on module level for the parameters.
+
+        :param limit: Stop after that many items. `None` to get all of them.
+        :type  limit: int|None
+
+        :param _raw: Skip building the models, see `iter_system_filters(...)` on module level. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: Iterator over the parsed results from the API.
+        :rtype:  Iterator[Filter]
+        """
+        return iter_system_filters(
+            limit=limit,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def iter_system_filters
+    
     # noinspection PyMethodMayBeStatic
     def user_filters(
         self, 
         page: Union[int, None] = None,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: Union[None, bool, str] = None,
     ) -> List[Filter]:
         """
         Fetches a list of **filter responses** that belong to the user given by **key**. If no **key** is given or it is invalid, will return a **403 Forbidden** error.
@@ -1961,21 +4465,55 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
         :rtype:  List[Filter]
         """
         return user_filters(
             key=self._key,
             page=page,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def user_filters
     
+    def iter_user_filters(
+        self, 
+        limit: Union[int, None] = None,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: Union[None, bool, str] = None,
+    ) -> Iterator[Filter]:
+        """
+        Walks through all the pages of `user_filters(...)`, yielding every single `Filter`.
+        While the items of a page are consumed, the next page is already requested in the background.
+        See `iter_user_filters(...)` on module level for the parameters.
+
+        :param limit: Stop after that many items. `None` to get all of them.
+        :type  limit: int|None
+
+        :param _raw: Skip building the models, see `iter_user_filters(...)` on module level. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: Iterator over the parsed results from the API.
+        :rtype:  Iterator[Filter]
+        """
+        return iter_user_filters(
+            key=self._key,
+            limit=limit,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def iter_user_filters
+    
     # noinspection PyMethodMayBeStatic
     def oembed(
         self, 
         url: str,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: Union[None, bool, str] = None,
     ) -> Oembed:
         """
         Fetches an **oEmbed response** for the given app link or CDN URL.
@@ -2008,12 +4546,17 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
         :rtype:  Oembed
         """
         return oembed(
             url=url,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def oembed
     
@@ -2023,7 +4566,8 @@ class DerpiClient(object):
         query: str,
         page: Union[int, None] = None,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
-    ) -> List[Comment]:
+        _raw: Union[None, bool, str] = None,
+    ) -> SearchResult[Comment]:
         """
         Executes the search given by the `q` query parameter (case insensitive and stemming is applied. If you search for **best pony** results like **Best Ponies** are also be returned), and returns **comment responses** sorted by descending creation time.
 
@@ -2031,7 +4575,7 @@ class DerpiClient(object):
         It will take in account `self._base_url` and fill in all url variables and append the data parameters as needed,
         which would for example look like this: https://derpibooru.org/api/v1/json/search/comments?q=image_id:1000000
 
-        The API should return json looking like `{"comments":[Comment]}` which will then be parsed to the python result `List[Comment]`.
+        The API should return json looking like `{"comments":[Comment]}` which will then be parsed to the python result `SearchResult[Comment]`.
         
         :param query: The current search query, if the request is a search request.
         :type  query: str
@@ -2061,18 +4605,113 @@ class DerpiClient(object):
                         ...     client.close()
 
 
-        :type  _client: requests.Session|httpx.Client|None
-        
-        :return: The parsed result from the API.
-        :rtype:  List[Comment]
+        :type  _client: requests.Session|httpx.Client|None
+        
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: The parsed result from the API.
+        :rtype:  SearchResult[Comment]
+        """
+        return search_comments(
+            query=query,
+            page=page,
+            key=self._key,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def search_comments
+    
+    def iter_search_comments(
+        self, 
+        query: str,
+        limit: Union[int, None] = None,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: Union[None, bool, str] = None,
+    ) -> Iterator[Comment]:
+        """
+        Walks through all the pages of `search_comments(...)`, yielding every single `Comment`.
+        While the items of a page are consumed, the next page is already requested in the background.
+        See `iter_search_comments(...)` on module level for the parameters.
+
+        :param limit: Stop after that many items. `None` to get all of them.
+        :type  limit: int|None
+
+        :param _raw: Skip building the models, see `iter_search_comments(...)` on module level. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: Iterator over the parsed results from the API.
+        :rtype:  Iterator[Comment]
+        """
+        return iter_search_comments(
+            query=query,
+            key=self._key,
+            limit=limit,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def iter_search_comments
+    
+    def fan_out_search_comments(
+        self, 
+        query: str,
+        limit: Union[int, None] = None,
+        max_concurrency: int = 4,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: Union[None, bool, str] = None,
+    ) -> SearchResult[Comment]:
+        """
+        Loads all the results of `search_comments(...)` at once, requesting the pages concurrently.
+        See `fan_out_search_comments(...)` on module level for the parameters.
+
+        :param limit: Stop after that many items. `None` to get all of them.
+        :type  limit: int|None
+
+        :param max_concurrency: How many pages may be requested at the same time.
+        :type  max_concurrency: int
+
+        :param _raw: Skip building the models, see `fan_out_search_comments(...)` on module level. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: All the parsed results from the API.
+        :rtype:  SearchResult[Comment]
+        """
+        return fan_out_search_comments(
+            query=query,
+            key=self._key,
+            limit=limit,
+            max_concurrency=max_concurrency,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def fan_out_search_comments
+    
+    def stream_search_comments(
+        self, 
+        query: str,
+        page: Union[int, None] = None,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: Union[None, bool, str] = None,
+    ) -> Iterator[Comment]:
+        """
+        Like `search_comments(...)`, but yields every single `Comment` as soon as it was downloaded.
+        See `stream_search_comments(...)` on module level for the parameters.
+
+        :param _raw: Skip building the models, see `stream_search_comments(...)` on module level. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: Iterator over the parsed results from the API.
+        :rtype:  Iterator[Comment]
         """
-        return search_comments(
+        return stream_search_comments(
             query=query,
             page=page,
             key=self._key,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
-    # end def search_comments
+    # end def stream_search_comments
     
     # noinspection PyMethodMayBeStatic
     def search_galleries(
@@ -2080,7 +4719,8 @@ class DerpiClient(object):
         query: str,
         page: Union[int, None] = None,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
-    ) -> List[Gallery]:
+        _raw: Union[None, bool, str] = None,
+    ) -> SearchResult[Gallery]:
         """
         Executes the search given by the `q` query parameter, and returns **gallery responses** sorted by descending creation time.
 
@@ -2088,7 +4728,7 @@ class DerpiClient(object):
         It will take in account `self._base_url` and fill in all url variables and append the data parameters as needed,
         which would for example look like this: https://derpibooru.org/api/v1/json/search/galleries?q=title:mean*
 
-        The API should return json looking like `{"galleries":[Gallery]}` which will then be parsed to the python result `List[Gallery]`.
+        The API should return json looking like `{"galleries":[Gallery]}` which will then be parsed to the python result `SearchResult[Gallery]`.
         
         :param query: The current search query, if the request is a search request.
         :type  query: str
@@ -2120,24 +4760,120 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
-        :rtype:  List[Gallery]
+        :rtype:  SearchResult[Gallery]
         """
         return search_galleries(
             query=query,
             page=page,
             key=self._key,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def search_galleries
     
+    def iter_search_galleries(
+        self, 
+        query: str,
+        limit: Union[int, None] = None,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: Union[None, bool, str] = None,
+    ) -> Iterator[Gallery]:
+        """
+        Walks through all the pages of `search_galleries(...)`, yielding every single `Gallery`.
+        While the items of a page are consumed, the next page is already requested in the background.
+        See `iter_search_galleries(...)` on module level for the parameters.
+
+        :param limit: Stop after that many items. `None` to get all of them.
+        :type  limit: int|None
+
+        :param _raw: Skip building the models, see `iter_search_galleries(...)` on module level. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: Iterator over the parsed results from the API.
+        :rtype:  Iterator[Gallery]
+        """
+        return iter_search_galleries(
+            query=query,
+            key=self._key,
+            limit=limit,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def iter_search_galleries
+    
+    def fan_out_search_galleries(
+        self, 
+        query: str,
+        limit: Union[int, None] = None,
+        max_concurrency: int = 4,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: Union[None, bool, str] = None,
+    ) -> SearchResult[Gallery]:
+        """
+        Loads all the results of `search_galleries(...)` at once, requesting the pages concurrently.
+        See `fan_out_search_galleries(...)` on module level for the parameters.
+
+        :param limit: Stop after that many items. `None` to get all of them.
+        :type  limit: int|None
+
+        :param max_concurrency: How many pages may be requested at the same time.
+        :type  max_concurrency: int
+
+        :param _raw: Skip building the models, see `fan_out_search_galleries(...)` on module level. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: All the parsed results from the API.
+        :rtype:  SearchResult[Gallery]
+        """
+        return fan_out_search_galleries(
+            query=query,
+            key=self._key,
+            limit=limit,
+            max_concurrency=max_concurrency,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def fan_out_search_galleries
+    
+    def stream_search_galleries(
+        self, 
+        query: str,
+        page: Union[int, None] = None,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: Union[None, bool, str] = None,
+    ) -> Iterator[Gallery]:
+        """
+        Like `search_galleries(...)`, but yields every single `Gallery` as soon as it was downloaded.
+        See `stream_search_galleries(...)` on module level for the parameters.
+
+        :param _raw: Skip building the models, see `stream_search_galleries(...)` on module level. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: Iterator over the parsed results from the API.
+        :rtype:  Iterator[Gallery]
+        """
+        return stream_search_galleries(
+            query=query,
+            page=page,
+            key=self._key,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def stream_search_galleries
+    
     # noinspection PyMethodMayBeStatic
     def search_posts(
         self, 
         query: str,
         page: Union[int, None] = None,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
-    ) -> List[Post]:
+        _raw: Union[None, bool, str] = None,
+    ) -> SearchResult[Post]:
         """
         Executes the search given by the `q` query parameter, and returns **post responses** sorted by descending creation time.
 
@@ -2145,7 +4881,7 @@ class DerpiClient(object):
         It will take in account `self._base_url` and fill in all url variables and append the data parameters as needed,
         which would for example look like this: https://derpibooru.org/api/v1/json/search/posts?q=subject:time wasting thread
 
-        The API should return json looking like `{"posts":[Post]}` which will then be parsed to the python result `List[Post]`.
+        The API should return json looking like `{"posts":[Post]}` which will then be parsed to the python result `SearchResult[Post]`.
         
         :param query: The current search query, if the request is a search request.
         :type  query: str
@@ -2177,17 +4913,112 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
-        :rtype:  List[Post]
+        :rtype:  SearchResult[Post]
         """
         return search_posts(
             query=query,
             page=page,
             key=self._key,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def search_posts
     
+    def iter_search_posts(
+        self, 
+        query: str,
+        limit: Union[int, None] = None,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: Union[None, bool, str] = None,
+    ) -> Iterator[Post]:
+        """
+        Walks through all the pages of `search_posts(...)`, yielding every single `Post`.
+        While the items of a page are consumed, the next page is already requested in the background.
+        See `iter_search_posts(...)` on module level for the parameters.
+
+        :param limit: Stop after that many items. `None` to get all of them.
+        :type  limit: int|None
+
+        :param _raw: Skip building the models, see `iter_search_posts(...)` on module level. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: Iterator over the parsed results from the API.
+        :rtype:  Iterator[Post]
+        """
+        return iter_search_posts(
+            query=query,
+            key=self._key,
+            limit=limit,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def iter_search_posts
+    
+    def fan_out_search_posts(
+        self, 
+        query: str,
+        limit: Union[int, None] = None,
+        max_concurrency: int = 4,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: Union[None, bool, str] = None,
+    ) -> SearchResult[Post]:
+        """
+        Loads all the results of `search_posts(...)` at once, requesting the pages concurrently.
+        See `fan_out_search_posts(...)` on module level for the parameters.
+
+        :param limit: Stop after that many items. `None` to get all of them.
+        :type  limit: int|None
+
+        :param max_concurrency: How many pages may be requested at the same time.
+        :type  max_concurrency: int
+
+        :param _raw: Skip building the models, see `fan_out_search_posts(...)` on module level. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: All the parsed results from the API.
+        :rtype:  SearchResult[Post]
+        """
+        return fan_out_search_posts(
+            query=query,
+            key=self._key,
+            limit=limit,
+            max_concurrency=max_concurrency,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def fan_out_search_posts
+    
+    def stream_search_posts(
+        self, 
+        query: str,
+        page: Union[int, None] = None,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: Union[None, bool, str] = None,
+    ) -> Iterator[Post]:
+        """
+        Like `search_posts(...)`, but yields every single `Post` as soon as it was downloaded.
+        See `stream_search_posts(...)` on module level for the parameters.
+
+        :param _raw: Skip building the models, see `stream_search_posts(...)` on module level. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: Iterator over the parsed results from the API.
+        :rtype:  Iterator[Post]
+        """
+        return stream_search_posts(
+            query=query,
+            page=page,
+            key=self._key,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def stream_search_posts
+    
     # noinspection PyMethodMayBeStatic
     def search_images(
         self, 
@@ -2198,7 +5029,8 @@ class DerpiClient(object):
         sort_direction: Union[str, None] = None,
         sort_field: Union[str, None] = None,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
-    ) -> List[Image]:
+        _raw: Union[None, bool, str] = None,
+    ) -> SearchResult[Image]:
         """
         Executes the search given by the `q` query parameter, and returns **image responses**.
 
@@ -2206,7 +5038,7 @@ class DerpiClient(object):
         It will take in account `self._base_url` and fill in all url variables and append the data parameters as needed,
         which would for example look like this: https://derpibooru.org/api/v1/json/search/images?q=safe
 
-        The API should return json looking like `{"images":[Image]}` which will then be parsed to the python result `List[Image]`.
+        The API should return json looking like `{"images":[Image]}` which will then be parsed to the python result `SearchResult[Image]`.
         
         :param query: The current search query, if the request is a search request.
         :type  query: str
@@ -2250,8 +5082,12 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
-        :rtype:  List[Image]
+        :rtype:  SearchResult[Image]
         """
         return search_images(
             query=query,
@@ -2261,17 +5097,171 @@ class DerpiClient(object):
             sort_direction=sort_direction,
             sort_field=sort_field,
             key=self._key,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def search_images
     
+    def iter_search_images(
+        self, 
+        query: str,
+        filter_id: Union[int, None] = None,
+        per_page: Union[int, None] = 50,
+        sort_direction: Union[str, None] = None,
+        sort_field: Union[str, None] = None,
+        limit: Union[int, None] = None,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: Union[None, bool, str] = None,
+    ) -> Iterator[Image]:
+        """
+        Walks through all the pages of `search_images(...)`, yielding every single `Image`.
+        While the items of a page are consumed, the next page is already requested in the background.
+        See `iter_search_images(...)` on module level for the parameters.
+
+        :param limit: Stop after that many items. `None` to get all of them.
+        :type  limit: int|None
+
+        :param _raw: Skip building the models, see `iter_search_images(...)` on module level. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: Iterator over the parsed results from the API.
+        :rtype:  Iterator[Image]
+        """
+        return iter_search_images(
+            query=query,
+            filter_id=filter_id,
+            per_page=per_page,
+            sort_direction=sort_direction,
+            sort_field=sort_field,
+            key=self._key,
+            limit=limit,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def iter_search_images
+    
+    def fan_out_search_images(
+        self, 
+        query: str,
+        filter_id: Union[int, None] = None,
+        per_page: Union[int, None] = 50,
+        sort_direction: Union[str, None] = None,
+        sort_field: Union[str, None] = None,
+        limit: Union[int, None] = None,
+        max_concurrency: int = 4,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: Union[None, bool, str] = None,
+    ) -> SearchResult[Image]:
+        """
+        Loads all the results of `search_images(...)` at once, requesting the pages concurrently.
+        See `fan_out_search_images(...)` on module level for the parameters.
+
+        :param limit: Stop after that many items. `None` to get all of them.
+        :type  limit: int|None
+
+        :param max_concurrency: How many pages may be requested at the same time.
+        :type  max_concurrency: int
+
+        :param _raw: Skip building the models, see `fan_out_search_images(...)` on module level. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: All the parsed results from the API.
+        :rtype:  SearchResult[Image]
+        """
+        return fan_out_search_images(
+            query=query,
+            filter_id=filter_id,
+            per_page=per_page,
+            sort_direction=sort_direction,
+            sort_field=sort_field,
+            key=self._key,
+            limit=limit,
+            max_concurrency=max_concurrency,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def fan_out_search_images
+    
+    def cursor_search_images(
+        self, 
+        query: str,
+        filter_id: Union[int, None] = None,
+        per_page: Union[int, None] = 50,
+        cursor: Union[str, None] = None,
+        limit: Union[int, None] = None,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: Union[None, bool, str] = None,
+    ) -> SearchCursor:
+        """
+        Walks through all the results of `search_images(...)` with keyset pagination, newest first.
+        See `cursor_search_images(...)` on module level for the parameters.
+
+        :param cursor: The `token` of an earlier `SearchCursor` for the same query, to continue after its last item.
+        :type  cursor: str|None
+
+        :param limit: Stop after that many items. `None` to get all of them.
+        :type  limit: int|None
+
+        :param _raw: Skip building the models, see `cursor_search_images(...)` on module level. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: Iterator over the parsed results from the API, with a resumable `token`.
+        :rtype:  SearchCursor
+        """
+        return cursor_search_images(
+            query=query,
+            filter_id=filter_id,
+            per_page=per_page,
+            key=self._key,
+            cursor=cursor,
+            limit=limit,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def cursor_search_images
+    
+    def stream_search_images(
+        self, 
+        query: str,
+        filter_id: Union[int, None] = None,
+        page: Union[int, None] = None,
+        per_page: Union[int, None] = None,
+        sort_direction: Union[str, None] = None,
+        sort_field: Union[str, None] = None,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: Union[None, bool, str] = None,
+    ) -> Iterator[Image]:
+        """
+        Like `search_images(...)`, but yields every single `Image` as soon as it was downloaded.
+        See `stream_search_images(...)` on module level for the parameters.
+
+        :param _raw: Skip building the models, see `stream_search_images(...)` on module level. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: Iterator over the parsed results from the API.
+        :rtype:  Iterator[Image]
+        """
+        return stream_search_images(
+            query=query,
+            filter_id=filter_id,
+            page=page,
+            per_page=per_page,
+            sort_direction=sort_direction,
+            sort_field=sort_field,
+            key=self._key,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def stream_search_images
+    
     # noinspection PyMethodMayBeStatic
     def search_tags(
         self, 
         query: str,
         page: Union[int, None] = None,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
-    ) -> List[Tag]:
+        _raw: Union[None, bool, str] = None,
+    ) -> SearchResult[Tag]:
         """
         Executes the search given by the `q` query parameter, and returns **tag responses** sorted by descending image count.
 
@@ -2279,7 +5269,7 @@ class DerpiClient(object):
         It will take in account `self._base_url` and fill in all url variables and append the data parameters as needed,
         which would for example look like this: https://derpibooru.org/api/v1/json/search/tags?q=analyzed_name:wing
 
-        The API should return json looking like `{"tags":[Tag]}` which will then be parsed to the python result `List[Tag]`.
+        The API should return json looking like `{"tags":[Tag]}` which will then be parsed to the python result `SearchResult[Tag]`.
         
         :param query: The current search query, if the request is a search request.
         :type  query: str
@@ -2306,23 +5296,116 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
-        :rtype:  List[Tag]
+        :rtype:  SearchResult[Tag]
         """
         return search_tags(
             query=query,
             page=page,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def search_tags
     
+    def iter_search_tags(
+        self, 
+        query: str,
+        limit: Union[int, None] = None,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: Union[None, bool, str] = None,
+    ) -> Iterator[Tag]:
+        """
+        Walks through all the pages of `search_tags(...)`, yielding every single `Tag`.
+        While the items of a page are consumed, the next page is already requested in the background.
+        See `iter_search_tags(...)` on module level for the parameters.
+
+        :param limit: Stop after that many items. `None` to get all of them.
+        :type  limit: int|None
+
+        :param _raw: Skip building the models, see `iter_search_tags(...)` on module level. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: Iterator over the parsed results from the API.
+        :rtype:  Iterator[Tag]
+        """
+        return iter_search_tags(
+            query=query,
+            limit=limit,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def iter_search_tags
+    
+    def fan_out_search_tags(
+        self, 
+        query: str,
+        limit: Union[int, None] = None,
+        max_concurrency: int = 4,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: Union[None, bool, str] = None,
+    ) -> SearchResult[Tag]:
+        """
+        Loads all the results of `search_tags(...)` at once, requesting the pages concurrently.
+        See `fan_out_search_tags(...)` on module level for the parameters.
+
+        :param limit: Stop after that many items. `None` to get all of them.
+        :type  limit: int|None
+
+        :param max_concurrency: How many pages may be requested at the same time.
+        :type  max_concurrency: int
+
+        :param _raw: Skip building the models, see `fan_out_search_tags(...)` on module level. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: All the parsed results from the API.
+        :rtype:  SearchResult[Tag]
+        """
+        return fan_out_search_tags(
+            query=query,
+            limit=limit,
+            max_concurrency=max_concurrency,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def fan_out_search_tags
+    
+    def stream_search_tags(
+        self, 
+        query: str,
+        page: Union[int, None] = None,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: Union[None, bool, str] = None,
+    ) -> Iterator[Tag]:
+        """
+        Like `search_tags(...)`, but yields every single `Tag` as soon as it was downloaded.
+        See `stream_search_tags(...)` on module level for the parameters.
+
+        :param _raw: Skip building the models, see `stream_search_tags(...)` on module level. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: Iterator over the parsed results from the API.
+        :rtype:  Iterator[Tag]
+        """
+        return stream_search_tags(
+            query=query,
+            page=page,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def stream_search_tags
+    
     # noinspection PyMethodMayBeStatic
     def search_reverse(
         self, 
         url: str,
         distance: Union[float, None] = None,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
-    ) -> List[Image]:
+        _raw: Union[None, bool, str] = None,
+    ) -> SearchResult[Image]:
         """
         Returns **image responses** based on the results of reverse-searching the image given by the `url` query parameter.
 
@@ -2330,7 +5413,7 @@ class DerpiClient(object):
         It will take in account `self._base_url` and fill in all url variables and append the data parameters as needed,
         which would for example look like this: https://derpibooru.org/api/v1/json/search/reverse?url=https://derpicdn.net/img/2019/12/24/2228439/full.jpg
 
-        The API should return json looking like `{"images":[Image]}` which will then be parsed to the python result `List[Image]`.
+        The API should return json looking like `{"images":[Image]}` which will then be parsed to the python result `SearchResult[Image]`.
         
         :param url: Link a deviantART page, a Tumblr post, or the image directly.
         :type  url: str
@@ -2362,14 +5445,19 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
-        :rtype:  List[Image]
+        :rtype:  SearchResult[Image]
         """
         return search_reverse(
             url=url,
             distance=distance,
             key=self._key,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def search_reverse
     
@@ -2377,6 +5465,7 @@ class DerpiClient(object):
     def forums(
         self, 
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: Union[None, bool, str] = None,
     ) -> List[Forum]:
         """
         Fetches a list of **forum responses**.
@@ -2406,11 +5495,16 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
         :rtype:  List[Forum]
         """
         return forums(
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def forums
     
@@ -2419,6 +5513,7 @@ class DerpiClient(object):
         self, 
         short_name: str,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: Union[None, bool, str] = None,
     ) -> Forum:
         """
         Fetches a **forum response** for the abbreviated name given by the `short_name` URL parameter.
@@ -2451,12 +5546,17 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
         :rtype:  Forum
         """
         return forum(
             short_name=short_name,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def forum
     
@@ -2466,6 +5566,7 @@ class DerpiClient(object):
         short_name: str,
         page: Union[int, None] = None,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: Union[None, bool, str] = None,
     ) -> List[Topic]:
         """
         Fetches a list of **topic responses** for the abbreviated forum name given by the `short_name` URL parameter.
@@ -2501,22 +5602,57 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
         :rtype:  List[Topic]
         """
         return forum_topics(
             short_name=short_name,
             page=page,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def forum_topics
     
+    def iter_forum_topics(
+        self, 
+        short_name: str,
+        limit: Union[int, None] = None,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: Union[None, bool, str] = None,
+    ) -> Iterator[Topic]:
+        """
+        Walks through all the pages of `forum_topics(...)`, yielding every single `Topic`.
+        While the items of a page are consumed, the next page is already requested in the background.
+        See `iter_forum_topics(...)` on module level for the parameters.
+
+        :param limit: Stop after that many items. `None` to get all of them.
+        :type  limit: int|None
+
+        :param _raw: Skip building the models, see `iter_forum_topics(...)` on module level. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: Iterator over the parsed results from the API.
+        :rtype:  Iterator[Topic]
+        """
+        return iter_forum_topics(
+            short_name=short_name,
+            limit=limit,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def iter_forum_topics
+    
     # noinspection PyMethodMayBeStatic
     def forum_topic(
         self, 
         short_name: str,
         topic_slug: str,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: Union[None, bool, str] = None,
     ) -> Topic:
         """
         Fetches a **topic response** for the abbreviated forum name given by the `short_name` and topic given by `topic_slug` URL parameters.
@@ -2552,13 +5688,18 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
         :rtype:  Topic
         """
         return forum_topic(
             short_name=short_name,
             topic_slug=topic_slug,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def forum_topic
     
@@ -2569,6 +5710,7 @@ class DerpiClient(object):
         topic_slug: str,
         page: Union[int, None] = None,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: Union[None, bool, str] = None,
     ) -> List[Post]:
         """
         Fetches a list of **post responses** for the abbreviated forum name given by the `short_name` and topic given by `topic_slug` URL parameters.
@@ -2607,6 +5749,10 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
         :rtype:  List[Post]
         """
@@ -2614,10 +5760,42 @@ class DerpiClient(object):
             short_name=short_name,
             topic_slug=topic_slug,
             page=page,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def forum_posts
     
+    def iter_forum_posts(
+        self, 
+        short_name: str,
+        topic_slug: str,
+        limit: Union[int, None] = None,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: Union[None, bool, str] = None,
+    ) -> Iterator[Post]:
+        """
+        Walks through all the pages of `forum_posts(...)`, yielding every single `Post`.
+        While the items of a page are consumed, the next page is already requested in the background.
+        See `iter_forum_posts(...)` on module level for the parameters.
+
+        :param limit: Stop after that many items. `None` to get all of them.
+        :type  limit: int|None
+
+        :param _raw: Skip building the models, see `iter_forum_posts(...)` on module level. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
+        :return: Iterator over the parsed results from the API.
+        :rtype:  Iterator[Post]
+        """
+        return iter_forum_posts(
+            short_name=short_name,
+            topic_slug=topic_slug,
+            limit=limit,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def iter_forum_posts
+    
     # noinspection PyMethodMayBeStatic
     def forum_post(
         self, 
@@ -2625,6 +5803,7 @@ class DerpiClient(object):
         topic_slug: str,
         post_id: int,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: Union[None, bool, str] = None,
     ) -> Post:
         """
         Fetches a **post response** for the abbreviated forum name given by the `short_name`, topic given by `topic_slug` and post given by `post_id` URL parameters.
@@ -2663,6 +5842,10 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
+        :param _raw: Skip building the models: `True` returns the decoded json, `'bytes'` the undecoded response body.
+                     `'lazy'` returns lazy models. `None` uses the `raw` setting of this client.
+        :type  _raw: bool|str|None
+
         :return: The parsed result from the API.
         :rtype:  Post
         """
@@ -2670,8 +5853,59 @@ class DerpiClient(object):
             short_name=short_name,
             topic_slug=topic_slug,
             post_id=post_id,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def forum_post
     
-# end class
\ No newline at end of file
+    def images(
+        self,
+        image_ids: List[int],
+        filter_id: Union[int, None] = None,
+        max_concurrency: int = 4,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+    ) -> Tuple[List[Image], List[int]]:
+        """
+        Fetches a lot of images by their ID at once, with up to `BULK_BATCH_SIZE` IDs per search request.
+        See `images(...)` on module level for the parameters.
+
+        :return: The found images in the order of `image_ids`, and the IDs which could not be found.
+        :rtype:  Tuple[List[Image], List[int]]
+        """
+        return images(
+            image_ids=image_ids,
+            filter_id=filter_id,
+            key=self._key,
+            max_concurrency=max_concurrency,
+            _client=_client if _client else self,
+        )
+    # end def images
+
+    def images_by_hash(
+        self,
+        hashes: List[str],
+        original: bool = False,
+        filter_id: Union[int, None] = None,
+        max_concurrency: int = 4,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+    ) -> Tuple[List[Image], List[str]]:
+        """
+        Fetches a lot of images by their SHA512 hash at once, with up to `BULK_BATCH_SIZE` hashes per search request.
+        See `images_by_hash(...)` on module level for the parameters.
+
+        :return: The found images in the order of `hashes`, and the hashes which could not be found.
+        :rtype:  Tuple[List[Image], List[str]]
+        """
+        return images_by_hash(
+            hashes=hashes,
+            original=original,
+            filter_id=filter_id,
+            key=self._key,
+            max_concurrency=max_concurrency,
+            _client=_client if _client else self,
+        )
+    # end def images_by_hash
+# end class
+
+
+atexit.register(DerpiClient.close_shared_client)
\ No newline at end of file
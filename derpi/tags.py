@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compact storage of the tags of images.
+
+The same few tag names (like `safe` or `pony`) are on millions of images, so with `Image._compact_tags = True`
+the names of all images share the same string objects of the `TAG_TABLE`, stored in a tuple,
+and the tag ids are stored in a sorted `array('I')` (4 bytes per id instead of a pointer to an int object).
+"""
+from array import array
+from bisect import bisect_left
+from typing import Union, List, Dict, Tuple, Iterable
+
+__author__ = 'luckydonald'
+
+
+__all__ = ['TagTable', 'TAG_TABLE', 'compact_tag_ids', 'contains_tag_id', 'has_tag', 'intersects']
+
+
+class TagTable(object):
+    """
+    Keeps a single string object per tag name, to be shared by every image having that tag.
+
+    >>> table = TagTable()
+    >>> table.intern(['safe', 'pony'])[0] is table.intern(['safe'])[0]
+    True
+    """
+    def __init__(self):
+        self._names: Dict[str, str] = {}
+    # end def
+
+    def intern(self, names: Iterable[str]) -> Tuple[str, ...]:
+        """
+        :param names: The tag names, as parsed from the json.
+        :return: The same names, but the string objects shared with every other image.
+        """
+        table = self._names
+        return tuple([table.setdefault(name, name) for name in names])
+    # end def
+
+    def clear(self) -> None:
+        """
+        Forgets all the tag names. The images already built keep theirs.
+        """
+        self._names.clear()
+    # end def
+
+    def __len__(self) -> int:
+        return len(self._names)
+    # end def
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._names
+    # end def
+# end class
+
+
+TAG_TABLE = TagTable()  # shared by all images.
+
+
+def compact_tag_ids(tag_ids: Iterable[int]) -> array:
+    """
+    :param tag_ids: The tag ids, as parsed from the json.
+    :return: The ids, sorted, in an `array('I')`.
+    """
+    return array('I', sorted(tag_ids))
+# end def
+
+
+def contains_tag_id(tag_ids: Union[array, List[int]], tag_id: int) -> bool:
+    """
+    :param tag_ids: The tag ids of an image, either a sorted `array` (see `compact_tag_ids`) or a plain list.
+    :param tag_id: The tag id to look for.
+    :return: If it is in there. Binary search for an array, linear for a list.
+    """
+    if isinstance(tag_ids, array):
+        index = bisect_left(tag_ids, tag_id)
+        return index < len(tag_ids) and tag_ids[index] == tag_id
+    # end if
+    return tag_id in tag_ids
+# end def
+
+
+def has_tag(tags: Iterable[str], tag_ids: Union[array, List[int]], tag: Union[str, int]) -> bool:
+    """
+    :param tags: The tag names of an image.
+    :param tag_ids: The tag ids of an image.
+    :param tag: A tag name or tag id.
+    :return: If the image has that tag.
+    """
+    if isinstance(tag, int):
+        return contains_tag_id(tag_ids, tag)
+    # end if
+    return tag in tags
+# end def
+
+
+def intersects(tags: Iterable[str], tag_ids: Union[array, List[int]], other: Iterable[Union[str, int]]) -> bool:
+    """
+    :param tags: The tag names of an image.
+    :param tag_ids: The tag ids of an image.
+    :param other: Tag names and/or tag ids. Best a `set`, if it is used for a lot of images.
+    :return: If the image has any of those tags.
+    """
+    if not isinstance(other, (set, frozenset)):
+        other = set(other)
+    # end if
+    return not other.isdisjoint(tags) or not other.isdisjoint(tag_ids)
+# end def
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Parsing of the timestamps the API returns, like `"2019-05-02T05:33:36"` or `"2020-03-22T20:20:02Z"`.
+"""
+import iso8601
+from typing import Union
+from datetime import datetime, timezone
+
+__author__ = 'luckydonald'
+
+
+__all__ = ['parse_datetime', 'format_datetime']
+
+
+def parse_datetime(value: str) -> datetime:
+    """
+    Parses a RFC3339 timestamp. Those without a timezone are in UTC.
+
+    The fixed format of the API is handled by the (much faster) `datetime.fromisoformat`,
+    anything else it doesn't understand by `iso8601.parse_date`.
+
+    :param value: The timestamp, e.g. `"2019-05-02T05:33:36"`.
+    :return: The timezone aware datetime.
+    """
+    text = value[:-1] + '+00:00' if value.endswith('Z') else value  # python < 3.11 doesn't know `Z`.
+    try:
+        result = datetime.fromisoformat(text)
+    except ValueError:
+        return iso8601.parse_date(value)
+    # end try
+    if result.tzinfo is None:
+        result = result.replace(tzinfo=timezone.utc)
+    # end if
+    return result
+# end def
+
+
+def format_datetime(value: Union[datetime, str, None]) -> Union[str, None]:
+    """
+    The reverse of `parse_datetime`, for serializing models.
+
+    :param value: The datetime. A string (not parsed yet) is returned as is.
+    :return: The timestamp, e.g. `"2019-05-02T05:33:36+00:00"`.
+    """
+    if value is None or isinstance(value, str):
+        return value
+    # end if
+    return value.isoformat()
+# end def
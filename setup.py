@@ -78,6 +78,11 @@ setup(
     extras_require={
         'sync': ['requests'],
         'async': ['httpx'],
+        'http2': ['httpx[http2]'],
+        'speedups': ['orjson'],
+        'msgpack': ['msgpack'],
+        'numpy': ['numpy'],
+        'arrow': ['pyarrow'],
     },
     # If there are data files included in your packages that need to be
     # installed, specify them here. If using Python 2.6 or less, then these
@@ -0,0 +1,238 @@
+import json
+import asyncio
+import unittest
+from unittest import mock
+import httpx
+from derpi.asyncrounous import client, Tag
+from derpi.retry import NO_RETRY
+from derpi.exceptions import RateLimitedError
+from derpi.concurrency import AdaptiveConcurrencyLimiter
+
+null = None    # jSoN
+false = False  # JsOn
+true = True    # JsoN
+
+TAG_LITTLEPIP = {
+    "aliased_tag": null, "aliases": ["littlepip"], "category": "oc", "description": "", "dnp_entries": [],
+    "id": 113046, "images": 3663, "implied_by_tags": ["pipbutt"], "implied_tags": ["fallout+equestria", "oc"],
+    "name": "oc:littlepip", "name_in_namespace": "littlepip", "namespace": "oc", "short_description": "",
+    "slug": "oc-colon-littlepip", "spoiler_image_uri": null,
+}
+
+
+def fake_client(*bodies, delay=0.01):
+    """
+    An `httpx.AsyncClient` answering offline with the given json bodies (in order), taking `delay` seconds each.
+    A body can also be a tuple of `(status_code, body)`.
+    :return: the client and the list the requests are recorded into.
+    """
+    bodies = list(bodies)
+    requests = []
+
+    async def handler(request):
+        requests.append(request)
+        await asyncio.sleep(delay)
+        status_code, body = 200, bodies.pop(0)
+        if isinstance(body, tuple):
+            status_code, body = body
+        # end if
+        return httpx.Response(
+            status_code, headers={'content-type': 'application/json; charset=utf-8'}, content=json.dumps(body).encode(),
+        )
+    # end def
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler)), requests
+# end def
+
+
+class CoalesceTest(unittest.IsolatedAsyncioTestCase):
+    async def test_identical_requests(self):
+        session, requests = fake_client({"tag": TAG_LITTLEPIP})
+        async with session:
+            derpi = client.DerpiClient(key=None, client=session)
+            tags = await asyncio.gather(*[derpi.tag('oc-colon-littlepip') for _ in range(10)])
+        # end with
+        self.assertEqual(len(requests), 1)
+        self.assertTrue(all(isinstance(tag, Tag) and tag.id == 113046 for tag in tags))
+        self.assertIsNot(tags[0], tags[1], 'every caller should get their own model')
+    # end def
+
+    async def test_different_requests(self):
+        session, requests = fake_client({"tag": TAG_LITTLEPIP}, {"tag": TAG_LITTLEPIP})
+        async with session:
+            derpi = client.DerpiClient(key=None, client=session)
+            await asyncio.gather(derpi.tag('oc-colon-littlepip'), derpi.tag('littlepip'))
+        # end with
+        self.assertEqual(len(requests), 2)
+    # end def
+
+    async def test_cancelled_caller(self):
+        session, requests = fake_client({"tag": TAG_LITTLEPIP}, delay=0.05)
+        async with session:
+            derpi = client.DerpiClient(key=None, client=session)
+            first = asyncio.ensure_future(derpi.tag('oc-colon-littlepip'))
+            second = asyncio.ensure_future(derpi.tag('oc-colon-littlepip'))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            tag = await second
+        # end with
+        self.assertEqual(tag.id, 113046)
+        self.assertEqual(len(requests), 1)
+    # end def
+
+    async def test_sequential_requests(self):
+        session, requests = fake_client({"tag": TAG_LITTLEPIP}, {"tag": TAG_LITTLEPIP})
+        async with session:
+            derpi = client.DerpiClient(key=None, client=session)
+            await derpi.tag('oc-colon-littlepip')
+            await derpi.tag('oc-colon-littlepip')
+        # end with
+        self.assertEqual(len(requests), 2, 'only requests running at the same time should be joined')
+    # end def
+
+    async def test_different_clients(self):
+        first_session, first_requests = fake_client({"tag": TAG_LITTLEPIP})
+        second_session, second_requests = fake_client({"tag": TAG_LITTLEPIP})
+        async with first_session, second_session:
+            first = client.DerpiClient(key=None, client=first_session)
+            second = client.DerpiClient(key=None, client=second_session)
+            await asyncio.gather(first.tag('oc-colon-littlepip'), second.tag('oc-colon-littlepip'))
+        # end with
+        self.assertEqual(len(first_requests), 1)
+        self.assertEqual(len(second_requests), 1, 'requests of different clients should not be joined')
+    # end def
+# end class
+
+
+class ConcurrencyLimiterTest(unittest.IsolatedAsyncioTestCase):
+    async def test_limit_is_respected(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+        running = []
+        most = 0
+
+        async def work():
+            nonlocal most
+            await limiter.acquire()
+            running.append(1)
+            most = max(most, len(running))
+            await asyncio.sleep(0.01)
+            running.pop()
+            limiter.release(0.01)
+        # end def
+
+        await asyncio.gather(*[work() for _ in range(6)])
+        self.assertEqual(most, 2)
+        self.assertEqual(limiter.in_flight, 0)
+    # end def
+
+    async def test_additive_increase(self):
+        session, requests = fake_client(*[{"tag": TAG_LITTLEPIP}] * 20, delay=0.001)
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, latency_tolerance=1000)
+        async with session:
+            derpi = client.DerpiClient(key=None, client=session, concurrency_limiter=limiter)
+            await asyncio.gather(*[derpi.tag(f'tag-{i}') for i in range(20)])
+        # end with
+        self.assertGreater(limiter.limit, 2)
+        self.assertEqual(limiter.stats()['successes'], 20)
+        self.assertIsNotNone(limiter.stats()['latency'])
+    # end def
+
+    async def test_multiplicative_decrease(self):
+        session, requests = fake_client((429, {"error": "slow down"}))
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+        async with session:
+            derpi = client.DerpiClient(key=None, client=session, concurrency_limiter=limiter, retry=NO_RETRY)
+            with self.assertRaises(RateLimitedError):
+                await derpi.tag('oc-colon-littlepip')
+            # end with
+        # end with
+        self.assertEqual(limiter.limit, 4)
+        self.assertEqual(limiter.in_flight, 0)
+    # end def
+
+    async def test_cancelled_waiter(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+        await limiter.acquire()
+        waiting = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        waiting.cancel()
+        await asyncio.sleep(0)
+        limiter.release(0.01)
+        await asyncio.wait_for(limiter.acquire(), timeout=1)
+        self.assertEqual(limiter.in_flight, 1)
+    # end def
+
+    async def test_cancelled_and_released_at_once(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+        await limiter.acquire()
+        waiting = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        waiting.cancel()
+        limiter.release(0.01)  # before the waiting task could resume and handle its cancellation.
+        with self.assertRaises(asyncio.CancelledError):
+            await waiting
+        # end with
+        self.assertEqual(limiter.in_flight, 0)
+        await asyncio.wait_for(limiter.acquire(), timeout=1)
+        self.assertEqual(limiter.in_flight, 1)
+    # end def
+# end class
+
+
+class Http2Test(unittest.IsolatedAsyncioTestCase):
+    async def test_create_client(self):
+        try:
+            import h2
+        except ImportError:
+            self.skipTest('needs the "h2" package')
+        # end try
+        with mock.patch.object(client.internet, 'AsyncClient', wraps=httpx.AsyncClient) as async_client:
+            async with client.DerpiClient(key=None, http2=True):
+                pass
+            # end with
+            self.assertTrue(async_client.call_args.kwargs.get('http2', False))
+            async with client.DerpiClient(key=None):
+                pass
+            # end with
+            self.assertFalse(async_client.call_args.kwargs.get('http2', False))
+        # end with
+    # end def
+
+    async def test_shared_client(self):
+        requests = {}
+
+        def create_client(http2=None):
+            session, requests[http2] = fake_client({"tag": TAG_LITTLEPIP}, {"tag": TAG_LITTLEPIP})
+            return session
+        # end def
+
+        with mock.patch.object(client.DerpiClient, 'create_client', side_effect=create_client):
+            try:
+                # not used as context manager, so the shared pool is used.
+                await client.DerpiClient(key=None, http2=True).tag('oc-colon-littlepip')
+                await client.DerpiClient(key=None, http2=True).tag('oc-colon-littlepip')
+                await client.DerpiClient(key=None).tag('oc-colon-littlepip')
+            finally:
+                await client.DerpiClient.close_shared_client()
+            # end try
+        # end with
+        self.assertEqual({http2: len(sent) for http2, sent in requests.items()}, {True: 2, False: 1})
+    # end def
+# end class
+
+
+class StreamTest(unittest.IsolatedAsyncioTestCase):
+    async def test_stream(self):
+        tags = [dict(TAG_LITTLEPIP, id=i) for i in range(1, 4)]
+        session, requests = fake_client({"tags": tags, "total": 3})
+        async with session:
+            derpi = client.DerpiClient(key=None, client=session)
+            ids = [tag.id async for tag in derpi.stream_search_tags('pip')]
+        # end with
+        self.assertEqual(ids, [1, 2, 3])
+    # end def
+# end class
+
+
+if __name__ == '__main__':
+    unittest.main()
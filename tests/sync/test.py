@@ -1,9 +1,32 @@
+import io
+import re
+import json
 import unittest
+from unittest import mock
 import iso8601
 import datetime
+import requests
+from urllib.parse import urlparse, parse_qs
+import os
+import time
+import tempfile
+import sqlite3
+import pickle
+from derpi.cache import MemoryCache, SQLiteCache, make_cache_key
+from derpi.retry import RetryPolicy, NO_RETRY
+from derpi.ratelimit import RateLimiter, TokenBucket, FileTokenBucket
+from derpi.decoding import set_json_decoder, get_json_decoder, JSON_DECODERS
+from derpi.streaming import JsonArrayStream
+from derpi.timestamps import parse_datetime
+from derpi.tags import TagTable, TAG_TABLE, compact_tag_ids, contains_tag_id
+from derpi.columns import ImageColumns, decode_image_columns
+from derpi.schemas import SCHEMAS
+from derpi.export import arrow_schema, iter_record_batches, write_parquet, write_arrow
+from array import array
+from derpi.exceptions import ServerError, NotFoundError, RateLimitedError, CloudflareChallengeError, parse_retry_after
 from derpi.syncrounous import (
     client, Comment, Image, Intensities, Representations, DerpiModel, Tag, Post, User, Filter,
-    Oembed, Links, Awards, Gallery, Forum, Topic,
+    Oembed, Links, Awards, Gallery, Forum, Topic, SearchResult, LazyImage, LazyRepresentations,
 )
 
 null = None    # jSoN
@@ -12,6 +35,40 @@ true = True    # JsoN
 
 DerpiModel._assert_consuming_all_params = True
 
+TAG_LITTLEPIP = {
+    "aliased_tag": null, "aliases": ["littlepip"], "category": "oc", "description": "", "dnp_entries": [],
+    "id": 113046, "images": 3663, "implied_by_tags": ["pipbutt"], "implied_tags": ["fallout+equestria", "oc"],
+    "name": "oc:littlepip", "name_in_namespace": "littlepip", "namespace": "oc", "short_description": "",
+    "slug": "oc-colon-littlepip", "spoiler_image_uri": null,
+}
+
+
+def image_dict(image_id, **changes):
+    data = {
+        "animated": false, "aspect_ratio": 1.0, "comment_count": 0, "created_at": "2019-05-02T05:33:36",
+        "deletion_reason": null, "description": "", "downvotes": 0, "duplicate_of": null, "duration": 0.04, "faves": 0,
+        "first_seen_at": "2019-05-02T05:33:36", "format": "png", "height": 100, "hidden_from_users": false,
+        "id": image_id, "intensities": null, "mime_type": "image/png", "name": "image.png",
+        "orig_sha512_hash": f"orig{image_id}", "processed": true, "representations": {
+            key: f"https://derpicdn.net/img/2019/5/2/{image_id}/{key}.png"
+            for key in ["full", "large", "medium", "small", "tall", "thumb", "thumb_small", "thumb_tiny"]
+        }, "score": 0, "sha512_hash": f"sha{image_id}", "size": 1234, "source_url": "", "spoilered": false,
+        "tag_count": 1, "tag_ids": [40482], "tags": ["safe"], "thumbnails_generated": true,
+        "updated_at": "2020-04-10T00:14:35", "uploader": "Kam3E433", "uploader_id": 459261, "upvotes": 0,
+        "view_url": f"https://derpicdn.net/img/view/2019/5/2/{image_id}.png", "width": 100, "wilson_score": 0.0,
+    }
+    data.update(changes)
+    return data
+# end def
+
+
+def gallery_dict(gallery_id):
+    return {
+        "description": "Best. Pony.", "id": gallery_id, "spoiler_warning": "", "thumbnail_id": 1484633,
+        "title": "Best Pony", "user": "Ciaran", "user_id": 370912,
+    }
+# end def
+
 
 def cloudflare_blocked_request(
     cls, method, url, params=None, client=None,
@@ -32,6 +89,80 @@ def cloudflare_blocked_request(
 client.DerpiClient.request = classmethod(cloudflare_blocked_request)
 
 
+class Status(object):
+    """
+    A body for the `FakeAdapter`, answered with a different status code and additional headers.
+    """
+    def __init__(self, status_code, body, headers=None):
+        self.status_code = status_code
+        self.body = body
+        self.headers = {} if headers is None else headers
+    # end def
+# end class
+
+
+class FakeAdapter(requests.adapters.BaseAdapter):
+    """
+    Answers requests of a `requests.Session` offline, with the given json bodies (in order), recording the requests.
+    """
+    def __init__(self, *bodies, status_code=200, headers=None):
+        super().__init__()
+        self.bodies = list(bodies)
+        self.status_code = status_code
+        self.headers = {'content-type': 'application/json; charset=utf-8'} if headers is None else headers
+        self.requests = []
+    # end def
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.headers.update(self.headers)
+        body = self.bodies.pop(0)
+        if callable(body):
+            body = body(request)
+        # end if
+        if isinstance(body, Status):
+            response.status_code = body.status_code
+            response.headers.update(body.headers)
+            body = body.body
+        # end if
+        response.raw = io.BytesIO(json.dumps(body).encode('utf-8'))
+        response.url = request.url
+        response.request = request
+        return response
+    # end def
+
+    def close(self):
+        pass
+    # end def
+# end class
+
+
+def fake_session(*bodies, **kwargs):
+    session = requests.Session()
+    adapter = FakeAdapter(*bodies, **kwargs)
+    session.mount('https://', adapter)
+    return session, adapter
+# end def
+
+
+def assert_fields_equal(test_case, first, second):
+    """
+    Like `test_case.assertEqual(first, second)`, but comparing all the fields of the models (or lists of them),
+    as `==` only compares the ids of images, tags, etc.
+    """
+    if isinstance(first, list) and isinstance(second, list):
+        test_case.assertEqual(len(first), len(second))
+        for first_item, second_item in zip(first, second):
+            assert_fields_equal(test_case, first_item, second_item)
+        # end for
+        return
+    # end if
+    test_case.assertTrue(first.fields_equal(second), f'{first!r} != {second!r}')
+# end def
+
+
 class OnlineTest(unittest.TestCase):
     def test_comment(self):
         comment = client.comment(8927783)
@@ -120,7 +251,8 @@ class OnlineTest(unittest.TestCase):
 
     def test_search_comments(self):
         search_comments = client.search_comments('best pony')
-        self.assertIsInstance(search_comments, list)
+        self.assertIsInstance(search_comments, SearchResult)
+        self.assertGreaterEqual(search_comments.total, len(search_comments))
         for comment in search_comments:
             self.assertIsInstance(comment, Comment)
             self.assertTrue(self._contains_best_pony(comment.body), f'should contain "best pony" or similar in comment body: {comment.body!r}')
@@ -129,7 +261,8 @@ class OnlineTest(unittest.TestCase):
 
     def test_search_galleries(self):
         search_galleries = client.search_galleries('best pony')
-        self.assertIsInstance(search_galleries, list)
+        self.assertIsInstance(search_galleries, SearchResult)
+        self.assertGreaterEqual(search_galleries.total, len(search_galleries))
         for gallery in search_galleries:
             self.assertIsInstance(gallery, Gallery)
             self.assertTrue(self._contains_best_pony(gallery.title) or self._contains_best_pony(gallery.description), f'should contain "best pony" or similar in gallery title or description: {gallery.title!r} and {gallery.description}')
@@ -138,7 +271,8 @@ class OnlineTest(unittest.TestCase):
 
     def test_search_posts(self):
         search_posts = client.search_posts('best pony')
-        self.assertIsInstance(search_posts, list)
+        self.assertIsInstance(search_posts, SearchResult)
+        self.assertGreaterEqual(search_posts.total, len(search_posts))
         for post in search_posts:
             self.assertIsInstance(post, Post)
             self.assertTrue(self._contains_best_pony(post.body), f'should contain "best pony" or similar in post body: {post.body!r}')
@@ -148,7 +282,8 @@ class OnlineTest(unittest.TestCase):
     def test_search_images(self):
         items = 2
         search_images = client.search_images(query='littlepip', per_page=items)
-        self.assertIsInstance(search_images, list)
+        self.assertIsInstance(search_images, SearchResult)
+        self.assertGreaterEqual(search_images.total, len(search_images))
         self.assertEquals(len(search_images), items)
         for image in search_images:
             self.assertIsInstance(image, Image)
@@ -158,7 +293,7 @@ class OnlineTest(unittest.TestCase):
 
     def test_search_tags(self):
         search_tags = client.search_tags('littlepip', page=1)
-        self.assertIsInstance(search_tags, list)
+        self.assertIsInstance(search_tags, SearchResult)
         self.assertTrue(search_tags)
         for tag in search_tags:
             self.assertIsInstance(tag, Tag)
@@ -168,7 +303,7 @@ class OnlineTest(unittest.TestCase):
 
     def test_search_reverse(self):
         search_reverse = client.search_reverse(url='https://derpicdn.net/img/view/2016/2/3/1079240.png')
-        self.assertIsInstance(search_reverse, list)
+        self.assertIsInstance(search_reverse, SearchResult)
         self.assertTrue(search_reverse)
         self.assertEqual(len(search_reverse), 1, 'should have exactly 1 result')
         self.assertIsInstance(search_reverse[0], Image)
@@ -225,6 +360,892 @@ class OnlineTest(unittest.TestCase):
 # end class
 
 
+class PoolTest(unittest.TestCase):
+    def test_shared_client(self):
+        shared = client.DerpiClient.get_shared_client()
+        self.assertIs(client.DerpiClient.get_shared_client(), shared)
+        client.DerpiClient.close_shared_client()
+        self.assertIsNot(client.DerpiClient.get_shared_client(), shared)
+    # end def
+
+    def test_context_manager(self):
+        with client.DerpiClient(key=None) as derpi:
+            self.assertIsNotNone(derpi._client)
+            self.assertIsNot(derpi._client, client.DerpiClient.get_shared_client())
+        # end with
+        self.assertIsNone(derpi._client)
+    # end def
+
+    def test_given_client_is_kept_open(self):
+        session, adapter = fake_session({"tag": TAG_LITTLEPIP})
+        with client.DerpiClient(key=None, client=session, base_url='https://furbooru.org') as derpi:
+            tag = derpi.tag('oc-colon-littlepip')
+        # end with
+        self.assertIs(derpi._client, session)
+        self.assertIsInstance(tag, Tag)
+        self.assertEqual(adapter.requests[0].url, 'https://furbooru.org/api/v1/json/tags/oc-colon-littlepip')
+    # end def
+# end class
+
+
+class PaginationTest(unittest.TestCase):
+    def test_iter_all_pages(self):
+        session, adapter = fake_session(
+            {"galleries": [gallery_dict(1), gallery_dict(2)], "total": 5},
+            {"galleries": [gallery_dict(3), gallery_dict(4)], "total": 5},
+            {"galleries": [gallery_dict(5)], "total": 5},
+        )
+        galleries = list(client.iter_search_galleries('best pony', _client=session))
+        self.assertEqual([gallery.id for gallery in galleries], [1, 2, 3, 4, 5])
+        self.assertEqual(len(adapter.requests), 3, 'the short last page should not trigger another request')
+        self.assertIn('page=3', adapter.requests[2].url)
+    # end def
+
+    def test_iter_limit(self):
+        session, adapter = fake_session(
+            {"galleries": [gallery_dict(1), gallery_dict(2)], "total": 6},
+            {"galleries": [gallery_dict(3), gallery_dict(4)], "total": 6},
+            {"galleries": [gallery_dict(5), gallery_dict(6)], "total": 6},
+        )
+        galleries = list(client.iter_search_galleries('best pony', limit=3, _client=session))
+        self.assertEqual([gallery.id for gallery in galleries], [1, 2, 3])
+        self.assertEqual(len(adapter.requests), 2, 'should not prefetch pages beyond the limit')
+    # end def
+
+    def test_iter_per_page_over_maximum(self):
+        def image_page(request):  # like the api, returning at most 50 per page.
+            page = int(parse_qs(urlparse(request.url).query)['page'][0])
+            image_ids = range((page - 1) * 50 + 1, min(page * 50, 120) + 1)
+            return {"images": [image_dict(image_id) for image_id in image_ids], "interactions": [], "total": 120}
+        # end def
+
+        session, adapter = fake_session(*[image_page] * 3)
+        images = list(client.iter_search_images('safe', per_page=100, _client=session))
+        self.assertEqual([image.id for image in images], list(range(1, 121)))
+        self.assertEqual(len(adapter.requests), 3)
+    # end def
+
+    def test_fan_out(self):
+        def gallery_page(request):
+            page = int(parse_qs(urlparse(request.url).query)['page'][0])
+            return {"galleries": [gallery_dict(i) for i in range(page * 2 - 1, min(page * 2, 5) + 1)], "total": 5}
+        # end def
+
+        session, adapter = fake_session(*[gallery_page] * 3)
+        galleries = client.fan_out_search_galleries('best pony', _client=session)
+        self.assertIsInstance(galleries, SearchResult)
+        self.assertEqual(galleries.total, 5)
+        self.assertEqual([gallery.id for gallery in galleries], [1, 2, 3, 4, 5])
+        self.assertEqual(len(adapter.requests), 3)
+    # end def
+
+    def test_fan_out_pinned(self):
+        def image_page(request):
+            params = parse_qs(urlparse(request.url).query)
+            page, per_page = int(params['page'][0]), int(params['per_page'][0])
+            image_ids = list(range(5, 0, -1))[(page - 1) * per_page:page * per_page]
+            return {"images": [image_dict(image_id) for image_id in image_ids], "interactions": [], "total": 5}
+        # end def
+
+        for query, pinned in [('safe', '(safe) && id.lte:5'), ('', 'id.lte:5'), ('  ', 'id.lte:5')]:
+            session, adapter = fake_session(*[image_page] * 4)
+            images = client.fan_out_search_images(query, per_page=2, _client=session)
+            self.assertEqual([image.id for image in images], [5, 4, 3, 2, 1])
+            self.assertEqual(len(adapter.requests), 4, 'the newest image, then 3 pages')
+            self.assertEqual(
+                [parse_qs(urlparse(request.url).query, keep_blank_values=True)['q'] for request in adapter.requests[1:]],
+                [[pinned]] * 3,
+            )
+        # end for
+    # end def
+
+    def test_fan_out_per_page_over_maximum(self):
+        def image_page(request):  # like the api, returning at most 50 per page.
+            params = parse_qs(urlparse(request.url).query)
+            page, per_page = int(params['page'][0]), min(int(params['per_page'][0]), 50)
+            image_ids = list(range(120, 0, -1))[(page - 1) * per_page:page * per_page]
+            return {"images": [image_dict(image_id) for image_id in image_ids], "interactions": [], "total": 120}
+        # end def
+
+        session, adapter = fake_session(*[image_page] * 4)
+        images = client.fan_out_search_images('safe', per_page=100, _client=session)
+        self.assertEqual([image.id for image in images], list(range(120, 0, -1)))
+        self.assertEqual(len(adapter.requests), 4, 'the newest image, then 3 pages')
+    # end def
+
+    def test_cursor(self):
+        def image_page(request):
+            params = parse_qs(urlparse(request.url).query)
+            self.assertEqual((params['sf'], params['sd'], params['page']), (['id'], ['desc'], ['1']))
+            match = re.search(r'id\.lt:(\d+)', params['q'][0])
+            older = [image_id for image_id in range(5, 0, -1) if not match or image_id < int(match.group(1))]
+            return {"images": [image_dict(image_id) for image_id in older[:2]], "interactions": [], "total": len(older)}
+        # end def
+
+        session, adapter = fake_session(*[image_page] * 4)
+        cursor = client.cursor_search_images('safe', per_page=2, limit=3, _client=session)
+        self.assertEqual([image.id for image in cursor], [5, 4, 3])
+        self.assertEqual(parse_qs(urlparse(adapter.requests[1].url).query)['q'], ['(safe) && id.lt:4'])
+
+        resumed = client.cursor_search_images('safe', per_page=2, cursor=cursor.token, _client=session)
+        self.assertEqual([image.id for image in resumed], [2, 1])
+        self.assertEqual(len(adapter.requests), 3, 'the page containing the rest of the total should be the last one')
+        with self.assertRaises(ValueError):
+            client.cursor_search_images('explicit', cursor=cursor.token, _client=session)
+        # end with
+
+        for query in ('', '  '):
+            empty = client.cursor_search_images(query, per_page=2, _client=session)
+            empty.last_id = 4
+            self.assertEqual(empty.page_query(), 'id.lt:4')
+        # end for
+    # end def
+# end class
+
+
+class BulkTest(unittest.TestCase):
+    def test_images(self):
+        def image_batch(request):
+            query = parse_qs(urlparse(request.url).query)['q'][0]
+            image_ids = [int(image_id) for image_id in re.findall(r'id:(\d+)', query)]
+            existing = [image_id for image_id in image_ids if image_id % 7 != 0]
+            return {"images": [image_dict(image_id) for image_id in reversed(existing)], "interactions": [], "total": len(existing)}
+        # end def
+
+        session, adapter = fake_session(*[image_batch] * 3)
+        wanted = list(range(120, 0, -1)) + [3]
+        images, missing = client.images(wanted, filter_id=56027, _client=session)
+        self.assertEqual([image.id for image in images], [i for i in range(120, 0, -1) if i % 7 != 0])
+        self.assertEqual(missing, [i for i in range(120, 0, -1) if i % 7 == 0])
+        self.assertEqual(len(adapter.requests), 3, 'should batch 50 ids per request')
+        queries = sorted(parse_qs(urlparse(request.url).query)['q'][0] for request in adapter.requests)
+        self.assertIn(' || '.join(f'id:{i}' for i in range(120, 70, -1)), queries)
+    # end def
+
+    def test_images_by_hash(self):
+        session, adapter = fake_session({"images": [image_dict(2), image_dict(1)], "interactions": [], "total": 2})
+        images, missing = client.images_by_hash(['SHA1', 'sha2', 'sha3'], _client=session)
+        self.assertEqual([image.id for image in images], [1, 2])
+        self.assertEqual(missing, ['sha3'])
+        self.assertEqual(
+            parse_qs(urlparse(adapter.requests[0].url).query)['q'],
+            ['sha512_hash:sha1 || sha512_hash:sha2 || sha512_hash:sha3'],
+        )
+    # end def
+
+    def test_images_by_hash_missing_hash(self):
+        unprocessed = image_dict(3)
+        unprocessed['sha512_hash'] = None
+        session, adapter = fake_session({"images": [unprocessed, image_dict(1)], "interactions": [], "total": 2})
+        images, missing = client.images_by_hash(['sha1', 'sha3'], _client=session)
+        self.assertEqual([image.id for image in images], [1])
+        self.assertEqual(missing, ['sha3'])
+    # end def
+# end class
+
+
+class CacheTest(unittest.TestCase):
+    def test_cached_route(self):
+        session, adapter = fake_session({"tag": TAG_LITTLEPIP}, {"tag": TAG_LITTLEPIP})
+        cache = MemoryCache()
+        derpi = client.DerpiClient(key=None, client=session, cache=cache)
+        self.assertEqual(derpi.tag('oc-colon-littlepip'), derpi.tag('oc-colon-littlepip'))
+        self.assertEqual(len(adapter.requests), 1)
+        self.assertEqual(cache.stats()['hits'], 1)
+        self.assertEqual(cache.stats()['misses'], 1)
+    # end def
+
+    def test_uncached_route(self):
+        session, adapter = fake_session({"tag": TAG_LITTLEPIP}, {"tag": TAG_LITTLEPIP})
+        derpi = client.DerpiClient(key=None, client=session, cache=MemoryCache(ttls={'tag': None}, default_ttl=None))
+        derpi.tag('oc-colon-littlepip')
+        derpi.tag('oc-colon-littlepip')
+        self.assertEqual(len(adapter.requests), 2)
+    # end def
+
+    def test_cache_key(self):
+        url = 'https://derpibooru.org/api/v1/json/search/tags'
+        self.assertEqual(
+            make_cache_key('GET', url, {'q': 'pip', 'page': None, 'per_page': 2}),
+            make_cache_key('GET', url, {'per_page': 2, 'q': 'pip'}),
+        )
+        self.assertEqual(make_cache_key('GET', url, {'q': 'pip', 'key': None}), make_cache_key('GET', url, {'q': 'pip'}))
+        self.assertNotEqual(make_cache_key('GET', url, {'q': 'pip', 'key': 'a'}), make_cache_key('GET', url, {'q': 'pip'}))
+        self.assertNotEqual(
+            make_cache_key('GET', url, {'q': 'pip', 'key': 'a'}), make_cache_key('GET', url, {'q': 'pip', 'key': 'b'}),
+        )
+        self.assertNotIn('secret', make_cache_key('GET', url, {'q': 'pip', 'key': 'secret'}))
+    # end def
+
+    def test_lru_eviction(self):
+        cache = MemoryCache(max_bytes=30)
+        cache.set('a', b'0123456789', ttl=60)
+        cache.set('b', b'0123456789', ttl=60)
+        self.assertEqual(cache.get('a'), b'0123456789')  # now 'b' is the least recently used one.
+        cache.set('c', b'0123456789', ttl=60)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), b'0123456789')
+        self.assertEqual(cache.stats()['evictions'], 1)
+        self.assertLessEqual(cache.size, 30)
+    # end def
+
+    def test_sqlite_persists(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'cache.sqlite')
+            session, adapter = fake_session({"tag": TAG_LITTLEPIP})
+            cache = SQLiteCache(path)
+            client.DerpiClient(key=None, client=session, cache=cache).tag('oc-colon-littlepip')
+            cache.close()
+
+            restarted = SQLiteCache(path)  # e.g. after the crawler was restarted.
+            tag = client.DerpiClient(key=None, client=session, cache=restarted).tag('oc-colon-littlepip')
+            self.assertEqual(tag.id, 113046)
+            self.assertEqual(len(adapter.requests), 1)
+            self.assertEqual(restarted.stats()['hits'], 1)
+            restarted.close()
+        # end with
+    # end def
+
+    def test_sqlite_eviction(self):
+        with tempfile.TemporaryDirectory() as folder:
+            cache = SQLiteCache(os.path.join(folder, 'cache.sqlite'), max_bytes=40, compression_level=1)
+            cache.set('a', b'a' * 1000, ttl=60)
+            self.assertLess(cache.stats()['size'], 1000, 'should be stored compressed')
+            cache.set('b', b'b' * 1000, ttl=60)
+            self.assertEqual(cache.get('a'), b'a' * 1000)  # now 'b' is the least recently used one.
+            cache.set('c', b'c' * 1000, ttl=60)
+            self.assertIsNone(cache.get('b'))
+            self.assertEqual(cache.get('a'), b'a' * 1000)
+            self.assertEqual(cache.get('c'), b'c' * 1000)
+            self.assertLessEqual(cache.stats()['size'], 40)
+            cache.close()
+        # end with
+    # end def
+
+    def test_sqlite_size_total(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'cache.sqlite')
+            connection = sqlite3.connect(path)  # a cache file without the total, of an older version.
+            connection.execute(
+                'CREATE TABLE responses (key TEXT PRIMARY KEY, expires_at REAL NOT NULL, accessed_at REAL NOT NULL,'
+                ' size INTEGER NOT NULL, content BLOB NOT NULL)'
+            )
+            connection.execute("INSERT INTO responses VALUES ('old', 0, 0, 12, x'00')")
+            connection.commit()
+            connection.close()
+
+            cache = SQLiteCache(path, max_bytes=40, compression_level=1)
+            self.assertEqual(cache.stats()['size'], 12)
+
+            def stored_size():
+                return cache._connection().execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+            # end def
+            cache.set('a', b'a' * 1000, ttl=60)
+            cache.set('a', b'a' * 10, ttl=60)  # replaced
+            self.assertEqual(cache.stats()['size'], stored_size())
+            cache.set('b', b'b' * 1000, ttl=60)
+            cache.set('c', b'c' * 1000, ttl=60)  # evicts
+            self.assertGreater(cache.stats()['evictions'], 0)
+            self.assertEqual(cache.stats()['size'], stored_size())
+            cache.clear()
+            self.assertEqual(cache.stats()['size'], 0)
+            cache.close()
+        # end with
+    # end def
+
+    def test_expiry(self):
+        cache = MemoryCache()
+        cache.set('a', b'data', ttl=-1)
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(len(cache), 0)
+    # end def
+# end class
+
+
+class RetryTest(unittest.TestCase):
+    def setUp(self):
+        self.retry = RetryPolicy(max_retries=2, backoff_factor=0.001)
+    # end def
+
+    def test_retry_after(self):
+        session, adapter = fake_session(
+            Status(429, {"error": "too many requests"}, headers={'retry-after': '0'}),
+            Status(502, {"error": "bad gateway"}),
+            {"tag": TAG_LITTLEPIP},
+        )
+        tag = client.DerpiClient(key=None, client=session, retry=self.retry).tag('oc-colon-littlepip')
+        self.assertEqual(tag.id, 113046)
+        self.assertEqual(len(adapter.requests), 3)
+    # end def
+
+    def test_retry_after_server_error(self):
+        session, adapter = fake_session(
+            Status(503, {"error": "down for maintenance"}, headers={'retry-after': '3'}),
+            {"tag": TAG_LITTLEPIP},
+        )
+        with mock.patch.object(client.time, 'sleep') as sleep:
+            tag = client.DerpiClient(key=None, client=session, retry=self.retry).tag('oc-colon-littlepip')
+        # end with
+        self.assertEqual(tag.id, 113046)
+        self.assertEqual(len(adapter.requests), 2)
+        sleep.assert_called_once_with(3.0)
+    # end def
+
+    def test_give_up(self):
+        session, adapter = fake_session(*[Status(503, {"error": "down"})] * 3)
+        with self.assertRaises(ServerError) as context:
+            client.DerpiClient(key=None, client=session, retry=self.retry).tag('oc-colon-littlepip')
+        # end with
+        self.assertEqual(context.exception.status_code, 503)
+        self.assertEqual(len(adapter.requests), 3)
+    # end def
+
+    def test_not_found(self):
+        session, adapter = fake_session(Status(404, {"error": "not found"}))
+        with self.assertRaises(NotFoundError):
+            client.DerpiClient(key=None, client=session, retry=self.retry).tag('does-not-exist')
+        # end with
+        self.assertEqual(len(adapter.requests), 1, 'should not be retried')
+    # end def
+
+    def test_cloudflare_challenge(self):
+        session, adapter = fake_session(Status(
+            403, "<html>Just a moment...</html>", headers={'content-type': 'text/html', 'server': 'cloudflare'},
+        ))
+        with self.assertRaises(CloudflareChallengeError):
+            client.DerpiClient(key=None, client=session, retry=NO_RETRY).tag('oc-colon-littlepip')
+        # end with
+    # end def
+
+    def test_retry_after_header(self):
+        self.assertEqual(parse_retry_after('12'), 12.0)
+        self.assertEqual(parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT'), 0.0)
+        self.assertIsNone(parse_retry_after('soon'))
+        response = requests.Response()
+        response.status_code = 429
+        response.headers['retry-after'] = '500'
+        self.assertEqual(self.retry.delay(0, RateLimitedError('', response)), 120.0, 'should be capped by max_backoff')
+    # end def
+# end class
+
+
+def reserve_file_bucket(path):
+    return FileTokenBucket(path, rate=1, burst=2).reserve()
+# end def
+
+
+class RateLimitTest(unittest.TestCase):
+    def test_token_bucket(self):
+        bucket = TokenBucket(rate=10, burst=2)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertAlmostEqual(bucket.reserve(), 0.1, places=2)
+        self.assertAlmostEqual(bucket.reserve(), 0.2, places=2)
+    # end def
+
+    def test_file_bucket_across_processes(self):
+        from concurrent.futures import ProcessPoolExecutor
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'bucket')
+            with ProcessPoolExecutor(max_workers=2) as executor:
+                waits = sorted(executor.map(reserve_file_bucket, [path] * 4))
+            # end with
+        # end with
+        self.assertEqual(waits[:2], [0, 0], 'the burst should be shared')
+        self.assertGreater(waits[2], 0.5)
+        self.assertGreater(waits[3], 1.5)
+    # end def
+
+    def test_per_base_url(self):
+        limiter = RateLimiter(per_base_url={'https://furbooru.org/': TokenBucket(rate=1)})
+        self.assertIsNone(limiter.bucket_for('https://derpibooru.org/api/v1/json/tags/safe'))
+        self.assertIsNotNone(limiter.bucket_for('https://furbooru.org/api/v1/json/tags/safe'))
+        self.assertEqual(limiter.reserve('https://derpibooru.org/api/v1/json/tags/safe'), 0)
+    # end def
+
+    def test_limited_client(self):
+        session, adapter = fake_session({"tag": TAG_LITTLEPIP}, {"tag": TAG_LITTLEPIP})
+        derpi = client.DerpiClient(key=None, client=session, rate_limiter=RateLimiter(rate=20))
+        start = time.monotonic()
+        derpi.tag('oc-colon-littlepip')
+        derpi.tag('oc-colon-littlepip')
+        self.assertGreaterEqual(time.monotonic() - start, 0.04)
+        self.assertEqual(len(adapter.requests), 2)
+    # end def
+# end class
+
+
+class DecodingTest(unittest.TestCase):
+    def tearDown(self):
+        set_json_decoder()
+    # end def
+
+    def test_decoders(self):
+        for name in JSON_DECODERS:
+            try:
+                set_json_decoder(name)
+            except ImportError:
+                continue
+            # end try
+            self.assertEqual(get_json_decoder(), name)
+            session, adapter = fake_session({"images": [image_dict(1), image_dict(2)], "interactions": [], "total": 2})
+            images = client.search_images('safe', _client=session)
+            self.assertEqual([image.id for image in images], [1, 2], name)
+            self.assertEqual(images.total, 2, name)
+        # end for
+    # end def
+
+    def test_unknown_decoder(self):
+        with self.assertRaises(ValueError):
+            set_json_decoder('yaml')
+        # end with
+    # end def
+# end class
+
+
+class StreamTest(unittest.TestCase):
+    def test_stream(self):
+        session, adapter = fake_session({"images": [image_dict(i) for i in range(1, 4)], "interactions": [], "total": 3})
+        derpi = client.DerpiClient(key=None, client=session)
+        images = derpi.stream_search_images('safe', per_page=3)
+        self.assertEqual(next(images).id, 1)
+        self.assertEqual([image.id for image in images], [2, 3])
+        self.assertIn('per_page=3', adapter.requests[0].url)
+    # end def
+
+    def test_split_chunks(self):
+        data = {"x": {"images": [0]}, "images": [{"a": "q\\\"],{ü€", "b": [1, {"c": "}"}]}, 5, "s,t", [], None], "total": 5}
+        body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        stream = JsonArrayStream('images')
+        items = [item for i in range(len(body)) for item in stream.feed(body[i:i + 1])]
+        stream.close()
+        self.assertEqual(items, data['images'])
+    # end def
+
+    def test_missing_array(self):
+        session, adapter = fake_session({"total": 0})
+        with self.assertRaises(ValueError):
+            list(client.stream_search_comments('pip', _client=session))
+        # end with
+    # end def
+# end class
+
+
+class TimestampTest(unittest.TestCase):
+    def test_formats(self):
+        for value in ['2019-05-02T05:33:36', '2020-03-22T20:20:02Z', '2018-05-02T20:35:09.123Z', '2020-03-22T20:20:02.12345+02:00', '2020-03-22T20:20:02+0100']:
+            self.assertEqual(parse_datetime(value), iso8601.parse_date(value), value)
+            self.assertEqual(parse_datetime(value).utcoffset(), iso8601.parse_date(value).utcoffset(), value)
+        # end for
+    # end def
+
+    def test_lazy(self):
+        topic = Topic.from_dict({'author': 'dracone', 'last_replied_to_at': '2020-03-22T20:20:02Z', 'locked': False, 'post_count': 3, 'slug': 'a-lack-of-images', 'sticky': False, 'title': 'A lack of images', 'user_id': 363222, 'view_count': 0})
+        self.assertEqual(topic._last_replied_to_at, '2020-03-22T20:20:02Z', 'not parsed yet')
+        expected = datetime.datetime(2020, 3, 22, 20, 20, 2, tzinfo=datetime.timezone.utc)
+        self.assertEqual(topic.last_replied_to_at, expected)
+        self.assertIs(topic.last_replied_to_at, topic._last_replied_to_at, 'parsed only once')
+        topic.last_replied_to_at = expected
+        self.assertIs(topic.last_replied_to_at, expected)
+    # end def
+# end class
+
+
+class TagTest(unittest.TestCase):
+    def test_table(self):
+        table = TagTable()
+        first = table.intern(['safe', 'pony'])
+        second = table.intern([''.join(['sa', 'fe'])])
+        self.assertIs(first[0], second[0])
+        self.assertEqual(len(table), 2)
+    # end def
+
+    def test_compact(self):
+        Image._compact_tags = True
+        try:
+            first = Image.from_dict(image_dict(1, tags=['safe', 'pony'], tag_ids=[40482, 26707]))
+            second = Image.from_dict(image_dict(2, tags=[''.join(['sa', 'fe'])], tag_ids=[40482]))
+        finally:
+            Image._compact_tags = False
+        # end try
+        self.assertIs(first.tags[0], second.tags[0])
+        self.assertIn('safe', TAG_TABLE)
+        self.assertEqual(first.tag_ids, array('I', [26707, 40482]), 'sorted')
+        for image in [first, Image.from_dict(image_dict(1, tags=['safe', 'pony'], tag_ids=[40482, 26707]))]:
+            self.assertTrue(image.has_tag('pony'))
+            self.assertTrue(image.has_tag(26707))
+            self.assertFalse(image.has_tag('explicit'))
+            self.assertFalse(image.has_tag(1))
+            self.assertTrue(image.intersects({'explicit', 40482}))
+            self.assertTrue(image.intersects(['explicit', 'pony']))
+            self.assertFalse(image.intersects({'explicit', 26153}))
+        # end for
+    # end def
+
+    def test_contains_tag_id(self):
+        tag_ids = compact_tag_ids([5, 3, 9])
+        self.assertEqual([tag_id for tag_id in range(11) if contains_tag_id(tag_ids, tag_id)], [3, 5, 9])
+    # end def
+# end class
+
+
+class RepresentationsTest(unittest.TestCase):
+    URLS = {
+        "full": "https://derpicdn.net/img/view/2019/5/2/2028858.png",
+        "large": "https://derpicdn.net/img/2019/5/2/2028858/large.png",
+        "medium": "https://derpicdn.net/img/2019/5/2/2028858/medium.png",
+        "small": "https://derpicdn.net/img/2019/5/2/2028858/small.png",
+        "tall": "https://derpicdn.net/img/2019/5/2/2028858/tall.png",
+        "thumb": "https://derpicdn.net/img/2019/5/2/2028858/thumb.png",
+        "thumb_small": "https://derpicdn.net/img/2019/5/2/2028858/thumb_small.png",
+        "thumb_tiny": "https://derpicdn.net/img/2019/5/2/2028858/thumb_tiny.png",
+    }
+
+    def test_derived(self):
+        representations = Representations.from_dict(self.URLS)
+        self.assertIsNone(representations._urls, 'everything derived')
+        self.assertEqual({name: getattr(representations, name) for name in self.URLS}, self.URLS)
+        self.assertIsNone(representations.mp4)
+        self.assertEqual(representations, Representations(**self.URLS))
+    # end def
+
+    def test_fallback(self):
+        urls = dict(self.URLS, full='https://example.com/full.png', mp4='https://derpicdn.net/img/2019/5/2/2028858/full.mp4')
+        representations = Representations.from_dict(urls)
+        self.assertEqual(set(representations._urls), {'full', 'mp4'})
+        self.assertEqual({name: getattr(representations, name) for name in urls}, urls)
+        representations = Representations.from_dict(dict(urls, thumb='https://example.com/x'))
+        self.assertEqual({name: getattr(representations, name) for name in urls}, dict(urls, thumb='https://example.com/x'))
+    # end def
+
+    def test_set(self):
+        representations = Representations.from_dict(self.URLS)
+        representations.large = 'https://example.com/large.png'
+        self.assertEqual(representations.large, 'https://example.com/large.png')
+        self.assertEqual(representations.small, self.URLS['small'])
+        self.assertNotEqual(representations, Representations.from_dict(self.URLS))
+    # end def
+# end class
+
+
+class ColumnsTest(unittest.TestCase):
+    def setUp(self):
+        try:
+            import numpy
+        except ImportError:
+            self.skipTest('numpy is not installed')
+        # end try
+        self.numpy = numpy
+    # end def
+
+    def test_page(self):
+        page = {"images": [
+            image_dict(1, score=3, tag_ids=[5, 6]),
+            image_dict(2, created_at='2020-01-01T01:00:00+01:00', tag_ids=[]),
+            image_dict(3, first_seen_at=None, tag_ids=[6, 7, 8]),
+        ], "interactions": [], "total": 3}
+        columns = decode_image_columns(json.dumps(page).encode('utf-8'))
+        self.assertIsInstance(columns, ImageColumns)
+        self.assertEqual(len(columns), 3)
+        self.assertEqual(columns.id.tolist(), [1, 2, 3])
+        self.assertEqual(columns['score'].tolist(), [3, 0, 0])
+        self.assertEqual(columns.created_at[0], self.numpy.datetime64('2019-05-02T05:33:36'))
+        self.assertEqual(columns.created_at[1], self.numpy.datetime64('2020-01-01T00:00:00'))
+        self.assertTrue(self.numpy.isnat(columns.first_seen_at[2]))
+        self.assertEqual(columns.tag_offsets.tolist(), [0, 2, 2, 5])
+        self.assertEqual(columns.tags_of(2).tolist(), [6, 7, 8])
+        self.assertEqual(columns.has_tag(6).tolist(), [True, False, True])
+        self.assertEqual(columns.has_any_tag({5, 8}).tolist(), [True, False, True])
+        with self.assertRaises(AttributeError):
+            columns.tags
+        # end with
+    # end def
+
+    def test_pages(self):
+        pages = [{"images": [image_dict(image_id, tag_ids=[image_id] * image_id)], "total": 4} for image_id in range(1, 5)]
+        for chunk_size in (1, 3, 100):
+            columns = decode_image_columns(iter(pages), chunk_size=chunk_size)
+            self.assertEqual(columns.id.tolist(), [1, 2, 3, 4])
+            self.assertEqual(columns.tag_counts().tolist(), [1, 2, 3, 4])
+            self.assertEqual(columns.tags_of(3).tolist(), [4, 4, 4, 4])
+        # end for
+        self.assertEqual(len(decode_image_columns([])), 0)
+    # end def
+# end class
+
+class SchemasTest(unittest.TestCase):
+    def test_same_fields(self):
+        import derpi.syncrounous.models
+        for name, columns in SCHEMAS.items():
+            self.assertEqual({column for column, type in columns}, getattr(derpi.syncrounous.models, name)._FIELDS, name)
+        # end for
+    # end def
+# end class
+
+
+class ExportTest(unittest.TestCase):
+    def setUp(self):
+        try:
+            import pyarrow
+        except ImportError:
+            self.skipTest('pyarrow is not installed')
+        # end try
+        import pyarrow.ipc
+        import pyarrow.parquet
+        self.pyarrow = pyarrow
+    # end def
+
+    def test_parquet(self):
+        images = [Image.from_dict(image_dict(1, tags=['safe', 'pony'], tag_ids=[40482, 26707])), LazyImage.from_dict(image_dict(2, intensities={"ne": 1.0, "nw": 2.0, "se": 3.0, "sw": 4.0}))]
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'images.parquet')
+            self.assertEqual(write_parquet(iter(images), path, batch_size=1), 2)
+            table = self.pyarrow.parquet.read_table(path)
+        # end with
+        self.assertEqual(table.schema, arrow_schema(Image))
+        rows = table.to_pylist()
+        self.assertEqual([row['id'] for row in rows], [1, 2])
+        self.assertEqual(rows[0]['tags'], ['safe', 'pony'])
+        self.assertEqual(rows[0]['tag_ids'], [40482, 26707])
+        self.assertEqual(rows[0]['created_at'], datetime.datetime(2019, 5, 2, 5, 33, 36, tzinfo=datetime.timezone.utc))
+        self.assertEqual(rows[0]['representations']['thumb'], images[0].representations.thumb)
+        self.assertIsNone(rows[0]['representations']['mp4'])
+        self.assertIsNone(rows[0]['intensities'])
+        self.assertEqual(rows[1]['intensities'], {"ne": 1.0, "nw": 2.0, "se": 3.0, "sw": 4.0})
+    # end def
+
+    def test_arrow(self):
+        user = User.from_dict(SerializationTest.USER)
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'users.arrow')
+            self.assertEqual(write_arrow([user], path), 1)
+            self.assertEqual(write_arrow([], os.path.join(folder, 'nothing.arrow')), 0)
+            self.assertFalse(os.path.exists(os.path.join(folder, 'nothing.arrow')), 'no model to take the schema from')
+            self.assertEqual(write_arrow([], os.path.join(folder, 'empty.arrow'), model=User), 0)
+            row = self.pyarrow.ipc.open_file(path).read_all().to_pylist()[0]
+            self.assertEqual(self.pyarrow.ipc.open_file(os.path.join(folder, 'empty.arrow')).read_all().num_rows, 0)
+        # end with
+        self.assertEqual(row['links'][0]['tag_id'], 53157)
+        self.assertEqual(row['links'][0]['created_at'], datetime.datetime(2018, 5, 2, 20, 42, 44, tzinfo=datetime.timezone.utc))
+        self.assertEqual(row['awards'][0]['title'], 'Artist')
+    # end def
+
+    def test_compact_and_mixed(self):
+        Image._compact_tags = True
+        try:
+            image = Image.from_dict(image_dict(1, tags=['safe', 'pony'], tag_ids=[40482, 26707]))
+        finally:
+            Image._compact_tags = False
+        # end try
+        batch = next(iter_record_batches([image]))
+        self.assertEqual(batch.column('tag_ids').to_pylist(), [[26707, 40482]])
+        with self.assertRaises(TypeError):
+            list(iter_record_batches([image, Gallery.from_dict(gallery_dict(1))]))
+        # end with
+    # end def
+# end class
+
+class LazyTest(unittest.TestCase):
+    def test_same_as_model(self):
+        data = image_dict(1, intensities={"ne": 1.0, "nw": 2.0, "se": 3.0, "sw": 4.0})
+        lazy = LazyImage.from_dict(data)
+        self.assertIsInstance(lazy, Image)
+        assert_fields_equal(self, lazy, Image.from_dict(data))
+        assert_fields_equal(self, Image.from_dict(data), lazy)
+        self.assertIsInstance(lazy.representations, LazyRepresentations)
+        self.assertIs(lazy.representations, lazy.representations, 'converted only once')
+        self.assertEqual(lazy.intensities.ne, 1.0)
+        self.assertEqual(lazy.created_at, datetime.datetime(2019, 5, 2, 5, 33, 36, tzinfo=datetime.timezone.utc))
+        self.assertEqual(data, image_dict(1, intensities={"ne": 1.0, "nw": 2.0, "se": 3.0, "sw": 4.0}), 'not modified')
+    # end def
+
+    def test_only_accessed(self):
+        lazy = LazyImage.from_dict({"id": 1, "created_at": "not a date"})
+        self.assertEqual(lazy.id, 1)
+        self.assertIsNone(lazy._values, 'nothing converted yet')
+        with self.assertRaises(ValueError):
+            lazy.created_at
+        # end with
+    # end def
+
+    def test_set(self):
+        data = image_dict(1)
+        lazy = LazyImage.from_dict(data)
+        lazy.score = 5
+        lazy.created_at = '2020-01-01T00:00:00Z'
+        self.assertEqual(lazy.score, 5)
+        self.assertEqual(lazy.created_at.year, 2020)
+        self.assertEqual(data['score'], 0)
+    # end def
+
+    def test_client(self):
+        session, adapter = fake_session({"images": [image_dict(1)], "interactions": [], "total": 1})
+        result = client.search_images('safe', _client=session, _raw='lazy')
+        self.assertIsInstance(result.hits[0], LazyImage)
+        self.assertEqual(result.hits[0].id, 1)
+    # end def
+# end class
+
+
+class SerializationTest(unittest.TestCase):
+    USER = {
+        "avatar_url": None, "comments_count": 10, "created_at": "2013-05-02T16:07:03", "description": None,
+        "id": 264159, "name": "luckydonald", "posts_count": 3, "role": "user", "slug": "luckydonald",
+        "topics_count": 0, "uploads_count": 12,
+        "awards": [{"awarded_on": "2018-05-02T20:35:09Z", "id": 27, "image_url": None, "label": None, "title": "Artist"}],
+        "links": [{"created_at": "2018-05-02T20:42:44", "state": "verified", "tag_id": 53157, "user_id": 264159}],
+    }
+
+    def tearDown(self):
+        Image._compact_tags = False
+    # end def
+
+    def test_to_dict(self):
+        data = image_dict(1, intensities={"ne": 1.0, "nw": 2.0, "se": 3.0, "sw": 4.0})
+        self.assertEqual(Image.from_dict(data).to_dict(), data)
+        self.assertEqual(User.from_dict(self.USER).to_dict(), self.USER)
+        image = Image.from_dict(data)
+        image.created_at  # parsed now
+        assert_fields_equal(self, Image.from_dict(image.to_dict()), image)
+        assert_fields_equal(self, Image.from_dict(json.loads(image.to_json())), image)
+    # end def
+
+    def test_pickle(self):
+        for compact_tags in (False, True):
+            Image._compact_tags = compact_tags
+            image = Image.from_dict(image_dict(1, tags=['safe', 'pony'], tag_ids=[40482, 26707]))
+            copy = pickle.loads(pickle.dumps(image))
+            assert_fields_equal(self, copy, image)
+            self.assertEqual(copy.representations.full, image.representations.full)
+            self.assertEqual(type(copy.tag_ids), type(image.tag_ids))
+        # end for
+        user = User.from_dict(self.USER)
+        assert_fields_equal(self, pickle.loads(pickle.dumps(user)), user)
+        self.assertIsInstance(pickle.loads(pickle.dumps(user)).links[0], Links)
+    # end def
+
+    def test_pickle_keeps_raw(self):
+        DerpiModel._keep_raw = True
+        try:
+            topic = Topic.from_dict({'author': 'dracone', 'last_replied_to_at': '2020-03-22T20:20:02Z', 'locked': False, 'post_count': 3, 'slug': 'a-lack-of-images', 'sticky': False, 'title': 'A lack of images', 'user_id': 363222, 'view_count': 0})
+        finally:
+            DerpiModel._keep_raw = False
+        # end try
+        self.assertEqual(pickle.loads(pickle.dumps(topic))._raw, topic._raw)
+    # end def
+
+    def test_lazy(self):
+        data = image_dict(1)
+        lazy = LazyImage.from_dict(data)
+        self.assertEqual(lazy.to_dict(), data)
+        lazy.score = 5
+        self.assertEqual(lazy.to_dict()['score'], 5)
+        copy = pickle.loads(pickle.dumps(lazy))
+        self.assertIsInstance(copy, LazyImage)
+        self.assertEqual(copy.score, 5)
+        assert_fields_equal(self, copy, lazy)
+    # end def
+
+    def test_msgpack(self):
+        try:
+            import msgpack
+        except ImportError:
+            self.skipTest('msgpack is not installed')
+        # end try
+        image = Image.from_dict(image_dict(1))
+        assert_fields_equal(self, Image.from_msgpack(image.to_msgpack()), image)
+    # end def
+# end class
+
+class IdentityTest(unittest.TestCase):
+    def test_image(self):
+        first, changed = Image.from_dict(image_dict(1)), Image.from_dict(image_dict(1, score=5))
+        self.assertEqual(first, changed)
+        self.assertFalse(first.fields_equal(changed))
+        self.assertTrue(first.fields_equal(Image.from_dict(image_dict(1))))
+        self.assertNotEqual(first, Image.from_dict(image_dict(2)))
+        self.assertEqual(len({first, changed, Image.from_dict(image_dict(2)), LazyImage.from_dict(image_dict(2))}), 2)
+        self.assertNotEqual(first, 1)
+    # end def
+
+    def test_types(self):
+        image, gallery = Image.from_dict(image_dict(1)), Gallery.from_dict(gallery_dict(1))
+        self.assertNotEqual(image, gallery)
+        self.assertNotEqual(hash(image), hash(gallery))
+        self.assertEqual(len({image, gallery}), 2)
+    # end def
+
+    def test_topic(self):
+        data = {'author': 'dracone', 'last_replied_to_at': '2020-03-22T20:20:02Z', 'locked': False, 'post_count': 3, 'slug': 'a-lack-of-images', 'sticky': False, 'title': 'A lack of images', 'user_id': 363222, 'view_count': 0}
+        # the slug is only unique within a forum, so the same one in another forum is a different topic.
+        other_forum = dict(data, author='Background Pony #1', title='A Lack of Images', user_id=1, post_count=12)
+        self.assertNotEqual(Topic.from_dict(data), Topic.from_dict(other_forum))
+        self.assertEqual(Topic.from_dict(data), Topic.from_dict(dict(data)))
+        self.assertNotEqual(Topic.from_dict(data), Topic.from_dict(dict(data, post_count=4)))
+        with self.assertRaises(TypeError):
+            {Topic.from_dict(data), Topic.from_dict(other_forum)}
+        # end with
+        self.assertTrue(Topic.from_dict(data).fields_equal(Topic.from_dict(dict(data, last_replied_to_at='2020-03-22T20:20:02+00:00'))))
+    # end def
+
+    def test_structural(self):
+        self.assertEqual(Intensities(ne=1.0, nw=2.0, se=3.0, sw=4.0), Intensities(ne=1.0, nw=2.0, se=3.0, sw=4.0))
+        self.assertNotEqual(Intensities(ne=1.0, nw=2.0, se=3.0, sw=4.0), Intensities(ne=1.0, nw=2.0, se=3.0, sw=5.0))
+        with self.assertRaises(TypeError):
+            hash(Intensities(ne=1.0, nw=2.0, se=3.0, sw=4.0))
+        # end with
+    # end def
+# end class
+
+class RawTest(unittest.TestCase):
+    def test_raw_call(self):
+        payload = {"images": [image_dict(1)], "interactions": [], "total": 1}
+        session, adapter = fake_session(payload, payload)
+        self.assertEqual(client.search_images('safe', _client=session, _raw=True), payload)
+        self.assertEqual(json.loads(client.search_images('safe', _client=session, _raw='bytes')), payload)
+    # end def
+
+    def test_raw_client(self):
+        session, adapter = fake_session(
+            {"tag": TAG_LITTLEPIP}, {"tag": TAG_LITTLEPIP},
+            {"galleries": [gallery_dict(1)], "total": 1}, {"galleries": [], "total": 1},
+        )
+        derpi = client.DerpiClient(key=None, client=session, raw=True)
+        self.assertEqual(derpi.tag('oc-colon-littlepip'), {"tag": TAG_LITTLEPIP})
+        self.assertIsInstance(derpi.tag('oc-colon-littlepip', _raw=False), Tag)
+        self.assertEqual(list(derpi.iter_search_galleries('best pony')), [gallery_dict(1)])
+    # end def
+
+    def test_raw_iter(self):
+        session, adapter = fake_session({"galleries": [gallery_dict(1), gallery_dict(2)], "total": 3}, {"galleries": [gallery_dict(3)], "total": 3})
+        self.assertEqual(list(client.iter_search_galleries('best pony', _client=session, _raw='bytes')), [gallery_dict(i) for i in (1, 2, 3)])
+    # end def
+
+    def test_raw_stream(self):
+        payload = {"images": [image_dict(1), image_dict(2)], "interactions": [], "total": 2}
+        session, adapter = fake_session(payload, payload)
+        derpi = client.DerpiClient(key=None, client=session, raw=True)
+        self.assertEqual(list(derpi.stream_search_images('safe')), payload['images'])
+        self.assertIsInstance(next(derpi.stream_search_images('safe', _raw='lazy')), LazyImage)
+    # end def
+
+    def test_raw_fan_out(self):
+        session, adapter = fake_session({"galleries": [gallery_dict(1), gallery_dict(2)], "total": 3}, {"galleries": [gallery_dict(3)], "total": 3})
+        galleries = client.fan_out_search_galleries('best pony', _client=session, _raw=True)
+        self.assertEqual(galleries, {"galleries": [gallery_dict(i) for i in (1, 2, 3)], "total": 3})
+    # end def
+
+    def test_raw_cursor(self):
+        session, adapter = fake_session(
+            {"images": [image_dict(2), image_dict(1)], "interactions": [], "total": 2},
+        )
+        cursor = client.DerpiClient(key=None, client=session, raw=True).cursor_search_images('safe', per_page=2)
+        self.assertEqual(list(cursor), [image_dict(2), image_dict(1)])
+        self.assertEqual(cursor.last_id, 1)
+    # end def
+# end class
+
+
 class OfflineTest(unittest.TestCase):
     def test_image(self):
         image = Image.from_dict({
@@ -284,7 +1305,7 @@ class OfflineTest(unittest.TestCase):
             "interactions": []
         }['image'])
         expected = Image(aspect_ratio=1.7454090150250416, comment_count=63, created_at=datetime.datetime(2019, 5, 2, 5, 33, 36, tzinfo=datetime.timezone.utc), deletion_reason=None, description='bird.', downvotes=11, duplicate_of=None, faves=813, first_seen_at=datetime.datetime(2019, 5, 2, 5, 33, 36, tzinfo=datetime.timezone.utc), format='png', height=1198, hidden_from_users=False, id=2028858, intensities=Intensities(ne=43.666426229379056, nw=55.8670966658656, se=29.931677346829446, sw=43.073299224516546), mime_type='image/png', name='cacaw.png', orig_sha512_hash='ef377b5ce9b6abb39701bded38d9588e8ee6c28a6bc384d764237a9800356860484351be1f992c2c76a6db9425eb5171d260fde351c92e0615c4af7a3024156f', processed=True, representations=Representations(full='https://derpicdn.net/img/view/2019/5/2/2028858.png', large='https://derpicdn.net/img/2019/5/2/2028858/large.png', medium='https://derpicdn.net/img/2019/5/2/2028858/medium.png', small='https://derpicdn.net/img/2019/5/2/2028858/small.png', tall='https://derpicdn.net/img/2019/5/2/2028858/tall.png', thumb='https://derpicdn.net/img/2019/5/2/2028858/thumb.png', thumb_small='https://derpicdn.net/img/2019/5/2/2028858/thumb_small.png', thumb_tiny='https://derpicdn.net/img/2019/5/2/2028858/thumb_tiny.png'), score=1103, sha512_hash='ef377b5ce9b6abb39701bded38d9588e8ee6c28a6bc384d764237a9800356860484351be1f992c2c76a6db9425eb5171d260fde351c92e0615c4af7a3024156f', source_url='https://twitter.com/KamDrawings/status/1123822106784010240', spoilered=False, tag_count=42, tag_ids=[24249, 26029, 27084, 28087, 29252, 33855, 36710, 38185, 40482, 41554, 41769, 42627, 43713, 44356, 45218, 47596, 48683, 49989, 54099, 60900, 70995, 75881, 82531, 83246, 98475, 109992, 129556, 140006, 141241, 169378, 173557, 178114, 186417, 187857, 191172, 210505, 234813, 243362, 355725, 373735, 377490, 407683], tags=['cute', 'earth pony', 'feather', 'frown', 'griffon', 'male', 'open mouth', 'pony', 'safe', 'shocked', 'simple background', 'speech', 'surprised', 'text', 'this will end in tears', 'wings', 'solo focus', 'this will end in pain', 'mismatched eyes', 'caw', 'airhorn', 'alarmed', 'featured image', 'exclamation point', 'wide eyes', 'gradient background', 'catbird', 'behaving like a bird', 'birb', 'blue eyes', 'blue background', 'griffons doing bird things', 'offscreen character', 'spread wings', 'hoof hold', 'quadrupedal', 'gallus', 'this will end in deafness', 'sandbar', 'gallabetes', 'birds doing bird things', 'artist:kam'], thumbnails_generated=True, updated_at=datetime.datetime(2020, 4, 10, 0, 14, 35, tzinfo=datetime.timezone.utc), uploader='Kam3E433', uploader_id=459261, upvotes=1114, view_url='https://derpicdn.net/img/view/2019/5/2/2028858__safe_artist-colon-kam_gallus_sandbar_earth+pony_griffon_pony_airhorn_alarmed_behaving+like+a+bird_birb_birds+doing+bird+things_blue+background_blue+eye.png', width=2091, wilson_score=0.9792839499360272, size=1810951, animated=False, duration=0.04)
-        self.assertEqual(image, expected)
+        assert_fields_equal(self, image, expected)
     # end def
 
     def test_tag(self):
@@ -318,7 +1339,7 @@ class OfflineTest(unittest.TestCase):
           }
         }['tag'])
         expected = Tag(aliased_tag=None, aliases=['littlepip'], category='oc', description='Creator: Kkat\r\nSpecies: Unicorn Female\r\nMain protagonist of the "Fallout: Equestria series":http://www.fimfiction.net/story/119190/fallout-equestria  (NSFW)\r\n>>610341s', dnp_entries=[], id=113046, images=3663, implied_by_tags=['futa+oc-colon-littlepip', 'busty+littlepip', 'pipabetes', 'pipbutt'], implied_tags=['fallout+equestria', 'oc'], name='oc:littlepip', name_in_namespace='littlepip', namespace='oc', short_description='', slug='oc-colon-littlepip', spoiler_image_uri=None)
-        self.assertEqual(tag, expected)
+        assert_fields_equal(self, tag, expected)
     # end def
 
     def test_tag__aliased(self):
@@ -342,7 +1363,7 @@ class OfflineTest(unittest.TestCase):
           }
         }['tag'])
         expected = Tag(aliased_tag='oc-colon-littlepip', aliases=[], category=None, description='', dnp_entries=[], id=33169, images=0, implied_by_tags=[], implied_tags=[], name='littlepip', name_in_namespace='littlepip', namespace=None, short_description='', slug='littlepip', spoiler_image_uri=None)
-        self.assertEqual(tag, expected)
+        assert_fields_equal(self, tag, expected)
 
     def test_post(self):
         post = Post.from_dict({
@@ -359,7 +1380,7 @@ class OfflineTest(unittest.TestCase):
           }
         }['post'])
         expected = Post(author='Joey', body='This notice is primarily targeted towards developers, but may affect anyone using third party applications to update the site:\r\n\r\n*If you do not know what an API is and you only browse Derpibooru in a web browser, than this post does not affect you, and you can ignore this announcement.*\r\n\r\nIn December, Derpibooru completed the migration to "Philomena":https://github.com/derpibooru/philomena - our new, rewritten from the ground-up codebase - to significantly improve performance of the site and to pave the way for future enhancements.\r\n\r\nAs part of this migration, Philomena implements a new API that allows more capabilities than our previous API. You can read a bit about that "here":/forums/meta/topics/philomena-open-beta-breaking-api-changes\r\n\r\nThe old API has remained available since the migration to ensure compatibility with older apps and to allow third party developers time to migrate to the new API. Regrettably, maintaining compatibility with the old API is causing some limits with regards to changes we\'d like to make to the site\'s code. As such, our development team has made the decision to begin deprecating and shutting down the old API.\r\n\r\nCurrently the old API is scheduled to be decommissioned on *March 31st, 2020*.\r\n\r\nIf you write third party apps or scripts that interact with Derpibooru, we encourage you to make sure that your application is compatible with the new API by then. You can read documentation on the current API "here":/pages/api\r\n\r\nIf you use an app or script that interacts with the site, and it has not been updated since December, then it is likely it\'s utilizing the old API still, and you should reach out to the developer to ensure that it\'s updated so compatibility is maintained.', id=4704912, user_id=216494, avatar='https://derpicdn.net/avatars/2019/11/13/14215782720827205181237247282992609700.png', created_at=datetime.datetime(2020, 2, 20, 16, 18, 4, tzinfo=datetime.timezone.utc), edit_reason=None, edited_at=datetime.datetime(2020, 2, 21, 5, 42, 40, tzinfo=datetime.timezone.utc), updated_at=datetime.datetime(2020, 2, 21, 5, 42, 40, tzinfo=datetime.timezone.utc))
-        self.assertEqual(post, expected)
+        assert_fields_equal(self, post, expected)
     # end def
 
     def test_user(self):
@@ -402,7 +1423,7 @@ class OfflineTest(unittest.TestCase):
           }
         }['user'])
         expected = User(id=264159, name='luckydonald', slug='luckydonald', role='user', description=None, avatar_url='https://derpicdn.net/avatars/2013/5/2/6960000e0c80e94df370222.png', created_at=datetime.datetime(2013, 5, 2, 16, 7, 3, tzinfo=datetime.timezone.utc), comments_count=10, uploads_count=12, posts_count=3, topics_count=0, links=[Links.from_dict({'created_at': '2018-05-02T20:42:44', 'state': 'verified', 'tag_id': 53157, 'user_id': 264159}), Links.from_dict({'created_at': '2018-05-02T20:33:00', 'state': 'verified', 'tag_id': 53157, 'user_id': 264159})], awards=[Awards.from_dict({'awarded_on': '2018-05-02T20:35:09Z', 'id': 27, 'image_url': 'https://derpicdn.net/media/2016/8/23/540676fb2fd6546ee45a1c1.svg', 'label': None, 'title': 'Artist'})])
-        self.assertEqual(user, expected)
+        assert_fields_equal(self, user, expected)
     # end def
 
     def test_filter(self):
@@ -422,13 +1443,13 @@ class OfflineTest(unittest.TestCase):
           }
         }['filter'])
         expected = Filter(id=179331, name='Best Pony', description='Displays only images of Waifu horse.\r\n\r\nID: 179331', user_id=264159, user_count=0, system=False, public=True, spoilered_tag_ids=[26707], spoilered_complex=None, hidden_tag_ids=[115234, 26911], hidden_complex='score.lte:100\r\n-littlepip')
-        self.assertEqual(filter, expected)
+        assert_fields_equal(self, filter, expected)
     # end def
 
     def test_oembed(self):
         oembed = Oembed.from_dict({'author_name': 'ramiras', 'author_url': 'https://vk.com/feed?w=wall-80761589_14016', 'cache_age': 7200, 'derpibooru_comments': 3, 'derpibooru_id': 2301208, 'derpibooru_score': 254, 'derpibooru_tags': ['book cover', 'clothes', 'cover', 'fallout equestria', 'fanfic', 'fanfic art', 'female', 'gun', 'hooves', 'horn', 'little macintosh', 'mare', 'oc', 'pipbuck', 'pony', 'revolver', 'ruins', 'safe', 'solo', 'spritebot', 'sweet apple acres', 'tree', 'unicorn', 'weapon', 'canterlot castle', 'handgun', 'vault suit', 'oc only', 'oc:littlepip', 'dead tree', 'artist:ramiras', 'oc:watcher', 'optical sight'], 'provider_name': 'Derpibooru', 'provider_url': 'https://derpibooru.org', 'title': '#2301208 - safe, artist:ramiras, oc, oc only, oc:littlepip, oc:watcher, pony, unicorn, fallout equestria, book cover, canterlot castle, clothes, cover, dead tree, fanfic, fanfic art, female, gun, handgun, hooves, horn, little macintosh, mare, optical sight, pipbuck, revolver, ruins, solo, spritebot, sweet apple acres, tree, vault suit, weapon - Derpibooru', 'type': 'photo', 'version': '1.0'})
         expected = Oembed(author_name='ramiras', author_url='https://vk.com/feed?w=wall-80761589_14016', cache_age=7200, derpibooru_comments=3, derpibooru_id=2301208, derpibooru_score=254, derpibooru_tags=['book cover', 'clothes', 'cover', 'fallout equestria', 'fanfic', 'fanfic art', 'female', 'gun', 'hooves', 'horn', 'little macintosh', 'mare', 'oc', 'pipbuck', 'pony', 'revolver', 'ruins', 'safe', 'solo', 'spritebot', 'sweet apple acres', 'tree', 'unicorn', 'weapon', 'canterlot castle', 'handgun', 'vault suit', 'oc only', 'oc:littlepip', 'dead tree', 'artist:ramiras', 'oc:watcher', 'optical sight'], provider_name='Derpibooru', provider_url='https://derpibooru.org', title='#2301208 - safe, artist:ramiras, oc, oc only, oc:littlepip, oc:watcher, pony, unicorn, fallout equestria, book cover, canterlot castle, clothes, cover, dead tree, fanfic, fanfic art, female, gun, handgun, hooves, horn, little macintosh, mare, optical sight, pipbuck, revolver, ruins, solo, spritebot, sweet apple acres, tree, vault suit, weapon - Derpibooru', type='photo', version='1.0')
-        self.assertEqual(oembed, expected)
+        assert_fields_equal(self, oembed, expected)
     # end def
 
     def test_search_comments(self):
@@ -442,7 +1463,7 @@ class OfflineTest(unittest.TestCase):
           }['comments']
         ]
         expected = [Comment(author='Background Pony', avatar='https://derpicdn.net/avatars/2016/02/28/03_09_08_673_Bildschirmfoto_2016_02_28_um_03.07.54.png', body='Littlepip is best pony.', id=8927783, created_at=datetime.datetime(2020, 4, 10, 21, 59, 56, tzinfo=datetime.timezone.utc), image_id=1322277, edit_reason='edited because of reasons.', edited_at=datetime.datetime(2020, 4, 10, 22, 2, 39, tzinfo=datetime.timezone.utc), updated_at=datetime.datetime(2020, 4, 10, 22, 2, 39, tzinfo=datetime.timezone.utc), user_id=367522), Comment(author='DrakeyC', avatar='https://derpicdn.net/avatars/2020/1/17/15792252968821100189574183.png', body='"@Yet One More Idiot":/images/2270133#comment_8802985\r\n"@Th3BlueRose":/images/2270133#comment_8835793\r\n"@Rainbow Dash is Best Pony":/images/2270133#comment_8802667\r\n\r\nHow\'s this? >>2318822', id=8926854, created_at=datetime.datetime(2020, 4, 10, 14, 1, 38, tzinfo=datetime.timezone.utc), image_id=2318822, edit_reason=None, edited_at=None, updated_at=datetime.datetime(2020, 4, 10, 14, 1, 38, tzinfo=datetime.timezone.utc), user_id=313105), Comment(author='RAMMSTEIN45', avatar='https://derpicdn.net/avatars/2020/3/21/15848125506438370286815213.png', body='Best Pony!\r\nWill you be uploading Sugarcoat for this set too?', id=8925332, created_at=datetime.datetime(2020, 4, 9, 21, 26, 32, tzinfo=datetime.timezone.utc), image_id=2317885, edit_reason=None, edited_at=None, updated_at=datetime.datetime(2020, 4, 9, 21, 26, 32, tzinfo=datetime.timezone.utc), user_id=236352), Comment(author='Digital Seapony', avatar='https://derpicdn.net/avatars/2018/8/27/998891edd88da597d41b6a9.jpg', body='Luster Dawn, apprentice best pony.', id=8922366, created_at=datetime.datetime(2020, 4, 8, 16, 57, 41, tzinfo=datetime.timezone.utc), image_id=2317196, edit_reason=None, edited_at=None, updated_at=datetime.datetime(2020, 4, 8, 16, 57, 41, tzinfo=datetime.timezone.utc), user_id=454945), Comment(author='*Rainbow Dash*', avatar='https://derpicdn.net/avatars/2014/10/18/19_16_04_432_soarindash_by_anarchemitis_d6rvvty.png', body='"@Background Pony #2AFB":/images/2316923#comment_8921241\r\nwell because shes best pony! thats why :)', id=8921300, created_at=datetime.datetime(2020, 4, 8, 4, 15, 12, tzinfo=datetime.timezone.utc), image_id=2316923, edit_reason=None, edited_at=None, updated_at=datetime.datetime(2020, 4, 8, 4, 15, 12, tzinfo=datetime.timezone.utc), user_id=217509), Comment(author='Sugar Morning', avatar='https://derpicdn.net/avatars/2017/10/31/2284605dd2290564e132379.png', body='"@Sea Swirl is best pony":/images/2315826#comment_8919797\r\nI won\'t charge more for background or bunny ears, you can ask me if you want them to have background or bunny ears :3 and yes you get versions without additional charges.\r\n\r\nThe additional charges are only for merging 2 animation into one (you can commission 2 ponies without merging them if you can merge it yourself of course :P)\r\n\r\nSo for 75$ you\'ll get one merged animation and 2 separate ponies jumping alone.', id=8919839, created_at=datetime.datetime(2020, 4, 7, 14, 52, 39, tzinfo=datetime.timezone.utc), image_id=2315826, edit_reason=None, edited_at=None, updated_at=datetime.datetime(2020, 4, 7, 14, 52, 39, tzinfo=datetime.timezone.utc), user_id=423165), Comment(author='GrapefruitFace', avatar='https://derpicdn.net/avatars/2020/3/4/158335243352111503166980.png', body='Trixie Lulamoon! All hail best pony <3', id=8917815, created_at=datetime.datetime(2020, 4, 6, 18, 30, 17, tzinfo=datetime.timezone.utc), image_id=2315620, edit_reason=None, edited_at=None, updated_at=datetime.datetime(2020, 4, 6, 18, 30, 17, tzinfo=datetime.timezone.utc), user_id=421796), Comment(author='Background Pony #8D6F', avatar='data:image/svg+xml;base64,PHN2ZyB4bWxucz0iaHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmciIHdpZHRoPSIxMjUiIGhlaWdodD0iMTI1IiB2aWV3Qm94PSIwIDAgMTI1IDEyNSIgY2xhc3M9ImF2YXRhci1zdmciPjxyZWN0IHdpZHRoPSIxMjUiIGhlaWdodD0iMTI1IiBmaWxsPSIjYzZkZmYyIi8+PHBhdGggZD0iTTE1LjQ1NiAxMDkuMTVDMTIuMDIgOTcuODA1IDYuNDQgOTUuMDM2LS43OTQgOTguODl2MTkuMTAyYzUuMTMtMTAuMDkgMTAuMjYzLTguMjk0IDE1LjM5NS01LjciIGZpbGw9IiNBMjhGNDgiLz48cGF0aCBkPSJNNzMuMDU0IDI0LjQ2YzI1Ljg4NiAwIDM5LjE0NCAyNi4zOSAyOC45MTYgNDQuOTUgMS4yNjMuMzggNC45MjQgMi4yNzQgMy40MSA0LjgtMS41MTYgMi41MjUtNy41NzcgMTYuMjg4LTI3Ljc4IDE0Ljc3My0xLjAxIDYuNDQtLjMzIDEyLjYxMyAxLjY0MiAyMi44NTQgMS4zOSA3LjIyNC0uNjMyIDE0LjY0OC0uNjMyIDE0LjY0OHMtNDcuNzg1LjIxNi03My43NC0uMTI3Yy0xLjg4My02LjM4NyA4Ljk2NC0yNS43NiAyMC44MzMtMjQuNzQ4IDE1LjY3NCAxLjMzNCAxOS4xOTMgMS42NCAyMS41OTItMi4wMiAyLjQtMy42NjIgMC0yMy4yMzQtMy41MzUtMzAuODEtMy41MzYtNy41NzctNy44My00MC43ODUgMjkuMjk0LTQ0LjMyeiIgZmlsbD0iIzUzNzc1RCIvPjxwYXRoIGQ9Ik01Ni4xNiAyOC4wNDRjMTcuMzQ0LTEzLjIyIDU2LjI1OC0yOS4yMDUgNjMuMDYzIDMuODQ3IDIuNTIgMTIuMjQ4LjIyNSAxMy43Ni02LjE4OCAxNy45MS03Ljc5IDUuMDQ1LTE3LjM4Ni0xLjM3LTE1LjA1LTYuNjYyLTguNjUyIDcuNzA3LTE1LjQ4NCAxMC42MjQtMjMuMTIgOS44NS05LjE2Ny0uOTI3LTYuNDM3LTYuNzYtMi40MTctOS44NzIgMi40MzctMS44ODcgNS4wOC0zLjU3IDkuNDM2LTUuNzYtNy45NDIgMi41NS0xMy45OTIgMS45NzQtMTkuMjgyLTMuMzRsLTEwLjk0NyA1LjU1LjAxNSAxMS41NDJDNTMuMyA2NC4xNyA2Mi43NTggODAuODEgNjMuOTEyIDkzLjQyYy43MiA3Ljg3Ni01LjUzMiA2LjYzNy04LjY1IDEuNDI1IDEuODQ3IDUuNTgyIDMuNTkyIDkuODkyIDMuNDgzIDE1Ljg5LS4xMyA3LjE3OC04LjM4NiAxMS41NC0xMi4wNDcgMS4wOTgtNy41MDUtMjEuNDA1LTEyLjk2NS01MS45Ny0uOTczLTc1LjN6IiBmaWxsPSIjQTI4RjQ4Ii8+PHBhdGggZD0iTTY0LjM0MiAzNS41N3MzLjI4My04LjA4LTcuMzI0LTE5LjMxOGMtMS43NjgtMS43NjgtMy4wMy0yLjI3My00LjY3Mi0uNzU4LTEuNjQgMS41MTUtMTcuMDQ2IDE2LjAzNi4yNTMgMzguMjYuNTA0LTIuNCAxLjEzNS05LjU5NyAxLjEzNS05LjU5N3oiIGZpbGw9IiM1Mzc3NUQiLz48L3N2Zz4=', body="Twilight's wondering if she truly is best pony (because she totally is)", id=8917628, created_at=datetime.datetime(2020, 4, 6, 16, 13, 9, tzinfo=datetime.timezone.utc), image_id=2315464, edit_reason=None, edited_at=None, updated_at=datetime.datetime(2020, 4, 6, 16, 13, 9, tzinfo=datetime.timezone.utc), user_id=None), Comment(author='AzriBoss', avatar='data:image/svg+xml;base64,PHN2ZyB4bWxucz0iaHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmciIHdpZHRoPSIxMjUiIGhlaWdodD0iMTI1IiB2aWV3Qm94PSIwIDAgMTI1IDEyNSIgY2xhc3M9ImF2YXRhci1zdmciPjxyZWN0IHdpZHRoPSIxMjUiIGhlaWdodD0iMTI1IiBmaWxsPSIjYzZkZmYyIi8+PHBhdGggZD0iTTE1LjQ1NiAxMDkuMTVDMTIuMDIgOTcuODA1IDYuNDQgOTUuMDM2LS43OTQgOTguODl2MTkuMTAyYzUuMTMtMTAuMDkgMTAuMjYzLTguMjk0IDE1LjM5NS01LjciIGZpbGw9IiNDODc0OTYiLz48cGF0aCBkPSJNNzMuMDU0IDI0LjQ2YzI1Ljg4NiAwIDM5LjE0NCAyNi4zOSAyOC45MTYgNDQuOTUgMS4yNjMuMzggNC45MjQgMi4yNzQgMy40MSA0LjgtMS41MTYgMi41MjUtNy41NzcgMTYuMjg4LTI3Ljc4IDE0Ljc3My0xLjAxIDYuNDQtLjMzIDEyLjYxMyAxLjY0MiAyMi44NTQgMS4zOSA3LjIyNC0uNjMyIDE0LjY0OC0uNjMyIDE0LjY0OHMtNDcuNzg1LjIxNi03My43NC0uMTI3Yy0xLjg4My02LjM4NyA4Ljk2NC0yNS43NiAyMC44MzMtMjQuNzQ4IDE1LjY3NCAxLjMzNCAxOS4xOTMgMS42NCAyMS41OTItMi4wMiAyLjQtMy42NjIgMC0yMy4yMzQtMy41MzUtMzAuODEtMy41MzYtNy41NzctNy44My00MC43ODUgMjkuMjk0LTQ0LjMyeiIgZmlsbD0iIzlFQTM1NSIvPjxwYXRoIGQ9Ik01Ni4xNiAyOC4wNDRjMTcuMzQ0LTEzLjIyIDU2LjI1OC0yOS4yMDUgNjMuMDYzIDMuODQ3IDIuNTIgMTIuMjQ4LjIyNSAxMy43Ni02LjE4OCAxNy45MS03Ljc5IDUuMDQ1LTE3LjM4Ni0xLjM3LTE1LjA1LTYuNjYyLTguNjUyIDcuNzA3LTE1LjQ4NCAxMC42MjQtMjMuMTIgOS44NS05LjE2Ny0uOTI3LTYuNDM3LTYuNzYtMi40MTctOS44NzIgMi40MzctMS44ODcgNS4wOC0zLjU3IDkuNDM2LTUuNzYtNy45NDIgMi41NS0xMy45OTIgMS45NzQtMTkuMjgyLTMuMzRsLTEwLjk0NyA1LjU1LjAxNSAxMS41NDJDNTMuMyA2NC4xNyA2Mi43NTggODAuODEgNjMuOTEyIDkzLjQyYy43MiA3Ljg3Ni01LjUzMiA2LjYzNy04LjY1IDEuNDI1IDEuODQ3IDUuNTgyIDMuNTkyIDkuODkyIDMuNDgzIDE1Ljg5LS4xMyA3LjE3OC04LjM4NiAxMS41NC0xMi4wNDcgMS4wOTgtNy41MDUtMjEuNDA1LTEyLjk2NS01MS45Ny0uOTczLTc1LjN6IiBmaWxsPSIjQzg3NDk2Ii8+PHBhdGggZD0iTTQzLjI2NyAxMDcuMzI0cy02LjgyNS0xNC4xMzctNy42NC0zMC4xNjZjLS44MTctMTYuMDMtNC4xOTctMzEuNDY4LTEwLjU1LTQwLjY4OC02LjM1NC05LjIyLTEzLjI3Mi05LjczLTExLjk5Ny0zLjk4MiAxLjI3NSA1Ljc0OCAxMS4xMjMgMzMuMDE2IDEyLjEyOCAzNS45NTRDMjMuMDQyIDY1LjY0OCA3LjAzOCA0MS4xMS0uNDMgMzcuMjIyYy03LjQ3LTMuODg2LTguOTYuMzQ2LTYuODkyIDUuODg1IDIuMDY4IDUuNTQgMTguNTA3IDMwLjg0NCAyMC44ODYgMzMuNTAyLTIuNzM4LTEuNjg1LTEyLjI1Ni05LjAzNi0xNi45OTctOC45OTYtNC43NDIuMDQtNC45MSA1LjM2Ni0yLjYxNyA4LjUyNiAyLjI5MiAzLjE2MiAyMC45MTIgMTkuMTczIDI1LjE1IDIwLjk0NS01LjM1LjI4LTEwLjM4NCAxLjk5Ni05LjE4NiA2LjAwNCAxLjIgNC4wMDYgMTEuMzg0IDE0LjA2MyAyOC41MyAxMi4zNzcgMi41NzYtMi44MzQgNC44MjMtOC4xNDMgNC44MjMtOC4xNDN6IiBmaWxsPSIjOUVBMzU1Ii8+PHBhdGggZD0iTTY0LjM0MiAzNS41N3MzLjI4My04LjA4LTcuMzI0LTE5LjMxOGMtMS43NjgtMS43NjgtMy4wMy0yLjI3My00LjY3Mi0uNzU4LTEuNjQgMS41MTUtMTcuMDQ2IDE2LjAzNi4yNTMgMzguMjYuNTA0LTIuNCAxLjEzNS05LjU5NyAxLjEzNS05LjU5N3oiIGZpbGw9IiM5RUEzNTUiLz48L3N2Zz4=', body='Best pony', id=8917599, created_at=datetime.datetime(2020, 4, 6, 15, 44, 4, tzinfo=datetime.timezone.utc), image_id=2315424, edit_reason=None, edited_at=None, updated_at=datetime.datetime(2020, 4, 6, 15, 44, 4, tzinfo=datetime.timezone.utc), user_id=425326), Comment(author="Soarin's Beeyatch", avatar='https://derpicdn.net/avatars/2020/4/6/1586209669826494025012921.png', body='Wonderful case study for best pony~', id=8917183, created_at=datetime.datetime(2020, 4, 6, 10, 33, 37, tzinfo=datetime.timezone.utc), image_id=2315305, edit_reason=None, edited_at=None, updated_at=datetime.datetime(2020, 4, 6, 10, 33, 37, tzinfo=datetime.timezone.utc), user_id=492014), Comment(author='Background Pony #257E', avatar='data:image/svg+xml;base64,PHN2ZyB4bWxucz0iaHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmciIHdpZHRoPSIxMjUiIGhlaWdodD0iMTI1IiB2aWV3Qm94PSIwIDAgMTI1IDEyNSIgY2xhc3M9ImF2YXRhci1zdmciPjxyZWN0IHdpZHRoPSIxMjUiIGhlaWdodD0iMTI1IiBmaWxsPSIjYzZkZmYyIi8+PHBhdGggZD0iTTE1LjQ1NiAxMDkuMTVDMTIuMDIgOTcuODA1IDYuNDQgOTUuMDM2LS43OTQgOTguODl2MTkuMTAyYzUuMTMtMTAuMDkgMTAuMjYzLTguMjk0IDE1LjM5NS01LjciIGZpbGw9IiNBMTg3QkUiLz48cGF0aCBkPSJNNzMuMDU0IDI0LjQ2YzI1Ljg4NiAwIDM5LjE0NCAyNi4zOSAyOC45MTYgNDQuOTUgMS4yNjMuMzggNC45MjQgMi4yNzQgMy40MSA0LjgtMS41MTYgMi41MjUtNy41NzcgMTYuMjg4LTI3Ljc4IDE0Ljc3My0xLjAxIDYuNDQtLjMzIDEyLjYxMyAxLjY0MiAyMi44NTQgMS4zOSA3LjIyNC0uNjMyIDE0LjY0OC0uNjMyIDE0LjY0OHMtNDcuNzg1LjIxNi03My43NC0uMTI3Yy0xLjg4My02LjM4NyA4Ljk2NC0yNS43NiAyMC44MzMtMjQuNzQ4IDE1LjY3NCAxLjMzNCAxOS4xOTMgMS42NCAyMS41OTItMi4wMiAyLjQtMy42NjIgMC0yMy4yMzQtMy41MzUtMzAuODEtMy41MzYtNy41NzctNy44My00MC43ODUgMjkuMjk0LTQ0LjMyeiIgZmlsbD0iIzgxNzNBOSIvPjxwYXRoIGQ9Ik01Ni4xNiAyOC4wNDRjMTcuMzQ0LTEzLjIyIDU2LjI1OC0yOS4yMDUgNjMuMDYzIDMuODQ3IDIuNTIgMTIuMjQ4LjIyNSAxMy43Ni02LjE4OCAxNy45MS03Ljc5IDUuMDQ1LTE3LjM4Ni0xLjM3LTE1LjA1LTYuNjYyLTguNjUyIDcuNzA3LTE1LjQ4NCAxMC42MjQtMjMuMTIgOS44NS05LjE2Ny0uOTI3LTYuNDM3LTYuNzYtMi40MTctOS44NzIgMi40MzctMS44ODcgNS4wOC0zLjU3IDkuNDM2LTUuNzYtNy45NDIgMi41NS0xMy45OTIgMS45NzQtMTkuMjgyLTMuMzRsLTEwLjk0NyA1LjU1LjAxNSAxMS41NDJDNTMuMyA2NC4xNyA2Mi43NTggODAuODEgNjMuOTEyIDkzLjQyYy43MiA3Ljg3Ni01LjUzMiA2LjYzNy04LjY1IDEuNDI1IDEuODQ3IDUuNTgyIDMuNTkyIDkuODkyIDMuNDgzIDE1Ljg5LS4xMyA3LjE3OC04LjM4NiAxMS41NC0xMi4wNDcgMS4wOTgtNy41MDUtMjEuNDA1LTEyLjk2NS01MS45Ny0uOTczLTc1LjN6IiBmaWxsPSIjQTE4N0JFIi8+PHBhdGggZD0iTTQzLjI2NyAxMDcuMzI0cy02LjgyNS0xNC4xMzctNy42NC0zMC4xNjZjLS44MTctMTYuMDMtNC4xOTctMzEuNDY4LTEwLjU1LTQwLjY4OC02LjM1NC05LjIyLTEzLjI3Mi05LjczLTExLjk5Ny0zLjk4MiAxLjI3NSA1Ljc0OCAxMS4xMjMgMzMuMDE2IDEyLjEyOCAzNS45NTRDMjMuMDQyIDY1LjY0OCA3LjAzOCA0MS4xMS0uNDMgMzcuMjIyYy03LjQ3LTMuODg2LTguOTYuMzQ2LTYuODkyIDUuODg1IDIuMDY4IDUuNTQgMTguNTA3IDMwLjg0NCAyMC44ODYgMzMuNTAyLTIuNzM4LTEuNjg1LTEyLjI1Ni05LjAzNi0xNi45OTctOC45OTYtNC43NDIuMDQtNC45MSA1LjM2Ni0yLjYxNyA4LjUyNiAyLjI5MiAzLjE2MiAyMC45MTIgMTkuMTczIDI1LjE1IDIwLjk0NS01LjM1LjI4LTEwLjM4NCAxLjk5Ni05LjE4NiA2LjAwNCAxLjIgNC4wMDYgMTEuMzg0IDE0LjA2MyAyOC41MyAxMi4zNzcgMi41NzYtMi44MzQgNC44MjMtOC4xNDMgNC44MjMtOC4xNDN6IiBmaWxsPSIjODE3M0E5Ii8+PHBhdGggZD0iTTY0LjM0MiAzNS41N3MzLjI4My04LjA4LTcuMzI0LTE5LjMxOGMtMS43NjgtMS43NjgtMy4wMy0yLjI3My00LjY3Mi0uNzU4LTEuNjQgMS41MTUtMTcuMDQ2IDE2LjAzNi4yNTMgMzguMjYuNTA0LTIuNCAxLjEzNS05LjU5NyAxLjEzNS05LjU5N3oiIGZpbGw9IiM4MTczQTkiLz48L3N2Zz4=', body='Best pony', id=8915817, created_at=datetime.datetime(2020, 4, 5, 21, 11, 46, tzinfo=datetime.timezone.utc), image_id=1981478, edit_reason=None, edited_at=None, updated_at=datetime.datetime(2020, 4, 5, 21, 11, 46, tzinfo=datetime.timezone.utc), user_id=None), Comment(author='Background Pony #B56E', avatar='data:image/svg+xml;base64,PHN2ZyB4bWxucz0iaHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmciIHdpZHRoPSIxMjUiIGhlaWdodD0iMTI1IiB2aWV3Qm94PSIwIDAgMTI1IDEyNSIgY2xhc3M9ImF2YXRhci1zdmciPjxyZWN0IHdpZHRoPSIxMjUiIGhlaWdodD0iMTI1IiBmaWxsPSIjYzZkZmYyIi8+PHBhdGggZD0iTTE1LjQ1NiAxMDkuMTVDMTIuMDIgOTcuODA1IDYuNDQgOTUuMDM2LS43OTQgOTguODl2MTkuMTAyYzUuMTMtMTAuMDkgMTAuMjYzLTguMjk0IDE1LjM5NS01LjciIGZpbGw9IiNBNTUwNTMiLz48cGF0aCBkPSJNNzMuMDU0IDI0LjQ2YzI1Ljg4NiAwIDM5LjE0NCAyNi4zOSAyOC45MTYgNDQuOTUgMS4yNjMuMzggNC45MjQgMi4yNzQgMy40MSA0LjgtMS41MTYgMi41MjUtNy41NzcgMTYuMjg4LTI3Ljc4IDE0Ljc3My0xLjAxIDYuNDQtLjMzIDEyLjYxMyAxLjY0MiAyMi44NTQgMS4zOSA3LjIyNC0uNjMyIDE0LjY0OC0uNjMyIDE0LjY0OHMtNDcuNzg1LjIxNi03My43NC0uMTI3Yy0xLjg4My02LjM4NyA4Ljk2NC0yNS43NiAyMC44MzMtMjQuNzQ4IDE1LjY3NCAxLjMzNCAxOS4xOTMgMS42NCAyMS41OTItMi4wMiAyLjQtMy42NjIgMC0yMy4yMzQtMy41MzUtMzAuODEtMy41MzYtNy41NzctNy44My00MC43ODUgMjkuMjk0LTQ0LjMyeiIgZmlsbD0iIzY5OEVDMiIvPjxwYXRoIGQ9Ik02My42MiAzNS4wMjVjMTEuNTYyLjczNiAxOS43OTggMy40MzQgMzQuNTY3IDExLjU5NyAyNS4zODMtMTIuMjQzIDE2LjAxLTM1LjUyNC0uNzYzLTM5Ljk5LTE1LjYyNS00LjE2LTI1LjgzLTEuNzU1LTM3LTUuNTY1IDEuOTU2IDQuMTQgNC41NjQgOC4zNDggOCAxMC4zMjItMTguODI2LS4xOC0yOC4xMTMtMy42NzYtNDIuNzUtNy4wNSAyLjk1IDUuMjkgOS45OTQgMTEuNTIgMTMuMjUgMTMuODg0LTEyLjA4MyA1LjA5NC0yMC45MTYtLjA3Ni0zMy0yLjE1IDMuMzMzIDUuODIzIDcuMDQ4IDExLjE5IDEyLjI1IDE0Ljc4My01IDE2LjM0MyAxOS45MTYgMzcuMTk3IDI5Ljc4NyA1Ny4xNCAyLjctMTIuODE1IDQuNzYtMzAuNzkyIDMuMjktNDMuNjA3eiIgZmlsbD0iI0E1NTA1MyIvPjxwYXRoIGQ9Ik05Mi43NTIgMzYuODM0czkuMDkyLTE5LjU3MiA2LjA2LTIyLjczYy0zLjAzLTMuMTU2LTE1LjI3NyAxMS40OTItMTYuOTIgMTYuNTQyIDIuMDIuNTA1IDguMDgyIDIuMjczIDEwLjg2IDYuMTg4eiIgZmlsbD0iIzY5OEVDMiIvPjxwYXRoIGQ9Ik02NC4zNDIgMzUuNTdzMy4yODMtOC4wOC03LjMyNC0xOS4zMThjLTEuNzY4LTEuNzY4LTMuMDMtMi4yNzMtNC42NzItLjc1OC0xLjY0IDEuNTE1LTE3LjA0NiAxNi4wMzYuMjUzIDM4LjI2LjUwNC0yLjQgMS4xMzUtOS41OTcgMS4xMzUtOS41OTd6IiBmaWxsPSIjNjk4RUMyIi8+PC9zdmc+', body='This is my dream right here, having a relaxing experience at the spa with best pony', id=8915809, created_at=datetime.datetime(2020, 4, 5, 21, 6, 24, tzinfo=datetime.timezone.utc), image_id=2314905, edit_reason=None, edited_at=None, updated_at=datetime.datetime(2020, 4, 5, 21, 6, 24, tzinfo=datetime.timezone.utc), user_id=None), Comment(author='Background Pony #A77B', avatar='data:image/svg+xml;base64,PHN2ZyB4bWxucz0iaHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmciIHdpZHRoPSIxMjUiIGhlaWdodD0iMTI1IiB2aWV3Qm94PSIwIDAgMTI1IDEyNSIgY2xhc3M9ImF2YXRhci1zdmciPjxyZWN0IHdpZHRoPSIxMjUiIGhlaWdodD0iMTI1IiBmaWxsPSIjYzZkZmYyIi8+PHBhdGggZD0iTTE1LjQ1NiAxMDkuMTVDMTIuMDIgOTcuODA1IDYuNDQgOTUuMDM2LS43OTQgOTguODl2MTkuMTAyYzUuMTMtMTAuMDkgMTAuMjYzLTguMjk0IDE1LjM5NS01LjciIGZpbGw9IiM4RThDNzEiLz48cGF0aCBkPSJNNzMuMDU0IDI0LjQ2YzI1Ljg4NiAwIDM5LjE0NCAyNi4zOSAyOC45MTYgNDQuOTUgMS4yNjMuMzggNC45MjQgMi4yNzQgMy40MSA0LjgtMS41MTYgMi41MjUtNy41NzcgMTYuMjg4LTI3Ljc4IDE0Ljc3My0xLjAxIDYuNDQtLjMzIDEyLjYxMyAxLjY0MiAyMi44NTQgMS4zOSA3LjIyNC0uNjMyIDE0LjY0OC0uNjMyIDE0LjY0OHMtNDcuNzg1LjIxNi03My43NC0uMTI3Yy0xLjg4My02LjM4NyA4Ljk2NC0yNS43NiAyMC44MzMtMjQuNzQ4IDE1LjY3NCAxLjMzNCAxOS4xOTMgMS42NCAyMS41OTItMi4wMiAyLjQtMy42NjIgMC0yMy4yMzQtMy41MzUtMzAuODEtMy41MzYtNy41NzctNy44My00MC43ODUgMjkuMjk0LTQ0LjMyeiIgZmlsbD0iIzcyOTc5RiIvPjxwYXRoIGQ9Ik01NC4zIDE5LjZjMTkuMTktMTQuOTQ3IDQ0LjQ5LTEyLjY4IDYyLjM4Ni00LjAxNCA0LjY5NyAyLjI3NSAxMS44NTcgMTIuMS0zLjU4MyAxMi4wNSAxMC43NDYgMy44OTMgMTEuODcgMjIuNTYyIDYuNzAyIDI0LjU1OC01Ljk1NiAyLjMtMTAuNzEtNy40MjItMTAuMjI3LTEzLjYzNy0yLjUyMiAxMS4yMTUtOC4zNiAyMi44OTMtMTMuODQgMTguMzEtNC41OTctMy44NDYtNC4xOTItOC42MTctLjk1LTEzLjc2NC01LjY5NCA0LjcyNC0xMS4yOTggNy44NzItMTYuOTkyIDMuNTY2LTUuNzcgMy4yMDQtMTAuNzc2IDguNjI1LTE3LjE4MiA1LjkzLTcuOTM1LTMuMzQtMS4wMjQtMTMuNDY4IDMuOTc2LTE3LjE0My03LjMwOC0uMzE0LTkuODE1IDMuNDU0LTE0LjQzMiAxMi44OTUgMi45NjMgMTcuODUgMTkuNDM4IDMyLjIwMiAxOC41MTcgNDkuMjUtLjUzNiA5LjkxNi00LjY4OCAxMC44OC01Ljg1MiAyLjUxIDEuNjk2IDI1LjI1My04LjYzNCAyNC44MTYtOS4zNTYgMTMuOTA0LTkuNDQ3IDE2LjItMTMuNjI1IDQuNTEtMTAuOTMtNC4xODMgMi4wNTQtNi42MjggNC4wMy0xMi4xNiA2LjQyNS0xNi43NzctMi41NDcgNy42Ni03LjMzMyA1LjIzMi04LjU4MyA0LjQzLTIuODU0LTEuODM0LS44NTUtMTIuMzAyIDQuMDM1LTE5LjMzIDguMy0xMS45My0yMy43My0zMC4xNzIgMi40Ny01My4xOTciIGZpbGw9IiM4RThDNzEiLz48cGF0aCBkPSJNNDMuMjY3IDEwNy4zMjRzLTYuODI1LTE0LjEzNy03LjY0LTMwLjE2NmMtLjgxNy0xNi4wMy00LjE5Ny0zMS40NjgtMTAuNTUtNDAuNjg4LTYuMzU0LTkuMjItMTMuMjcyLTkuNzMtMTEuOTk3LTMuOTgyIDEuMjc1IDUuNzQ4IDExLjEyMyAzMy4wMTYgMTIuMTI4IDM1Ljk1NEMyMy4wNDIgNjUuNjQ4IDcuMDM4IDQxLjExLS40MyAzNy4yMjJjLTcuNDctMy44ODYtOC45Ni4zNDYtNi44OTIgNS44ODUgMi4wNjggNS41NCAxOC41MDcgMzAuODQ0IDIwLjg4NiAzMy41MDItMi43MzgtMS42ODUtMTIuMjU2LTkuMDM2LTE2Ljk5Ny04Ljk5Ni00Ljc0Mi4wNC00LjkxIDUuMzY2LTIuNjE3IDguNTI2IDIuMjkyIDMuMTYyIDIwLjkxMiAxOS4xNzMgMjUuMTUgMjAuOTQ1LTUuMzUuMjgtMTAuMzg0IDEuOTk2LTkuMTg2IDYuMDA0IDEuMiA0LjAwNiAxMS4zODQgMTQuMDYzIDI4LjUzIDEyLjM3NyAyLjU3Ni0yLjgzNCA0LjgyMy04LjE0MyA0LjgyMy04LjE0M3oiIGZpbGw9IiM3Mjk3OUYiLz48cGF0aCBkPSJNNjQuMzQyIDM1LjU3czMuMjgzLTguMDgtNy4zMjQtMTkuMzE4Yy0xLjc2OC0xLjc2OC0zLjAzLTIuMjczLTQuNjcyLS43NTgtMS42NCAxLjUxNS0xNy4wNDYgMTYuMDM2LjI1MyAzOC4yNi41MDQtMi40IDEuMTM1LTkuNTk3IDEuMTM1LTkuNTk3eiIgZmlsbD0iIzcyOTc5RiIvPjwvc3ZnPg==', body='Portu calez > Portugal\r\n"Port of the grail"\r\nGuys, Dash found the Holy Grail. Templars confirmed. Rainbow Dash is best pony.', id=8915112, created_at=datetime.datetime(2020, 4, 5, 14, 35, 8, tzinfo=datetime.timezone.utc), image_id=2314697, edit_reason=None, edited_at=None, updated_at=datetime.datetime(2020, 4, 5, 14, 35, 8, tzinfo=datetime.timezone.utc), user_id=None), Comment(author='Doeknight Sprinkles', avatar='https://derpicdn.net/avatars/2020/1/7/1578373965192687025633191.gif', body='I love this! Fluttershy is best pony pred! We need more of this! Thank you opti!', id=8914496, created_at=datetime.datetime(2020, 4, 5, 5, 37, 45, tzinfo=datetime.timezone.utc), image_id=2314498, edit_reason=None, edited_at=None, updated_at=datetime.datetime(2020, 4, 5, 5, 37, 45, tzinfo=datetime.timezone.utc), user_id=450458), Comment(author='Twidorable', avatar='https://derpicdn.net/avatars/2012/6/4/0098cb63fb856eb401.jpg', body='Coloratura is still Best Pony', id=8912304, created_at=datetime.datetime(2020, 4, 4, 5, 16, 46, tzinfo=datetime.timezone.utc), image_id=2312766, edit_reason=None, edited_at=None, updated_at=datetime.datetime(2020, 4, 4, 5, 16, 46, tzinfo=datetime.timezone.utc), user_id=211668), Comment(author='ABronyAccount', avatar='https://derpicdn.net/avatars/2016/03/10/03_39_28_295_CeilingSpikeAvTransparent_125_by_shelltoontv_d3czifb.png', body='"@Rainbow Dash is Best Pony":/images/2308194#comment_8911421\r\nAt least they didn\'t make the site into a Rainbow Factory reference or something awful like that! ^_~', id=8911579, created_at=datetime.datetime(2020, 4, 3, 22, 41, 32, tzinfo=datetime.timezone.utc), image_id=2308194, edit_reason=None, edited_at=None, updated_at=datetime.datetime(2020, 4, 3, 22, 41, 32, tzinfo=datetime.timezone.utc), user_id=341159), Comment(author='Beau Skunky', avatar='https://derpicdn.net/avatars/2012/7/22/045f57f5b8676bad34.jpg', body='"@FlutterButterButt":/images/2313389#comment_8911503\r\nAnd he\'s best pony.', id=8911526, created_at=datetime.datetime(2020, 4, 3, 22, 13, 51, tzinfo=datetime.timezone.utc), image_id=2313389, edit_reason=None, edited_at=None, updated_at=datetime.datetime(2020, 4, 3, 22, 13, 51, tzinfo=datetime.timezone.utc), user_id=222513), Comment(author='radostt', avatar='https://derpicdn.net/avatars/2020/4/6/15861317880504380165861956.jpg', body='Because making mistakes can lead to all kinds of shenanigans. Plus her in the moment writing is more relate able. Shes just the best. Her writing can stand for itself. Plus she has one of the best pony designs in the show, and shes super strong. Shes also a leader.', id=8911129, created_at=datetime.datetime(2020, 4, 3, 19, 13, 35, tzinfo=datetime.timezone.utc), image_id=2042365, edit_reason=None, edited_at=None, updated_at=datetime.datetime(2020, 4, 3, 19, 13, 35, tzinfo=datetime.timezone.utc), user_id=357245), Comment(author='radostt', avatar='https://derpicdn.net/avatars/2020/4/6/15861317880504380165861956.jpg', body='3 best ponies in the show.', id=8911122, created_at=datetime.datetime(2020, 4, 3, 19, 8, 52, tzinfo=datetime.timezone.utc), image_id=2053410, edit_reason=None, edited_at=None, updated_at=datetime.datetime(2020, 4, 3, 19, 8, 52, tzinfo=datetime.timezone.utc), user_id=357245), Comment(author='Background Pony #F783', avatar='data:image/svg+xml;base64,PHN2ZyB4bWxucz0iaHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmciIHdpZHRoPSIxMjUiIGhlaWdodD0iMTI1IiB2aWV3Qm94PSIwIDAgMTI1IDEyNSIgY2xhc3M9ImF2YXRhci1zdmciPjxyZWN0IHdpZHRoPSIxMjUiIGhlaWdodD0iMTI1IiBmaWxsPSIjYzZkZmYyIi8+PHBhdGggZD0iTTE1LjQ1NiAxMDkuMTVDMTIuMDIgOTcuODA1IDYuNDQgOTUuMDM2LS43OTQgOTguODl2MTkuMTAyYzUuMTMtMTAuMDkgMTAuMjYzLTguMjk0IDE1LjM5NS01LjciIGZpbGw9IiM0QjZCNzUiLz48cGF0aCBkPSJNNzMuMDU0IDI0LjQ2YzI1Ljg4NiAwIDM5LjE0NCAyNi4zOSAyOC45MTYgNDQuOTUgMS4yNjMuMzggNC45MjQgMi4yNzQgMy40MSA0LjgtMS41MTYgMi41MjUtNy41NzcgMTYuMjg4LTI3Ljc4IDE0Ljc3My0xLjAxIDYuNDQtLjMzIDEyLjYxMyAxLjY0MiAyMi44NTQgMS4zOSA3LjIyNC0uNjMyIDE0LjY0OC0uNjMyIDE0LjY0OHMtNDcuNzg1LjIxNi03My43NC0uMTI3Yy0xLjg4My02LjM4NyA4Ljk2NC0yNS43NiAyMC44MzMtMjQuNzQ4IDE1LjY3NCAxLjMzNCAxOS4xOTMgMS42NCAyMS41OTItMi4wMiAyLjQtMy42NjIgMC0yMy4yMzQtMy41MzUtMzAuODEtMy41MzYtNy41NzctNy44My00MC43ODUgMjkuMjk0LTQ0LjMyeiIgZmlsbD0iIzRDNkRDMiIvPjxwYXRoIGQ9Ik01Ni4xNiAyOC4wNDRjMTcuMzQ0LTEzLjIyIDU2LjI1OC0yOS4yMDUgNjMuMDYzIDMuODQ3IDIuNTIgMTIuMjQ4LjIyNSAxMy43Ni02LjE4OCAxNy45MS03Ljc5IDUuMDQ1LTE3LjM4Ni0xLjM3LTE1LjA1LTYuNjYyLTguNjUyIDcuNzA3LTE1LjQ4NCAxMC42MjQtMjMuMTIgOS44NS05LjE2Ny0uOTI3LTYuNDM3LTYuNzYtMi40MTctOS44NzIgMi40MzctMS44ODcgNS4wOC0zLjU3IDkuNDM2LTUuNzYtNy45NDIgMi41NS0xMy45OTIgMS45NzQtMTkuMjgyLTMuMzRsLTEwLjk0NyA1LjU1LjAxNSAxMS41NDJDNTMuMyA2NC4xNyA2Mi43NTggODAuODEgNjMuOTEyIDkzLjQyYy43MiA3Ljg3Ni01LjUzMiA2LjYzNy04LjY1IDEuNDI1IDEuODQ3IDUuNTgyIDMuNTkyIDkuODkyIDMuNDgzIDE1Ljg5LS4xMyA3LjE3OC04LjM4NiAxMS41NC0xMi4wNDcgMS4wOTgtNy41MDUtMjEuNDA1LTEyLjk2NS01MS45Ny0uOTczLTc1LjN6IiBmaWxsPSIjNEI2Qjc1Ii8+PHBhdGggZD0iTTQzLjI2NyAxMDcuMzI0cy02LjgyNS0xNC4xMzctNy42NC0zMC4xNjZjLS44MTctMTYuMDMtNC4xOTctMzEuNDY4LTEwLjU1LTQwLjY4OC02LjM1NC05LjIyLTEzLjI3Mi05LjczLTExLjk5Ny0zLjk4MiAxLjI3NSA1Ljc0OCAxMS4xMjMgMzMuMDE2IDEyLjEyOCAzNS45NTRDMjMuMDQyIDY1LjY0OCA3LjAzOCA0MS4xMS0uNDMgMzcuMjIyYy03LjQ3LTMuODg2LTguOTYuMzQ2LTYuODkyIDUuODg1IDIuMDY4IDUuNTQgMTguNTA3IDMwLjg0NCAyMC44ODYgMzMuNTAyLTIuNzM4LTEuNjg1LTEyLjI1Ni05LjAzNi0xNi45OTctOC45OTYtNC43NDIuMDQtNC45MSA1LjM2Ni0yLjYxNyA4LjUyNiAyLjI5MiAzLjE2MiAyMC45MTIgMTkuMTczIDI1LjE1IDIwLjk0NS01LjM1LjI4LTEwLjM4NCAxLjk5Ni05LjE4NiA2LjAwNCAxLjIgNC4wMDYgMTEuMzg0IDE0LjA2MyAyOC41MyAxMi4zNzcgMi41NzYtMi44MzQgNC44MjMtOC4xNDMgNC44MjMtOC4xNDN6IiBmaWxsPSIjNEM2REMyIi8+PHBhdGggZD0iTTY0LjM0MiAzNS41N3MzLjI4My04LjA4LTcuMzI0LTE5LjMxOGMtMS43NjgtMS43NjgtMy4wMy0yLjI3My00LjY3Mi0uNzU4LTEuNjQgMS41MTUtMTcuMDQ2IDE2LjAzNi4yNTMgMzguMjYuNTA0LTIuNCAxLjEzNS05LjU5NyAxLjEzNS05LjU5N3oiIGZpbGw9IiM0QzZEQzIiLz48L3N2Zz4=', body='"@Azerdoe":/images/2311224#comment_8906195\r\nAJ is best pony as well. They’re awesome and [spoiler]even got together, I know it’s mostly implied but still[/spoiler]', id=8906692, created_at=datetime.datetime(2020, 4, 1, 22, 1, 57, tzinfo=datetime.timezone.utc), image_id=2311224, edit_reason=None, edited_at=None, updated_at=datetime.datetime(2020, 4, 1, 22, 1, 57, tzinfo=datetime.timezone.utc), user_id=None), Comment(author='Azerdoe', avatar='https://derpicdn.net/avatars/2014/07/12/00_53_04_746_02.jpg', body='"@Background Pony #F783":/images/2311224#comment_8906150\r\n[bq="Background Pony #F783"] "@Azerdoe":/images/2311224#comment_8906021\r\nLol no XD but I do think Dash deserves a best pony spot too! [/bq]\r\nHmmmm.... Well she is a best pony yes, as are the rest of them no doubt. But AJ is the best character in the show bar-none. If you need proof, watch Drowning In Horseshoes character review on her. It explains everything.\r\n\r\nhttps://youtu.be/kWm072ccqyw ', id=8906158, created_at=datetime.datetime(2020, 4, 1, 16, 33, 19, tzinfo=datetime.timezone.utc), image_id=2311224, edit_reason=None, edited_at=datetime.datetime(2020, 4, 1, 16, 33, 39, tzinfo=datetime.timezone.utc), updated_at=datetime.datetime(2020, 4, 1, 16, 33, 39, tzinfo=datetime.timezone.utc), user_id=296207), Comment(author='Background Pony #F783', avatar='data:image/svg+xml;base64,PHN2ZyB4bWxucz0iaHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmciIHdpZHRoPSIxMjUiIGhlaWdodD0iMTI1IiB2aWV3Qm94PSIwIDAgMTI1IDEyNSIgY2xhc3M9ImF2YXRhci1zdmciPjxyZWN0IHdpZHRoPSIxMjUiIGhlaWdodD0iMTI1IiBmaWxsPSIjYzZkZmYyIi8+PHBhdGggZD0iTTE1LjQ1NiAxMDkuMTVDMTIuMDIgOTcuODA1IDYuNDQgOTUuMDM2LS43OTQgOTguODl2MTkuMTAyYzUuMTMtMTAuMDkgMTAuMjYzLTguMjk0IDE1LjM5NS01LjciIGZpbGw9IiM0QjZCNzUiLz48cGF0aCBkPSJNNzMuMDU0IDI0LjQ2YzI1Ljg4NiAwIDM5LjE0NCAyNi4zOSAyOC45MTYgNDQuOTUgMS4yNjMuMzggNC45MjQgMi4yNzQgMy40MSA0LjgtMS41MTYgMi41MjUtNy41NzcgMTYuMjg4LTI3Ljc4IDE0Ljc3My0xLjAxIDYuNDQtLjMzIDEyLjYxMyAxLjY0MiAyMi44NTQgMS4zOSA3LjIyNC0uNjMyIDE0LjY0OC0uNjMyIDE0LjY0OHMtNDcuNzg1LjIxNi03My43NC0uMTI3Yy0xLjg4My02LjM4NyA4Ljk2NC0yNS43NiAyMC44MzMtMjQuNzQ4IDE1LjY3NCAxLjMzNCAxOS4xOTMgMS42NCAyMS41OTItMi4wMiAyLjQtMy42NjIgMC0yMy4yMzQtMy41MzUtMzAuODEtMy41MzYtNy41NzctNy44My00MC43ODUgMjkuMjk0LTQ0LjMyeiIgZmlsbD0iIzRDNkRDMiIvPjxwYXRoIGQ9Ik01Ni4xNiAyOC4wNDRjMTcuMzQ0LTEzLjIyIDU2LjI1OC0yOS4yMDUgNjMuMDYzIDMuODQ3IDIuNTIgMTIuMjQ4LjIyNSAxMy43Ni02LjE4OCAxNy45MS03Ljc5IDUuMDQ1LTE3LjM4Ni0xLjM3LTE1LjA1LTYuNjYyLTguNjUyIDcuNzA3LTE1LjQ4NCAxMC42MjQtMjMuMTIgOS44NS05LjE2Ny0uOTI3LTYuNDM3LTYuNzYtMi40MTctOS44NzIgMi40MzctMS44ODcgNS4wOC0zLjU3IDkuNDM2LTUuNzYtNy45NDIgMi41NS0xMy45OTIgMS45NzQtMTkuMjgyLTMuMzRsLTEwLjk0NyA1LjU1LjAxNSAxMS41NDJDNTMuMyA2NC4xNyA2Mi43NTggODAuODEgNjMuOTEyIDkzLjQyYy43MiA3Ljg3Ni01LjUzMiA2LjYzNy04LjY1IDEuNDI1IDEuODQ3IDUuNTgyIDMuNTkyIDkuODkyIDMuNDgzIDE1Ljg5LS4xMyA3LjE3OC04LjM4NiAxMS41NC0xMi4wNDcgMS4wOTgtNy41MDUtMjEuNDA1LTEyLjk2NS01MS45Ny0uOTczLTc1LjN6IiBmaWxsPSIjNEI2Qjc1Ii8+PHBhdGggZD0iTTQzLjI2NyAxMDcuMzI0cy02LjgyNS0xNC4xMzctNy42NC0zMC4xNjZjLS44MTctMTYuMDMtNC4xOTctMzEuNDY4LTEwLjU1LTQwLjY4OC02LjM1NC05LjIyLTEzLjI3Mi05LjczLTExLjk5Ny0zLjk4MiAxLjI3NSA1Ljc0OCAxMS4xMjMgMzMuMDE2IDEyLjEyOCAzNS45NTRDMjMuMDQyIDY1LjY0OCA3LjAzOCA0MS4xMS0uNDMgMzcuMjIyYy03LjQ3LTMuODg2LTguOTYuMzQ2LTYuODkyIDUuODg1IDIuMDY4IDUuNTQgMTguNTA3IDMwLjg0NCAyMC44ODYgMzMuNTAyLTIuNzM4LTEuNjg1LTEyLjI1Ni05LjAzNi0xNi45OTctOC45OTYtNC43NDIuMDQtNC45MSA1LjM2Ni0yLjYxNyA4LjUyNiAyLjI5MiAzLjE2MiAyMC45MTIgMTkuMTczIDI1LjE1IDIwLjk0NS01LjM1LjI4LTEwLjM4NCAxLjk5Ni05LjE4NiA2LjAwNCAxLjIgNC4wMDYgMTEuMzg0IDE0LjA2MyAyOC41MyAxMi4zNzcgMi41NzYtMi44MzQgNC44MjMtOC4xNDMgNC44MjMtOC4xNDN6IiBmaWxsPSIjNEM2REMyIi8+PHBhdGggZD0iTTY0LjM0MiAzNS41N3MzLjI4My04LjA4LTcuMzI0LTE5LjMxOGMtMS43NjgtMS43NjgtMy4wMy0yLjI3My00LjY3Mi0uNzU4LTEuNjQgMS41MTUtMTcuMDQ2IDE2LjAzNi4yNTMgMzguMjYuNTA0LTIuNCAxLjEzNS05LjU5NyAxLjEzNS05LjU5N3oiIGZpbGw9IiM0QzZEQzIiLz48L3N2Zz4=', body='"@Azerdoe":/images/2311224#comment_8906021\r\nLol no XD but I do think Dash deserves a best pony spot too!', id=8906150, created_at=datetime.datetime(2020, 4, 1, 16, 29, 19, tzinfo=datetime.timezone.utc), image_id=2311224, edit_reason=None, edited_at=None, updated_at=datetime.datetime(2020, 4, 1, 16, 29, 19, tzinfo=datetime.timezone.utc), user_id=None), Comment(author='Background Pony #F783', avatar='data:image/svg+xml;base64,PHN2ZyB4bWxucz0iaHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmciIHdpZHRoPSIxMjUiIGhlaWdodD0iMTI1IiB2aWV3Qm94PSIwIDAgMTI1IDEyNSIgY2xhc3M9ImF2YXRhci1zdmciPjxyZWN0IHdpZHRoPSIxMjUiIGhlaWdodD0iMTI1IiBmaWxsPSIjYzZkZmYyIi8+PHBhdGggZD0iTTE1LjQ1NiAxMDkuMTVDMTIuMDIgOTcuODA1IDYuNDQgOTUuMDM2LS43OTQgOTguODl2MTkuMTAyYzUuMTMtMTAuMDkgMTAuMjYzLTguMjk0IDE1LjM5NS01LjciIGZpbGw9IiM0QjZCNzUiLz48cGF0aCBkPSJNNzMuMDU0IDI0LjQ2YzI1Ljg4NiAwIDM5LjE0NCAyNi4zOSAyOC45MTYgNDQuOTUgMS4yNjMuMzggNC45MjQgMi4yNzQgMy40MSA0LjgtMS41MTYgMi41MjUtNy41NzcgMTYuMjg4LTI3Ljc4IDE0Ljc3My0xLjAxIDYuNDQtLjMzIDEyLjYxMyAxLjY0MiAyMi44NTQgMS4zOSA3LjIyNC0uNjMyIDE0LjY0OC0uNjMyIDE0LjY0OHMtNDcuNzg1LjIxNi03My43NC0uMTI3Yy0xLjg4My02LjM4NyA4Ljk2NC0yNS43NiAyMC44MzMtMjQuNzQ4IDE1LjY3NCAxLjMzNCAxOS4xOTMgMS42NCAyMS41OTItMi4wMiAyLjQtMy42NjIgMC0yMy4yMzQtMy41MzUtMzAuODEtMy41MzYtNy41NzctNy44My00MC43ODUgMjkuMjk0LTQ0LjMyeiIgZmlsbD0iIzRDNkRDMiIvPjxwYXRoIGQ9Ik01Ni4xNiAyOC4wNDRjMTcuMzQ0LTEzLjIyIDU2LjI1OC0yOS4yMDUgNjMuMDYzIDMuODQ3IDIuNTIgMTIuMjQ4LjIyNSAxMy43Ni02LjE4OCAxNy45MS03Ljc5IDUuMDQ1LTE3LjM4Ni0xLjM3LTE1LjA1LTYuNjYyLTguNjUyIDcuNzA3LTE1LjQ4NCAxMC42MjQtMjMuMTIgOS44NS05LjE2Ny0uOTI3LTYuNDM3LTYuNzYtMi40MTctOS44NzIgMi40MzctMS44ODcgNS4wOC0zLjU3IDkuNDM2LTUuNzYtNy45NDIgMi41NS0xMy45OTIgMS45NzQtMTkuMjgyLTMuMzRsLTEwLjk0NyA1LjU1LjAxNSAxMS41NDJDNTMuMyA2NC4xNyA2Mi43NTggODAuODEgNjMuOTEyIDkzLjQyYy43MiA3Ljg3Ni01LjUzMiA2LjYzNy04LjY1IDEuNDI1IDEuODQ3IDUuNTgyIDMuNTkyIDkuODkyIDMuNDgzIDE1Ljg5LS4xMyA3LjE3OC04LjM4NiAxMS41NC0xMi4wNDcgMS4wOTgtNy41MDUtMjEuNDA1LTEyLjk2NS01MS45Ny0uOTczLTc1LjN6IiBmaWxsPSIjNEI2Qjc1Ii8+PHBhdGggZD0iTTQzLjI2NyAxMDcuMzI0cy02LjgyNS0xNC4xMzctNy42NC0zMC4xNjZjLS44MTctMTYuMDMtNC4xOTctMzEuNDY4LTEwLjU1LTQwLjY4OC02LjM1NC05LjIyLTEzLjI3Mi05LjczLTExLjk5Ny0zLjk4MiAxLjI3NSA1Ljc0OCAxMS4xMjMgMzMuMDE2IDEyLjEyOCAzNS45NTRDMjMuMDQyIDY1LjY0OCA3LjAzOCA0MS4xMS0uNDMgMzcuMjIyYy03LjQ3LTMuODg2LTguOTYuMzQ2LTYuODkyIDUuODg1IDIuMDY4IDUuNTQgMTguNTA3IDMwLjg0NCAyMC44ODYgMzMuNTAyLTIuNzM4LTEuNjg1LTEyLjI1Ni05LjAzNi0xNi45OTctOC45OTYtNC43NDIuMDQtNC45MSA1LjM2Ni0yLjYxNyA4LjUyNiAyLjI5MiAzLjE2MiAyMC45MTIgMTkuMTczIDI1LjE1IDIwLjk0NS01LjM1LjI4LTEwLjM4NCAxLjk5Ni05LjE4NiA2LjAwNCAxLjIgNC4wMDYgMTEuMzg0IDE0LjA2MyAyOC41MyAxMi4zNzcgMi41NzYtMi44MzQgNC44MjMtOC4xNDMgNC44MjMtOC4xNDN6IiBmaWxsPSIjNEM2REMyIi8+PHBhdGggZD0iTTY0LjM0MiAzNS41N3MzLjI4My04LjA4LTcuMzI0LTE5LjMxOGMtMS43NjgtMS43NjgtMy4wMy0yLjI3My00LjY3Mi0uNzU4LTEuNjQgMS41MTUtMTcuMDQ2IDE2LjAzNi4yNTMgMzguMjYuNTA0LTIuNCAxLjEzNS05LjU5NyAxLjEzNS05LjU5N3oiIGZpbGw9IiM0QzZEQzIiLz48L3N2Zz4=', body='Best pony in all her glory. Oh, and Applejack is there too. \r\nHappy Birthday Ashleigh Ball!', id=8905979, created_at=datetime.datetime(2020, 4, 1, 14, 48, 11, tzinfo=datetime.timezone.utc), image_id=2311224, edit_reason=None, edited_at=None, updated_at=datetime.datetime(2020, 4, 1, 14, 48, 11, tzinfo=datetime.timezone.utc), user_id=None), Comment(author='Slytherin-Rui', avatar='https://derpicdn.net/avatars/2016/6/18/674933f753fa6a39ed3b7dc.jpg', body='"@UserAccount":/images/2309849#comment_8905336\r\n"Rainbow is hot and Starlight is one of the best ponies."\r\nTotally agree with you there, except for Rainbow. AJ and RD are the only ponies of the mane 6 that I don\'t find sexually appealing, while the rest are freaking hot as hell. Especially Twilight and Fluttershy.', id=8905820, created_at=datetime.datetime(2020, 4, 1, 12, 44, 33, tzinfo=datetime.timezone.utc), image_id=2309849, edit_reason=None, edited_at=datetime.datetime(2020, 4, 1, 12, 45, 3, tzinfo=datetime.timezone.utc), updated_at=datetime.datetime(2020, 4, 1, 12, 45, 3, tzinfo=datetime.timezone.utc), user_id=380341), Comment(author='Azerdoe', avatar='https://derpicdn.net/avatars/2014/07/12/00_53_04_746_02.jpg', body='Best pony in all her glory. Oh, and Rainbow Dash is there too.\r\nHappy Birthday Ashleigh Ball!', id=8905556, created_at=datetime.datetime(2020, 4, 1, 8, 35, 42, tzinfo=datetime.timezone.utc), image_id=2311224, edit_reason=None, edited_at=None, updated_at=datetime.datetime(2020, 4, 1, 8, 35, 42, tzinfo=datetime.timezone.utc), user_id=296207)]
-        self.assertEqual(cls, expected)
+        assert_fields_equal(self, cls, expected)
     # end def
 
     def test_gallery(self):
@@ -456,25 +1477,56 @@ class OfflineTest(unittest.TestCase):
           "user_id": 370912
         })
         expected = Gallery(description='Best. Pony.', id=4810, spoiler_warning='', thumbnail_id=1484633, title='Best Pony', user='Ciaran', user_id=370912)
-        self.assertEqual(gallery, expected)
+        assert_fields_equal(self, gallery, expected)
     # end def
 
     def test_forum(self):
         forum = Forum.from_dict({"description":"Discuss art of any form, and share techniques and tips","name":"Art Chat","post_count":55603,"short_name":"art","topic_count":1737})
         expected = Forum(name='Art Chat', short_name='art', description='Discuss art of any form, and share techniques and tips', topic_count=1737, post_count=55603)
-        self.assertEqual(forum, expected)
+        assert_fields_equal(self, forum, expected)
     # end def
 
     def test_topic(self):
         cls = Topic.from_dict({'topic': {'author': 'dracone', 'last_replied_to_at': '2020-03-22T20:20:02Z', 'locked': False, 'post_count': 3, 'slug': 'a-lack-of-images', 'sticky': False, 'title': 'A lack of images', 'user_id': 363222, 'view_count': 0}}['topic'])
         expected =  Topic(slug='a-lack-of-images', title='A lack of images', post_count=3, view_count=0, sticky=False, last_replied_to_at=datetime.datetime(2020, 3, 22, 20, 20, 2, tzinfo=datetime.timezone.utc), locked=False, user_id=363222, author='dracone')
-        self.assertEqual(cls, expected)
+        assert_fields_equal(self, cls, expected)
+    # end def
+
+    def test_from_dict_keeps_data(self):
+        data = {'author': 'dracone', 'last_replied_to_at': '2020-03-22T20:20:02Z', 'locked': False, 'post_count': 3, 'slug': 'a-lack-of-images', 'sticky': False, 'title': 'A lack of images', 'user_id': 363222, 'view_count': 0}
+        copy = dict(data)
+        topic = Topic.from_dict(data)
+        self.assertEqual(data, copy, 'the given dict must not be modified')
+        self.assertIsNone(topic._raw, 'only kept if asked for')
+        Topic._keep_raw = True
+        try:
+            self.assertIs(Topic.from_dict(data)._raw, data)
+        finally:
+            del Topic._keep_raw
+        # end try
+    # end def
+
+    def test_slots(self):
+        forum = Forum(name='Art Chat', short_name='art', description='', topic_count=1, post_count=1)
+        self.assertFalse(hasattr(forum, '__dict__'))
+        with self.assertRaises(AttributeError):
+            forum.color = 'red'
+        # end with
+    # end def
+
+    def test_from_dict_unknown_keys(self):
+        data = {'description': '', 'name': 'Art Chat', 'post_count': 1, 'short_name': 'art', 'topic_count': 1, 'color': 'red'}
+        with self.assertRaises(ValueError) as context:
+            Forum.from_dict(data)
+        # end with
+        self.assertIn("'color'", str(context.exception))
+        self.assertIn('color', data)
     # end def
 
     def est_cls(self):
         cls = Cls.from_dict({}['cls'])
         expected = Cls()
-        self.assertEqual(cls, expected)
+        assert_fields_equal(self, cls, expected)
     # end def
 
 